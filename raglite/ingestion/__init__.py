@@ -1,8 +1,20 @@
 """Document ingestion module for RAGLite.
 
-Handles PDF and Excel ingestion with Docling and openpyxl.
+Handles PDF and Excel ingestion with Docling and openpyxl. The pipeline (and
+its docling/pandas/openpyxl dependencies) is imported on first attribute access.
 """
 
-from raglite.ingestion.pipeline import ingest_pdf
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["ingest_pdf"]
+if TYPE_CHECKING:
+    from raglite.ingestion.pipeline import bulk_load_mode, ingest_directory, ingest_pdf
+
+__all__ = ["bulk_load_mode", "ingest_directory", "ingest_pdf"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        from raglite.ingestion import pipeline
+
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
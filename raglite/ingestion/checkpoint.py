@@ -0,0 +1,284 @@
+"""Resumable ingestion checkpoints in a per-document work directory.
+
+``ingest_pdf`` records each completed stage under
+``settings.ingest_checkpoint_dir/<sha256 of the file>/``:
+
+- ``conversion.json``: the Docling document (a retry skips conversion)
+- ``chunks.npz``: the chunk batch (text buffer, offsets, page numbers, indices)
+- ``embeddings-<start>.npy``: one file per embedded batch; the batches present
+  are the embedding watermark
+
+Files are written under a unique temporary name and renamed into place, so a
+crash (or a concurrent ingestion of the same file) never leaves a torn
+checkpoint behind. Checkpoints are keyed by file content (an edited file starts
+over) and removed once the document is stored. Point IDs are derived from chunk
+IDs (see ``chunk_point_id``), so replaying the upload after a crash overwrites
+points instead of duplicating them.
+
+Every ingestion holds a shared lock on ``<sha256>.lock`` next to the work
+directory until it finishes (``close``); ``clear`` only removes the checkpoint
+if no other ingestion of the same content holds it, otherwise the last one
+to finish does. Checkpoints of documents that are never retried are removed by
+``prune_checkpoints`` once untouched for
+``settings.ingest_checkpoint_max_age_hours`` (run on every ``for_document``).
+
+Checkpointing is best effort: a failed write is logged and ingestion continues.
+
+Example:
+    >>> checkpoint = IngestionCheckpoint.for_document(Path("reports/annual_2024.pdf"))
+    >>> document = checkpoint.load_conversion()  # None on the first attempt
+    >>> ...
+    >>> checkpoint.clear()  # Once stored; checkpoint.close() if ingestion failed
+"""
+
+import fcntl
+import hashlib
+import os
+import shutil
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+from docling_core.types.doc import DoclingDocument
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.models import ChunkBatch, DocumentMetadata
+
+logger = get_logger(__name__)
+
+_CONVERSION = "conversion.json"
+_CHUNKS = "chunks.npz"
+
+
+def _file_digest(path: Path) -> str:
+    with path.open("rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def _lock_path(directory: Path) -> Path:
+    return directory.with_name(f"{directory.name}.lock")
+
+
+def _lock(path: Path, operation: int) -> BinaryIO | None:
+    """Open and flock a lock file; None if a non-blocking lock is held elsewhere.
+
+    Retries when the file was unlinked (by clear or prune) while waiting, so
+    every holder locks the file that is currently in place.
+    """
+    while True:
+        f = path.open("ab")
+        try:
+            fcntl.flock(f, operation)
+        except BlockingIOError:
+            f.close()
+            return None
+        try:
+            current = os.stat(path).st_ino == os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            current = False
+        if current:
+            return f
+        f.close()
+
+
+def prune_checkpoints(root: Path, max_age_seconds: float, keep: str | None = None) -> int:
+    """Remove checkpoints untouched for max_age_seconds that no ingestion is using.
+
+    Args:
+        root: Checkpoint root (settings.ingest_checkpoint_dir)
+        max_age_seconds: Age of the newest checkpoint file after which it is removed
+        keep: Digest of a checkpoint never to remove (the one about to be used)
+
+    Returns:
+        Number of checkpoints removed
+    """
+    try:
+        names = {entry.name.removesuffix(".lock") for entry in root.iterdir()}
+    except FileNotFoundError:
+        return 0
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    for name in names - {keep}:
+        directory = root / name
+        lock_path = _lock_path(directory)
+        try:
+            mtimes = [p.stat().st_mtime for p in (directory, lock_path) if p.exists()]
+            if not mtimes or max(mtimes) >= cutoff:
+                continue
+            lock = _lock(lock_path, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            continue
+        if lock is None:  # In use by an ingestion
+            continue
+        with lock:
+            shutil.rmtree(directory, ignore_errors=True)
+            lock_path.unlink(missing_ok=True)
+        removed += 1
+    if removed:
+        logger.info("Pruned stale ingestion checkpoints", extra={"checkpoints": removed})
+    return removed
+
+
+class IngestionCheckpoint:
+    """Stage checkpoints of one document (see module docstring).
+
+    Args:
+        directory: Work directory holding this document's checkpoint files
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._lease: BinaryIO | None = None  # Shared lock held while ingesting
+
+    @classmethod
+    def for_document(cls, path: Path, digest: str | None = None) -> "IngestionCheckpoint | None":
+        """Return the checkpoint for a document file, or None if checkpoints are disabled.
+
+        Hashes the file unless its sha256 hex digest is given, and may wait for a
+        concurrent clear: call it from a worker thread. The caller must ``clear``
+        (document stored) or ``close`` (ingestion failed) the checkpoint to release
+        its lock.
+        """
+        if settings.ingest_checkpoint_dir is None:
+            return None
+        root = Path(settings.ingest_checkpoint_dir)
+        try:
+            if digest is None:
+                digest = _file_digest(path)
+            if settings.ingest_checkpoint_max_age_hours is not None:
+                prune_checkpoints(root, settings.ingest_checkpoint_max_age_hours * 3600, digest)
+            checkpoint = cls(root / digest)
+            root.mkdir(parents=True, exist_ok=True)
+            checkpoint._lease = _lock(_lock_path(checkpoint.directory), fcntl.LOCK_SH)
+        except OSError as e:
+            logger.warning("Cannot checkpoint document", extra={"path": str(path), "error": str(e)})
+            return None
+        return checkpoint
+
+    def _write(self, name: str, write: Callable[[BinaryIO], None]) -> None:
+        """Atomically write a checkpoint file (unique temporary file + rename)."""
+        target = self.directory / name
+        tmp: str | None = None
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{name}.", suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, target)
+        except Exception as e:  # Never fail ingestion over a checkpoint
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
+            logger.warning(
+                "Failed to write ingestion checkpoint",
+                extra={"checkpoint": str(target), "error": str(e)},
+            )
+
+    def _read(self, name: str) -> Path | None:
+        path = self.directory / name
+        return path if path.is_file() else None
+
+    def save_conversion(self, document: DoclingDocument) -> None:
+        self._write(_CONVERSION, lambda f: f.write(document.model_dump_json().encode("utf-8")))
+
+    def load_conversion(self) -> DoclingDocument | None:
+        """Return the checkpointed Docling document, or None if not converted yet."""
+        path = self._read(_CONVERSION)
+        if path is None:
+            return None
+        try:
+            return DoclingDocument.model_validate_json(path.read_bytes())
+        except Exception as e:
+            logger.warning(
+                "Ignoring unreadable conversion checkpoint",
+                extra={"checkpoint": str(path), "error": str(e)},
+            )
+            return None
+
+    def save_chunks(self, chunks: ChunkBatch) -> None:
+        self._write(
+            _CHUNKS,
+            lambda f: np.savez(
+                f,
+                text=np.array(chunks.text),
+                offsets=np.asarray(chunks.offsets, dtype=np.int64),
+                page_numbers=np.asarray(chunks.page_numbers, dtype=np.int32),
+                chunk_indices=np.asarray(chunks.chunk_indices, dtype=np.int32),
+            ),
+        )
+
+    def load_chunks(self, metadata: DocumentMetadata) -> ChunkBatch | None:
+        """Rebuild the checkpointed chunk batch for metadata, or None if not chunked yet."""
+        path = self._read(_CHUNKS)
+        if path is None:
+            return None
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                text = str(data["text"])
+                offsets = data["offsets"].tolist()
+                page_numbers = data["page_numbers"].tolist()
+                chunk_indices = data["chunk_indices"].tolist()
+        except Exception as e:
+            logger.warning(
+                "Ignoring unreadable chunk checkpoint",
+                extra={"checkpoint": str(path), "error": str(e)},
+            )
+            return None
+
+        chunks = ChunkBatch(metadata)
+        for i, (page_number, chunk_index) in enumerate(
+            zip(page_numbers, chunk_indices, strict=True)
+        ):
+            chunks.append(text[offsets[i] : offsets[i + 1]], page_number, chunk_index)
+        return chunks
+
+    def save_embeddings(self, start: int, embeddings: np.ndarray) -> None:
+        """Record the embeddings of the batch beginning at chunk ``start``."""
+        array = np.asarray(embeddings, dtype=np.float32)
+        self._write(f"embeddings-{start:08d}.npy", lambda f: np.save(f, array))
+
+    def load_embeddings(self, start: int, count: int) -> np.ndarray | None:
+        """Return checkpointed embeddings for chunks ``start:start + count``, if complete."""
+        path = self._read(f"embeddings-{start:08d}.npy")
+        if path is None:
+            return None
+        try:
+            embeddings = np.load(path, allow_pickle=False)
+        except Exception as e:
+            logger.warning(
+                "Ignoring unreadable embedding checkpoint",
+                extra={"checkpoint": str(path), "error": str(e)},
+            )
+            return None
+        return embeddings if embeddings.shape[0] == count else None
+
+    def clear(self) -> None:
+        """Remove this document's checkpoint (after it has been stored) and release it.
+
+        Left in place while another ingestion of the same content uses it; that
+        one removes it when it finishes.
+        """
+        lease = self._lease
+        if lease is None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            return
+        try:
+            fcntl.flock(lease, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logger.debug(
+                "Ingestion checkpoint in use by another ingestion, not cleared",
+                extra={"checkpoint": str(self.directory)},
+            )
+        else:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            _lock_path(self.directory).unlink(missing_ok=True)
+        self.close()
+
+    def close(self) -> None:
+        """Release this ingestion's lock, keeping the checkpoint (for a retry)."""
+        if self._lease is not None:
+            self._lease.close()
+            self._lease = None
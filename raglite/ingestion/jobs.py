@@ -0,0 +1,560 @@
+"""Background ingestion jobs backed by a persistent SQLite job table.
+
+``JobManager.submit`` records a job and returns its status (with the JobID)
+immediately. Worker threads claim queued jobs atomically (``BEGIN IMMEDIATE``
+transaction), run the ingestion pipeline and record stage progress, embedding
+throughput and the resulting DocumentMetadata. Jobs left ``running`` by a
+process that exited are re-queued when the manager starts (up to
+``settings.ingest_job_max_attempts``), so submitted work survives a restart;
+the re-run resumes from the document's ingestion checkpoints
+(raglite.ingestion.checkpoint). The manager is created on the first job tool
+call; at server startup ``resume_ingestion_jobs`` starts it only if a job table
+already exists, so an unwritable data directory never stops the server.
+
+Job runs go through ``ingest_flight``, the same singleflight as the ingest
+tool: a job and a tool call for the same file and content ingest it once.
+
+Stage progress comes from the pipeline's tracing spans (convert, chunk, embed,
+upload). Cancellation is cooperative: a running job stops at its next stage or
+embedding batch.
+
+Example:
+    >>> manager = get_job_manager()
+    >>> job = manager.submit("reports/annual_2024.pdf")
+    >>> manager.get(job.job_id).stage
+    'embed'
+"""
+
+import asyncio
+import hashlib
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import closing, contextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.metrics import COALESCED_REQUESTS
+from raglite.shared.models import DocumentMetadata, IngestionJobStatus, JobID
+from raglite.shared.scheduler import get_ingestion_admission
+from raglite.shared.singleflight import SingleFlight
+from raglite.shared.tracing import Span, observe_spans
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingestion_jobs (
+    job_id TEXT PRIMARY KEY,
+    doc_path TEXT NOT NULL,
+    status TEXT NOT NULL,
+    stage TEXT,
+    stage_started_at REAL,
+    chunks_total INTEGER,
+    chunks_embedded INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    submitted_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS ingestion_jobs_queue ON ingestion_jobs (status, submitted_at);
+"""
+
+# Pipeline span name -> job stage reported to clients
+_STAGES = {
+    "convert": "convert",
+    "chunk_by_docling_items": "chunk",
+    "chunk_document": "chunk",
+    "generate_embeddings": "embed",
+    "store_vectors": "upload",
+}
+
+# Seconds between progress writes and between cross-process cancel checks
+_PROGRESS_INTERVAL = 0.5
+_CANCEL_POLL_INTERVAL = 1.0
+
+# Idle workers re-check the queue this often (picks up jobs submitted elsewhere)
+_IDLE_POLL_SECONDS = 2.0
+
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+# Identical in-flight ingestions (same file path and content) share one execution,
+# whether started by the ingest tool or by a job worker
+ingest_flight: SingleFlight[DocumentMetadata] = SingleFlight("ingest")
+
+
+class JobNotFoundError(Exception):
+    """Raised when a JobID does not exist in the job table."""
+
+    pass
+
+
+class JobCancelledError(Exception):
+    """Raised inside a running job when cancellation was requested."""
+
+    pass
+
+
+class JobsUnavailableError(Exception):
+    """Raised when the job table cannot be opened (e.g. unwritable data directory)."""
+
+    pass
+
+
+def document_key(doc_path: str) -> tuple[str, str] | None:
+    """Coalescing key of a document: resolved path and content sha256 (None if missing)."""
+    path = Path(doc_path).resolve()
+    if not path.is_file():
+        return None  # The pipeline reports the missing file
+    with path.open("rb") as f:
+        return str(path), hashlib.file_digest(f, "sha256").hexdigest()
+
+
+async def _ingest_coalesced(doc_path: str) -> DocumentMetadata:
+    """Ingest a document, joining an identical ingestion already in flight."""
+    from raglite.ingestion.pipeline import ingest_document
+
+    key = await asyncio.to_thread(document_key, doc_path)
+    if key is None:
+        return await ingest_document(doc_path)
+    return await ingest_flight.do(key, lambda: ingest_document(doc_path, content_digest=key[1]))
+
+
+def _iso(timestamp: float | None) -> str | None:
+    return datetime.fromtimestamp(timestamp, tz=UTC).isoformat() if timestamp else None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class _JobProgress:
+    """Span observer that records a running job's stage and embedding progress.
+
+    Also raises JobCancelledError at the next span once cancellation was
+    requested (in-process event, or the cancel flag set by another process).
+    """
+
+    def __init__(self, manager: "JobManager", job_id: JobID, cancel: threading.Event) -> None:
+        self._manager = manager
+        self._job_id = job_id
+        self._cancel = cancel
+        self._embedded = 0
+        self._last_write = 0.0
+        self._last_cancel_poll = float("-inf")  # First check reads the cancel flag
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _check_cancel(self) -> None:
+        now = time.monotonic()
+        if not self._cancel.is_set() and now - self._last_cancel_poll >= _CANCEL_POLL_INTERVAL:
+            self._last_cancel_poll = now
+            if self._manager._cancel_requested(self._job_id):
+                self._cancel.set()
+        if self._cancel.is_set():
+            raise JobCancelledError(f"Ingestion job {self._job_id} cancelled")
+
+    def on_span_start(self, span: Span) -> None:
+        self._check_cancel()
+        stage = _STAGES.get(span.name)
+        if stage is None:
+            return
+        fields: dict[str, Any] = {"stage": stage, "stage_started_at": time.time()}
+        if stage == "embed":
+            self._embedded = 0
+            fields.update(chunks_total=span.attributes.get("chunks"), chunks_embedded=0)
+        self._manager._update(self._job_id, **fields)
+
+    def on_span_end(self, span: Span) -> None:
+        if span.name == "embed.batch" and span.status == "ok":
+            self._embedded += int(span.attributes.get("batch_size", 0))
+            now = time.monotonic()
+            if now - self._last_write >= _PROGRESS_INTERVAL:
+                self._last_write = now
+                self._manager._update(self._job_id, chunks_embedded=self._embedded)
+        elif span.name == "generate_embeddings":
+            self._manager._update(self._job_id, chunks_embedded=self._embedded)
+
+
+class JobManager:
+    """Persistent ingestion job queue with in-process worker threads.
+
+    Args:
+        db_path: SQLite database file (created if missing)
+        workers: Number of worker threads running ingestions
+        max_attempts: Attempts before an interrupted job is marked failed
+    """
+
+    def __init__(self, db_path: str | Path, workers: int = 1, max_attempts: int = 3) -> None:
+        self.db_path = Path(db_path)
+        self.workers = max(1, workers)
+        self.max_attempts = max_attempts
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._threads: list[threading.Thread] = []
+        self._cancel_events: dict[JobID, threading.Event] = {}
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: safe across worker threads
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction holding the database write lock from the start."""
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def _update(self, job_id: JobID, **fields: Any) -> None:
+        assignments = ", ".join(f"{name} = ?" for name in fields)
+        with closing(self._connect()) as conn:
+            conn.execute(
+                f"UPDATE ingestion_jobs SET {assignments} WHERE job_id = ?",  # nosec B608
+                (*fields.values(), job_id),
+            )
+
+    def _cancel_requested(self, job_id: JobID) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT cancel_requested FROM ingestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def start(self) -> None:
+        """Re-queue jobs orphaned by a previous process and start worker threads."""
+        with self._lock:
+            if self._threads:
+                return
+            self.recover_orphaned_jobs()
+            for i in range(self.workers):
+                thread = threading.Thread(
+                    target=self._worker_loop, name=f"raglite-ingest-job-{i}", daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        self._wakeup.set()
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Stop workers after their current job (running jobs are resumed on restart)."""
+        self._stop.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+
+    def recover_orphaned_jobs(self) -> int:
+        """Re-queue running jobs whose owning process on this host has exited.
+
+        Jobs cancelled while their process was down are marked cancelled instead.
+
+        Returns:
+            Number of jobs re-queued
+        """
+        host = socket.gethostname()
+        requeued = 0
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT job_id, owner, attempts, cancel_requested FROM ingestion_jobs "
+                "WHERE status = 'running'"
+            ).fetchall()
+            for row in rows:
+                owner_host, _, pid = (row["owner"] or "").rpartition(":")
+                if owner_host != host or not pid.isdigit() or _pid_alive(int(pid)):
+                    continue
+                if row["cancel_requested"]:
+                    conn.execute(
+                        "UPDATE ingestion_jobs SET status = 'cancelled', finished_at = ? "
+                        "WHERE job_id = ?",
+                        (time.time(), row["job_id"]),
+                    )
+                    continue
+                if row["attempts"] >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE ingestion_jobs SET status = 'failed', finished_at = ?, "
+                        "error = ? WHERE job_id = ?",
+                        (
+                            time.time(),
+                            f"Interrupted {row['attempts']} times (server restarts)",
+                            row["job_id"],
+                        ),
+                    )
+                    continue
+                conn.execute(
+                    "UPDATE ingestion_jobs SET status = 'queued', owner = NULL, stage = NULL, "
+                    "stage_started_at = NULL, chunks_embedded = 0 WHERE job_id = ?",
+                    (row["job_id"],),
+                )
+                requeued += 1
+        if requeued:
+            logger.info("Resuming interrupted ingestion jobs", extra={"jobs": requeued})
+        return requeued
+
+    def submit(self, doc_path: str) -> IngestionJobStatus:
+        """Queue a document for background ingestion.
+
+        A document that is already queued (same absolute path) is not queued
+        again: the existing job is returned. The queued job reads the file when
+        it starts, so it covers the re-submitted content too.
+
+        Args:
+            doc_path: Path to the document (stored as an absolute path)
+
+        Returns:
+            IngestionJobStatus of the queued job (job_id for polling)
+
+        Raises:
+            FileNotFoundError: If the document doesn't exist
+        """
+        path = Path(doc_path).resolve()
+        if not path.is_file():
+            raise FileNotFoundError(f"Document file not found: {doc_path}")
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT job_id FROM ingestion_jobs WHERE doc_path = ? AND status = 'queued' "
+                "AND cancel_requested = 0",
+                (str(path),),
+            ).fetchone()
+            queued = row is not None
+            job_id = row["job_id"] if queued else uuid.uuid4().hex
+            if not queued:
+                conn.execute(
+                    "INSERT INTO ingestion_jobs (job_id, doc_path, status, submitted_at) "
+                    "VALUES (?, ?, 'queued', ?)",
+                    (job_id, str(path), time.time()),
+                )
+        if queued:
+            COALESCED_REQUESTS.labels(kind="ingest_job").inc()
+            logger.info("Ingestion job already queued", extra={"job_id": job_id, "path": str(path)})
+            return self.get(job_id)
+        logger.info("Ingestion job submitted", extra={"job_id": job_id, "path": str(path)})
+        self._wakeup.set()
+        return self.get(job_id)
+
+    def get(self, job_id: JobID) -> IngestionJobStatus:
+        """Return the status of a job.
+
+        Raises:
+            JobNotFoundError: If the JobID is unknown
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT * FROM ingestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            raise JobNotFoundError(f"Ingestion job not found: {job_id}")
+        return self._to_status(row)
+
+    def cancel(self, job_id: JobID) -> IngestionJobStatus:
+        """Cancel a job: queued jobs never start, running jobs stop at the next stage.
+
+        Raises:
+            JobNotFoundError: If the JobID is unknown
+        """
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT status FROM ingestion_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                raise JobNotFoundError(f"Ingestion job not found: {job_id}")
+            if row["status"] == "queued":
+                conn.execute(
+                    "UPDATE ingestion_jobs SET status = 'cancelled', cancel_requested = 1, "
+                    "finished_at = ? WHERE job_id = ?",
+                    (time.time(), job_id),
+                )
+            elif row["status"] == "running":
+                conn.execute(
+                    "UPDATE ingestion_jobs SET cancel_requested = 1 WHERE job_id = ?", (job_id,)
+                )
+        event = self._cancel_events.get(job_id)
+        if event is not None:
+            event.set()
+        logger.info("Ingestion job cancel requested", extra={"job_id": job_id})
+        return self.get(job_id)
+
+    def _claim(self) -> tuple[JobID, str] | None:
+        """Atomically move the oldest queued job to running for this process."""
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT job_id, doc_path FROM ingestion_jobs WHERE status = 'queued' "
+                "AND cancel_requested = 0 ORDER BY submitted_at, rowid LIMIT 1"
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE ingestion_jobs SET status = 'running', owner = ?, started_at = ?, "
+                "attempts = attempts + 1 WHERE job_id = ?",
+                (self.owner, time.time(), row["job_id"]),
+            )
+            return row["job_id"], row["doc_path"]
+
+    def _worker_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self._claim()
+            except sqlite3.Error as e:
+                logger.error("Failed to claim ingestion job", extra={"error": str(e)})
+                claimed = None
+            if claimed is None:
+                self._wakeup.wait(_IDLE_POLL_SECONDS)
+                self._wakeup.clear()
+                continue
+            self._run(*claimed)
+
+    def _run(self, job_id: JobID, doc_path: str) -> None:
+        """Run one claimed job to completion, failure or cancellation."""
+        cancel = threading.Event()
+        self._cancel_events[job_id] = cancel
+        progress = _JobProgress(self, job_id, cancel)
+        logger.info("Ingestion job started", extra={"job_id": job_id, "path": doc_path})
+        admission = get_ingestion_admission()
+        admission.acquire(reject=False)  # Shares the ingestion limit with tool calls
+        try:
+            with observe_spans(progress):
+                progress._check_cancel()
+                metadata = asyncio.run(_ingest_coalesced(doc_path))
+        except Exception as e:
+            if progress.cancelled:
+                self._update(job_id, status="cancelled", finished_at=time.time())
+                logger.info("Ingestion job cancelled", extra={"job_id": job_id})
+            else:
+                self._update(job_id, status="failed", finished_at=time.time(), error=str(e))
+                logger.error(
+                    "Ingestion job failed",
+                    extra={"job_id": job_id, "path": doc_path, "error": str(e)},
+                    exc_info=True,
+                )
+        else:
+            self._update(
+                job_id,
+                status="succeeded",
+                stage=None,
+                finished_at=time.time(),
+                result=metadata.model_dump_json(),
+            )
+            logger.info(
+                "Ingestion job complete",
+                extra={"job_id": job_id, "chunks": metadata.chunk_count},
+            )
+        finally:
+            admission.release()
+            self._cancel_events.pop(job_id, None)
+
+    @staticmethod
+    def _to_status(row: sqlite3.Row) -> IngestionJobStatus:
+        progress = None
+        chunks_per_second = None
+        if row["stage"] == "embed" and row["chunks_total"]:
+            progress = round(row["chunks_embedded"] / row["chunks_total"], 4)
+            elapsed = time.time() - (row["stage_started_at"] or time.time())
+            if elapsed > 0 and row["chunks_embedded"]:
+                chunks_per_second = round(row["chunks_embedded"] / elapsed, 2)
+        return IngestionJobStatus(
+            job_id=row["job_id"],
+            doc_path=row["doc_path"],
+            status=row["status"],
+            stage=row["stage"],
+            progress=progress,
+            chunks_embedded=row["chunks_embedded"],
+            chunks_total=row["chunks_total"],
+            chunks_per_second=chunks_per_second,
+            attempts=row["attempts"],
+            cancel_requested=bool(row["cancel_requested"]),
+            submitted_at=_iso(row["submitted_at"]) or "",
+            started_at=_iso(row["started_at"]),
+            finished_at=_iso(row["finished_at"]),
+            error=row["error"],
+            result=DocumentMetadata.model_validate_json(row["result"]) if row["result"] else None,
+        )
+
+
+# Module-level manager (created and started on first use)
+_job_manager: JobManager | None = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    """Return the process-wide JobManager, starting its workers on first use.
+
+    Starting also re-queues jobs interrupted by a previous server process.
+
+    Raises:
+        JobsUnavailableError: If the job table cannot be created or opened
+    """
+    global _job_manager
+
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                db_path = Path(settings.ingest_jobs_db_path).resolve()
+                try:
+                    manager = JobManager(
+                        db_path,
+                        workers=settings.ingest_job_workers,
+                        max_attempts=settings.ingest_job_max_attempts,
+                    )
+                    manager.start()
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning(
+                        "Ingestion jobs unavailable",
+                        extra={"db_path": str(db_path), "error": str(e)},
+                    )
+                    raise JobsUnavailableError(
+                        f"Ingestion jobs unavailable: cannot open job table {db_path}: {e}"
+                    ) from e
+                _job_manager = manager
+    return _job_manager
+
+
+def resume_ingestion_jobs() -> None:
+    """Start the job workers at server startup if a job table already exists.
+
+    Jobs interrupted by a previous server process resume without waiting for a
+    job tool call. A missing table is not created here, and one that cannot be
+    opened only disables jobs (logged); the server starts either way.
+    """
+    if not Path(settings.ingest_jobs_db_path).exists():
+        return
+    try:
+        get_job_manager()
+    except JobsUnavailableError:
+        pass  # Logged by get_job_manager; job tools report the error
+
+
+def shutdown_job_manager(timeout: float | None = None) -> None:
+    """Stop the job workers if the manager was started (never creates one)."""
+    if _job_manager is not None:
+        _job_manager.shutdown(timeout)
@@ -3,26 +3,87 @@
 Extracts text, tables, and page numbers from financial documents with high accuracy.
 """
 
+import asyncio
+import threading
 import time
-import uuid
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any, Literal, TypeVar, overload
 
+import numpy as np
 import openpyxl
 import pandas as pd
 from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions, TableFormerMode
+from docling.datamodel.pipeline_options import (
+    AcceleratorOptions,
+    PdfPipelineOptions,
+    TableFormerMode,
+)
 from docling.document_converter import ConversionResult, DocumentConverter, PdfFormatOption
-from docling_core.types.doc import TableItem
-from qdrant_client.models import Distance, PointStruct, VectorParams
-
-from raglite.shared.clients import get_embedding_model, get_qdrant_client
+from docling_core.types.doc import DoclingDocument, TableItem
+from qdrant_client.models import (
+    CollectionStatus,
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    HnswConfigDiff,
+    MatchAny,
+    MatchValue,
+    OptimizersConfigDiff,
+    PayloadSchemaType,
+    PointStruct,
+    Range,
+    VectorParams,
+)
+
+from raglite.ingestion.checkpoint import IngestionCheckpoint
+from raglite.shared.clients import get_embedding_model, get_vector_store
 from raglite.shared.config import settings
+from raglite.shared.epoch import bump_collection_epoch
 from raglite.shared.logging import get_logger
-from raglite.shared.models import Chunk, DocumentMetadata
+from raglite.shared.metrics import CACHE_REQUESTS, INGEST_CHUNKS, INGEST_STAGE_SECONDS
+from raglite.shared.models import (
+    Chunk,
+    ChunkBatch,
+    DocumentMetadata,
+    IngestionTimings,
+    chunk_point_id,
+)
+from raglite.shared.scheduler import Priority, embed_with_priority, run_ingest_task
+from raglite.shared.threads import get_thread_budget
+from raglite.shared.tracing import span
 
 logger = get_logger(__name__)
 
+# Supported document extensions (see ingest_document routing)
+SUPPORTED_EXTENSIONS = (".pdf", ".xlsx", ".xls")
+
+# Payload fields indexed on every collection (filtered search and per-document counts)
+PAYLOAD_INDEXES: dict[str, PayloadSchemaType] = {
+    "source_document": PayloadSchemaType.KEYWORD,
+    "source_path": PayloadSchemaType.KEYWORD,  # Per-document counts and stale-chunk deletes
+    "chunk_index": PayloadSchemaType.INTEGER,  # Adjacent-chunk lookups and range filters
+}
+
+# Collection schemas verified in this process (collection name -> vector size)
+_collection_registry: dict[str, int] = {}
+
+# Bulk loads in progress per collection, across all threads and event loops
+# (bulk_load_mode), and the HNSW m each collection is restored to
+_bulk_load_users: dict[str, int] = {}
+_bulk_load_restore_m: dict[str, int] = {}
+_bulk_load_lock = threading.Lock()
+
+# Shared Docling converter (get_document_converter); pipeline models load once per process
+_document_converter: DocumentConverter | None = None
+_document_converter_lock = threading.Lock()
+
+# Ingestion stages accept either a list of Chunk objects or a columnar ChunkBatch
+ChunksT = TypeVar("ChunksT", list[Chunk], ChunkBatch)
+
 
 # Exception classes
 class EmbeddingGenerationError(Exception):
@@ -37,17 +98,23 @@ class VectorStorageError(Exception):
     pass
 
 
-async def generate_embeddings(chunks: list[Chunk]) -> list[Chunk]:
+async def generate_embeddings(
+    chunks: ChunksT, checkpoint: IngestionCheckpoint | None = None
+) -> ChunksT:
     """Generate Fin-E5 embeddings for document chunks.
 
     Processes chunks in batches of 32 for memory efficiency. Populates the
-    embedding field of each Chunk with 1024-dimensional vectors.
+    embedding field of each Chunk with 1024-dimensional vectors. For a
+    ChunkBatch, embeddings are written into its float32 ``embeddings`` matrix
+    instead (no per-chunk list conversion).
 
     Args:
-        chunks: List of Chunk objects from chunking pipeline
+        chunks: List of Chunk objects or a ChunkBatch from chunking pipeline
+        checkpoint: Reuse batches embedded by an earlier attempt and record new
+            ones (resumable ingestion)
 
     Returns:
-        Same list with embedding field populated (1024-dimensional vectors)
+        Same list/batch with embeddings populated (1024-dimensional vectors)
 
     Raises:
         EmbeddingGenerationError: If embedding generation fails
@@ -56,6 +123,7 @@ async def generate_embeddings(chunks: list[Chunk]) -> list[Chunk]:
         - Batch processing: 32 chunks per batch for memory efficiency
         - Fin-E5 model: intfloat/e5-large-v2 (1024 dimensions)
         - Model cached: Loaded once at module level, reused across calls
+        - Scheduling: batches run on the shared embedder thread behind queries
         - Empty chunks: Handled gracefully (skip or zero vector)
         - Performance: <2 minutes target for 300-chunk document
 
@@ -73,29 +141,55 @@ async def generate_embeddings(chunks: list[Chunk]) -> list[Chunk]:
 
     if not chunks:
         logger.warning("No chunks provided for embedding generation")
-        return []
+        return chunks
 
     # Load model (singleton pattern)
     model = get_embedding_model()
     batch_size = 32
+    columnar = isinstance(chunks, ChunkBatch)
+    resumed_batches = 0
 
     # Process in batches
     for i in range(0, len(chunks), batch_size):
-        batch = chunks[i : i + batch_size]
-        texts = [chunk.content for chunk in batch]
+        if isinstance(chunks, ChunkBatch):
+            texts = chunks.contents(i, i + batch_size)
+        else:
+            texts = [chunk.content for chunk in chunks[i : i + batch_size]]
 
         try:
-            # Generate embeddings for batch
-            embeddings = model.encode(texts, batch_size=batch_size, show_progress_bar=False)
-
-            # Populate embedding field (convert numpy array to list for JSON serialization)
-            for chunk, embedding in zip(batch, embeddings, strict=False):
-                chunk.embedding = embedding.tolist()
+            cached = checkpoint.load_embeddings(i, len(texts)) if checkpoint else None
+            if cached is not None:
+                embeddings = cached
+                resumed_batches += 1
+            else:
+                # Generate embeddings for batch
+                with span("embed.batch", batch_index=i // batch_size + 1, batch_size=len(texts)):
+                    embeddings = await embed_with_priority(
+                        Priority.INGEST,
+                        model.encode,
+                        texts,
+                        batch_size=batch_size,
+                        show_progress_bar=False,
+                    )
+                if checkpoint is not None:
+                    checkpoint.save_embeddings(i, embeddings)
+
+            if isinstance(chunks, ChunkBatch):
+                # Write rows straight into the batch's float32 matrix
+                if chunks.embeddings is None:
+                    chunks.embeddings = np.empty(
+                        (len(chunks), embeddings.shape[1]), dtype=np.float32
+                    )
+                chunks.embeddings[i : i + len(texts)] = embeddings
+            else:
+                # Populate embedding field (convert numpy array to list for JSON serialization)
+                for chunk, embedding in zip(chunks[i : i + batch_size], embeddings, strict=False):
+                    chunk.embedding = embedding.tolist()
 
             logger.info(
                 f"Batch {i // batch_size + 1} complete",
                 extra={
-                    "batch_size": len(batch),
+                    "batch_size": len(texts),
                     "embeddings_shape": str(embeddings.shape),
                     "batch_index": i // batch_size + 1,
                 },
@@ -107,7 +201,7 @@ async def generate_embeddings(chunks: list[Chunk]) -> list[Chunk]:
                 "Embedding generation failed for batch",
                 extra={
                     "batch_index": i // batch_size + 1,
-                    "batch_size": len(batch),
+                    "batch_size": len(texts),
                     "error": str(e),
                 },
                 exc_info=True,
@@ -115,14 +209,20 @@ async def generate_embeddings(chunks: list[Chunk]) -> list[Chunk]:
             raise EmbeddingGenerationError(error_msg) from e
 
     # Calculate final metrics
+    INGEST_STAGE_SECONDS.labels(stage="embed").observe(time.time() - start_time)
     duration_ms = int((time.time() - start_time) * 1000)
-    embedding_dim = len(chunks[0].embedding) if chunks and chunks[0].embedding else 0
+    if isinstance(chunks, ChunkBatch):
+        embedding_dim = chunks.embeddings.shape[1] if chunks.embeddings is not None else 0
+    else:
+        embedding_dim = len(chunks[0].embedding) if chunks[0].embedding else 0
 
     logger.info(
         "Embedding generation complete",
         extra={
             "chunk_count": len(chunks),
             "dimensions": embedding_dim,
+            "columnar": columnar,
+            "resumed_batches": resumed_batches,
             "duration_ms": duration_ms,
             "chunks_per_second": round(len(chunks) / (duration_ms / 1000), 2)
             if duration_ms > 0
@@ -133,68 +233,122 @@ async def generate_embeddings(chunks: list[Chunk]) -> list[Chunk]:
     return chunks
 
 
+def reset_collection_registry(collection_name: str | None = None) -> None:
+    """Forget cached collection schemas so the next create_collection re-checks Qdrant.
+
+    Call after deleting or recreating a collection outside create_collection.
+
+    Args:
+        collection_name: Collection to forget (default: all collections)
+    """
+    if collection_name is None:
+        _collection_registry.clear()
+    else:
+        _collection_registry.pop(collection_name, None)
+
+
 def create_collection(
     collection_name: str = "financial_docs",
     vector_size: int = 1024,
     distance: Distance = Distance.COSINE,
+    bulk_load: bool = False,
 ) -> None:
     """Create Qdrant collection if it doesn't exist.
 
-    Checks for existing collection before creation to ensure idempotency.
-    Configures collection with HNSW indexing (default) for optimal retrieval
-    performance and COSINE distance for semantic similarity.
+    The collection schema is checked against Qdrant once per process and cached
+    in a registry, so repeated calls (one per ingested document) make no
+    control-plane requests. Configures collection with HNSW indexing (default)
+    for optimal retrieval performance and COSINE distance for semantic similarity.
 
     Args:
         collection_name: Name of the collection (default: financial_docs)
         vector_size: Vector dimension (default: 1024 for Fin-E5)
         distance: Distance metric (default: COSINE for embeddings)
+        bulk_load: Create with HNSW indexing disabled (m=0); see bulk_load_mode()
 
     Raises:
-        VectorStorageError: If collection creation fails
+        VectorStorageError: If collection creation fails or the existing
+            collection has a different vector size
 
     Strategy:
+        - Return immediately if the schema is already in the process registry
         - Check if collection exists (idempotent operation)
-        - Create with HNSW indexing (default, O(log n) search complexity)
-        - COSINE distance for semantic similarity (best for embeddings)
-        - No manual index configuration needed (Qdrant uses optimal defaults)
+        - Existing collection: verify vector size, add missing payload indexes
+        - New collection: create with HNSW indexing (default, O(log n) search)
+          and COSINE distance, then create payload indexes (PAYLOAD_INDEXES)
 
     Example:
         >>> create_collection("financial_docs", vector_size=1024)
-        >>> # Safe to call multiple times - won't error if exists
+        >>> # Safe to call multiple times - cached after the first call
         >>> create_collection("financial_docs", vector_size=1024)
     """
-    client = get_qdrant_client()
+    cached_size = _collection_registry.get(collection_name)
+    CACHE_REQUESTS.labels(
+        cache="collection_schema", result="miss" if cached_size is None else "hit"
+    ).inc()
+    if cached_size is not None:
+        if cached_size != vector_size:
+            raise VectorStorageError(
+                f"Collection {collection_name} has vector size {cached_size}, expected {vector_size}"
+            )
+        return
+
+    client = get_vector_store()
 
     try:
-        # Check if collection exists
-        collections = client.get_collections().collections
-        existing = [c.name for c in collections]
+        if client.collection_exists(collection_name):
+            info = client.get_collection(collection_name)
+            vectors = info.config.params.vectors
+            existing_size = vectors.size if isinstance(vectors, VectorParams) else None
+            if existing_size is not None and existing_size != vector_size:
+                raise VectorStorageError(
+                    f"Collection {collection_name} has vector size {existing_size}, "
+                    f"expected {vector_size}"
+                )
 
-        if collection_name in existing:
+            missing = {
+                field: schema
+                for field, schema in PAYLOAD_INDEXES.items()
+                if field not in (info.payload_schema or {})
+            }
             logger.info(
                 "Collection already exists",
-                extra={"collection": collection_name, "status": "exists"},
+                extra={
+                    "collection": collection_name,
+                    "status": "exists",
+                    "missing_indexes": sorted(missing),
+                },
+            )
+        else:
+            # Create collection with HNSW indexing (default), or deferred for bulk loads
+            logger.info(
+                "Creating Qdrant collection",
+                extra={
+                    "collection": collection_name,
+                    "vector_size": vector_size,
+                    "distance": distance.name,
+                    "indexing": "deferred (bulk load)" if bulk_load else "HNSW (default)",
+                },
             )
-            return
 
-        # Create collection with HNSW indexing (default)
-        logger.info(
-            "Creating Qdrant collection",
-            extra={
-                "collection": collection_name,
-                "vector_size": vector_size,
-                "distance": distance.name,
-                "indexing": "HNSW (default)",
-            },
-        )
+            client.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(size=vector_size, distance=distance),
+                hnsw_config=HnswConfigDiff(m=0) if bulk_load else None,
+            )
+            missing = dict(PAYLOAD_INDEXES)
+            # A recreated collection must not serve results cached from its predecessor
+            bump_collection_epoch(collection_name)
 
-        client.create_collection(
-            collection_name=collection_name,
-            vectors_config=VectorParams(size=vector_size, distance=distance),
-        )
+            logger.info("Collection created successfully", extra={"collection": collection_name})
 
-        logger.info("Collection created successfully", extra={"collection": collection_name})
+        for field, schema in missing.items():
+            client.create_payload_index(
+                collection_name=collection_name, field_name=field, field_schema=schema, wait=True
+            )
 
+    except VectorStorageError:
+        raise
     except Exception as e:
         logger.error(
             "Collection creation failed",
@@ -203,32 +357,264 @@ def create_collection(
         )
         raise VectorStorageError(f"Failed to create collection {collection_name}: {e}") from e
 
+    _collection_registry[collection_name] = vector_size
+
+
+def wait_for_collection_optimized(collection_name: str, timeout: float | None = None) -> bool:
+    """Block until Qdrant reports the collection as fully optimized (status GREEN).
+
+    Sleeps between polls: call it from a worker thread in async code.
+
+    Args:
+        collection_name: Collection to wait on
+        timeout: Maximum seconds to wait (default: settings.qdrant_optimize_timeout_seconds)
+
+    Returns:
+        True if the collection reached GREEN, False on timeout
+
+    Note:
+        GREY status means optimizations are pending but not triggered; an empty
+        optimizer config update is sent once to trigger them.
+    """
+    client = get_vector_store()
+    deadline = time.monotonic() + (
+        settings.qdrant_optimize_timeout_seconds if timeout is None else timeout
+    )
+    delay = 0.5
+    triggered = False
+
+    while True:
+        status = client.get_collection(collection_name).status
+        if status == CollectionStatus.GREEN:
+            return True
+        if status == CollectionStatus.GREY and not triggered:
+            client.update_collection(collection_name, optimizers_config=OptimizersConfigDiff())
+            triggered = True
+        if time.monotonic() >= deadline:
+            logger.warning(
+                "Timed out waiting for collection optimization",
+                extra={"collection": collection_name, "status": str(status)},
+            )
+            return False
+        time.sleep(delay)
+        delay = min(delay * 2, 5.0)
+
+
+def _acquire_bulk_load(collection_name: str, vector_size: int) -> None:
+    """Register a bulk load; the first one on a collection defers its HNSW indexing."""
+    with _bulk_load_lock:
+        users = _bulk_load_users.get(collection_name, 0)
+        if users == 0:
+            client = get_vector_store()
+            create_collection(collection_name, vector_size=vector_size, bulk_load=True)
+            try:
+                hnsw_m = client.get_collection(collection_name).config.hnsw_config.m
+                if hnsw_m != 0:
+                    client.update_collection(collection_name, hnsw_config=HnswConfigDiff(m=0))
+            except Exception as e:
+                raise VectorStorageError(
+                    f"Failed to enable bulk-load mode for {collection_name}: {e}"
+                ) from e
+            # m=0 left behind by an interrupted bulk load restores to the configured default
+            _bulk_load_restore_m[collection_name] = hnsw_m or settings.qdrant_hnsw_m
+            logger.info(
+                "Bulk-load mode enabled (HNSW indexing deferred)",
+                extra={
+                    "collection": collection_name,
+                    "restore_m": _bulk_load_restore_m[collection_name],
+                },
+            )
+        _bulk_load_users[collection_name] = users + 1
+
+
+def _release_bulk_load(collection_name: str) -> int | None:
+    """Unregister a bulk load; the last one restores HNSW indexing and returns its m."""
+    with _bulk_load_lock:
+        users = _bulk_load_users[collection_name] - 1
+        if users:
+            _bulk_load_users[collection_name] = users
+            return None
+        del _bulk_load_users[collection_name]
+        restore_m = _bulk_load_restore_m.pop(collection_name)
+        get_vector_store().update_collection(
+            collection_name, hnsw_config=HnswConfigDiff(m=restore_m)
+        )
+        return restore_m
+
+
+@asynccontextmanager
+async def bulk_load_mode(
+    collection_name: str = "financial_docs", vector_size: int = 1024
+) -> AsyncIterator[None]:
+    """Defer HNSW indexing while streaming a large ingest into Qdrant.
+
+    Sets HNSW ``m=0`` so Qdrant stops building graph segments during upserts,
+    then restores the HNSW config on exit and waits until optimization finishes,
+    so ingest and concurrent queries don't compete with continuous index rebuilds.
+    Overlapping bulk loads of a collection (nested blocks, concurrent jobs or
+    tool calls in any thread) share one deferral: indexing is restored when the
+    last of them exits. Config updates and the optimization wait run in worker
+    threads, so queries on the event loop keep being served.
+
+    Args:
+        collection_name: Collection to bulk load (created with indexing off if missing)
+        vector_size: Vector dimension used if the collection must be created
+
+    Raises:
+        VectorStorageError: If the collection config cannot be changed
+
+    Example:
+        >>> async with bulk_load_mode("financial_docs"):
+        ...     for path in report_paths:
+        ...         await ingest_document(path)
+    """
+    await asyncio.to_thread(_acquire_bulk_load, collection_name, vector_size)
+    start_time = time.time()
+    try:
+        yield
+    finally:
+        restore_m = await asyncio.to_thread(_release_bulk_load, collection_name)
+        if restore_m is not None:
+            optimized = await asyncio.to_thread(wait_for_collection_optimized, collection_name)
+            logger.info(
+                "Bulk-load mode finished (HNSW index restored)",
+                extra={
+                    "collection": collection_name,
+                    "hnsw_m": restore_m,
+                    "optimized": optimized,
+                    "duration_ms": int((time.time() - start_time) * 1000),
+                },
+            )
+
+
+def _document_source(metadata: DocumentMetadata) -> str:
+    """Identity of a document in point IDs and payloads: its resolved path, else file name."""
+    return metadata.source_path or metadata.filename
+
+
+def _build_points(chunks: list[Chunk] | ChunkBatch, collection_name: str) -> list[PointStruct]:
+    """Convert chunks with embeddings into Qdrant points with retrieval payloads.
+
+    ChunkBatch rows are read straight from the shared text buffer and embedding
+    matrix, and points are built without pydantic re-validation.
+    """
+    points = []
+
+    if isinstance(chunks, ChunkBatch):
+        if chunks.embeddings is None:
+            logger.warning(
+                "Chunk batch has no embeddings, skipping",
+                extra={"doc_filename": chunks.metadata.filename, "collection": collection_name},
+            )
+            return points
+
+        source_document = chunks.metadata.filename
+        source_path = _document_source(chunks.metadata)
+        vectors = chunks.embeddings.tolist()
+        for i, content in enumerate(chunks.contents()):
+            points.append(
+                PointStruct.model_construct(
+                    id=chunk_point_id(source_path, chunks.chunk_id(i)),
+                    vector=vectors[i],
+                    payload={
+                        "chunk_id": chunks.chunk_id(i),
+                        "text": content,
+                        "word_count": len(content.split()),
+                        "source_document": source_document,
+                        "source_path": source_path,
+                        "page_number": chunks.page_numbers[i],
+                        "chunk_index": chunks.chunk_indices[i],
+                    },
+                )
+            )
+        return points
+
+    for chunk in chunks:
+        if not chunk.embedding:
+            logger.warning(
+                "Chunk has no embedding, skipping",
+                extra={"chunk_id": chunk.chunk_id, "collection": collection_name},
+            )
+            continue
+
+        # Calculate word count from content
+        word_count = len(chunk.content.split())
+
+        source_path = _document_source(chunk.metadata)
+        point = PointStruct(
+            id=chunk_point_id(source_path, chunk.chunk_id),
+            vector=chunk.embedding,
+            payload={
+                "chunk_id": chunk.chunk_id,
+                "text": chunk.content,
+                "word_count": word_count,
+                "source_document": chunk.metadata.filename,
+                "source_path": source_path,
+                "page_number": chunk.page_number,
+                "chunk_index": chunk.chunk_index,  # Use explicit field from Chunk model
+            },
+        )
+        points.append(point)
+
+    return points
+
+
+def _adaptive_batch_size(points: list[PointStruct]) -> int:
+    """Pick an upload batch size so each request stays near the target payload size.
+
+    Estimates the serialized size of a point from its vector dimension (JSON floats
+    average ~20 bytes) and payload text length, sampled over the first points.
+    """
+    sample = points[:64]
+    total_bytes = 0
+    for point in sample:
+        dim = len(point.vector) if isinstance(point.vector, list) else settings.embedding_dimension
+        total_bytes += dim * 20 + len((point.payload or {}).get("text", "")) + 256
+    avg_bytes = total_bytes / max(len(sample), 1)
+    batch_size = int(settings.qdrant_upload_target_batch_bytes // max(avg_bytes, 1))
+    return max(8, min(batch_size, settings.qdrant_upload_max_batch_size))
+
 
 async def store_vectors_in_qdrant(
-    chunks: list[Chunk], collection_name: str = "financial_docs", batch_size: int = 100
+    chunks: list[Chunk] | ChunkBatch,
+    collection_name: str = "financial_docs",
+    batch_size: int | None = None,
+    parallel: int | None = None,
 ) -> int:
     """Store document chunks with embeddings in Qdrant vector database.
 
-    Processes chunks in batches for memory efficiency. Generates unique UUIDs for
-    each point and stores all chunk metadata for retrieval and attribution.
+    Streams all but the last batch through Qdrant's parallel ``upload_points``
+    without waiting for acknowledgement of each write (``wait=False``), then
+    upserts the final batch with ``wait=True`` as a consistency barrier: Qdrant
+    applies updates in order, so once the barrier returns every earlier batch
+    has been applied. Point IDs are derived from the document path and chunk
+    ID, so storing a chunk again overwrites its point (uploads are safe to
+    replay), and chunks left over from an earlier, longer version of the
+    document are deleted. Stores all chunk metadata for retrieval and attribution.
 
     Args:
-        chunks: List of Chunk objects with embeddings from Story 1.5
+        chunks: List of Chunk objects or a ChunkBatch with embeddings from Story 1.5
         collection_name: Qdrant collection name (default: financial_docs)
-        batch_size: Vectors per batch (default: 100 for memory efficiency)
+        batch_size: Vectors per request (default: adaptive to payload size, see
+            settings.qdrant_upload_target_batch_bytes)
+        parallel: Upload worker processes (default: settings.qdrant_upload_parallel,
+            used only above settings.qdrant_upload_parallel_min_points)
 
     Returns:
-        Number of points successfully stored in Qdrant
+        Number of points stored in Qdrant for the chunks' source document(s)
 
     Raises:
         VectorStorageError: If storage fails
 
     Strategy:
         - Ensure collection exists (create if needed)
-        - Batch upload: 100 vectors per batch to prevent memory issues
-        - Generate unique UUID for each point (Qdrant requirement)
-        - Store metadata: chunk_id, text, word_count, source_document, page_number, chunk_index
-        - Validate: points_count == len(chunks) after storage
+        - Batch upload: batch size adapts to payload size (~4 MiB per request)
+        - Parallel, non-blocking upload for intermediate batches, final barrier upsert
+        - Deterministic UUID per chunk (chunk_point_id): replays overwrite, not duplicate
+        - Delete the document's points past its last chunk (re-ingested shorter version)
+        - Store metadata: chunk_id, text, word_count, source_document, source_path,
+          page_number, chunk_index
+        - Validate: exact count of points for the stored document(s) >= len(chunks)
         - Performance target: <30 seconds for 300 chunks (AC10)
 
     Example:
@@ -251,37 +637,13 @@ async def store_vectors_in_qdrant(
         logger.warning("No chunks provided for storage", extra={"collection": collection_name})
         return 0
 
-    # Ensure collection exists
+    # Ensure collection exists (cached after the first call in this process)
     create_collection(collection_name, vector_size=settings.embedding_dimension)
 
-    client = get_qdrant_client()
+    client = get_vector_store()
 
     # Prepare points for upload
-    points = []
-    for chunk in chunks:
-        if not chunk.embedding:
-            logger.warning(
-                "Chunk has no embedding, skipping",
-                extra={"chunk_id": chunk.chunk_id, "collection": collection_name},
-            )
-            continue
-
-        # Calculate word count from content
-        word_count = len(chunk.content.split())
-
-        point = PointStruct(
-            id=str(uuid.uuid4()),
-            vector=chunk.embedding,
-            payload={
-                "chunk_id": chunk.chunk_id,
-                "text": chunk.content,
-                "word_count": word_count,
-                "source_document": chunk.metadata.filename,
-                "page_number": chunk.page_number,
-                "chunk_index": chunk.chunk_index,  # Use explicit field from Chunk model
-            },
-        )
-        points.append(point)
+    points = _build_points(chunks, collection_name)
 
     if not points:
         logger.warning(
@@ -289,30 +651,94 @@ async def store_vectors_in_qdrant(
         )
         return 0
 
-    # Upload in batches
+    # Split into streamed intermediate batches and a final barrier batch
+    if batch_size is None:
+        batch_size = _adaptive_batch_size(points)
     total_batches = (len(points) + batch_size - 1) // batch_size
+    split = (total_batches - 1) * batch_size
+    streamed_points, final_points = points[:split], points[split:]
 
-    try:
-        for i in range(0, len(points), batch_size):
-            batch_num = (i // batch_size) + 1
-            batch_points = points[i : i + batch_size]
-
-            logger.info(
-                f"Uploading batch {batch_num}/{total_batches}",
-                extra={
-                    "batch_num": batch_num,
-                    "batch_size": len(batch_points),
-                    "total_batches": total_batches,
-                    "collection": collection_name,
-                },
-            )
+    if parallel is None:
+        parallel = settings.qdrant_upload_parallel
+    if len(points) < settings.qdrant_upload_parallel_min_points:
+        parallel = 1  # Worker process startup outweighs gains for small uploads
+    parallel = max(1, min(parallel, total_batches - 1))
 
-            client.upsert(collection_name=collection_name, points=batch_points)
+    logger.info(
+        "Uploading points",
+        extra={
+            "points": len(points),
+            "batch_size": batch_size,
+            "total_batches": total_batches,
+            "parallel": parallel,
+            "collection": collection_name,
+        },
+    )
 
-        # Verify storage (critical validation for AC9)
-        collection_info = client.get_collection(collection_name)
-        points_stored: int = collection_info.points_count or 0  # Handle None case
+    try:
+        upload_start = time.perf_counter()
+
+        if streamed_points:
+            with span(
+                "upload.stream",
+                points=len(streamed_points),
+                batches=total_batches - 1,
+                batch_size=batch_size,
+                parallel=parallel,
+            ):
+                client.upload_points(
+                    collection_name=collection_name,
+                    points=streamed_points,
+                    batch_size=batch_size,
+                    parallel=parallel,
+                    max_retries=settings.qdrant_upload_max_retries,
+                    wait=False,
+                )
 
+        # Consistency barrier: waits until this and all earlier batches are applied
+        with span("upload.barrier", points=len(final_points)):
+            client.upsert(collection_name=collection_name, points=final_points, wait=True)
+
+        # Chunks past the end of each document are left over from a longer earlier version
+        chunk_counts: dict[str, int] = {}
+        for point in points:
+            source_path, chunk_index = point.payload["source_path"], point.payload["chunk_index"]
+            chunk_counts[source_path] = max(chunk_counts.get(source_path, 0), chunk_index + 1)
+        with span("upload.delete_stale", documents=len(chunk_counts)):
+            for source_path, chunk_count in chunk_counts.items():
+                client.delete(
+                    collection_name=collection_name,
+                    points_selector=FilterSelector(
+                        filter=Filter(
+                            must=[
+                                FieldCondition(
+                                    key="source_path", match=MatchValue(value=source_path)
+                                ),
+                                FieldCondition(key="chunk_index", range=Range(gte=chunk_count)),
+                            ]
+                        )
+                    ),
+                    wait=True,
+                )
+        bump_collection_epoch(collection_name)  # Cached query results predate these points
+
+        upload_seconds = time.perf_counter() - upload_start
+
+        # Verify storage (critical validation for AC9): exact count scoped to the
+        # stored document(s), not the whole collection
+        with span("upload.verify", documents=len(chunk_counts)):
+            points_stored: int = client.count(
+                collection_name=collection_name,
+                count_filter=Filter(
+                    must=[
+                        FieldCondition(key="source_path", match=MatchAny(any=sorted(chunk_counts)))
+                    ]
+                ),
+                exact=True,
+            ).count
+
+        INGEST_STAGE_SECONDS.labels(stage="upload").observe(time.time() - start_time)
+        INGEST_CHUNKS.inc(len(points))
         duration_ms = int((time.time() - start_time) * 1000)
 
         logger.info(
@@ -321,13 +747,17 @@ async def store_vectors_in_qdrant(
                 "points_stored": points_stored,
                 "collection": collection_name,
                 "duration_ms": duration_ms,
+                "upload_ms": round(upload_seconds * 1000, 2),
+                "points_per_second": round(len(points) / upload_seconds, 2)
+                if upload_seconds > 0
+                else 0,
                 "chunks_per_second": round(len(chunks) / (duration_ms / 1000), 2)
                 if duration_ms > 0
                 else 0,
             },
         )
 
-        # Critical validation: points_count should match chunk_count (AC9)
+        # Critical validation: document point count should match chunk_count (AC9)
         if points_stored < len(chunks):
             logger.warning(
                 "Storage count mismatch - some chunks may not be stored",
@@ -341,6 +771,7 @@ async def store_vectors_in_qdrant(
         return points_stored
 
     except Exception as e:
+        bump_collection_epoch(collection_name)  # Some batches may have been applied
         logger.error(
             "Vector storage failed",
             extra={"collection": collection_name, "error": str(e)},
@@ -349,7 +780,60 @@ async def store_vectors_in_qdrant(
         raise VectorStorageError(f"Failed to store vectors in Qdrant: {e}") from e
 
 
-async def ingest_document(file_path: str) -> DocumentMetadata:
+async def delete_document(source_document: str, collection_name: str = "financial_docs") -> int:
+    """Delete every chunk of a document from Qdrant.
+
+    Bumps the collection epoch so cached query results that cite the document
+    are no longer served (raglite.shared.epoch).
+
+    Args:
+        source_document: Document filename, as stored in the source_document payload
+        collection_name: Qdrant collection (default: financial_docs)
+
+    Returns:
+        Number of chunks deleted (0 if the document is not in the collection)
+
+    Raises:
+        VectorStorageError: If the deletion fails
+
+    Example:
+        >>> await delete_document("Q3_Report.pdf")
+        42
+    """
+    client = get_vector_store()
+    document_filter = Filter(
+        must=[FieldCondition(key="source_document", match=MatchValue(value=source_document))]
+    )
+    try:
+        chunks: int = client.count(
+            collection_name=collection_name, count_filter=document_filter, exact=True
+        ).count
+        if chunks:
+            client.delete(
+                collection_name=collection_name,
+                points_selector=FilterSelector(filter=document_filter),
+                wait=True,
+            )
+    except Exception as e:
+        logger.error(
+            "Document deletion failed",
+            extra={"collection": collection_name, "doc_filename": source_document, "error": str(e)},
+            exc_info=True,
+        )
+        raise VectorStorageError(f"Failed to delete {source_document}: {e}") from e
+
+    if chunks:
+        bump_collection_epoch(collection_name)
+    logger.info(
+        "Document deleted",
+        extra={"collection": collection_name, "doc_filename": source_document, "chunks": chunks},
+    )
+    return chunks
+
+
+async def ingest_document(
+    file_path: str, bulk_load: bool = False, content_digest: str | None = None
+) -> DocumentMetadata:
     """Ingest financial document (PDF or Excel) with automatic format detection.
 
     Routes documents to appropriate extraction handler based on file extension.
@@ -357,6 +841,9 @@ async def ingest_document(file_path: str) -> DocumentMetadata:
 
     Args:
         file_path: Path to document file (relative or absolute)
+        bulk_load: Defer HNSW indexing until the document is stored (see bulk_load_mode)
+        content_digest: sha256 hex digest of the file, if the caller already hashed it
+            (keys the PDF checkpoint; computed when omitted)
 
     Returns:
         DocumentMetadata with extraction results
@@ -381,30 +868,175 @@ async def ingest_document(file_path: str) -> DocumentMetadata:
         )
         raise FileNotFoundError(error_msg)
 
+    if bulk_load:
+        async with bulk_load_mode(settings.qdrant_collection_name, settings.embedding_dimension):
+            return await ingest_document(str(doc_path), content_digest=content_digest)
+
     # Route based on file extension
     extension = doc_path.suffix.lower()
 
-    if extension == ".pdf":
-        return await ingest_pdf(str(doc_path))
-    elif extension in [".xlsx", ".xls"]:
-        return await extract_excel(str(doc_path))
+    with span("ingest_document", doc_filename=doc_path.name, extension=extension):
+        if extension == ".pdf":
+            return await ingest_pdf(str(doc_path), content_digest)
+        elif extension in [".xlsx", ".xls"]:
+            return await extract_excel(str(doc_path))
+        else:
+            error_msg = (
+                f"Unsupported file format: {extension}. Supported formats: .pdf, .xlsx, .xls"
+            )
+            logger.error(
+                "Unsupported document format",
+                extra={"path": str(doc_path), "extension": extension},
+            )
+            raise ValueError(error_msg)
+
+
+async def ingest_directory(
+    dir_path: str, recursive: bool = False, bulk_load: bool = False
+) -> list[DocumentMetadata]:
+    """Ingest every supported document (PDF, Excel) in a directory.
+
+    Documents are ingested one at a time in sorted path order. A failing document
+    is logged and skipped so one corrupt file doesn't abort a backfill.
+
+    Args:
+        dir_path: Directory containing documents
+        recursive: Include documents in subdirectories
+        bulk_load: Defer HNSW indexing for the whole directory and rebuild the
+            index once at the end (recommended for large backfills)
+
+    Returns:
+        DocumentMetadata for each successfully ingested document
+
+    Raises:
+        FileNotFoundError: If the directory doesn't exist
+
+    Example:
+        >>> results = await ingest_directory("reports/2019-2024", bulk_load=True)
+        >>> print(f"Ingested {len(results)} documents")
+    """
+    directory = Path(dir_path).resolve()
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Directory not found: {dir_path}")
+
+    pattern = "**/*" if recursive else "*"
+    paths = sorted(
+        p
+        for p in directory.glob(pattern)
+        if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS
+    )
+
+    logger.info(
+        "Starting directory ingestion",
+        extra={"path": str(directory), "documents": len(paths), "bulk_load": bulk_load},
+    )
+    start_time = time.time()
+    results: list[DocumentMetadata] = []
+
+    async def _ingest_all() -> None:
+        for path in paths:
+            try:
+                results.append(await ingest_document(str(path)))
+            except Exception as e:
+                logger.error(
+                    "Document ingestion failed - skipping",
+                    extra={"path": str(path), "error": str(e)},
+                    exc_info=True,
+                )
+
+    if bulk_load and paths:
+        async with bulk_load_mode(settings.qdrant_collection_name, settings.embedding_dimension):
+            await _ingest_all()
     else:
-        error_msg = f"Unsupported file format: {extension}. Supported formats: .pdf, .xlsx, .xls"
-        logger.error(
-            "Unsupported document format",
-            extra={"path": str(doc_path), "extension": extension},
-        )
-        raise ValueError(error_msg)
+        await _ingest_all()
+
+    logger.info(
+        "Directory ingestion complete",
+        extra={
+            "path": str(directory),
+            "documents_ingested": len(results),
+            "documents_failed": len(paths) - len(results),
+            "duration_ms": int((time.time() - start_time) * 1000),
+        },
+    )
+    return results
+
+
+@contextmanager
+def _stage_timer(stage_ms: dict[str, float], key: str) -> Iterator[None]:
+    """Record the block's wall time in milliseconds as stage_ms[key]."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage_ms[key] = round((time.perf_counter() - start) * 1000, 2)
+
+
+def _ingestion_timings(
+    stage_ms: dict[str, float], duration_ms: int, page_count: int, chunk_count: int
+) -> IngestionTimings:
+    """Build the per-stage timing breakdown reported in DocumentMetadata."""
+    seconds = duration_ms / 1000
+    return IngestionTimings(
+        **stage_ms,
+        total_ms=duration_ms,
+        pages_per_second=round(page_count / seconds, 2) if seconds > 0 else 0.0,
+        chunks_per_second=round(chunk_count / seconds, 2) if seconds > 0 else 0.0,
+    )
+
+
+def get_document_converter() -> DocumentConverter:
+    """Lazy-load the Docling PDF converter (singleton pattern, thread-safe).
+
+    Configured with table structure recognition in ACCURATE mode (Story 1.15).
+    Docling loads its layout and TableFormer models on the first conversion (or
+    on ``initialize_pipeline``), so reusing one converter pays that cost once per
+    process instead of once per document.
+
+    Returns:
+        Cached DocumentConverter instance
+
+    Example:
+        >>> converter = get_document_converter()
+        >>> result = converter.convert("docs/sample pdf/report.pdf")
+    """
+    global _document_converter
+
+    if _document_converter is None:
+        with _document_converter_lock:
+            if _document_converter is None:
+                pipeline_options = PdfPipelineOptions(do_table_structure=True)
+                pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
+                budget = get_thread_budget()
+                if budget is not None:
+                    pipeline_options.accelerator_options = AcceleratorOptions(
+                        num_threads=budget.docling
+                    )
+
+                _document_converter = DocumentConverter(
+                    format_options={
+                        InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)
+                    }
+                )
+                logger.info(
+                    "Docling converter initialized with table extraction",
+                    extra={"table_mode": "ACCURATE"},
+                )
+
+    return _document_converter
 
 
-async def ingest_pdf(file_path: str) -> DocumentMetadata:
+async def ingest_pdf(file_path: str, content_digest: str | None = None) -> DocumentMetadata:
     """Ingest financial PDF and extract text, tables, and structure with page numbers.
 
     Uses Docling library for high-accuracy extraction (97.9% table accuracy).
-    Extracts page numbers from element provenance metadata.
+    Extracts page numbers from element provenance metadata. Completed stages are
+    checkpointed (see raglite.ingestion.checkpoint), so retrying a document after
+    a crash resumes from the last converted, chunked or embedded batch.
 
     Args:
         file_path: Path to PDF file (relative or absolute)
+        content_digest: sha256 hex digest of the file (computed off the event loop when omitted)
 
     Returns:
         DocumentMetadata with extraction results including page_count and ingestion timestamp
@@ -439,49 +1071,73 @@ async def ingest_pdf(file_path: str) -> DocumentMetadata:
         },
     )
 
-    # Initialize Docling converter with table extraction enabled (Story 1.15 fix)
-    # Configure table structure recognition to extract table cell data
+    # Resume from the stage checkpoints of an interrupted attempt, if any
+    checkpoint = await asyncio.to_thread(IngestionCheckpoint.for_document, pdf_path, content_digest)
     try:
-        pipeline_options = PdfPipelineOptions(do_table_structure=True)
-        pipeline_options.table_structure_options.mode = TableFormerMode.ACCURATE
-
-        converter = DocumentConverter(
-            format_options={InputFormat.PDF: PdfFormatOption(pipeline_options=pipeline_options)}
-        )
+        return await _ingest_pdf_stages(pdf_path, checkpoint, start_time)
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+
+async def _ingest_pdf_stages(
+    pdf_path: Path, checkpoint: IngestionCheckpoint | None, start_time: float
+) -> DocumentMetadata:
+    """Convert, chunk, embed and store a PDF, resuming from its checkpoint (ingest_pdf)."""
+    converted: ConversionResult | DoclingDocument | None = (
+        checkpoint.load_conversion() if checkpoint is not None else None
+    )
+    stage_ms: dict[str, float] = {}
+    if converted is not None:
+        document = converted
         logger.info(
-            "Docling converter initialized with table extraction",
-            extra={"table_mode": "ACCURATE", "path": str(pdf_path)},
+            "Resuming PDF ingestion from checkpoint",
+            extra={"doc_filename": pdf_path.name, "checkpoint": str(checkpoint.directory)},
         )
-    except Exception as e:
-        error_msg = f"Failed to initialize Docling converter: {e}"
-        logger.error(
-            "Docling initialization failed",
-            extra={"path": str(pdf_path), "error": str(e)},
-            exc_info=True,
-        )
-        raise RuntimeError(error_msg) from e
+    else:
+        # Docling converter with table extraction enabled (Story 1.15 fix), shared across calls
+        try:
+            converter = get_document_converter()
+        except Exception as e:
+            error_msg = f"Failed to initialize Docling converter: {e}"
+            logger.error(
+                "Docling initialization failed",
+                extra={"path": str(pdf_path), "error": str(e)},
+                exc_info=True,
+            )
+            raise RuntimeError(error_msg) from e
 
-    # Convert PDF with Docling
-    try:
-        result = converter.convert(str(pdf_path))
-    except Exception as e:
-        error_msg = f"Docling parsing failed for {pdf_path.name}: {e}"
-        logger.error(
-            "PDF parsing failed",
-            extra={"path": str(pdf_path), "doc_filename": pdf_path.name, "error": str(e)},
-            exc_info=True,
-        )
-        raise RuntimeError(error_msg) from e
+        # Convert PDF with Docling
+        try:
+            convert_start = time.perf_counter()
+            with span("convert", doc_filename=pdf_path.name) as convert_span:
+                result = await run_ingest_task(converter.convert, str(pdf_path))
+                convert_span.set_attribute("pages", result.document.num_pages())
+            convert_seconds = time.perf_counter() - convert_start
+            INGEST_STAGE_SECONDS.labels(stage="convert").observe(convert_seconds)
+            stage_ms["convert_ms"] = round(convert_seconds * 1000, 2)
+        except Exception as e:
+            error_msg = f"Docling parsing failed for {pdf_path.name}: {e}"
+            logger.error(
+                "PDF parsing failed",
+                extra={"path": str(pdf_path), "doc_filename": pdf_path.name, "error": str(e)},
+                exc_info=True,
+            )
+            raise RuntimeError(error_msg) from e
+        converted = result
+        document = result.document
+        if checkpoint is not None:
+            checkpoint.save_conversion(document)
 
     # Extract page count from DoclingDocument
     # Use num_pages() method which returns total page count
-    page_count = result.document.num_pages()
+    page_count = document.num_pages()
 
     # Count elements with provenance data for metrics
     total_elements = 0
     elements_with_pages = 0
 
-    for item, _ in result.document.iterate_items():
+    for item, _ in document.iterate_items():
         total_elements += 1
         if hasattr(item, "prov") and item.prov:
             elements_with_pages += 1
@@ -496,14 +1152,14 @@ async def ingest_pdf(file_path: str) -> DocumentMetadata:
     # Extract full text from Docling result
     # Use export_to_markdown() to get structured text with tables
     try:
-        result.document.export_to_markdown()
+        document.export_to_markdown()
     except Exception as e:
         logger.warning(
             "Failed to export markdown - falling back to plain text",
             extra={"path": str(pdf_path), "error": str(e)},
         )
         # Fallback: concatenate all text from elements
-        "\n".join(item.text for item, _ in result.document.iterate_items() if hasattr(item, "text"))
+        "\n".join(item.text for item, _ in document.iterate_items() if hasattr(item, "text"))
 
     # Create initial metadata for chunking
     metadata = DocumentMetadata(
@@ -516,17 +1172,29 @@ async def ingest_pdf(file_path: str) -> DocumentMetadata:
     )
 
     # Chunk the document using Docling items with provenance (Story 1.13 fix)
-    # This extracts actual page numbers from Docling metadata instead of estimating
-    chunks = await chunk_by_docling_items(result, metadata)
+    # This extracts actual page numbers from Docling metadata instead of estimating.
+    # Columnar batch keeps large documents cheap through embedding and upload.
+    chunks = checkpoint.load_chunks(metadata) if checkpoint is not None else None
+    if chunks is None:
+        with span("chunk_by_docling_items") as chunk_span, _stage_timer(stage_ms, "chunk_ms"):
+            chunks = await chunk_by_docling_items(converted, metadata, columnar=True)
+            chunk_span.set_attribute("chunks", len(chunks))
+        if checkpoint is not None:
+            checkpoint.save_chunks(chunks)
 
     # Generate embeddings for chunks (Story 1.5)
-    chunks_with_embeddings = await generate_embeddings(chunks)
+    with span("generate_embeddings", chunks=len(chunks)), _stage_timer(stage_ms, "embed_ms"):
+        chunks_with_embeddings = await generate_embeddings(chunks, checkpoint=checkpoint)
 
     # Store vectors in Qdrant (Story 1.6)
     if chunks_with_embeddings:
-        points_stored = await store_vectors_in_qdrant(
-            chunks_with_embeddings, collection_name=settings.qdrant_collection_name
-        )
+        with (
+            span("store_vectors", chunks=len(chunks_with_embeddings)),
+            _stage_timer(stage_ms, "upload_ms"),
+        ):
+            points_stored = await store_vectors_in_qdrant(
+                chunks_with_embeddings, collection_name=settings.qdrant_collection_name
+            )
         logger.info(
             "Vectors stored in Qdrant",
             extra={
@@ -536,11 +1204,15 @@ async def ingest_pdf(file_path: str) -> DocumentMetadata:
             },
         )
 
+    if checkpoint is not None:
+        checkpoint.clear()
+
     # Update metadata with chunk count
     metadata.chunk_count = len(chunks_with_embeddings)
 
     # Calculate ingestion metrics
     duration_ms = int((time.time() - start_time) * 1000)
+    metadata.timings = _ingestion_timings(stage_ms, duration_ms, page_count, metadata.chunk_count)
 
     logger.info(
         "PDF ingested successfully",
@@ -560,53 +1232,16 @@ async def ingest_pdf(file_path: str) -> DocumentMetadata:
     return metadata
 
 
-async def extract_excel(file_path: str) -> DocumentMetadata:
-    """Extract financial data from Excel spreadsheet with multi-sheet support.
-
-    Uses openpyxl for Excel parsing and pandas for data manipulation.
-    Extracts all sheets preserving numeric formatting and sheet numbers for citations.
-
-    Note: This function is marked async for consistency with the ingestion pipeline
-    pattern (ingest_pdf, future chunking/embedding operations). While openpyxl and
-    pandas operations are currently synchronous, this allows for future async
-    enhancements like streaming large files or parallel sheet processing.
-
-    Args:
-        file_path: Path to Excel file (relative or absolute, .xlsx or .xls)
+def _parse_workbook(excel_path: Path) -> tuple[list[dict[str, Any]], int, int, int]:
+    """Load a workbook and render each non-empty sheet as markdown (run on the ingestion pool).
 
     Returns:
-        DocumentMetadata with extraction results including sheet_count as page_count
+        (sheets with sheet_name, sheet_number, content and row_count;
+        sheets in the workbook; total rows; skipped empty sheets)
 
     Raises:
-        FileNotFoundError: If Excel file doesn't exist at specified path
-        RuntimeError: If Excel parsing fails, file is password-protected, or corrupted
-
-    Example:
-        >>> metadata = await extract_excel("data/financial_report.xlsx")
-        >>> print(f"Extracted {metadata.page_count} sheets")
+        RuntimeError: If the workbook is invalid, password-protected or unreadable
     """
-    start_time = time.time()
-
-    # Resolve file path
-    excel_path = Path(file_path).resolve()
-
-    if not excel_path.exists():
-        error_msg = f"Excel file not found: {file_path}"
-        logger.error(
-            "Excel extraction failed - file not found",
-            extra={"path": str(excel_path), "error": error_msg},
-        )
-        raise FileNotFoundError(error_msg)
-
-    logger.info(
-        "Starting Excel extraction",
-        extra={
-            "path": str(excel_path),
-            "doc_filename": excel_path.name,
-            "size_mb": round(excel_path.stat().st_size / (1024 * 1024), 2),
-        },
-    )
-
     # Load Excel workbook
     try:
         # data_only=True: Load computed values instead of formulas
@@ -630,21 +1265,8 @@ async def extract_excel(file_path: str) -> DocumentMetadata:
         )
         raise RuntimeError(error_msg) from e
 
-    # Check for empty workbook
     if not workbook.sheetnames:
-        logger.warning(
-            "Empty Excel workbook - no sheets found",
-            extra={"path": str(excel_path), "doc_filename": excel_path.name},
-        )
-        # Return metadata with zero sheets for empty workbook
-        metadata = DocumentMetadata(
-            filename=excel_path.name,
-            doc_type="Excel",
-            ingestion_timestamp=datetime.now(UTC).isoformat(),
-            page_count=0,
-            source_path=str(excel_path),
-        )
-        return metadata
+        return [], 0, 0, 0
 
     # Extract all sheets with sheet numbers
     sheets_data = []
@@ -700,6 +1322,76 @@ async def extract_excel(file_path: str) -> DocumentMetadata:
         )
         raise RuntimeError(error_msg) from e
 
+    return sheets_data, len(workbook.sheetnames), total_rows, skipped_sheets
+
+
+async def extract_excel(file_path: str) -> DocumentMetadata:
+    """Extract financial data from Excel spreadsheet with multi-sheet support.
+
+    Uses openpyxl for Excel parsing and pandas for data manipulation.
+    Extracts all sheets preserving numeric formatting and sheet numbers for citations.
+
+    Note: Workbook parsing (openpyxl, pandas) and chunking run on the ingestion
+    pool (run_ingest_task), so a large workbook does not block the event loop
+    serving queries.
+
+    Args:
+        file_path: Path to Excel file (relative or absolute, .xlsx or .xls)
+
+    Returns:
+        DocumentMetadata with extraction results including sheet_count as page_count
+
+    Raises:
+        FileNotFoundError: If Excel file doesn't exist at specified path
+        RuntimeError: If Excel parsing fails, file is password-protected, or corrupted
+
+    Example:
+        >>> metadata = await extract_excel("data/financial_report.xlsx")
+        >>> print(f"Extracted {metadata.page_count} sheets")
+    """
+    start_time = time.time()
+
+    # Resolve file path
+    excel_path = Path(file_path).resolve()
+
+    if not excel_path.exists():
+        error_msg = f"Excel file not found: {file_path}"
+        logger.error(
+            "Excel extraction failed - file not found",
+            extra={"path": str(excel_path), "error": error_msg},
+        )
+        raise FileNotFoundError(error_msg)
+
+    logger.info(
+        "Starting Excel extraction",
+        extra={
+            "path": str(excel_path),
+            "doc_filename": excel_path.name,
+            "size_mb": round(excel_path.stat().st_size / (1024 * 1024), 2),
+        },
+    )
+
+    # Parse sheets on the ingestion pool (openpyxl and pandas hold the GIL for seconds)
+    sheets_data, total_sheets, total_rows, skipped_sheets = await run_ingest_task(
+        _parse_workbook, excel_path
+    )
+
+    # Check for empty workbook
+    if total_sheets == 0:
+        logger.warning(
+            "Empty Excel workbook - no sheets found",
+            extra={"path": str(excel_path), "doc_filename": excel_path.name},
+        )
+        # Return metadata with zero sheets for empty workbook
+        metadata = DocumentMetadata(
+            filename=excel_path.name,
+            doc_type="Excel",
+            ingestion_timestamp=datetime.now(UTC).isoformat(),
+            page_count=0,
+            source_path=str(excel_path),
+        )
+        return metadata
+
     # Calculate extraction metrics
     sheet_count = len(sheets_data)
 
@@ -707,7 +1399,7 @@ async def extract_excel(file_path: str) -> DocumentMetadata:
     if sheet_count == 0:
         logger.warning(
             "No sheets extracted - verify Excel file structure",
-            extra={"path": str(excel_path), "total_sheets": len(workbook.sheetnames)},
+            extra={"path": str(excel_path), "total_sheets": total_sheets},
         )
 
     # Concatenate all sheet markdown for chunking
@@ -723,21 +1415,31 @@ async def extract_excel(file_path: str) -> DocumentMetadata:
         chunk_count=0,  # Will be updated after chunking
     )
 
+    # Sheet parsing counts as the extraction ("convert") stage
+    stage_ms = {"convert_ms": round((time.time() - start_time) * 1000, 2)}
+
     # Chunk the document if there's content
     chunks = []
     if full_text.strip():
-        chunks = await chunk_document(full_text, metadata)
+        with span("chunk_document") as chunk_span, _stage_timer(stage_ms, "chunk_ms"):
+            chunks = await chunk_document(full_text, metadata)
+            chunk_span.set_attribute("chunks", len(chunks))
 
     # Generate embeddings for chunks (Story 1.5)
     chunks_with_embeddings = []
     if chunks:
-        chunks_with_embeddings = await generate_embeddings(chunks)
+        with span("generate_embeddings", chunks=len(chunks)), _stage_timer(stage_ms, "embed_ms"):
+            chunks_with_embeddings = await generate_embeddings(chunks)
 
     # Store vectors in Qdrant (Story 1.6)
     if chunks_with_embeddings:
-        points_stored = await store_vectors_in_qdrant(
-            chunks_with_embeddings, collection_name=settings.qdrant_collection_name
-        )
+        with (
+            span("store_vectors", chunks=len(chunks_with_embeddings)),
+            _stage_timer(stage_ms, "upload_ms"),
+        ):
+            points_stored = await store_vectors_in_qdrant(
+                chunks_with_embeddings, collection_name=settings.qdrant_collection_name
+            )
         logger.info(
             "Vectors stored in Qdrant",
             extra={
@@ -752,6 +1454,7 @@ async def extract_excel(file_path: str) -> DocumentMetadata:
 
     # Calculate final metrics
     duration_ms = int((time.time() - start_time) * 1000)
+    metadata.timings = _ingestion_timings(stage_ms, duration_ms, sheet_count, metadata.chunk_count)
 
     logger.info(
         "Excel extracted successfully",
@@ -817,10 +1520,16 @@ async def chunk_document(
         - Generate unique chunk_id per chunk
 
     Note:
-        This function is declared async for consistency with the ingestion pipeline
-        pattern (ingest_pdf, extract_excel), enabling future async optimizations
-        such as parallel embedding generation. Current implementation is synchronous.
+        Chunking runs on the ingestion pool (run_ingest_task), so splitting a
+        large document does not block the event loop serving queries.
     """
+    return await run_ingest_task(_chunk_document, full_text, doc_metadata, chunk_size, overlap)
+
+
+def _chunk_document(
+    full_text: str, doc_metadata: DocumentMetadata, chunk_size: int, overlap: int
+) -> list[Chunk]:
+    """Chunk document text (chunk_document body, run on the ingestion pool)."""
     start_time = time.time()
 
     # Validate parameters
@@ -909,6 +1618,7 @@ async def chunk_document(
         chunk_index += 1
 
     # Calculate metrics
+    INGEST_STAGE_SECONDS.labels(stage="chunk").observe(time.time() - start_time)
     duration_ms = int((time.time() - start_time) * 1000)
     avg_chunk_size = sum(len(c.content.split()) for c in chunks) / len(chunks) if chunks else 0
 
@@ -925,12 +1635,36 @@ async def chunk_document(
     return chunks
 
 
+@overload
+async def chunk_by_docling_items(
+    result: ConversionResult | DoclingDocument,
+    doc_metadata: DocumentMetadata,
+    chunk_size: int = ...,
+    overlap: int = ...,
+    *,
+    columnar: Literal[False] = ...,
+) -> list[Chunk]: ...
+
+
+@overload
+async def chunk_by_docling_items(
+    result: ConversionResult | DoclingDocument,
+    doc_metadata: DocumentMetadata,
+    chunk_size: int = ...,
+    overlap: int = ...,
+    *,
+    columnar: Literal[True],
+) -> ChunkBatch: ...
+
+
 async def chunk_by_docling_items(
-    result: ConversionResult,
+    result: ConversionResult | DoclingDocument,
     doc_metadata: DocumentMetadata,
     chunk_size: int = 500,
     overlap: int = 50,
-) -> list[Chunk]:
+    *,
+    columnar: bool = False,
+) -> list[Chunk] | ChunkBatch:
     """Chunk document using Docling items with actual page numbers from provenance.
 
     Extracts page numbers directly from Docling provenance metadata instead of
@@ -938,17 +1672,37 @@ async def chunk_by_docling_items(
     that respect both page boundaries and target chunk size.
 
     Args:
-        result: Docling ConversionResult containing document with provenance
+        result: Docling ConversionResult (or its DoclingDocument, e.g. from a
+            checkpoint) containing document with provenance
         doc_metadata: Document metadata (filename, doc_type, etc.)
         chunk_size: Target chunk size in words (default: 500)
         overlap: Word overlap between chunks (default: 50)
+        columnar: Return a ChunkBatch instead of a list of Chunk objects
+            (compact representation for large backfills)
 
     Returns:
-        List of Chunk objects with accurate page numbers from provenance
+        List of Chunk objects (or a ChunkBatch if columnar=True) with accurate
+        page numbers from provenance
 
     Raises:
         RuntimeError: If chunking fails
+
+    Note:
+        Chunking runs on the ingestion pool (run_ingest_task), like Docling convert.
     """
+    return await run_ingest_task(
+        _chunk_by_docling_items, result, doc_metadata, chunk_size, overlap, columnar
+    )
+
+
+def _chunk_by_docling_items(
+    result: ConversionResult | DoclingDocument,
+    doc_metadata: DocumentMetadata,
+    chunk_size: int,
+    overlap: int,
+    columnar: bool,
+) -> list[Chunk] | ChunkBatch:
+    """Chunk Docling items by page (chunk_by_docling_items body, run on the ingestion pool)."""
     start_time = time.time()
 
     # Collect items with their page numbers
@@ -956,7 +1710,8 @@ async def chunk_by_docling_items(
     items_without_prov = 0
     last_known_page = 1
 
-    for item, _ in result.document.iterate_items():
+    document = result if isinstance(result, DoclingDocument) else result.document
+    for item, _ in document.iterate_items():
         # Extract page number from provenance
         page_no = None
         if hasattr(item, "prov") and item.prov:
@@ -1013,9 +1768,10 @@ async def chunk_by_docling_items(
             },
         )
 
-    # Create chunks from page items
-    chunks = []
+    # Create chunks from page items (columnar: one shared text buffer and metadata record)
+    batch = ChunkBatch(doc_metadata)
     chunk_index = 0
+    total_words = 0
 
     # Process each page in order
     for page_no in sorted(page_items.keys()):
@@ -1028,51 +1784,36 @@ async def chunk_by_docling_items(
 
         # If page is small enough, create single chunk
         if len(page_words) <= chunk_size:
-            chunk = Chunk(
-                chunk_id=f"{doc_metadata.filename}_{chunk_index}",
-                content=page_text,
-                metadata=doc_metadata,
-                page_number=page_no,
-                chunk_index=chunk_index,
-                embedding=[],
-            )
-            chunks.append(chunk)
+            batch.append(page_text, page_number=page_no, chunk_index=chunk_index)
+            total_words += len(page_words)
             chunk_index += 1
         else:
             # Split large page into multiple chunks while preserving page number
             idx = 0
             while idx < len(page_words):
                 chunk_words = page_words[idx : idx + chunk_size]
-                chunk_text = " ".join(chunk_words)
-
-                chunk = Chunk(
-                    chunk_id=f"{doc_metadata.filename}_{chunk_index}",
-                    content=chunk_text,
-                    metadata=doc_metadata,
-                    page_number=page_no,
-                    chunk_index=chunk_index,
-                    embedding=[],
-                )
-                chunks.append(chunk)
+                batch.append(" ".join(chunk_words), page_number=page_no, chunk_index=chunk_index)
+                total_words += len(chunk_words)
                 chunk_index += 1
 
                 # Move to next chunk with overlap
                 idx += chunk_size - overlap
 
     # Calculate metrics
+    INGEST_STAGE_SECONDS.labels(stage="chunk").observe(time.time() - start_time)
     duration_ms = int((time.time() - start_time) * 1000)
-    avg_chunk_size = sum(len(c.content.split()) for c in chunks) / len(chunks) if chunks else 0
+    avg_chunk_size = total_words / len(batch) if len(batch) else 0
     page_range = f"{min(page_items.keys())}-{max(page_items.keys())}" if page_items else "N/A"
 
     logger.info(
         "Document chunked with provenance",
         extra={
             "doc_filename": doc_metadata.filename,
-            "chunk_count": len(chunks),
+            "chunk_count": len(batch),
             "avg_chunk_size": round(avg_chunk_size, 1),
             "page_range": page_range,
             "duration_ms": duration_ms,
         },
     )
 
-    return chunks
+    return batch if columnar else batch.to_chunks()
@@ -5,28 +5,97 @@ to MCP clients (Claude Desktop, etc.). Provides two core tools:
   1. ingest_financial_document - Ingest PDF/Excel documents
   2. query_financial_documents - Query documents using natural language
 
+plus ``health`` (readiness), ``get_metrics`` (latency histograms, counters),
+``profile_requests`` (cProfile/tracemalloc reports for the next N requests) and
+background ingestion tools (``submit_ingestion``, ``get_ingestion_status``,
+``cancel_ingestion``). On startup the embedding model, vector store and Docling converter are
+loaded in a background thread (raglite.shared.preload) while the server already
+accepts connections.
+
 The server follows standard MCP pattern: tools return raw data (chunks with metadata),
 and the LLM client (Claude) synthesizes natural language answers.
 
 Example:
     Start server locally:
-    $ uv run python -m raglite.main
+    $ uv run python -m raglite.main    (or: raglite-server)
 
     Connect Claude Desktop to:
     - Server Name: RAGLite
     - Transport: stdio
+
+    Or serve many clients over HTTP (http://127.0.0.1:8000/mcp) with 4 workers:
+    $ MCP_TRANSPORT=http HTTP_WORKERS=4 uv run python -m raglite.main
 """
 
+import asyncio
+import shutil
+import tempfile
 import time
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
 
 from fastmcp import FastMCP
-
-from raglite.ingestion.pipeline import ingest_document
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from raglite.ingestion.jobs import (
+    document_key,
+    get_job_manager,
+    ingest_flight,
+    resume_ingestion_jobs,
+    shutdown_job_manager,
+)
 from raglite.retrieval.attribution import generate_citations
+from raglite.retrieval.packing import pack_results
 from raglite.retrieval.search import QueryError, search_documents
+from raglite.retrieval.slow_query_log import log_if_slow
+from raglite.shared.clients import get_embedding_model
 from raglite.shared.config import settings
+from raglite.shared.lazy import lazy_import
 from raglite.shared.logging import get_logger
-from raglite.shared.models import DocumentMetadata, QueryRequest, QueryResponse
+from raglite.shared.metrics import (
+    CITATION_SECONDS,
+    INFLIGHT_REQUESTS,
+    INGEST_SECONDS,
+    INGESTIONS,
+    QUERIES,
+    QUERY_SECONDS,
+    MetricsSnapshot,
+    disable_multiprocess,
+    enable_multiprocess,
+    registry,
+    render_metrics,
+    start_metrics_server,
+)
+from raglite.shared.models import (
+    DocumentMetadata,
+    HealthStatus,
+    IngestionJobStatus,
+    JobID,
+    ProfilingStatus,
+    QueryRequest,
+    QueryResponse,
+    QueryTimings,
+)
+from raglite.shared.prefork import bind_socket, serve_prefork
+from raglite.shared.preload import (
+    DOCUMENT_CONVERTER,
+    QUERY_COMPONENTS,
+    get_health_status,
+    start_preload,
+    wait_until_ready,
+)
+from raglite.shared.profiling import arm_profiling, get_profiling_status, profile_request
+from raglite.shared.scheduler import IngestionRejectedError, admit_ingestion
+from raglite.shared.threads import apply_thread_budget
+from raglite.shared.tracing import span
+
+if TYPE_CHECKING:
+    from raglite.ingestion.pipeline import ingest_document
+else:
+    # Ingestion pulls in docling, pandas and openpyxl; load on the first ingest call
+    ingest_document = lazy_import("raglite.ingestion.pipeline", "ingest_document")
 
 # Initialize structured logger
 logger = get_logger(__name__)
@@ -46,8 +115,19 @@ class DocumentProcessingError(Exception):
     pass
 
 
+async def _ingest_admitted(doc_path: str, content_digest: str | None = None) -> DocumentMetadata:
+    """Run the ingestion pipeline once an ingestion slot is free."""
+    # Bounded concurrency: wait for a slot, or reject when too many are waiting
+    async with admit_ingestion():
+        # Call Story 1.2 ingestion pipeline
+        with profile_request("ingest", {"doc_path": doc_path}):
+            return await ingest_document(doc_path, content_digest=content_digest)
+
+
 @mcp.tool()
-async def ingest_financial_document(doc_path: str) -> DocumentMetadata:
+async def ingest_financial_document(
+    doc_path: str, include_timings: bool = False
+) -> DocumentMetadata:
     """Ingest financial PDF or Excel document into RAGLite knowledge base.
 
     Processes the document through the complete ingestion pipeline:
@@ -56,8 +136,14 @@ async def ingest_financial_document(doc_path: str) -> DocumentMetadata:
       3. Generate embeddings (Fin-E5 model)
       4. Store vectors in Qdrant with metadata
 
+    A call for a document (same path and content) that is already being
+    ingested, by another call or a background job, waits for that ingestion
+    and returns its result.
+
     Args:
         doc_path: Absolute or relative path to document file (.pdf, .xlsx, .xls)
+        include_timings: Return per-stage timings (convert, chunk, embed, upload,
+            pages/s, chunks/s) in DocumentMetadata.timings
 
     Returns:
         DocumentMetadata with ingestion results including:
@@ -66,22 +152,37 @@ async def ingest_financial_document(doc_path: str) -> DocumentMetadata:
           - ingestion_timestamp: ISO8601 timestamp
           - page_count: Number of pages/sheets
           - chunk_count: Number of chunks created
+          - timings: Per-stage timings (only with include_timings)
 
     Raises:
         DocumentProcessingError: If ingestion fails (file not found, parsing error,
             embedding generation failure, or storage error)
+        IngestionRejectedError: If settings.ingest_max_concurrent ingestions are
+            running and settings.ingest_max_waiting calls already wait (backpressure)
 
     Example:
         >>> metadata = await ingest_financial_document("/data/Q3_2023_Report.pdf")
         >>> print(f"Ingested {metadata.chunk_count} chunks from {metadata.filename}")
     """
     logger.info("Ingesting document", extra={"path": doc_path})
+    INFLIGHT_REQUESTS.labels(tool="ingest").inc()
 
     try:
-        # Call Story 1.2 ingestion pipeline
+        # Early requests wait for the background preload instead of cold-loading
+        await wait_until_ready(*QUERY_COMPONENTS, DOCUMENT_CONVERTER)
+
+        # Re-submissions of a file still being ingested join the running ingestion
         start_time = time.perf_counter()
-        metadata = await ingest_document(doc_path)
+        key = await asyncio.to_thread(document_key, doc_path)
+        if key is None:
+            metadata = await _ingest_admitted(doc_path)
+        else:
+            metadata = await ingest_flight.do(key, lambda: _ingest_admitted(doc_path, key[1]))
         duration_ms = (time.perf_counter() - start_time) * 1000
+        INGEST_SECONDS.observe(duration_ms / 1000)
+        INGESTIONS.labels(status="ok").inc()
+        if not include_timings:
+            metadata.timings = None
 
         logger.info(
             "Ingestion complete",
@@ -95,7 +196,13 @@ async def ingest_financial_document(doc_path: str) -> DocumentMetadata:
         )
         return metadata
 
+    except IngestionRejectedError as e:
+        INGESTIONS.labels(status="rejected").inc()
+        logger.warning("Ingestion rejected", extra={"path": doc_path, "error": str(e)})
+        raise
+
     except FileNotFoundError as e:
+        INGESTIONS.labels(status="error").inc()
         logger.error(
             "Document not found",
             extra={"path": doc_path, "error": str(e)},
@@ -104,6 +211,7 @@ async def ingest_financial_document(doc_path: str) -> DocumentMetadata:
         raise DocumentProcessingError(f"Document not found: {doc_path}") from e
 
     except Exception as e:
+        INGESTIONS.labels(status="error").inc()
         logger.error(
             "Ingestion failed",
             extra={"path": doc_path, "error": str(e), "error_type": type(e).__name__},
@@ -111,6 +219,9 @@ async def ingest_financial_document(doc_path: str) -> DocumentMetadata:
         )
         raise DocumentProcessingError(f"Failed to ingest {doc_path}: {e}") from e
 
+    finally:
+        INFLIGHT_REQUESTS.labels(tool="ingest").dec()
+
 
 @mcp.tool()
 async def query_financial_documents(request: QueryRequest) -> QueryResponse:
@@ -123,25 +234,41 @@ async def query_financial_documents(request: QueryRequest) -> QueryResponse:
     Query pipeline:
       1. Generate query embedding (Fin-E5 model)
       2. Vector similarity search in Qdrant
-      3. Generate source citations for each chunk
-      4. Return raw chunks with metadata for LLM synthesis
+      3. Pack into token_budget, if given (raglite.retrieval.packing)
+      4. Generate source citations for each chunk
+      5. Return raw chunks with metadata for LLM synthesis
 
     Args:
         request: Query parameters containing:
           - query: Natural language query string
           - top_k: Number of results to return (default: 5, range: 1-50)
+          - diversify: Pick results by maximal marginal relevance, skipping
+            near-duplicate chunks (default: False)
+          - context_window: Neighbouring chunks merged around each result
+            into one passage (default: 0, range: 0-5)
+          - token_budget: Pack results into about this many tokens, without
+            overlapping or near-duplicate text (default: None, no packing)
+          - include_timings: Add a per-stage latency breakdown (default: False)
 
     Returns:
         QueryResponse containing:
           - results: List of QueryResult objects with:
-              * text: Chunk content with appended citation
+              * text: Chunk content with appended citation (not appended
+                when packed with token_budget)
+              * citation: Source citation string
               * score: Similarity score (0-1, higher is better)
               * source_document: Document filename
               * page_number: Page where chunk appears (or None)
               * chunk_index: Sequential chunk index
               * word_count: Chunk word count
+              * chunk_count: Chunks merged into the passage (context_window)
           - query: Original query string
           - retrieval_time_ms: Retrieval time in milliseconds
+          - timings: embed, vector search, expansion, rerank/fusion, citation
+            and packing ms
+            (only with include_timings)
+          - context_tokens: Estimated tokens of the packed results (only with
+            token_budget)
 
     Raises:
         QueryError: If search fails (empty query, embedding error, Qdrant error)
@@ -164,17 +291,53 @@ async def query_financial_documents(request: QueryRequest) -> QueryResponse:
     if not request.query or not request.query.strip():
         error_msg = "Query cannot be empty"
         logger.warning("Empty query rejected", extra={"query": request.query})
+        QUERIES.labels(status="invalid").inc()
         raise QueryError(error_msg)
 
+    INFLIGHT_REQUESTS.labels(tool="query").inc()
     try:
-        # Call Story 1.7 search pipeline
-        start_time = time.perf_counter()
-        results = await search_documents(request.query, request.top_k)
-        search_duration_ms = (time.perf_counter() - start_time) * 1000
-
-        # Call Story 1.8 citation generation
-        cited_results = await generate_citations(results)
+        # Early requests wait for the background preload instead of cold-loading
+        await wait_until_ready(*QUERY_COMPONENTS)
+
+        with (
+            profile_request("query", {"query": request.query, "top_k": request.top_k}),
+            span("query", top_k=request.top_k) as query_span,
+        ):
+            # Call Story 1.7 search pipeline (fills embed_ms, vector_search_ms, rerank_ms)
+            timings: dict[str, float] = {}
+            start_time = time.perf_counter()
+            results = await search_documents(
+                request.query,
+                request.top_k,
+                timings=timings,
+                context_window=request.context_window,
+                diversify=request.diversify,
+            )
+            search_duration_ms = (time.perf_counter() - start_time) * 1000
+
+            # Fit the results into the caller's token budget without repeated text
+            context_tokens = None
+            if request.token_budget is not None:
+                pack_start = time.perf_counter()
+                with span("pack_results", results=len(results)) as pack_span:
+                    results, context_tokens = pack_results(results, request.token_budget)
+                    pack_span.set_attribute("packed", len(results))
+                timings["pack_ms"] = round((time.perf_counter() - pack_start) * 1000, 2)
+
+            # Call Story 1.8 citation generation (packed: citation field only)
+            citation_start = time.perf_counter()
+            with span("generate_citations", results=len(results)):
+                cited_results = await generate_citations(
+                    results, append_to_text=request.token_budget is None
+                )
+            citation_seconds = time.perf_counter() - citation_start
+            CITATION_SECONDS.observe(citation_seconds)
+            timings["citation_ms"] = round(citation_seconds * 1000, 2)
+            query_span.set_attribute("results", len(cited_results))
         total_duration_ms = (time.perf_counter() - start_time) * 1000
+        QUERY_SECONDS.observe(total_duration_ms / 1000)
+        QUERIES.labels(status="ok").inc()
+        log_if_slow(request.query, request.top_k, total_duration_ms, timings, cited_results)
 
         logger.info(
             "Query complete",
@@ -190,13 +353,19 @@ async def query_financial_documents(request: QueryRequest) -> QueryResponse:
             results=cited_results,
             query=request.query,
             retrieval_time_ms=total_duration_ms,
+            timings=QueryTimings(**timings, total_ms=round(total_duration_ms, 2))
+            if request.include_timings
+            else None,
+            context_tokens=context_tokens,
         )
 
     except QueryError:
         # Re-raise QueryError (already logged in search.py)
+        QUERIES.labels(status="error").inc()
         raise
 
     except Exception as e:
+        QUERIES.labels(status="error").inc()
         logger.error(
             "Query failed",
             extra={
@@ -208,15 +377,261 @@ async def query_financial_documents(request: QueryRequest) -> QueryResponse:
         )
         raise QueryError(f"Query failed: {e}") from e
 
+    finally:
+        INFLIGHT_REQUESTS.labels(tool="query").dec()
 
-# Module-level execution for direct startup
-if __name__ == "__main__":
+
+@mcp.tool()
+async def health() -> HealthStatus:
+    """Report server readiness for MCP clients and orchestration probes.
+
+    Returns:
+        HealthStatus containing:
+          - ready: True once the embedding model and vector store are loaded
+          - components: Preload state per component (pending, loading, ready, failed)
+          - load_times_ms: Load time per preloaded component
+          - warmup_query_ms: Latency of the startup warm-up query
+          - errors: Load errors per failed component
+          - uptime_seconds: Seconds since server start
+
+    Example:
+        >>> status = await health()
+        >>> status.ready
+        True
+    """
+    return get_health_status()
+
+
+@mcp.tool()
+async def get_metrics() -> MetricsSnapshot:
+    """Return in-process metrics: latency histograms, counters and gauges.
+
+    Returns:
+        MetricsSnapshot containing:
+          - counters: Queries, ingestions and cache lookups by status/result
+          - gauges: In-flight requests per tool
+          - histograms: Count, sum and p50/p95/p99 estimates for query embed,
+            vector search, citation, end-to-end query and ingestion stage timings
+          - cache_hit_rates: Hit ratio per cache
+          - query_cache: Semantic query cache hit rate, similarities and latency
+            saved (when settings.query_cache_enabled)
+
+    With several HTTP workers this is the answering worker's view; GET /metrics
+    reports all workers.
+
+    Example:
+        >>> snapshot = await get_metrics()
+        >>> snapshot.histograms["raglite_query_seconds"].p95
+        0.41
+    """
+    snapshot = registry.snapshot()
+    if settings.query_cache_enabled:
+        from raglite.retrieval.query_cache import get_query_cache
+
+        snapshot.query_cache = get_query_cache().stats()
+    return snapshot
+
+
+@mcp.tool()
+async def profile_requests(
+    count: int | None = None, mode: Literal["cpu", "memory"] = "cpu"
+) -> ProfilingStatus:
+    """Profile the next ingest/query requests and write reports to workspace/reports.
+
+    Args:
+        count: Number of upcoming ingest/query calls to profile (0 disarms;
+            omit to only report the current state)
+        mode: "cpu" for a cProfile per request, "memory" for tracemalloc peak
+            memory per stage (convert, chunk, embed, upload, ...)
+
+    Returns:
+        ProfilingStatus containing:
+          - mode: Active profiling mode
+          - remaining: Requests still to be profiled
+          - output_dir: Report directory
+          - reports: Most recent report files
+
+    Example:
+        >>> status = await profile_requests(count=3, mode="memory")
+        >>> status.remaining
+        3
+    """
+    if count is None:
+        return get_profiling_status()
+    return arm_profiling(count, mode)
+
+
+@mcp.tool()
+async def submit_ingestion(doc_path: str) -> IngestionJobStatus:
+    """Queue a document for background ingestion and return immediately.
+
+    The job runs in a worker thread; poll get_ingestion_status with the
+    returned job_id. Jobs are persisted and resume after a server restart.
+
+    Args:
+        doc_path: Absolute or relative path to document file (.pdf, .xlsx, .xls)
+
+    Returns:
+        IngestionJobStatus with job_id and status "queued"
+
+    Raises:
+        DocumentProcessingError: If the document doesn't exist
+        JobsUnavailableError: If the job table cannot be opened
+
+    Example:
+        >>> job = await submit_ingestion("/data/Q3_2023_Report.pdf")
+        >>> job.status
+        'queued'
+    """
+    manager = await asyncio.to_thread(get_job_manager)
+    try:
+        return await asyncio.to_thread(manager.submit, doc_path)
+    except FileNotFoundError as e:
+        raise DocumentProcessingError(f"Document not found: {doc_path}") from e
+
+
+@mcp.tool()
+async def get_ingestion_status(job_id: JobID) -> IngestionJobStatus:
+    """Report a background ingestion job's stage, progress and result.
+
+    Args:
+        job_id: Job identifier returned by submit_ingestion
+
+    Returns:
+        IngestionJobStatus containing:
+          - status: queued, running, succeeded, failed or cancelled
+          - stage: convert, chunk, embed or upload while running
+          - progress, chunks_embedded, chunks_total, chunks_per_second
+          - result: DocumentMetadata once succeeded; error once failed
+
+    Raises:
+        JobNotFoundError: If the job_id is unknown
+    """
+    manager = await asyncio.to_thread(get_job_manager)
+    return await asyncio.to_thread(manager.get, job_id)
+
+
+@mcp.tool()
+async def cancel_ingestion(job_id: JobID) -> IngestionJobStatus:
+    """Cancel a background ingestion job.
+
+    Queued jobs are cancelled immediately; running jobs stop at the next
+    pipeline stage or embedding batch (poll until status is "cancelled").
+
+    Args:
+        job_id: Job identifier returned by submit_ingestion
+
+    Returns:
+        IngestionJobStatus with cancel_requested set
+
+    Raises:
+        JobNotFoundError: If the job_id is unknown
+    """
+    manager = await asyncio.to_thread(get_job_manager)
+    return await asyncio.to_thread(manager.cancel, job_id)
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def prometheus_metrics(request: Request) -> PlainTextResponse:
+    """Prometheus scrape endpoint (served when the MCP server runs over HTTP)."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+def _start_worker_services(metrics_dir: Path | None = None) -> None:
+    """Start preloading and the ingestion job workers in a serving process.
+
+    Args:
+        metrics_dir: Directory shared by the HTTP workers' metrics (None: one process)
+    """
+    if metrics_dir is not None:
+        enable_multiprocess(metrics_dir)
+    if settings.preload_on_startup:
+        start_preload()
+    resume_ingestion_jobs()
+
+
+def _stop_worker_services() -> None:
+    """Stop the job workers and write the final metrics of a serving process."""
+    shutdown_job_manager(timeout=5.0)
+    disable_multiprocess()
+
+
+def _load_shared_model() -> None:
+    """Load the embedding model in the HTTP master so forked workers share its weights."""
+    try:
+        get_embedding_model()
+    except RuntimeError:
+        logger.warning("Embedding model not loaded before fork; each worker loads its own")
+
+
+def serve_http() -> None:
+    """Serve MCP over streamable HTTP from settings.http_workers pre-forked workers.
+
+    The master loads the embedding model before forking so the workers share its
+    weights copy-on-write; each worker then preloads the rest (vector store,
+    Docling) itself. Requests are stateless (no MCP session affinity), so any
+    worker can serve any request from a load balancer. The workers share their
+    metrics through a temporary directory, so GET /metrics reports all of them
+    whichever worker takes the scrape.
+    """
+    sock = bind_socket(settings.mcp_server_host, settings.mcp_server_port)
+    logger.info(
+        "Serving MCP over HTTP",
+        extra={
+            "url": f"http://{settings.mcp_server_host}:{settings.mcp_server_port}/mcp",
+            "workers": settings.http_workers,
+        },
+    )
+    preload_model = settings.preload_on_startup and settings.http_workers > 1
+    metrics_dir = None
+    if settings.http_workers > 1:
+        metrics_dir = Path(tempfile.mkdtemp(prefix="raglite-metrics-"))
+    try:
+        serve_prefork(
+            mcp.http_app(path="/mcp", stateless_http=True),
+            sock,
+            workers=settings.http_workers,
+            graceful_timeout=settings.http_graceful_timeout,
+            before_fork=_load_shared_model if preload_model else None,
+            on_worker_start=partial(_start_worker_services, metrics_dir),
+            on_worker_exit=_stop_worker_services,
+        )
+    finally:
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def main() -> None:
+    """Start the RAGLite MCP server (raglite-server console script).
+
+    Applies the CPU thread budget before any model library is imported, starts
+    background preloading (unless settings.preload_on_startup is False)
+    and the ingestion job workers (resuming jobs interrupted by a previous run),
+    and serves MCP over stdio while models load, or over HTTP when
+    settings.mcp_transport is "http" (see serve_http).
+    """
+    apply_thread_budget()
     logger.info(
         "Starting RAGLite MCP Server",
         extra={
             "qdrant_host": settings.qdrant_host,
             "qdrant_port": settings.qdrant_port,
             "collection": settings.qdrant_collection_name,
+            "transport": settings.mcp_transport,
         },
     )
+    if settings.mcp_transport == "http":
+        serve_http()  # /metrics is a route of the HTTP app
+        return
+    if settings.preload_on_startup:
+        start_preload()
+    if settings.metrics_http_enabled:
+        # stdio transport leaves the server port free for a standalone scrape endpoint
+        start_metrics_server(settings.mcp_server_port)
+    resume_ingestion_jobs()
     mcp.run()
+
+
+# Module-level execution for direct startup
+if __name__ == "__main__":
+    main()
@@ -15,14 +15,24 @@ class CitationError(Exception):
     pass
 
 
-async def generate_citations(results: list[QueryResult]) -> list[QueryResult]:
+def format_citation(result: QueryResult) -> str:
+    """Citation string for a result: "(Source: document.pdf, page 12, chunk 5)"."""
+    page = result.page_number if result.page_number is not None else "N/A"
+    return f"(Source: {result.source_document}, page {page}, chunk {result.chunk_index})"
+
+
+async def generate_citations(
+    results: list[QueryResult], append_to_text: bool = True
+) -> list[QueryResult]:
     """Add formatted citations to query results.
 
     Args:
         results: List of QueryResult objects from search
+        append_to_text: Also append the citation to the text (False: citation
+            field only, e.g. for packed context)
 
     Returns:
-        Same list with citation strings appended to text
+        Same list with the citation field set (and citation strings appended to text)
 
     Raises:
         CitationError: If critical metadata missing (source_document)
@@ -31,7 +41,7 @@ async def generate_citations(results: list[QueryResult]) -> list[QueryResult]:
         "(Source: document.pdf, page 12, chunk 5)"
 
     Strategy:
-        - Append citation to chunk text (preserves original content)
+        - Set the citation field and append it to chunk text (preserves original content)
         - Validate required metadata (page_number, source_document)
         - Log warnings for missing page numbers (graceful degradation)
         - Raise error if source_document missing (critical field)
@@ -65,14 +75,11 @@ async def generate_citations(results: list[QueryResult]) -> list[QueryResult]:
             warnings_count += 1
 
         # Format citation
-        citation = (
-            f"(Source: {result.source_document}, "
-            f"page {result.page_number if result.page_number is not None else 'N/A'}, "
-            f"chunk {result.chunk_index})"
-        )
+        result.citation = format_citation(result)
 
         # Append citation to chunk text
-        result.text = f"{result.text}\n\n{citation}"
+        if append_to_text:
+            result.text = f"{result.text}\n\n{result.citation}"
 
         logger.debug(
             "Citation added",
@@ -0,0 +1,197 @@
+"""Adjacent-chunk context expansion for search results.
+
+Answers in financial reports often straddle chunk boundaries. With
+``context_window=k``, ``search_documents`` widens every hit to chunks
+``chunk_index - k .. chunk_index + k`` of the same document:
+
+- Point IDs are deterministic (``chunk_point_id`` of the document's source
+  path and ``{filename}_{chunk_index}``), so all neighbours of all hits are fetched in one
+  ``retrieve`` call, with no filter or search. Hits without a ``source_path``
+  payload come from collections ingested with older (random or file-name
+  based) IDs; their neighbours are looked up by ``source_document`` and
+  ``chunk_index`` filter instead (one ``scroll``), so re-ingestion is not needed.
+- Overlapping or touching windows of one document merge into one passage,
+  so a neighbour shared by two hits is returned once.
+- Consecutive chunks of a page overlap by 50 words (chunk_document,
+  chunk_by_docling_items), which are joined once (join_chunk_texts), so each
+  passage reads as contiguous text. Shorter matches (MIN_OVERLAP_WORDS) are
+  text that merely repeats across a chunk boundary and is kept.
+
+A passage takes the best score of the hits it contains, and the page number
+and chunk_index of its first chunk; ``chunk_count`` is the number of chunks
+merged. Passages are returned best score first.
+
+Example:
+    >>> hits = await search_documents("Q3 revenue", top_k=5)
+    >>> passages = expand_adjacent_chunks(store, "financial_docs", hits, window=1)
+"""
+
+from typing import Any
+
+from raglite.shared.models import QueryResult, chunk_point_id
+
+# Longest word overlap between consecutive chunks that join_chunk_texts removes
+MAX_OVERLAP_WORDS = 200
+
+# Shortest word overlap treated as chunker overlap (chunks of a page overlap by 50
+# words; chunks on different pages do not overlap, but may share a word or two)
+MIN_OVERLAP_WORDS = 8
+
+
+def word_overlap(
+    previous: list[str], following: list[str], min_words: int = MIN_OVERLAP_WORDS
+) -> int:
+    """Length of the longest suffix of previous that is a prefix of following.
+
+    Matches shorter than min_words are coincidental repeats and count as 0.
+    """
+    longest = min(len(previous), len(following), MAX_OVERLAP_WORDS)
+    for n in range(longest, max(min_words, 1) - 1, -1):
+        if previous[-n:] == following[:n]:
+            return n
+    return 0
+
+
+def join_chunk_texts(texts: list[str]) -> str:
+    """Join consecutive chunk texts, keeping the words they overlap by once."""
+    words: list[str] = []
+    for text in texts:
+        chunk_words = text.split()
+        words.extend(chunk_words[word_overlap(words, chunk_words) :])
+    return " ".join(words)
+
+
+def _windows(chunk_indices: list[int], window: int) -> list[tuple[int, int]]:
+    """Merge [index - window, index + window] ranges that overlap or touch."""
+    merged: list[tuple[int, int]] = []
+    for index in sorted(set(chunk_indices)):
+        start, stop = max(0, index - window), index + window
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], stop))
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def _scroll_legacy_neighbours(
+    store: Any, collection_name: str, neighbours: set[tuple[str, int]]
+) -> dict[tuple[str, int], tuple[str, int | None]]:
+    """Fetch neighbours of hits without source_path by file name and chunk_index filter."""
+    from qdrant_client.models import FieldCondition, Filter, MatchAny
+
+    scroll_filter = Filter(
+        must=[
+            FieldCondition(
+                key="source_document", match=MatchAny(any=sorted({s for s, _ in neighbours}))
+            ),
+            FieldCondition(
+                key="chunk_index", match=MatchAny(any=sorted({i for _, i in neighbours}))
+            ),
+        ]
+    )
+    chunks: dict[tuple[str, int], tuple[str, int | None]] = {}
+    offset = None
+    while True:
+        records, offset = store.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=max(len(neighbours), 64),
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        for record in records:
+            payload = record.payload or {}
+            key = (payload.get("source_document"), payload.get("chunk_index"))
+            # A file of the same name ingested later (with source_path) is another document
+            if key in neighbours and not payload.get("source_path"):
+                chunks[key] = (payload["text"], payload.get("page_number"))  # type: ignore[index]
+        if offset is None:
+            return chunks
+
+
+def expand_adjacent_chunks(
+    store: Any, collection_name: str, results: list[QueryResult], window: int
+) -> list[QueryResult]:
+    """Replace hits by passages of their neighbouring chunks (one batched retrieve).
+
+    Args:
+        store: Vector store (raglite.shared.clients.VectorStore)
+        collection_name: Collection the hits came from
+        results: Search hits, best first
+        window: Neighbouring chunks to add on each side of a hit (0: no change)
+
+    Returns:
+        Merged passages, best score first (fewer than results when windows merge)
+    """
+    if window <= 0 or not results:
+        return results
+
+    # Documents are told apart by source path (file names may repeat across directories)
+    hits: dict[tuple[str, int], QueryResult] = {
+        (r.source_path or r.source_document, r.chunk_index): r for r in reversed(results)
+    }
+    filenames = {source: hit.source_document for (source, _), hit in hits.items()}
+    with_path = {source for (source, _), hit in hits.items() if hit.source_path}
+    windows = {
+        source: _windows([i for s, i in hits if s == source], window)
+        for source in {s for s, _ in hits}
+    }
+
+    # Every neighbour that is not itself a hit, fetched in one request (by ID)
+    neighbours = {
+        (source, index)
+        for source, ranges in windows.items()
+        for start, stop in ranges
+        for index in range(start, stop + 1)
+        if (source, index) not in hits
+    }
+    wanted = {
+        chunk_point_id(source, f"{filenames[source]}_{index}"): (source, index)
+        for source, index in neighbours
+        if source in with_path
+    }
+    legacy = {(source, index) for source, index in neighbours if source not in with_path}
+    chunks: dict[tuple[str, int], tuple[str, int | None]] = {
+        key: (hit.text, hit.page_number) for key, hit in hits.items()
+    }
+    if wanted:
+        for record in store.retrieve(
+            collection_name=collection_name,
+            ids=list(wanted),
+            with_payload=True,
+            with_vectors=False,
+        ):
+            key = wanted.get(str(record.id))
+            if key is not None and record.payload:
+                chunks[key] = (record.payload["text"], record.payload.get("page_number"))
+    if legacy:
+        chunks.update(_scroll_legacy_neighbours(store, collection_name, legacy))
+
+    passages: list[QueryResult] = []
+    for source, ranges in windows.items():
+        for start, stop in ranges:
+            # Split at missing chunks (end of document, deleted points): passages stay contiguous
+            run: list[int] = []
+            for index in range(start, stop + 2):
+                if (source, index) in chunks and index <= stop:
+                    run.append(index)
+                    continue
+                run_hits = [hits[source, i] for i in run if (source, i) in hits]
+                if run_hits:
+                    text = join_chunk_texts([chunks[source, i][0] for i in run])
+                    passages.append(
+                        QueryResult(
+                            score=max(hit.score for hit in run_hits),
+                            text=text,
+                            source_document=run_hits[0].source_document,
+                            page_number=chunks[source, run[0]][1],
+                            chunk_index=run[0],
+                            word_count=len(text.split()),
+                            source_path=run_hits[0].source_path,
+                            chunk_count=len(run),
+                        )
+                    )
+                run = []
+    passages.sort(key=lambda passage: passage.score, reverse=True)
+    return passages
@@ -0,0 +1,153 @@
+"""Token-budgeted context packing for query results.
+
+A query can return up to 50 chunks of ~500 words. Consecutive chunks of a
+document overlap by 50 words (chunk_document), and boilerplate repeated
+across pages or reports retrieves as near-identical chunks. All of it is sent
+to the MCP client's LLM. ``pack_results`` fills a token budget in score order
+with only new text:
+
+- words a result shares with an already packed adjacent chunk (or passage)
+  of the same document (source path) are trimmed from its start or end; a
+  result inside an already packed passage is dropped. Only chunker overlap is
+  trimmed: matches shorter than MIN_OVERLAP_WORDS are words that repeat across
+  a page boundary and are kept (word_overlap, shared with context expansion)
+- near-duplicates of a packed result (word 3-gram Jaccard similarity at or
+  above NEAR_DUPLICATE_SIMILARITY) are dropped
+- a result that does not fit is truncated to the remaining budget if at
+  least MIN_PASSAGE_TOKENS remain, otherwise skipped (a shorter one may fit)
+
+Citations are counted in the budget but not appended to the text: the caller
+runs ``generate_citations(packed, append_to_text=False)`` so they stay in
+the structured ``citation`` field.
+
+Token counts are estimated from word counts (TOKENS_PER_WORD); the client's
+tokenizer is unknown to the server.
+
+Example:
+    >>> packed, tokens = pack_results(results, token_budget=2000)
+    >>> packed = await generate_citations(packed, append_to_text=False)
+"""
+
+import math
+import re
+
+from raglite.retrieval.attribution import format_citation
+from raglite.retrieval.expansion import MIN_OVERLAP_WORDS, word_overlap
+from raglite.shared.logging import get_logger
+from raglite.shared.models import QueryResult
+
+logger = get_logger(__name__)
+
+# Estimated tokens per whitespace-separated word (BPE tokenizers split numbers,
+# currency and punctuation finely, so financial text runs above English prose)
+TOKENS_PER_WORD = 1.4
+
+# Word 3-gram Jaccard similarity at which a result duplicates a packed one
+NEAR_DUPLICATE_SIMILARITY = 0.8
+
+# Smallest truncated result worth sending
+MIN_PASSAGE_TOKENS = 64
+
+_WORD = re.compile(r"\S+")
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimated token count of a text."""
+    return math.ceil(len(text.split()) * TOKENS_PER_WORD)
+
+
+def _shingles(words: list[str]) -> set[int]:
+    """Hashed lowercase word 3-grams (single words for very short texts)."""
+    lowered = [word.lower() for word in words]
+    if len(lowered) < 3:
+        return {hash(word) for word in lowered}
+    return {hash(tuple(lowered[i : i + 3])) for i in range(len(lowered) - 2)}
+
+
+def _similarity(a: set[int], b: set[int]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def pack_results(
+    results: list[QueryResult],
+    token_budget: int,
+    duplicate_similarity: float = NEAR_DUPLICATE_SIMILARITY,
+) -> tuple[list[QueryResult], int]:
+    """Pack results into a token budget, best score first, without repeated text.
+
+    Args:
+        results: Search results (chunks or expanded passages), without citations
+        token_budget: Maximum estimated tokens of text plus citations
+        duplicate_similarity: Jaccard similarity at which a result is a near-duplicate
+
+    Returns:
+        (packed results as copies, best score first; estimated tokens used)
+    """
+    packed: list[QueryResult] = []
+    packed_words: list[list[str]] = []
+    packed_shingles: list[set[int]] = []
+    used = 0
+    trimmed_words = duplicates = skipped = 0
+
+    for result in sorted(results, key=lambda r: r.score, reverse=True):
+        spans = [match.span() for match in _WORD.finditer(result.text)]
+        words = [result.text[start:stop] for start, stop in spans]
+        first, last = result.chunk_index, result.chunk_index + result.chunk_count - 1
+        start, stop = 0, len(words)
+
+        # Text already sent in an adjacent or enclosing chunk of the same document
+        source = result.source_path or result.source_document
+        contained = False
+        for other, other_words in zip(packed, packed_words, strict=True):
+            if (other.source_path or other.source_document) != source:
+                continue
+            other_first = other.chunk_index
+            other_last = other.chunk_index + other.chunk_count - 1
+            if other_first <= first and last <= other_last:
+                contained = True
+                break
+            if other_last == first - 1:
+                start += word_overlap(other_words, words[start:stop], MIN_OVERLAP_WORDS)
+            elif other_first == last + 1:
+                stop -= word_overlap(words[start:stop], other_words, MIN_OVERLAP_WORDS)
+        if contained or start >= stop:
+            duplicates += 1
+            continue
+        trimmed_words += len(words) - (stop - start)
+
+        shingles = _shingles(words[start:stop])
+        if any(_similarity(shingles, seen) >= duplicate_similarity for seen in packed_shingles):
+            duplicates += 1
+            continue
+
+        citation_tokens = estimate_tokens(format_citation(result))
+        cost = math.ceil((stop - start) * TOKENS_PER_WORD) + citation_tokens
+        remaining = token_budget - used
+        if cost > remaining:
+            if remaining - citation_tokens < MIN_PASSAGE_TOKENS:
+                skipped += 1
+                continue
+            stop = start + int((remaining - citation_tokens) / TOKENS_PER_WORD)
+            cost = math.ceil((stop - start) * TOKENS_PER_WORD) + citation_tokens
+
+        text = result.text[spans[start][0] : spans[stop - 1][1]]
+        packed.append(result.model_copy(update={"text": text, "word_count": stop - start}))
+        packed_words.append(words[start:stop])
+        packed_shingles.append(shingles)
+        used += cost
+
+    logger.info(
+        "Context packed",
+        extra={
+            "results_in": len(results),
+            "results_out": len(packed),
+            "tokens": used,
+            "token_budget": token_budget,
+            "overlap_words_trimmed": trimmed_words,
+            "duplicates_dropped": duplicates,
+            "over_budget_skipped": skipped,
+        },
+    )
+    return packed, used
@@ -0,0 +1,252 @@
+"""Semantic query cache: reuse results of a near-identical recent query.
+
+Exact-string caching misses paraphrases ("Q3 revenue" vs. "revenue in the
+third quarter"). ``SemanticQueryCache`` keeps the normalized embeddings of
+recent queries in one preallocated ``(size, dimension)`` float32 matrix. A
+lookup is a single matrix-vector product (cosine similarity against every
+cached query) masked to the eligible entries:
+
+- same filters, and a cached ``top_k`` at least as large as requested (the
+  cached results are sorted, so a prefix answers a smaller ``top_k``)
+- searched at the collection's current epoch (raglite.shared.epoch): entries
+  stay valid until documents are stored or deleted, in any process
+- not older than ``settings.query_cache_ttl_seconds`` (if set)
+
+The best eligible entry at or above ``settings.query_cache_similarity`` is a
+hit. Slots of entries from older epochs are reused first; when the cache is
+full the least recently used entry is replaced.
+
+Lookups record the best similarity (``raglite_query_cache_similarity``) so the
+threshold can be tuned, hits and misses (``raglite_cache_requests_total``,
+cache="semantic_query") and the vector search time saved.
+
+Example:
+    >>> cache, epoch = get_query_cache(), get_collection_epoch()
+    >>> results = cache.lookup(embedding, top_k=5, filters=(), epoch=epoch)
+    >>> if results is None:
+    ...     results = search(...)
+    ...     cache.store(embedding, 5, (), results, search_ms=42.0, epoch=epoch)
+"""
+
+import threading
+import time
+from collections.abc import Hashable, Sequence
+
+import numpy as np
+
+from raglite.shared.config import settings
+from raglite.shared.metrics import (
+    CACHE_REQUESTS,
+    QUERY_CACHE_SAVED_SECONDS,
+    QUERY_CACHE_SIMILARITY,
+)
+from raglite.shared.models import QueryCacheStats, QueryResult
+
+# Misses this close below the threshold are reported as near misses
+NEAR_MISS_MARGIN = 0.05
+
+
+class SemanticQueryCache:
+    """Fixed-size LRU cache of query results keyed by embedding similarity.
+
+    Args:
+        dimension: Embedding dimension
+        size: Maximum cached queries
+        threshold: Cosine similarity needed for a hit
+        ttl_seconds: Entry lifetime (None: until the epoch changes)
+    """
+
+    def __init__(
+        self,
+        dimension: int,
+        size: int = 1024,
+        threshold: float = 0.95,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        self.size = max(1, size)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self._vectors = np.zeros((self.size, dimension), dtype=np.float32)
+        self._top_k = np.zeros(self.size, dtype=np.int32)  # 0: empty slot
+        self._filters = np.full(self.size, -1, dtype=np.int64)  # Interned filter key
+        self._epochs = np.full(self.size, -1, dtype=np.int64)  # Collection epoch of each entry
+        self._expires = np.zeros(self.size, dtype=np.float64)
+        self._last_used = np.zeros(self.size, dtype=np.int64)  # LRU clock
+        self._results: list[list[QueryResult]] = [[] for _ in range(self.size)]
+        self._search_ms = np.zeros(self.size, dtype=np.float64)
+        self._filter_ids: dict[Hashable, int] = {}
+        self._clock = 0
+        self._latest_epoch = -1
+        self._lock = threading.Lock()
+        # Statistics
+        self._lookups = 0
+        self._hits = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._near_misses = 0
+        self._hit_similarity_sum = 0.0
+        self._min_hit_similarity: float | None = None
+        self._saved_ms = 0.0
+
+    def _normalize(self, embedding: Sequence[float] | np.ndarray) -> np.ndarray | None:
+        vector = np.asarray(embedding, dtype=np.float32)
+        if vector.shape != (self._vectors.shape[1],):
+            return None
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    def _observe_epoch(self, epoch: int) -> None:
+        if epoch > self._latest_epoch:
+            if self._latest_epoch >= 0:
+                self._invalidations += 1  # Earlier entries no longer match
+            self._latest_epoch = epoch
+
+    def lookup(
+        self,
+        embedding: Sequence[float] | np.ndarray,
+        top_k: int,
+        filters: Hashable = (),
+        epoch: int = 0,
+    ) -> list[QueryResult] | None:
+        """Return copies of the cached results of a similar query, or None on a miss.
+
+        Args:
+            epoch: Current epoch of the searched collection
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return None
+        with self._lock:
+            self._lookups += 1
+            self._observe_epoch(epoch)
+            filter_id = self._filter_ids.get(filters, -2)
+            eligible = (
+                (self._top_k >= top_k)
+                & (self._filters == filter_id)
+                & (self._epochs == epoch)
+                & (self._expires > time.monotonic())
+            )
+            best_similarity: float | None = None
+            hit: int | None = None
+            if eligible.any():
+                similarities = np.where(eligible, self._vectors @ vector, -np.inf)
+                best = int(np.argmax(similarities))
+                best_similarity = float(similarities[best])
+                if best_similarity >= self.threshold:
+                    hit = best
+            if best_similarity is not None:
+                QUERY_CACHE_SIMILARITY.observe(best_similarity)
+
+            if hit is None or best_similarity is None:
+                if best_similarity is not None and best_similarity >= (
+                    self.threshold - NEAR_MISS_MARGIN
+                ):
+                    self._near_misses += 1
+                CACHE_REQUESTS.labels(cache="semantic_query", result="miss").inc()
+                return None
+
+            self._clock += 1
+            self._last_used[hit] = self._clock
+            self._hits += 1
+            self._hit_similarity_sum += best_similarity
+            if self._min_hit_similarity is None or best_similarity < self._min_hit_similarity:
+                self._min_hit_similarity = best_similarity
+            saved_ms = float(self._search_ms[hit])
+            self._saved_ms += saved_ms
+            results = self._results[hit][:top_k]
+        CACHE_REQUESTS.labels(cache="semantic_query", result="hit").inc()
+        QUERY_CACHE_SAVED_SECONDS.inc(saved_ms / 1000)
+        return [result.model_copy(deep=True) for result in results]
+
+    def store(
+        self,
+        embedding: Sequence[float] | np.ndarray,
+        top_k: int,
+        filters: Hashable,
+        results: list[QueryResult],
+        search_ms: float,
+        epoch: int = 0,
+    ) -> None:
+        """Cache the results of a query (reusing a stale, expired or least recently used slot).
+
+        Args:
+            epoch: Collection epoch read before the search (if the collection
+                changed during the search, the entry never matches a lookup)
+        """
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        copies = [result.model_copy(deep=True) for result in results]
+        with self._lock:
+            self._observe_epoch(epoch)
+            free = np.flatnonzero(
+                (self._epochs != self._latest_epoch) | (self._expires <= time.monotonic())
+            )
+            if free.size:
+                slot = int(free[0])
+            else:
+                slot = int(np.argmin(self._last_used))
+                self._evictions += 1
+            self._clock += 1
+            self._vectors[slot] = vector
+            self._top_k[slot] = top_k
+            self._filters[slot] = self._filter_ids.setdefault(filters, len(self._filter_ids))
+            self._epochs[slot] = epoch
+            self._expires[slot] = (
+                time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else np.inf
+            )
+            self._last_used[slot] = self._clock
+            self._results[slot] = copies
+            self._search_ms[slot] = search_ms
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._top_k[:] = 0
+            self._epochs[:] = -1
+            self._expires[:] = 0
+            self._results = [[] for _ in range(self.size)]
+            self._filter_ids.clear()
+            self._filters[:] = -1
+
+    def stats(self) -> QueryCacheStats:
+        """Hit rate, similarity statistics and latency saved since start."""
+        with self._lock:
+            return QueryCacheStats(
+                entries=int(
+                    np.count_nonzero(
+                        (self._epochs == self._latest_epoch) & (self._expires > time.monotonic())
+                    )
+                ),
+                lookups=self._lookups,
+                hits=self._hits,
+                hit_rate=self._hits / self._lookups if self._lookups else 0.0,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                threshold=self.threshold,
+                mean_hit_similarity=self._hit_similarity_sum / self._hits if self._hits else None,
+                min_hit_similarity=self._min_hit_similarity,
+                near_misses=self._near_misses,
+                latency_saved_ms=round(self._saved_ms, 2),
+            )
+
+
+# Module-level cache (created on first use)
+_query_cache: SemanticQueryCache | None = None
+_query_cache_lock = threading.Lock()
+
+
+def get_query_cache() -> SemanticQueryCache:
+    """Return the process-wide semantic query cache (sized from settings)."""
+    global _query_cache
+
+    if _query_cache is None:
+        with _query_cache_lock:
+            if _query_cache is None:
+                _query_cache = SemanticQueryCache(
+                    settings.embedding_dimension,
+                    settings.query_cache_size,
+                    settings.query_cache_similarity,
+                    settings.query_cache_ttl_seconds,
+                )
+    return _query_cache
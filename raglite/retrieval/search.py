@@ -4,11 +4,20 @@ Performs semantic search using Fin-E5 embeddings and Qdrant vector database.
 """
 
 import time
+from typing import TYPE_CHECKING
 
-from raglite.shared.clients import get_embedding_model, get_qdrant_client
+from raglite.shared.clients import get_embedding_model, get_vector_store
 from raglite.shared.config import settings
+from raglite.shared.epoch import get_collection_epoch
 from raglite.shared.logging import get_logger
+from raglite.shared.metrics import QUERY_EMBED_SECONDS, RERANK_SECONDS, VECTOR_SEARCH_SECONDS
 from raglite.shared.models import QueryResult
+from raglite.shared.scheduler import Priority, embed_with_priority
+from raglite.shared.singleflight import SingleFlight, normalize_query
+from raglite.shared.tracing import span
+
+if TYPE_CHECKING:
+    from qdrant_client.models import ScoredPoint
 
 logger = get_logger(__name__)
 
@@ -19,6 +28,10 @@ class QueryError(Exception):
     pass
 
 
+# Identical in-flight searches share one execution: (results, stage timings)
+_query_flight: SingleFlight[tuple[list[QueryResult], dict[str, float]]] = SingleFlight("query")
+
+
 async def generate_query_embedding(query: str) -> list[float]:
     """Generate embedding vector for natural language query.
 
@@ -33,6 +46,7 @@ async def generate_query_embedding(query: str) -> list[float]:
 
     Strategy:
         - Reuse embedding model from Story 1.5 (get_embedding_model singleton)
+        - Runs on the shared embedder thread ahead of queued ingestion batches
         - Same model as document embeddings (Fin-E5 intfloat/e5-large-v2)
         - Returns list[float] compatible with Qdrant query_points API
 
@@ -49,9 +63,11 @@ async def generate_query_embedding(query: str) -> list[float]:
         start_time = time.time()
 
         model = get_embedding_model()
-        embedding = model.encode([query])[0]  # Returns numpy array
+        embeddings = await embed_with_priority(Priority.QUERY, model.encode, [query])
+        embedding = embeddings[0]  # Returns numpy array
 
         elapsed_ms = (time.time() - start_time) * 1000
+        QUERY_EMBED_SECONDS.observe(elapsed_ms / 1000)
         logger.info(
             "Query embedding generated",
             extra={"embedding_dim": len(embedding), "elapsed_ms": round(elapsed_ms, 2)},
@@ -70,17 +86,35 @@ async def generate_query_embedding(query: str) -> list[float]:
 
 
 async def search_documents(
-    query: str, top_k: int = 5, filters: dict[str, str] | None = None
+    query: str,
+    top_k: int = 5,
+    filters: dict[str, str] | None = None,
+    timings: dict[str, float] | None = None,
+    context_window: int = 0,
+    diversify: bool = False,
 ) -> list[QueryResult]:
     """Search documents using vector similarity.
 
+    Concurrent identical searches (same normalized query, top_k and filters)
+    share one execution (raglite.shared.singleflight). With
+    settings.query_cache_enabled, a similar query searched since the
+    collection last changed answers without a vector search
+    (raglite.retrieval.query_cache).
+
     Args:
         query: Natural language query
         top_k: Number of results to return (default: 5)
         filters: Optional metadata filters (e.g., {'source_document': 'Q3_Report.pdf'})
+        timings: Optional dict filled with stage latencies in milliseconds
+            (embed_ms, vector_search_ms, rerank_ms, expand_ms) for slow-query logging
+        context_window: Neighbouring chunks to add on each side of every hit,
+            merged into contiguous passages (raglite.retrieval.expansion)
+        diversify: Pick top_k of settings.mmr_candidates candidates by maximal
+            marginal relevance (raglite.retrieval.mmr)
 
     Returns:
-        List of QueryResult objects sorted by relevance (highest score first)
+        List of QueryResult objects sorted by relevance (highest score first);
+        with context_window, up to top_k passages (windows that overlap merge)
 
     Raises:
         QueryError: If search fails or query is invalid
@@ -99,6 +133,92 @@ async def search_documents(
         >>> results[0].score
         0.87
     """
+    # Searches of different collection versions (epochs) are never shared
+    epoch = get_collection_epoch(settings.qdrant_collection_name)
+    key = (
+        normalize_query(query),
+        top_k,
+        tuple(sorted((filters or {}).items())),
+        context_window,
+        diversify,
+        epoch,
+    )
+    results, stage_timings = await _query_flight.do(
+        key, lambda: _search_with_timings(query, top_k, filters, epoch, context_window, diversify)
+    )
+    if timings is not None:
+        timings.update(stage_timings)
+    return results
+
+
+async def _search_with_timings(
+    query: str,
+    top_k: int,
+    filters: dict[str, str] | None,
+    epoch: int,
+    context_window: int = 0,
+    diversify: bool = False,
+) -> tuple[list[QueryResult], dict[str, float]]:
+    timings: dict[str, float] = {}
+    results = await _search_documents(query, top_k, filters, timings, epoch, diversify)
+    if context_window > 0 and results:
+        results = _expand_results(results, context_window, timings)
+    return results, timings
+
+
+def _diversify(
+    points: list["ScoredPoint"], top_k: int, timings: dict[str, float] | None
+) -> list["ScoredPoint"]:
+    """Pick top_k of the candidate points by maximal marginal relevance."""
+    from raglite.retrieval.mmr import mmr_select
+
+    rerank_start = time.perf_counter()
+    with span("mmr", candidates=len(points), top_k=top_k):
+        order = mmr_select(
+            [point.score for point in points],
+            [point.vector for point in points],
+            top_k,
+            settings.mmr_lambda,
+        )
+    rerank_seconds = time.perf_counter() - rerank_start
+    RERANK_SECONDS.observe(rerank_seconds)
+    if timings is not None:
+        timings["rerank_ms"] = round(rerank_seconds * 1000, 2)
+    return [points[i] for i in order]
+
+
+def _expand_results(
+    results: list[QueryResult], context_window: int, timings: dict[str, float]
+) -> list[QueryResult]:
+    """Widen hits to passages of neighbouring chunks (see expand_adjacent_chunks)."""
+    from raglite.retrieval.expansion import expand_adjacent_chunks
+
+    expand_start = time.perf_counter()
+    try:
+        with span("expand_context", hits=len(results), window=context_window) as expand_span:
+            passages = expand_adjacent_chunks(
+                get_vector_store(), settings.qdrant_collection_name, results, context_window
+            )
+            expand_span.set_attribute("passages", len(passages))
+    except Exception as e:
+        logger.error(f"Context expansion failed: {e}", exc_info=True)
+        raise QueryError(f"Context expansion failed: {e}") from e
+    timings["expand_ms"] = round((time.perf_counter() - expand_start) * 1000, 2)
+    return passages
+
+
+async def _search_documents(
+    query: str,
+    top_k: int = 5,
+    filters: dict[str, str] | None = None,
+    timings: dict[str, float] | None = None,
+    epoch: int = 0,
+    diversify: bool = False,
+) -> list[QueryResult]:
+    """Run one vector search (uncoalesced; see search_documents).
+
+    epoch is the collection epoch read before the search (semantic cache key).
+    """
     from qdrant_client.models import FieldCondition, Filter, MatchValue
 
     logger.info(
@@ -113,10 +233,26 @@ async def search_documents(
 
     try:
         # Generate query embedding
-        query_embedding = await generate_query_embedding(query)
-
-        # Get Qdrant client
-        qdrant = get_qdrant_client()
+        embed_start = time.perf_counter()
+        with span("generate_query_embedding", query_length=len(query)):
+            query_embedding = await generate_query_embedding(query)
+        if timings is not None:
+            timings["embed_ms"] = round((time.perf_counter() - embed_start) * 1000, 2)
+
+        # A near-identical recent query answers without a vector search
+        cache = None
+        if settings.query_cache_enabled:
+            from raglite.retrieval.query_cache import get_query_cache
+
+            cache = get_query_cache()
+            filters_key = (tuple(sorted((filters or {}).items())), diversify)
+            cached = cache.lookup(query_embedding, top_k, filters_key, epoch)
+            if cached is not None:
+                logger.info("Query cache hit", extra={"query": query[:100], "results": len(cached)})
+                return cached
+
+        # Get vector store (Qdrant server, embedded Qdrant or NumPy, see settings.vector_backend)
+        store = get_vector_store()
 
         # Build Qdrant filter (if provided)
         qdrant_filter = None
@@ -129,18 +265,31 @@ async def search_documents(
                 ]
             )
 
-        # Perform vector search
-        search_result = qdrant.query_points(
-            collection_name=settings.qdrant_collection_name,
-            query=query_embedding,
-            limit=top_k,
-            query_filter=qdrant_filter,
-            with_payload=True,
-        )
+        # Perform vector search (diversify: over-fetch candidates with their vectors)
+        limit = max(top_k, settings.mmr_candidates) if diversify else top_k
+        search_start = time.perf_counter()
+        with span("query_points", top_k=limit, filtered=qdrant_filter is not None) as search_span:
+            search_result = store.query_points(
+                collection_name=settings.qdrant_collection_name,
+                query=query_embedding,
+                limit=limit,
+                query_filter=qdrant_filter,
+                with_payload=True,
+                with_vectors=diversify,
+            )
+            search_span.set_attribute("points", len(search_result.points))
+        search_seconds = time.perf_counter() - search_start
+        VECTOR_SEARCH_SECONDS.observe(search_seconds)
+        if timings is not None:
+            timings["vector_search_ms"] = round(search_seconds * 1000, 2)
+
+        points = search_result.points
+        if diversify and len(points) > top_k:
+            points = _diversify(points, top_k, timings)
 
         # Convert to QueryResult objects
         results = []
-        for point in search_result.points:
+        for point in points:
             payload = point.payload
 
             # Type guard: Qdrant with_payload=True should always return dict
@@ -172,9 +321,14 @@ async def search_documents(
                     page_number=payload["page_number"],
                     chunk_index=payload["chunk_index"],
                     word_count=payload["word_count"],
+                    source_path=payload.get("source_path"),
                 )
             )
 
+        if cache is not None:
+            search_ms = (time.perf_counter() - search_start) * 1000
+            cache.store(query_embedding, top_k, filters_key, results, search_ms, epoch)
+
         elapsed_ms = (time.time() - start_time) * 1000
         logger.info(
             "Search complete",
@@ -0,0 +1,79 @@
+"""Append-only log of slow queries with a per-stage latency breakdown.
+
+Every query slower than ``settings.slow_query_threshold_ms`` is appended to
+``settings.slow_query_log_file`` as one compact JSON line:
+
+    {"timestamp":"2025-10-12T09:30:01.123+00:00","query":"Q3 EBITDA margin?",
+     "top_k":5,"total_ms":2412.7,"embed_ms":38.1,
+     "vector_search_ms":2301.4,"citation_ms":0.4,"results":5,"top_score":0.8213}
+
+The tail of the latency distribution is kept with enough detail to see whether
+embedding or the vector search (HNSW ``ef``, cache misses) is responsible.
+
+Example:
+    $ jq -s 'sort_by(-.vector_search_ms) | .[:10]' workspace/reports/slow-queries.jsonl
+"""
+
+import json
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.metrics import SLOW_QUERIES
+from raglite.shared.models import QueryResult
+
+logger = get_logger(__name__)
+
+_write_lock = threading.Lock()
+
+
+def log_if_slow(
+    query: str,
+    top_k: int,
+    total_ms: float,
+    timings: dict[str, float],
+    results: list[QueryResult],
+) -> bool:
+    """Append the query to the slow-query log if it exceeded the threshold.
+
+    Write failures are logged, never raised: the query already succeeded.
+
+    Args:
+        query: Query string
+        top_k: Requested result count
+        total_ms: End-to-end query latency
+        timings: Stage latencies in ms (embed_ms, vector_search_ms, citation_ms)
+        results: Returned results (count and top score are recorded)
+
+    Returns:
+        True if the query was logged as slow
+    """
+    threshold_ms = settings.slow_query_threshold_ms
+    if threshold_ms is None or total_ms < threshold_ms:
+        return False
+
+    entry = {
+        "timestamp": datetime.now(UTC).isoformat(timespec="milliseconds"),
+        "query": query,
+        "top_k": top_k,
+        "total_ms": round(total_ms, 2),
+        "embed_ms": timings.get("embed_ms"),
+        "vector_search_ms": timings.get("vector_search_ms"),
+        "citation_ms": timings.get("citation_ms"),
+        "results": len(results),
+        "top_score": round(results[0].score, 4) if results else None,
+    }
+    SLOW_QUERIES.inc()
+
+    path = Path(settings.slow_query_log_file)
+    try:
+        line = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+        with _write_lock:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("a", encoding="utf-8") as f:
+                f.write(line + "\n")
+    except OSError as e:
+        logger.warning("Failed to write slow-query log", extra={"path": str(path), "error": str(e)})
+    return True
@@ -1,23 +1,132 @@
 """API client factories for external services.
 
-Provides singleton client instances for Qdrant and Claude API.
+Provides singleton client instances for Qdrant and Claude API, and the
+pluggable vector store used by ingestion and retrieval.
 """
 
-import time
+from __future__ import annotations
 
-from anthropic import Anthropic
-from qdrant_client import QdrantClient
-from sentence_transformers import SentenceTransformer
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING, Any, Protocol
 
 from raglite.shared.config import settings
+from raglite.shared.lazy import lazy_import
 from raglite.shared.logging import get_logger
 
+if TYPE_CHECKING:
+    from anthropic import Anthropic
+    from qdrant_client import QdrantClient
+    from qdrant_client.http.models import QueryResponse
+    from qdrant_client.models import (
+        CollectionInfo,
+        CountResult,
+        Filter,
+        PointStruct,
+        Record,
+        UpdateResult,
+    )
+    from sentence_transformers import SentenceTransformer
+else:
+    # Heavy client libraries are imported on first use (fast server startup)
+    Anthropic = lazy_import("anthropic", "Anthropic")
+    QdrantClient = lazy_import("qdrant_client", "QdrantClient")
+    SentenceTransformer = lazy_import("sentence_transformers", "SentenceTransformer")
+
 logger = get_logger(__name__)
 
 
+class VectorStore(Protocol):
+    """Vector database operations used by RAGLite (a subset of the QdrantClient API).
+
+    Implemented by QdrantClient (remote server or embedded path-based local mode)
+    and by raglite.shared.vector_store.NumpyVectorStore (in-process exact search).
+    """
+
+    def collection_exists(self, collection_name: str) -> bool: ...
+
+    def create_collection(
+        self, collection_name: str, vectors_config: Any, **kwargs: Any
+    ) -> bool: ...
+
+    def get_collection(self, collection_name: str) -> CollectionInfo: ...
+
+    def update_collection(self, collection_name: str, **kwargs: Any) -> bool: ...
+
+    def delete_collection(self, collection_name: str, **kwargs: Any) -> bool: ...
+
+    def create_payload_index(
+        self, collection_name: str, field_name: str, field_schema: Any = None, **kwargs: Any
+    ) -> UpdateResult: ...
+
+    def upsert(self, collection_name: str, points: Any, **kwargs: Any) -> UpdateResult: ...
+
+    def upload_points(
+        self, collection_name: str, points: Iterable[PointStruct], **kwargs: Any
+    ) -> None: ...
+
+    def delete(self, collection_name: str, points_selector: Any, **kwargs: Any) -> UpdateResult: ...
+
+    def count(
+        self, collection_name: str, count_filter: Filter | None = None, exact: bool = True
+    ) -> CountResult: ...
+
+    def query_points(
+        self, collection_name: str, query: Any = None, **kwargs: Any
+    ) -> QueryResponse: ...
+
+    def retrieve(
+        self, collection_name: str, ids: Sequence[str | int], **kwargs: Any
+    ) -> list[Record]: ...
+
+    def scroll(
+        self, collection_name: str, scroll_filter: Filter | None = None, **kwargs: Any
+    ) -> tuple[list[Record], Any]: ...
+
+
 # Module-level singletons (connection pooling and model caching)
 _qdrant_client: QdrantClient | None = None
+_vector_store: VectorStore | None = None  # Embedded backends (settings.vector_backend)
 _embedding_model: SentenceTransformer | None = None
+_embedding_model_lock = threading.Lock()  # Background preload and requests load once
+
+
+def create_qdrant_client(prefer_grpc: bool | None = None) -> QdrantClient:
+    """Create a new Qdrant client with transport settings applied.
+
+    Args:
+        prefer_grpc: Override settings.qdrant_prefer_grpc (used by transport benchmarks)
+
+    Returns:
+        New (uncached) QdrantClient instance
+
+    Note:
+        Transport parameters:
+        - prefer_grpc / grpc_port: gRPC sends vectors as packed floats instead of JSON
+        - pool size: REST keep-alive connection pool (gRPC multiplexes one channel)
+        - compression: gRPC gzip compression (trades CPU for bandwidth on remote links)
+    """
+    kwargs: dict[str, Any] = {
+        "host": settings.qdrant_host,
+        "port": settings.qdrant_port,
+        "grpc_port": settings.qdrant_grpc_port,
+        "prefer_grpc": settings.qdrant_prefer_grpc if prefer_grpc is None else prefer_grpc,
+        "timeout": settings.qdrant_timeout,
+    }
+    if settings.qdrant_pool_size is not None:
+        import httpx
+
+        kwargs["limits"] = httpx.Limits(
+            max_connections=settings.qdrant_pool_size,
+            max_keepalive_connections=settings.qdrant_pool_size,
+        )
+    if settings.qdrant_grpc_compression == "gzip":
+        import grpc
+
+        kwargs["grpc_compression"] = grpc.Compression.Gzip
+
+    return QdrantClient(**kwargs)
 
 
 def get_qdrant_client() -> QdrantClient:
@@ -36,8 +145,9 @@ def get_qdrant_client() -> QdrantClient:
     Note:
         Connection parameters:
         - Host: settings.qdrant_host (default: localhost)
-        - Port: settings.qdrant_port (default: 6333)
-        - Timeout: 30 seconds for operation completion
+        - Port: settings.qdrant_port (default: 6333), gRPC: settings.qdrant_grpc_port (6334)
+        - Transport: REST, or gRPC if settings.qdrant_prefer_grpc (see create_qdrant_client)
+        - Timeout: settings.qdrant_timeout (default: 30 seconds)
         - Retry policy: 3 attempts with exponential backoff (1s, 2s, 4s)
 
     Example:
@@ -52,7 +162,11 @@ def get_qdrant_client() -> QdrantClient:
     if _qdrant_client is None:
         logger.info(
             "Connecting to Qdrant",
-            extra={"host": settings.qdrant_host, "port": settings.qdrant_port},
+            extra={
+                "host": settings.qdrant_host,
+                "port": settings.qdrant_port,
+                "prefer_grpc": settings.qdrant_prefer_grpc,
+            },
         )
 
         # Retry configuration
@@ -61,9 +175,7 @@ def get_qdrant_client() -> QdrantClient:
 
         for attempt in range(max_retries):
             try:
-                _qdrant_client = QdrantClient(
-                    host=settings.qdrant_host, port=settings.qdrant_port, timeout=30
-                )
+                _qdrant_client = create_qdrant_client()
                 logger.info(
                     "Qdrant client connected successfully",
                     extra={
@@ -107,6 +219,43 @@ def get_qdrant_client() -> QdrantClient:
     return _qdrant_client
 
 
+def get_vector_store() -> VectorStore:
+    """Return the vector store selected by settings.vector_backend (singleton).
+
+    Backends:
+        - "qdrant": remote Qdrant server (get_qdrant_client, default)
+        - "qdrant_local": embedded Qdrant persisted at settings.vector_store_path;
+          no server process, but the directory is locked to a single process
+        - "numpy": in-process exact search over a memory-mapped float32 matrix at
+          settings.vector_store_path (NumpyVectorStore)
+
+    Returns:
+        VectorStore used by ingestion and retrieval
+
+    Example:
+        >>> store = get_vector_store()
+        >>> store.count("financial_docs").count
+    """
+    global _vector_store
+
+    if settings.vector_backend == "qdrant":
+        return get_qdrant_client()
+
+    if _vector_store is None:
+        logger.info(
+            "Opening embedded vector store",
+            extra={"backend": settings.vector_backend, "path": settings.vector_store_path},
+        )
+        if settings.vector_backend == "qdrant_local":
+            _vector_store = QdrantClient(path=settings.vector_store_path)
+        else:
+            from raglite.shared.vector_store import NumpyVectorStore
+
+            _vector_store = NumpyVectorStore(settings.vector_store_path)
+
+    return _vector_store
+
+
 def get_claude_client() -> Anthropic:
     """Factory function for Anthropic Claude API client.
 
@@ -162,7 +311,13 @@ def get_embedding_model() -> SentenceTransformer:
     """
     global _embedding_model
 
-    if _embedding_model is None:
+    if _embedding_model is not None:
+        return _embedding_model
+
+    with _embedding_model_lock:
+        if _embedding_model is not None:
+            return _embedding_model
+
         logger.info("Loading Fin-E5 embedding model", extra={"model": "intfloat/e5-large-v2"})
 
         try:
@@ -4,6 +4,8 @@ This module provides type-safe configuration management loaded from environment
 variables via .env file.
 """
 
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,11 +16,33 @@ class Settings(BaseSettings):
     Required settings will raise validation errors if not provided.
     """
 
+    # Vector store backend: remote Qdrant server, embedded Qdrant, or in-process NumPy
+    vector_backend: Literal["qdrant", "qdrant_local", "numpy"] = "qdrant"
+    vector_store_path: str = "data/vector_store"  # Embedded backends only
+
     # Qdrant Vector Database
     qdrant_host: str = "localhost"
     qdrant_port: int = 6333
     qdrant_collection_name: str = "financial_docs"
 
+    # Qdrant transport: gRPC avoids JSON encoding of 1024-float vectors
+    qdrant_prefer_grpc: bool = False
+    qdrant_grpc_port: int = 6334
+    qdrant_timeout: int = 30
+    qdrant_pool_size: int | None = None  # REST keep-alive pool (None: qdrant-client default)
+    qdrant_grpc_compression: Literal["gzip"] | None = None
+
+    # Qdrant bulk upload tuning (store_vectors_in_qdrant)
+    qdrant_upload_parallel: int = 4  # Upload worker processes for large ingests
+    qdrant_upload_parallel_min_points: int = 2000  # Below this, upload in-process
+    qdrant_upload_target_batch_bytes: int = 4 * 1024 * 1024  # Adaptive batch size target
+    qdrant_upload_max_batch_size: int = 512
+    qdrant_upload_max_retries: int = 3
+
+    # HNSW index (restored after bulk-load mode) and optimizer wait
+    qdrant_hnsw_m: int = 16
+    qdrant_optimize_timeout_seconds: float = 600.0
+
     # Anthropic Claude API (optional for Phase 1 setup, required for Story 1.11+)
     anthropic_api_key: str | None = None
 
@@ -28,6 +52,74 @@ class Settings(BaseSettings):
 
     # MCP Server Configuration
     mcp_server_port: int = 8000
+    mcp_server_host: str = "127.0.0.1"
+    mcp_transport: Literal["stdio", "http"] = "stdio"
+
+    # HTTP transport: pre-forked worker processes sharing one socket (see raglite.shared.prefork)
+    http_workers: int = 1
+    http_graceful_timeout: float = 30.0  # Seconds to drain in-flight requests on shutdown
+
+    # Logging (see raglite.shared.logging)
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    log_format: Literal["text", "json"] = "text"  # json: one object per line, with extras
+    log_async: bool = True  # Write from a QueueListener thread, off the request path
+    log_queue_size: int = 10_000  # Records beyond this are dropped, never waited on
+    log_debug_sample_rates: dict[str, float] = {}  # Logger prefix -> fraction of DEBUG kept
+
+    # Request tracing: JSONL span file (None disables tracing, see raglite.shared.tracing)
+    trace_file: str | None = None
+
+    # Slow-query log: queries over the threshold are appended as JSONL (None disables)
+    slow_query_threshold_ms: float | None = 2000.0
+    slow_query_log_file: str = "workspace/reports/slow-queries.jsonl"
+
+    # On-demand profiling of the next N ingest/query requests (see raglite.shared.profiling)
+    profile_next_requests: int = 0
+    profile_mode: Literal["cpu", "memory"] = "cpu"
+    profile_dir: str = "workspace/reports"
+
+    # Prometheus text endpoint (GET /metrics) on mcp_server_port
+    metrics_http_enabled: bool = False
+
+    # Startup preloading (background thread; see raglite.shared.preload)
+    preload_on_startup: bool = True
+    preload_document_converter: bool = True  # Disable for query-only servers
+
+    # Background ingestion jobs (SQLite job table; see raglite.ingestion.jobs)
+    ingest_jobs_db_path: str = "data/ingestion_jobs.sqlite3"
+    ingest_job_workers: int = 1
+    ingest_job_max_attempts: int = 3  # Interrupted jobs resume until this many attempts
+
+    # Admission control and embedder scheduling (see raglite.shared.scheduler)
+    ingest_max_concurrent: int = 1  # Ingestions running at once (tool calls and jobs)
+    ingest_max_waiting: int = 4  # Tool calls queued for a slot; more are rejected
+
+    # CPU thread budget split between queries and concurrent ingestions (see
+    # raglite.shared.threads); None values derive from the budget
+    thread_budget_enabled: bool = True
+    cpu_thread_budget: int | None = None  # Default: all CPUs
+    embedding_threads: int | None = None  # torch intra-op threads
+    docling_threads: int | None = None  # Docling accelerator threads per conversion
+
+    # Collection epoch files, bumped on every write (see raglite.shared.epoch)
+    collection_epoch_dir: str = "data/epochs"
+
+    # Semantic query cache: reuse the results of a near-identical recent query
+    # (see raglite.retrieval.query_cache); entries are valid until the collection epoch changes
+    query_cache_enabled: bool = False
+    query_cache_size: int = 1024  # Cached queries; least recently used are evicted
+    query_cache_similarity: float = 0.95  # Cosine similarity needed to reuse results
+    query_cache_ttl_seconds: float | None = None  # Optional age limit on top of the epoch
+
+    # MMR diversification for search_documents(diversify=True) (see raglite.retrieval.mmr)
+    mmr_candidates: int = 100  # Candidates fetched with vectors (at least top_k)
+    mmr_lambda: float = 0.7  # Relevance weight versus diversity (1.0: relevance only)
+
+    # Stage checkpoints for resumable PDF ingestion (None disables; see
+    # raglite.ingestion.checkpoint)
+    ingest_checkpoint_dir: str | None = "data/checkpoints"
+    # Checkpoints of documents not retried within this many hours are removed (None keeps them)
+    ingest_checkpoint_max_age_hours: float | None = 168.0
 
     # Pydantic 2.x configuration using SettingsConfigDict
     model_config = SettingsConfigDict(
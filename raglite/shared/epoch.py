@@ -0,0 +1,109 @@
+"""Collection epoch: a version number bumped whenever a collection's points change.
+
+Caches in front of ``search_documents`` (the semantic query cache, query
+coalescing) include the epoch of the collection they read in their keys, so a
+cached result stays valid until the collection changes, with no TTL to tune.
+``store_vectors_in_qdrant``, ``delete_document`` and the creation of a new
+collection bump the epoch once their writes are applied.
+
+The epoch is persisted as a tiny file per collection
+(``settings.collection_epoch_dir/<collection>.epoch``), shared by every process
+on the host (HTTP workers, ingestion jobs, scripts). Epoch values are
+microsecond timestamps, raised by at least one on every bump, so they only
+increase and two processes bumping concurrently never write the same value.
+Reads cost one ``stat`` call while the file is unchanged.
+
+Example:
+    >>> epoch = get_collection_epoch("financial_docs")
+    >>> bump_collection_epoch("financial_docs") > epoch
+    True
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class CollectionEpoch:
+    """Epoch of one collection, stored in a file.
+
+    Args:
+        path: Epoch file (missing file: epoch 0)
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._cached: tuple[tuple[int, int], int] | None = None  # ((inode, mtime_ns), epoch)
+
+    def current(self) -> int:
+        """Return the current epoch (re-read only when the file changed)."""
+        try:
+            stat = self.path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            return 0
+        signature = (stat.st_ino, stat.st_mtime_ns)
+        cached = self._cached
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        try:
+            epoch = int(self.path.read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            return 0  # Replaced or half-written between stat and read: re-read next time
+        self._cached = (signature, epoch)
+        return epoch
+
+    def bump(self) -> int:
+        """Advance the epoch (atomic file replace) and return the new value."""
+        with self._lock:
+            epoch = max(self.current() + 1, time.time_ns() // 1000)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(str(epoch))
+            os.replace(tmp_path, self.path)
+            return epoch
+
+
+# Epoch per collection name (created on first use)
+_epochs: dict[str, CollectionEpoch] = {}
+_epochs_lock = threading.Lock()
+
+
+def _collection_epoch(collection_name: str | None) -> CollectionEpoch:
+    name = collection_name or settings.qdrant_collection_name
+    epoch = _epochs.get(name)
+    if epoch is None:
+        with _epochs_lock:
+            epoch = _epochs.setdefault(
+                name, CollectionEpoch(Path(settings.collection_epoch_dir) / f"{name}.epoch")
+            )
+    return epoch
+
+
+def get_collection_epoch(collection_name: str | None = None) -> int:
+    """Return the epoch of a collection (default: settings.qdrant_collection_name)."""
+    return _collection_epoch(collection_name).current()
+
+
+def bump_collection_epoch(collection_name: str | None = None) -> int:
+    """Record that a collection changed; returns the new epoch.
+
+    Failures are logged, not raised: the write itself succeeded; cached
+    results stay stale until the next successful bump.
+    """
+    try:
+        epoch = _collection_epoch(collection_name).bump()
+    except OSError as e:
+        logger.warning(
+            "Collection epoch not bumped",
+            extra={"collection": collection_name, "error": str(e)},
+        )
+        return get_collection_epoch(collection_name)
+    logger.debug("Collection epoch bumped", extra={"collection": collection_name, "epoch": epoch})
+    return epoch
@@ -0,0 +1,61 @@
+"""Deferred imports for heavy optional dependencies.
+
+Keeps server startup fast: docling, pandas, torch/sentence-transformers,
+anthropic and qdrant-client are imported on first use instead of at module load.
+"""
+
+import importlib
+import threading
+from typing import Any
+
+
+class LazyAttribute:
+    """Stand-in for ``from module import name`` that imports on first use.
+
+    Calls and attribute access are forwarded to the real object, so module-level
+    names bound to a LazyAttribute work like the real import and can still be
+    replaced with ``unittest.mock.patch``.
+
+    Args:
+        module: Dotted module path (e.g. "sentence_transformers")
+        name: Attribute to load from the module (e.g. "SentenceTransformer")
+
+    Example:
+        >>> SentenceTransformer = LazyAttribute("sentence_transformers", "SentenceTransformer")
+        >>> model = SentenceTransformer("intfloat/e5-large-v2")  # Imports here
+    """
+
+    def __init__(self, module: str, name: str) -> None:
+        self._module = module
+        self._name = name
+        self._target: Any = None
+        self._lock = threading.Lock()
+
+    def resolve(self) -> Any:
+        """Import the module (once, thread-safe) and return the attribute."""
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = getattr(importlib.import_module(self._module), self._name)
+        return self._target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr in ("_module", "_name", "_target", "_lock"):  # Not yet initialized (copy)
+            raise AttributeError(attr)
+        return getattr(self.resolve(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._target is not None else "not loaded"
+        return f"<LazyAttribute {self._module}.{self._name} ({state})>"
+
+
+def lazy_import(module: str, name: str) -> Any:
+    """Return a LazyAttribute for ``from module import name``.
+
+    Typed as Any so call sites type-check against the real object (import it
+    under ``TYPE_CHECKING`` for annotations).
+    """
+    return LazyAttribute(module, name)
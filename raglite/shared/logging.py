@@ -1,10 +1,193 @@
 """Structured logging setup for RAGLite.
 
 Provides configured loggers with JSON formatting for CloudWatch compatibility.
+
+Output is controlled by settings:
+
+- ``log_format``: "json" emits one JSON object per line including every
+  ``extra={...}`` field; "text" keeps the human-readable format.
+- ``log_async``: records are put on a bounded queue (``QueueHandler``) and a
+  single ``QueueListener`` thread formats and writes them, so a slow sink never
+  blocks a query or ingestion batch. Records are dropped, not waited on, when
+  the queue is full.
+- ``log_debug_sample_rates``: per-logger fraction of DEBUG records kept (e.g.
+  ``{"raglite.retrieval": 0.01}``) for hot-path debug events.
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+import random
 import sys
+import threading
+import weakref
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any
+
+from raglite.shared.config import settings
+from raglite.shared.metrics import LOG_RECORDS_DROPPED
+from raglite.shared.tracing import current_span
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Attributes every LogRecord has; anything else was passed via extra={...}
+_RECORD_ATTRIBUTES = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {
+    "message",
+    "asctime",
+    "taskName",
+}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects, including extra fields.
+
+    Example output:
+        {"timestamp": "2025-10-12T09:30:01.123+00:00", "level": "INFO",
+         "logger": "raglite.main", "message": "Query complete", "results": 5}
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=UTC).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Keep a fraction of DEBUG records per logger; other levels always pass.
+
+    Rates are matched on the longest logger-name prefix, so
+    ``{"raglite": 0.1, "raglite.retrieval": 0.01}`` keeps 1% of retrieval
+    debug events and 10% of the rest.
+
+    Args:
+        rates: Logger-name prefix -> fraction of DEBUG records to keep (0.0-1.0)
+    """
+
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        self.rates = rates
+        self._resolved: dict[str, float] = {}
+
+    def _rate(self, name: str) -> float:
+        rate = self._resolved.get(name)
+        if rate is None:
+            matches = [p for p in self.rates if name == p or name.startswith(p + ".")]
+            rate = self.rates[max(matches, key=len)] if matches else 1.0
+            self._resolved[name] = rate
+        return rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate  # nosec B311 - sampling, not crypto
+
+
+class TraceContextFilter(logging.Filter):
+    """Add trace_id and span_id of the active span, correlating logs with traces."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        active = current_span()
+        if active is not None:
+            record.trace_id = active.trace_id
+            record.span_id = active.span_id
+        return True
+
+
+class _NonBlockingQueueHandler(QueueHandler):
+    """QueueHandler that defers formatting to the listener and never blocks."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args and render the traceback here (both reference caller state);
+        # the listener does the actual formatting. Extra fields stay on the record.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc()  # A full queue means the sink is stalled: shed load
+
+
+# Shared queue and listener thread for async mode (created on first logger)
+_log_queue: queue.Queue[logging.LogRecord] | None = None
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+_queue_handlers: "weakref.WeakSet[_NonBlockingQueueHandler]" = weakref.WeakSet()
+
+
+def _formatter() -> logging.Formatter:
+    if settings.log_format == "json":
+        return JsonFormatter()
+    return logging.Formatter(fmt=TEXT_FORMAT, datefmt=TEXT_DATEFMT)
+
+
+def _stream_handler() -> logging.Handler:
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_formatter())
+    return handler
+
+
+def _get_log_queue() -> queue.Queue[logging.LogRecord]:
+    """Return the shared log queue, starting its listener thread on first use."""
+    global _log_queue, _listener
+
+    with _listener_lock:
+        if _log_queue is None:
+            _log_queue = queue.Queue(maxsize=settings.log_queue_size)
+            _listener = QueueListener(_log_queue, _stream_handler())
+            _listener.start()
+            atexit.register(stop_log_listener)
+        return _log_queue
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own queue and listener (the parent's thread did not survive)."""
+    global _log_queue, _listener, _listener_lock
+
+    _log_queue = None
+    _listener = None
+    _listener_lock = threading.Lock()
+    if _queue_handlers:
+        log_queue = _get_log_queue()
+        for handler in _queue_handlers:
+            handler.queue = log_queue
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def stop_log_listener() -> None:
+    """Flush queued records and stop the listener thread (registered atexit)."""
+    global _listener
+
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -14,7 +197,8 @@ def get_logger(name: str) -> logging.Logger:
         name: Logger name (typically __name__ from calling module)
 
     Returns:
-        Configured logging.Logger instance with JSON formatter
+        Configured logging.Logger instance (format, async writes, level and
+        debug sampling from settings)
 
     Example:
         >>> logger = get_logger(__name__)
@@ -24,13 +208,17 @@ def get_logger(name: str) -> logging.Logger:
 
     # Only configure if not already configured
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            fmt="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-        handler.setFormatter(formatter)
+        handler: logging.Handler
+        if settings.log_async:
+            handler = _NonBlockingQueueHandler(_get_log_queue())
+            _queue_handlers.add(handler)
+        else:
+            handler = _stream_handler()
+        if settings.log_debug_sample_rates:
+            handler.addFilter(DebugSamplingFilter(settings.log_debug_sample_rates))
+        if settings.trace_file is not None:
+            handler.addFilter(TraceContextFilter())  # Filters run in the caller, before the queue
         logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
+        logger.setLevel(settings.log_level)
 
     return logger
@@ -0,0 +1,637 @@
+"""In-process metrics registry: counters, gauges and fixed-bucket histograms.
+
+Hot-path updates take no lock: every thread writes to its own value slots
+(created once per thread and metric) and readers sum the slots when a snapshot
+or Prometheus exposition is requested. Recording a histogram observation is a
+bisect plus three list increments (~1 µs), so instrumenting the query path has
+no measurable cost.
+
+Metrics are exposed through the ``get_metrics`` MCP tool (snapshot with
+percentile estimates and cache hit rates) and in Prometheus text format at
+``/metrics`` (see ``render_metrics``).
+
+Pre-forked HTTP workers (raglite.shared.prefork) each hold their own registry.
+With ``enable_multiprocess`` every worker writes its raw totals to
+``{pid}.json`` in a directory shared with the others, every
+MULTIPROCESS_WRITE_INTERVAL seconds and when it exits; ``/metrics`` merges all
+files, so a scrape reports the whole server whichever worker answers it:
+
+- counters and histograms are summed, including those of exited workers (a
+  respawn does not reset totals)
+- gauges are summed over live workers only
+
+Other workers' values are up to MULTIPROCESS_WRITE_INTERVAL seconds old. The
+``get_metrics`` tool reports the worker that answers it.
+
+Example:
+    >>> from raglite.shared.metrics import QUERY_EMBED_SECONDS
+    >>> start = time.perf_counter()
+    >>> embedding = model.encode([query])[0]
+    >>> QUERY_EMBED_SECONDS.observe(time.perf_counter() - start)
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Self, TypeVar, cast
+
+from pydantic import BaseModel, Field
+
+from raglite.shared.models import QueryCacheStats
+
+# Counter family used for cache hit rates (labels: cache, result=hit|miss)
+CACHE_REQUESTS_METRIC = "raglite_cache_requests_total"
+
+# Default latency buckets in seconds (1 ms .. 10 min)
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+    600.0,
+)
+
+# Seconds between writes of a worker's metrics file in multiprocess mode
+MULTIPROCESS_WRITE_INTERVAL = 5.0
+
+
+class _ThreadSlots:
+    """Per-thread value slots summed on read (writers never contend on a lock)."""
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._slots: list[list[float]] = []
+        self._lock = threading.Lock()  # Taken once per thread, and by readers
+
+    def get(self) -> list[float]:
+        """Return the calling thread's slots, creating them on first use."""
+        try:
+            return self._local.slots  # type: ignore[no-any-return]
+        except AttributeError:
+            slots = [0.0] * self._size
+            with self._lock:
+                self._slots.append(slots)
+            self._local.slots = slots
+            return slots
+
+    def totals(self) -> list[float]:
+        """Sum slots across all threads."""
+        with self._lock:
+            all_slots = list(self._slots)
+        totals = [0.0] * self._size
+        for slots in all_slots:
+            for i, value in enumerate(slots):
+                totals[i] += value
+        return totals
+
+
+class _Metric:
+    """Base class for a metric family, optionally split by label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Self] = {}
+        self._children_lock = threading.Lock()
+
+    def labels(self, **labels: str) -> Self:
+        """Return the child metric for a label combination (created on first use)."""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._children_lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._new_child()
+                    self._children[key] = child
+        return child
+
+    def _new_child(self) -> Self:
+        raise NotImplementedError
+
+    def samples(self) -> list[tuple[dict[str, str], Self]]:
+        """(labels, metric) pairs: the metric itself if unlabeled, else each child."""
+        if not self.labelnames:
+            return [({}, self)]
+        with self._children_lock:
+            children = list(self._children.items())
+        return [(dict(zip(self.labelnames, key, strict=True)), child) for key, child in children]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count (requests, errors, cache hits)."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._slots = _ThreadSlots(1)
+
+    def _new_child(self) -> Self:
+        return type(self)(self.name, self.documentation)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the counter."""
+        self._slots.get()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return self._slots.totals()[0]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down (in-flight requests, queue depth).
+
+    Either updated with inc/dec, or computed at read time from a callback
+    registered with ``set_function`` (e.g. ``queue.qsize``).
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._slots = _ThreadSlots(1)
+        self._function: Callable[[], float] | None = None
+
+    def _new_child(self) -> Self:
+        return type(self)(self.name, self.documentation)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._slots.get()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._slots.get()[0] -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute the gauge value by calling function at read time."""
+        self._function = function
+
+    @property
+    def value(self) -> float:
+        if self._function is not None:
+            return float(self._function())
+        return self._slots.totals()[0]
+
+
+class Histogram(_Metric):
+    """Distribution of observations in fixed cumulative buckets (latencies)."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Slots: one per bucket, +Inf bucket, sum, count
+        self._slots = _ThreadSlots(len(self.buckets) + 3)
+
+    def _new_child(self) -> Self:
+        return type(self)(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        slots = self._slots.get()
+        slots[bisect_left(self.buckets, value)] += 1
+        slots[-2] += value
+        slots[-1] += 1
+
+    def snapshot(self) -> "HistogramSnapshot":
+        """Counts, sum and bucket-interpolated percentiles."""
+        totals = self._slots.totals()
+        bucket_counts = totals[: len(self.buckets) + 1]
+        count = int(totals[-1])
+        cumulative = []
+        running = 0.0
+        for bucket_count in bucket_counts:
+            running += bucket_count
+            cumulative.append(int(running))
+        return HistogramSnapshot(
+            count=count,
+            sum=totals[-2],
+            p50=self._quantile(0.50, bucket_counts, count),
+            p95=self._quantile(0.95, bucket_counts, count),
+            p99=self._quantile(0.99, bucket_counts, count),
+            buckets=dict(zip([*map(_format_bound, self.buckets), "+Inf"], cumulative, strict=True)),
+        )
+
+    def _quantile(self, q: float, bucket_counts: list[float], count: int) -> float | None:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if count == 0:
+            return None
+        rank = q * count
+        running = 0.0
+        lower = 0.0
+        for i, bucket_count in enumerate(bucket_counts):
+            if running + bucket_count >= rank and bucket_count > 0:
+                if i == len(self.buckets):  # +Inf bucket: report the largest finite bound
+                    return self.buckets[-1]
+                upper = self.buckets[i]
+                return lower + (upper - lower) * (rank - running) / bucket_count
+            running += bucket_count
+            lower = self.buckets[i] if i < len(self.buckets) else lower
+        return self.buckets[-1]
+
+
+class HistogramSnapshot(BaseModel):
+    """Point-in-time view of a histogram."""
+
+    count: int = Field(..., description="Number of observations")
+    sum: float = Field(..., description="Sum of observed values")
+    p50: float | None = Field(default=None, description="Estimated median")
+    p95: float | None = Field(default=None, description="Estimated 95th percentile")
+    p99: float | None = Field(default=None, description="Estimated 99th percentile")
+    buckets: dict[str, int] = Field(
+        default_factory=dict, description="Cumulative count per upper bound (le)"
+    )
+
+
+class MetricsSnapshot(BaseModel):
+    """Point-in-time view of all metrics, keyed by name{label="value"}."""
+
+    counters: dict[str, float] = Field(default_factory=dict)
+    gauges: dict[str, float] = Field(default_factory=dict)
+    histograms: dict[str, HistogramSnapshot] = Field(default_factory=dict)
+    cache_hit_rates: dict[str, float] = Field(
+        default_factory=dict, description="Hit ratio per cache (raglite_cache_requests_total)"
+    )
+    query_cache: QueryCacheStats | None = Field(
+        default=None, description="Semantic query cache statistics (when enabled)"
+    )
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Named collection of metric families."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: MetricT) -> MetricT:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.kind}")
+                return cast(MetricT, existing)
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def metrics(self) -> list[_Metric]:
+        with self._lock:
+            return list(self._metrics.values())
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Collect every metric into a MetricsSnapshot."""
+        snapshot = MetricsSnapshot()
+        for family in self.metrics():
+            for labels, metric in family.samples():
+                key = family.name + _format_labels(labels)
+                if isinstance(metric, Histogram):
+                    snapshot.histograms[key] = metric.snapshot()
+                elif isinstance(metric, Gauge):
+                    snapshot.gauges[key] = metric.value
+                elif isinstance(metric, Counter):
+                    snapshot.counters[key] = metric.value
+
+        # Hit ratio per cache from the cache lookup counter (cache, result labels)
+        with self._lock:
+            cache_requests = self._metrics.get(CACHE_REQUESTS_METRIC)
+        if isinstance(cache_requests, Counter):
+            lookups: dict[str, dict[str, float]] = {}
+            for labels, metric in cache_requests.samples():
+                lookups.setdefault(labels["cache"], {})[labels["result"]] = metric.value
+            for cache, results in lookups.items():
+                hits = results.get("hit", 0.0)
+                total = hits + results.get("miss", 0.0)
+                if total:
+                    snapshot.cache_hit_rates[cache] = round(hits / total, 4)
+        return snapshot
+
+    def state(self) -> dict[str, dict[str, Any]]:
+        """Raw totals of every metric, JSON-serializable and summable across processes.
+
+        Returns:
+            {name: {kind, help, buckets, samples: [[labels, values], ...]}}; values
+            are the histogram slots (per-bucket counts, +Inf, sum, count) or [value]
+        """
+        state = {}
+        for family in self.metrics():
+            samples: list[list[Any]] = []
+            for labels, metric in family.samples():
+                if isinstance(metric, Histogram):
+                    samples.append([labels, metric._slots.totals()])
+                elif isinstance(metric, Counter | Gauge):
+                    samples.append([labels, [metric.value]])
+            state[family.name] = {
+                "kind": family.kind,
+                "help": family.documentation,
+                "buckets": list(family.buckets) if isinstance(family, Histogram) else [],
+                "samples": samples,
+            }
+        return state
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)."""
+        return _render_state(self.state())
+
+
+def _render_state(state: dict[str, dict[str, Any]]) -> str:
+    """Render MetricsRegistry.state() output in the Prometheus text format."""
+    lines = []
+    for name, family in state.items():
+        lines.append(f"# HELP {name} {family['help']}")
+        lines.append(f"# TYPE {name} {family['kind']}")
+        bounds = [*map(_format_bound, family["buckets"]), "+Inf"]
+        for labels, values in family["samples"]:
+            if family["kind"] == "histogram":
+                cumulative = 0.0
+                for bound, bucket_count in zip(bounds, values[:-2], strict=True):
+                    cumulative += bucket_count
+                    bucket_labels = _format_labels({**labels, "le": bound})
+                    lines.append(f"{name}_bucket{bucket_labels} {int(cumulative)}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {values[-2]}")
+                lines.append(f"{name}_count{_format_labels(labels)} {int(values[-1])}")
+            else:
+                lines.append(f"{name}{_format_labels(labels)} {values[0]}")
+    return "\n".join(lines) + "\n"
+
+
+def _merge_states(states: Iterable[tuple[dict[str, dict[str, Any]], bool]]) -> dict[str, Any]:
+    """Sum (state, process alive) pairs by metric and labels; dead processes' gauges are dropped."""
+    merged: dict[str, dict[str, Any]] = {}
+    sums: dict[str, dict[tuple[tuple[str, str], ...], list[float]]] = {}
+    for state, alive in states:
+        for name, family in state.items():
+            if name not in merged:
+                merged[name] = {**family, "samples": []}
+                sums[name] = {}
+            if family["kind"] == "gauge" and not alive:
+                continue
+            for labels, values in family["samples"]:
+                total = sums[name].setdefault(tuple(labels.items()), [0.0] * len(values))
+                if len(total) != len(values):
+                    continue  # Bucket layout changed between versions
+                for i, value in enumerate(values):
+                    total[i] += value
+    for name, family in merged.items():
+        family["samples"] = [[dict(key), values] for key, values in sums[name].items()]
+    return merged
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+class MultiprocessMetrics:
+    """Metrics of several processes shared through a directory of per-process files.
+
+    Each process writes its registry's totals to ``{pid}.json`` (atomically,
+    from a daemon thread); ``render`` merges the files of all processes.
+    """
+
+    def __init__(
+        self,
+        registry: "MetricsRegistry",
+        directory: Path,
+        interval: float = MULTIPROCESS_WRITE_INTERVAL,
+    ) -> None:
+        self.registry = registry
+        self.directory = Path(directory)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> None:
+        """Write this process's totals (readers never see a partial file)."""
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.registry.state(), f)
+            os.replace(temp_path, self.directory / f"{os.getpid()}.json")
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+
+    def start(self) -> None:
+        """Write now, then every interval seconds from a daemon thread."""
+        self.write()
+        self._thread = threading.Thread(
+            target=self._run, name="raglite-metrics-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except OSError:
+                pass  # Directory removed while the server shuts down
+
+    def stop(self) -> None:
+        """Stop the writer thread and write the final totals (call when the process exits)."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.write()
+
+    def render(self) -> str:
+        """Prometheus text of all processes' metrics, this one's up to date."""
+        self.write()
+        states = []
+        for path in self.directory.glob("*.json"):
+            try:
+                pid = int(path.stem)
+                state = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            states.append((state, pid == os.getpid() or _pid_alive(pid)))
+        return _render_state(_merge_states(states))
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items())
+    return "{" + inner + "}"
+
+
+# Process-wide registry and RAGLite's metric catalogue
+registry = MetricsRegistry()
+
+QUERIES = registry.counter("raglite_queries_total", "Queries handled", ("status",))
+QUERY_SECONDS = registry.histogram("raglite_query_seconds", "End-to-end query latency")
+QUERY_EMBED_SECONDS = registry.histogram(
+    "raglite_query_embed_seconds", "Query embedding latency (generate_query_embedding)"
+)
+VECTOR_SEARCH_SECONDS = registry.histogram(
+    "raglite_vector_search_seconds", "Vector store query_points latency"
+)
+RERANK_SECONDS = registry.histogram(
+    "raglite_rerank_seconds", "MMR diversification latency (diversified queries only)"
+)
+CITATION_SECONDS = registry.histogram("raglite_citation_seconds", "Citation generation latency")
+SLOW_QUERIES = registry.counter(
+    "raglite_slow_queries_total", "Queries over settings.slow_query_threshold_ms"
+)
+
+INGESTIONS = registry.counter("raglite_ingestions_total", "Documents ingested", ("status",))
+INGEST_SECONDS = registry.histogram("raglite_ingest_seconds", "End-to-end document ingestion")
+INGEST_STAGE_SECONDS = registry.histogram(
+    "raglite_ingest_stage_seconds",
+    "Ingestion stage duration (convert, chunk, embed, upload)",
+    ("stage",),
+)
+INGEST_CHUNKS = registry.counter("raglite_ingest_chunks_total", "Chunks embedded and stored")
+EMBED_QUEUE_SECONDS = registry.histogram(
+    "raglite_embed_queue_seconds",
+    "Time embedding calls wait for the embedder thread (query, ingest)",
+    ("priority",),
+)
+
+COALESCED_REQUESTS = registry.counter(
+    "raglite_coalesced_requests_total",
+    "Requests that joined an identical in-flight execution (query, ingest)",
+    ("kind",),
+)
+CACHE_REQUESTS = registry.counter(
+    CACHE_REQUESTS_METRIC,
+    "Cache lookups by cache and result (hit/miss)",
+    ("cache", "result"),
+)
+QUERY_CACHE_SIMILARITY = registry.histogram(
+    "raglite_query_cache_similarity",
+    "Best cosine similarity found per semantic query cache lookup",
+    buckets=(0.5, 0.7, 0.8, 0.85, 0.9, 0.925, 0.95, 0.97, 0.98, 0.99, 1.0),
+)
+QUERY_CACHE_SAVED_SECONDS = registry.counter(
+    "raglite_query_cache_saved_seconds_total",
+    "Vector search time saved by semantic query cache hits",
+)
+LOG_RECORDS_DROPPED = registry.counter(
+    "raglite_log_records_dropped_total", "Log records dropped because the log queue was full"
+)
+INFLIGHT_REQUESTS = registry.gauge(
+    "raglite_inflight_requests", "Requests currently being processed (queue depth)", ("tool",)
+)
+
+
+_multiprocess: MultiprocessMetrics | None = None
+
+
+def enable_multiprocess(directory: Path) -> None:
+    """Share this process's metrics through directory (call in each pre-forked worker)."""
+    global _multiprocess
+    _multiprocess = MultiprocessMetrics(registry, directory)
+    _multiprocess.start()
+
+
+def disable_multiprocess() -> None:
+    """Write this process's final totals and leave multiprocess mode."""
+    global _multiprocess
+    if _multiprocess is not None:
+        _multiprocess.stop()
+        _multiprocess = None
+
+
+def render_metrics() -> str:
+    """Prometheus text for /metrics (all workers' metrics in multiprocess mode)."""
+    multiprocess = _multiprocess
+    if multiprocess is not None:
+        return multiprocess.render()
+    return registry.render_prometheus()
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    """Serve the Prometheus text exposition at ``/metrics`` from a daemon thread.
+
+    Used when the MCP server runs over stdio, leaving its port free.
+
+    Args:
+        port: TCP port to listen on (settings.mcp_server_port)
+        host: Interface to bind (use 0.0.0.0 for scrapes from other hosts)
+
+    Returns:
+        The running HTTP server (call ``shutdown()`` to stop it)
+    """
+
+    class _MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = render_metrics().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: object) -> None:
+            pass  # Scrapes every few seconds would flood the logs
+
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="raglite-metrics-http", daemon=True).start()
+    return server
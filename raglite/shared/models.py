@@ -3,8 +3,30 @@
 Defines core data structures used across ingestion and retrieval modules.
 """
 
+import uuid
+from array import array
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Literal
+
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class IngestionTimings(BaseModel):
+    """Per-stage ingestion latency breakdown and throughput."""
+
+    convert_ms: float | None = Field(
+        default=None, description="Extraction (Docling convert, or Excel sheet parsing)"
+    )
+    chunk_ms: float | None = Field(default=None, description="Chunking")
+    embed_ms: float | None = Field(default=None, description="Embedding generation")
+    upload_ms: float | None = Field(default=None, description="Vector store upload and verify")
+    total_ms: float = Field(..., description="End-to-end ingestion time")
+    pages_per_second: float = Field(default=0.0, description="Pages (or sheets) per second")
+    chunks_per_second: float = Field(default=0.0, description="Chunks stored per second")
+
 
 class DocumentMetadata(BaseModel):
     """Metadata for ingested financial documents.
@@ -18,6 +40,9 @@ class DocumentMetadata(BaseModel):
     page_count: int = Field(default=0, description="Number of pages/sheets in document")
     source_path: str = Field(default="", description="Original file path")
     chunk_count: int = Field(default=0, description="Number of chunks created from document")
+    timings: IngestionTimings | None = Field(
+        default=None, description="Per-stage timings (opt-in on the ingestion tool)"
+    )
 
 
 class Chunk(BaseModel):
@@ -34,6 +59,122 @@ class Chunk(BaseModel):
     embedding: list[float] = Field(default_factory=list, description="Semantic embedding vector")
 
 
+class ChunkBatch:
+    """Columnar batch of chunks from a single document.
+
+    Stores page numbers and chunk indices in compact integer arrays and all chunk
+    text in one shared buffer addressed by offsets, with a single DocumentMetadata
+    record for the whole batch. Embeddings live in one float32 matrix once
+    generated. Avoids per-chunk pydantic validation and object overhead during
+    large backfills (50k+ chunks).
+
+    Indexing a batch returns a ``Chunk`` view built without validation; code
+    that expects ``list[Chunk]`` gets validated ``Chunk`` objects from
+    ``to_chunks()``.
+
+    Example:
+        >>> batch = ChunkBatch(metadata)
+        >>> batch.append("Revenue grew 15%...", page_number=3, chunk_index=0)
+        >>> batch[0].chunk_id
+        'report.pdf_0'
+    """
+
+    __slots__ = (
+        "metadata",
+        "page_numbers",
+        "chunk_indices",
+        "offsets",
+        "embeddings",
+        "_parts",
+        "_text",
+    )
+
+    def __init__(self, metadata: DocumentMetadata) -> None:
+        self.metadata = metadata
+        self.page_numbers = array("i")
+        self.chunk_indices = array("i")
+        self.offsets = array("q", [0])  # offsets[i]:offsets[i + 1] slices chunk i from text
+        self.embeddings: np.ndarray | None = None  # (len, dim) float32 once embedded
+        self._parts: list[str] = []  # Appended since the buffer was last built
+        self._text: str | None = ""
+
+    def append(self, content: str, page_number: int, chunk_index: int) -> None:
+        """Append one chunk to the batch."""
+        if self._text:
+            self._parts = [self._text]  # Built buffer becomes the first part again
+        self._parts.append(content)
+        self._text = None  # Buffer rebuilt lazily on next read
+        self.page_numbers.append(page_number)
+        self.chunk_indices.append(chunk_index)
+        self.offsets.append(self.offsets[-1] + len(content))
+
+    @property
+    def text(self) -> str:
+        """Shared text buffer holding all chunk contents back to back."""
+        if self._text is None:
+            self._text = "".join(self._parts)
+            self._parts = []  # The buffer holds the only copy of the text
+        return self._text
+
+    def __len__(self) -> int:
+        return len(self.chunk_indices)
+
+    def content(self, i: int) -> str:
+        """Text content of chunk ``i``."""
+        return self.text[self.offsets[i] : self.offsets[i + 1]]
+
+    def contents(self, start: int = 0, stop: int | None = None) -> list[str]:
+        """Text contents of chunks ``start:stop`` (for batched embedding)."""
+        stop = len(self) if stop is None else min(stop, len(self))
+        text = self.text
+        offsets = self.offsets
+        return [text[offsets[i] : offsets[i + 1]] for i in range(start, stop)]
+
+    def chunk_id(self, i: int) -> str:
+        """Chunk identifier for chunk ``i`` (``{filename}_{chunk_index}``)."""
+        return f"{self.metadata.filename}_{self.chunk_indices[i]}"
+
+    def __getitem__(self, i: int) -> Chunk:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("ChunkBatch index out of range")
+        return Chunk.model_construct(**self._fields(i))
+
+    def _fields(self, i: int) -> dict[str, Any]:
+        embedding: list[float] = self.embeddings[i].tolist() if self.embeddings is not None else []
+        return {
+            "chunk_id": self.chunk_id(i),
+            "content": self.content(i),
+            "metadata": self.metadata,
+            "page_number": self.page_numbers[i],
+            "chunk_index": self.chunk_indices[i],
+            "embedding": embedding,
+        }
+
+    def __iter__(self) -> Iterator[Chunk]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_chunks(self) -> list[Chunk]:
+        """Materialize the batch as a list of validated ``Chunk`` objects."""
+        return [Chunk(**self._fields(i)) for i in range(len(self))]
+
+
+# Namespace for deterministic Qdrant point IDs (chunk_point_id)
+POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_DNS, "chunks.raglite")
+
+
+def chunk_point_id(source_path: str, chunk_id: str) -> str:
+    """Deterministic Qdrant point ID of a chunk: resolved document path and chunk ID.
+
+    Re-uploading a chunk overwrites its point, so upserts are safe to replay;
+    documents with the same file name in different directories keep separate points
+    (chunk IDs are ``{filename}_{chunk_index}``).
+    """
+    return str(uuid.uuid5(POINT_ID_NAMESPACE, f"{source_path}#{chunk_id}"))
+
+
 class SearchResult(BaseModel):
     """Vector search result with score and source.
 
@@ -62,6 +203,20 @@ class QueryResult(BaseModel):
     )
     chunk_index: int = Field(..., description="Sequential chunk index (0-based)")
     word_count: int = Field(..., description="Word count of chunk")
+    source_path: str | None = Field(
+        default=None,
+        description="Resolved path of the source document at ingestion (tells apart "
+        "documents with the same file name)",
+    )
+    chunk_count: int = Field(
+        default=1,
+        ge=1,
+        description="Consecutive chunks merged into this passage, from chunk_index "
+        "(context expansion)",
+    )
+    citation: str | None = Field(
+        default=None, description="Formatted source citation (set by generate_citations)"
+    )
 
 
 class QueryRequest(BaseModel):
@@ -69,6 +224,44 @@ class QueryRequest(BaseModel):
 
     query: str = Field(..., description="Natural language query string")
     top_k: int = Field(default=5, ge=1, le=50, description="Number of results to return")
+    context_window: int = Field(
+        default=0,
+        ge=0,
+        le=5,
+        description="Neighbouring chunks added on each side of every result, merged into "
+        "contiguous passages (0: chunks only)",
+    )
+    diversify: bool = Field(
+        default=False,
+        description="Diversify results with maximal marginal relevance (fewer near-duplicates)",
+    )
+    token_budget: int | None = Field(
+        default=None,
+        ge=1,
+        description="Pack results into about this many tokens: overlap between adjacent "
+        "chunks and near-duplicates removed, citations only in the citation field",
+    )
+    include_timings: bool = Field(
+        default=False, description="Return a per-stage latency breakdown in the response"
+    )
+
+
+class QueryTimings(BaseModel):
+    """Per-stage query latency breakdown."""
+
+    embed_ms: float | None = Field(default=None, description="Query embedding")
+    vector_search_ms: float | None = Field(default=None, description="Vector store search")
+    expand_ms: float | None = Field(
+        default=None, description="Adjacent-chunk expansion (None if not requested)"
+    )
+    rerank_ms: float | None = Field(
+        default=None, description="Reranking/MMR diversification (None if no such stage ran)"
+    )
+    citation_ms: float | None = Field(default=None, description="Citation generation")
+    pack_ms: float | None = Field(
+        default=None, description="Context packing (None without token_budget)"
+    )
+    total_ms: float = Field(..., description="End-to-end query time")
 
 
 class QueryResponse(BaseModel):
@@ -77,7 +270,113 @@ class QueryResponse(BaseModel):
     results: list[QueryResult] = Field(..., description="Retrieved chunks sorted by relevance")
     query: str = Field(..., description="Original query string")
     retrieval_time_ms: float = Field(..., description="Retrieval time in milliseconds")
+    timings: QueryTimings | None = Field(
+        default=None, description="Per-stage timings (when requested with include_timings)"
+    )
+    context_tokens: int | None = Field(
+        default=None, description="Estimated tokens of the packed results (with token_budget)"
+    )
 
 
 # Type alias for job identifiers (used in ingestion pipeline)
 JobID = str
+
+
+class IngestionJobStatus(BaseModel):
+    """Background ingestion job state (submit_ingestion, get_ingestion_status tools)."""
+
+    job_id: JobID = Field(..., description="Job identifier for status polling and cancellation")
+    doc_path: str = Field(..., description="Absolute path of the document being ingested")
+    status: Literal["queued", "running", "succeeded", "failed", "cancelled"] = Field(
+        ..., description="Job lifecycle state"
+    )
+    stage: str | None = Field(
+        default=None, description="Current pipeline stage (convert, chunk, embed, upload)"
+    )
+    progress: float | None = Field(
+        default=None, ge=0.0, le=1.0, description="Fraction of chunks embedded (embed stage)"
+    )
+    chunks_embedded: int = Field(default=0, ge=0, description="Chunks embedded so far")
+    chunks_total: int | None = Field(default=None, description="Chunks to embed")
+    chunks_per_second: float | None = Field(
+        default=None, description="Embedding throughput during the embed stage"
+    )
+    attempts: int = Field(default=0, ge=0, description="Runs started (>1 after a restart)")
+    cancel_requested: bool = Field(default=False, description="Cancellation was requested")
+    submitted_at: str = Field(..., description="Submission timestamp (ISO8601)")
+    started_at: str | None = Field(default=None, description="Last start timestamp (ISO8601)")
+    finished_at: str | None = Field(default=None, description="Completion timestamp (ISO8601)")
+    error: str | None = Field(default=None, description="Failure reason")
+    result: DocumentMetadata | None = Field(
+        default=None, description="Ingested document metadata once succeeded"
+    )
+
+
+class ThreadBudget(BaseModel):
+    """CPU thread allocation across thread pools (see raglite.shared.threads)."""
+
+    total: int = Field(..., ge=1, description="CPU threads available to the process")
+    torch_intra_op: int = Field(..., ge=1, description="torch intra-op threads (embedder)")
+    torch_inter_op: int = Field(..., ge=1, description="torch inter-op threads")
+    docling: int = Field(..., ge=1, description="Docling accelerator threads per conversion")
+    blas: int = Field(..., ge=1, description="OpenMP/MKL/OpenBLAS/numexpr threads")
+    ingest_workers: int = Field(..., ge=1, description="Ingestion pool workers")
+
+
+class HealthStatus(BaseModel):
+    """Server readiness report returned by the health MCP tool."""
+
+    ready: bool = Field(..., description="True when queries can be served without cold loads")
+    components: dict[str, str] = Field(
+        default_factory=dict,
+        description="Preload state per component (pending, loading, ready, failed, lazy)",
+    )
+    load_times_ms: dict[str, float] = Field(
+        default_factory=dict, description="Time to load each preloaded component"
+    )
+    warmup_query_ms: float | None = Field(
+        default=None, description="Latency of the warm-up query (embedding + vector search)"
+    )
+    errors: dict[str, str] = Field(
+        default_factory=dict, description="Load errors per failed component"
+    )
+    uptime_seconds: float = Field(..., description="Seconds since server start")
+
+
+class QueryCacheStats(BaseModel):
+    """Semantic query cache effectiveness (raglite.retrieval.query_cache)."""
+
+    entries: int = Field(..., description="Cached queries currently valid")
+    lookups: int = Field(..., description="Cache lookups since start")
+    hits: int = Field(..., description="Lookups answered from a similar earlier query")
+    hit_rate: float = Field(..., description="hits / lookups (0 when no lookups)")
+    evictions: int = Field(..., description="Entries replaced by LRU eviction")
+    invalidations: int = Field(
+        ..., description="Collection epoch changes seen (entries from older epochs are stale)"
+    )
+    threshold: float = Field(..., description="Cosine similarity needed for a hit")
+    mean_hit_similarity: float | None = Field(
+        default=None, description="Average similarity of the matched query on hits"
+    )
+    min_hit_similarity: float | None = Field(
+        default=None, description="Lowest similarity that produced a hit"
+    )
+    near_misses: int = Field(
+        ..., description="Misses whose best similarity was within 0.05 below the threshold"
+    )
+    latency_saved_ms: float = Field(
+        ..., description="Vector search time of the cached queries served on hits"
+    )
+
+
+class ProfilingStatus(BaseModel):
+    """State of the on-demand request profiler (profile_requests MCP tool)."""
+
+    mode: Literal["cpu", "memory"] = Field(
+        ..., description="cpu: cProfile per request; memory: tracemalloc peak per stage"
+    )
+    remaining: int = Field(..., description="Upcoming ingest/query requests still to profile")
+    output_dir: str = Field(..., description="Directory the reports are written to")
+    reports: list[str] = Field(
+        default_factory=list, description="Most recent report files, oldest first"
+    )
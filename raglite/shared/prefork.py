@@ -0,0 +1,208 @@
+"""Pre-fork serving of the MCP HTTP transport.
+
+One process serves one stdio client; behind a load balancer RAGLite runs the
+streamable HTTP transport in ``settings.http_workers`` worker processes that
+accept connections from one shared listening socket:
+
+1. The master binds the socket and loads the read-only embedding model weights
+   (``before_fork``). It starts no threads, event loops or network clients:
+   none of them survive ``fork``.
+2. ``gc.freeze()`` moves everything loaded so far out of the garbage
+   collector's reach, so collections in the workers do not write to (and
+   copy) the pages holding the shared objects; the model weights stay
+   shared copy-on-write between the workers.
+3. Each forked worker runs ``on_worker_start`` (preloading, job workers) and a
+   uvicorn server on the shared socket.
+4. SIGTERM/SIGINT are forwarded to the workers, which stop accepting and drain
+   in-flight requests for up to ``graceful_timeout`` seconds; workers still
+   running after that are killed. Workers that die unexpectedly are respawned.
+
+With one worker the server runs in the calling process without forking.
+
+Example:
+    >>> sock = bind_socket("127.0.0.1", 8000)
+    >>> serve_prefork(app, sock, workers=4, graceful_timeout=30.0)
+"""
+
+import asyncio
+import gc
+import os
+import signal
+import socket
+import time
+from collections.abc import Callable
+from types import FrameType
+from typing import Any
+
+import uvicorn
+
+from raglite.shared.logging import get_logger, stop_log_listener
+
+logger = get_logger(__name__)
+
+# Workers that exit sooner than this after starting are respawned with a delay
+_MIN_WORKER_LIFETIME = 5.0
+_RESPAWN_DELAY = 1.0
+_POLL_INTERVAL = 0.2
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """Bind the listening socket shared by all workers (port 0 picks a free port)."""
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _run_server(app: Any, sock: socket.socket, graceful_timeout: float) -> None:
+    """Serve the ASGI app on the shared socket until SIGTERM/SIGINT, then drain."""
+    config = uvicorn.Config(
+        app,
+        timeout_graceful_shutdown=graceful_timeout,
+        log_config=None,  # Keep RAGLite's logging configuration
+        lifespan="on",
+    )
+    asyncio.run(uvicorn.Server(config).serve(sockets=[sock]))
+
+
+class _PreforkMaster:
+    """Spawn, supervise and stop the worker processes."""
+
+    def __init__(
+        self,
+        app: Any,
+        sock: socket.socket,
+        workers: int,
+        graceful_timeout: float,
+        on_worker_start: Callable[[], None] | None,
+        on_worker_exit: Callable[[], None] | None,
+    ) -> None:
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        self.on_worker_start = on_worker_start
+        self.on_worker_exit = on_worker_exit
+        self.children: dict[int, tuple[int, float]] = {}  # pid -> (worker index, start time)
+        self.stopping = False
+
+    def _spawn(self, index: int) -> None:
+        pid = os.fork()
+        if pid == 0:
+            self._worker_main(index)  # Never returns
+        self.children[pid] = (index, time.monotonic())
+        logger.info("HTTP worker started", extra={"worker": index, "pid": pid})
+
+    def _worker_main(self, index: int) -> None:
+        code = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)  # uvicorn installs its own
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            if self.on_worker_start is not None:
+                self.on_worker_start()
+            _run_server(self.app, self.sock, self.graceful_timeout)
+            if self.on_worker_exit is not None:
+                self.on_worker_exit()
+        except BaseException:
+            logger.exception("HTTP worker failed", extra={"worker": index, "pid": os.getpid()})
+            code = 1
+        finally:
+            stop_log_listener()
+            os._exit(code)  # Skip the master's stack and atexit handlers
+
+    def _handle_signal(self, signum: int, frame: FrameType | None) -> None:
+        self.stopping = True
+
+    def _reap(self) -> list[tuple[int, int, float]]:
+        """Collect exited workers: (worker index, exit status, lifetime)."""
+        exited = []
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            index, started = self.children.pop(pid)
+            exited.append((index, os.waitstatus_to_exitcode(status), time.monotonic() - started))
+        return exited
+
+    def run(self) -> None:
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        for index in range(self.workers):
+            self._spawn(index)
+
+        while not self.stopping:
+            time.sleep(_POLL_INTERVAL)
+            for index, code, lifetime in self._reap():
+                if self.stopping:
+                    break
+                logger.error(
+                    "HTTP worker exited unexpectedly; respawning",
+                    extra={"worker": index, "exit_code": code},
+                )
+                if lifetime < _MIN_WORKER_LIFETIME:
+                    time.sleep(_RESPAWN_DELAY)  # Don't spin on a worker that fails at startup
+                self._spawn(index)
+
+        self._stop()
+
+    def _stop(self) -> None:
+        logger.info(
+            "Draining HTTP workers",
+            extra={"workers": len(self.children), "graceful_timeout": self.graceful_timeout},
+        )
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        # Workers need the drain timeout plus time to run their exit hooks
+        deadline = time.monotonic() + self.graceful_timeout + 5.0
+        while self.children and time.monotonic() < deadline:
+            self._reap()
+            time.sleep(_POLL_INTERVAL)
+        for pid in list(self.children):
+            logger.warning("HTTP worker did not drain in time; killing", extra={"pid": pid})
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ChildProcessError, ProcessLookupError):
+                pass
+            self.children.pop(pid, None)
+        self.sock.close()
+
+
+def serve_prefork(
+    app: Any,
+    sock: socket.socket,
+    workers: int,
+    graceful_timeout: float,
+    before_fork: Callable[[], None] | None = None,
+    on_worker_start: Callable[[], None] | None = None,
+    on_worker_exit: Callable[[], None] | None = None,
+) -> None:
+    """Serve an ASGI app from pre-forked workers sharing one socket (blocks until stopped).
+
+    Args:
+        app: ASGI application (e.g. ``mcp.http_app()``)
+        sock: Bound listening socket (see bind_socket)
+        workers: Worker processes (1 serves in this process without forking)
+        graceful_timeout: Seconds each worker drains in-flight requests on shutdown
+        before_fork: Runs once in the master before forking (load shared read-only state)
+        on_worker_start: Runs in each worker before it starts serving
+        on_worker_exit: Runs in each worker after it has drained
+    """
+    if before_fork is not None:
+        before_fork()
+    if workers <= 1:
+        if on_worker_start is not None:
+            on_worker_start()
+        try:
+            _run_server(app, sock, graceful_timeout)
+        finally:
+            if on_worker_exit is not None:
+                on_worker_exit()
+        return
+    gc.freeze()
+    _PreforkMaster(app, sock, workers, graceful_timeout, on_worker_start, on_worker_exit).run()
@@ -0,0 +1,205 @@
+"""Background preloading of models and connections at server startup.
+
+The MCP server accepts connections immediately while a daemon thread loads the
+embedding model, connects the vector store, runs a warm-up query and initializes
+the Docling converter. Requests await the shared future of each component they
+need (``wait_until_ready``) instead of paying a cold load inside the request.
+"""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+
+from raglite.shared.clients import get_embedding_model, get_vector_store
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.models import HealthStatus
+
+logger = get_logger(__name__)
+
+# Preloaded components, in load order
+EMBEDDING_MODEL = "embedding_model"
+VECTOR_STORE = "vector_store"
+DOCUMENT_CONVERTER = "document_converter"
+
+# Components a query needs; the server is ready once these are loaded
+QUERY_COMPONENTS = (EMBEDDING_MODEL, VECTOR_STORE)
+
+_process_start = time.monotonic()
+
+
+class _PreloadState:
+    """Futures, load times and errors of the preload run."""
+
+    def __init__(self, components: list[str]) -> None:
+        self.futures: dict[str, Future[None]] = {name: Future() for name in components}
+        self.load_times_ms: dict[str, float] = {}
+        self.errors: dict[str, str] = {}
+        self.warmup_query_ms: float | None = None
+
+
+# Module-level preload state (None until start_preload is called)
+_preload: _PreloadState | None = None
+_preload_lock = threading.Lock()
+
+
+def _load_embedding_model() -> None:
+    get_embedding_model()
+
+
+def _load_vector_store() -> None:
+    # Round trip opens the connection (remote) or the on-disk store (embedded)
+    get_vector_store().collection_exists(settings.qdrant_collection_name)
+
+
+def _load_document_converter() -> None:
+    from docling.datamodel.base_models import InputFormat
+
+    from raglite.ingestion.pipeline import get_document_converter
+
+    # Loads layout and TableFormer models now rather than on the first conversion
+    get_document_converter().initialize_pipeline(InputFormat.PDF)
+
+
+_LOADERS: dict[str, Callable[[], None]] = {
+    EMBEDDING_MODEL: _load_embedding_model,
+    VECTOR_STORE: _load_vector_store,
+    DOCUMENT_CONVERTER: _load_document_converter,
+}
+
+
+def _warmup_query(state: _PreloadState) -> None:
+    """Run one query embedding and vector search to warm caches and record latency."""
+    start = time.perf_counter()
+    try:
+        embedding = get_embedding_model().encode(["warm-up query"])[0]
+        store = get_vector_store()
+        if store.collection_exists(settings.qdrant_collection_name):
+            store.query_points(
+                collection_name=settings.qdrant_collection_name,
+                query=embedding.tolist(),
+                limit=1,
+                with_payload=False,
+            )
+    except Exception as e:
+        logger.warning("Warm-up query failed", extra={"error": str(e)})
+        return
+    state.warmup_query_ms = round((time.perf_counter() - start) * 1000, 2)
+    logger.info("Warm-up query complete", extra={"latency_ms": state.warmup_query_ms})
+
+
+def _run_preload(state: _PreloadState) -> None:
+    """Load each component in order, resolving its future (preload thread body)."""
+    for name, future in state.futures.items():
+        future.set_running_or_notify_cancel()
+        start = time.perf_counter()
+        try:
+            _LOADERS[name]()
+        except Exception as e:
+            state.errors[name] = str(e)
+            logger.error(
+                "Component preload failed",
+                extra={"component": name, "error": str(e)},
+                exc_info=True,
+            )
+            future.set_exception(e)
+        else:
+            state.load_times_ms[name] = round((time.perf_counter() - start) * 1000, 2)
+            logger.info(
+                "Component preloaded",
+                extra={"component": name, "load_ms": state.load_times_ms[name]},
+            )
+            future.set_result(None)
+
+        if name == VECTOR_STORE and not any(c in state.errors for c in QUERY_COMPONENTS):
+            _warmup_query(state)
+
+
+def start_preload(include_document_converter: bool | None = None) -> bool:
+    """Start loading models and connections in a background daemon thread.
+
+    Args:
+        include_document_converter: Also initialize Docling (default:
+            settings.preload_document_converter)
+
+    Returns:
+        True if preloading started, False if it was already running
+
+    Example:
+        >>> start_preload()
+        >>> mcp.run()  # Accepts connections while models load
+    """
+    global _preload
+
+    if include_document_converter is None:
+        include_document_converter = settings.preload_document_converter
+
+    with _preload_lock:
+        if _preload is not None:
+            return False
+        components = [EMBEDDING_MODEL, VECTOR_STORE]
+        if include_document_converter:
+            components.append(DOCUMENT_CONVERTER)
+        _preload = _PreloadState(components)
+
+    logger.info("Starting background preload", extra={"components": components})
+    threading.Thread(
+        target=_run_preload, args=(_preload,), name="raglite-preload", daemon=True
+    ).start()
+    return True
+
+
+async def wait_until_ready(*components: str) -> None:
+    """Wait, without blocking the event loop, until components finish preloading.
+
+    Returns immediately if preloading was not started or a component is not
+    scheduled. Load failures are not raised here: the caller's own lazy load
+    (e.g. get_embedding_model) retries and reports them.
+
+    Args:
+        components: Component names (EMBEDDING_MODEL, VECTOR_STORE, DOCUMENT_CONVERTER)
+    """
+    state = _preload
+    if state is None:
+        return
+    pending = [
+        asyncio.wrap_future(state.futures[name])
+        for name in components
+        if name in state.futures and not state.futures[name].done()
+    ]
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _component_state(future: Future[None]) -> str:
+    if not future.done():
+        return "loading" if future.running() else "pending"
+    return "failed" if future.exception() is not None else "ready"
+
+
+def get_health_status() -> HealthStatus:
+    """Report readiness, per-component load times and warm-up query latency.
+
+    Without preloading, components load on first use and the server reports
+    ready with each query component marked "lazy".
+    """
+    uptime_seconds = round(time.monotonic() - _process_start, 2)
+    state = _preload
+    if state is None:
+        return HealthStatus(
+            ready=True,
+            components=dict.fromkeys(QUERY_COMPONENTS, "lazy"),
+            uptime_seconds=uptime_seconds,
+        )
+
+    components = {name: _component_state(future) for name, future in state.futures.items()}
+    return HealthStatus(
+        ready=all(components.get(name) == "ready" for name in QUERY_COMPONENTS),
+        components=components,
+        load_times_ms=dict(state.load_times_ms),
+        warmup_query_ms=state.warmup_query_ms,
+        errors=dict(state.errors),
+        uptime_seconds=uptime_seconds,
+    )
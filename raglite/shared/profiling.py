@@ -0,0 +1,314 @@
+"""On-demand profiling of the next N ingest or query requests.
+
+Arm the switch with ``PROFILE_NEXT_REQUESTS=N`` (at startup) or the
+``profile_requests`` MCP tool; each of the next N ``ingest_financial_document``
+or ``query_financial_documents`` calls is then profiled and a report is
+written to ``settings.profile_dir`` (default ``workspace/reports``):
+
+- ``cpu``: cProfile of the request, saved as ``.prof`` (snakeviz, pstats) plus
+  a ``.txt`` summary (top functions by cumulative time) with the request
+  parameters. Work the request hands to the ingestion pool (``run_ingest_task``:
+  Docling convert, Excel parsing, chunking) and to the embedder thread
+  (``embed_with_priority``: ``model.encode``) is profiled on those threads and
+  merged into the same report; the summary lists the threads covered.
+- ``memory``: tracemalloc during the request, saved as ``.json`` with peak
+  memory per stage (the tracing spans: convert, chunk, embed batches, upload,
+  query_points, ...) and the largest allocation sites still live at the end.
+
+When disarmed, ``profile_request`` costs one integer comparison. One profile
+of each mode runs at a time (cProfile and the tracemalloc peak are global);
+requests arriving meanwhile run unprofiled and do not use up the count.
+
+Note: on the event loop thread, coroutines of concurrent requests that run
+while a profiled request awaits appear in its profile. Other threads
+(``asyncio.to_thread``, the Qdrant client's upload workers) are not profiled.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Literal, TypeVar
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.models import ProfilingStatus
+from raglite.shared.tracing import Span, observe_spans
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+ProfileMode = Literal["cpu", "memory"]
+
+# Reports kept in ProfilingStatus.reports
+_RECENT_REPORTS = 20
+
+# Switch state: remaining requests to profile and mode (armed from settings at import)
+_remaining = settings.profile_next_requests
+_mode: ProfileMode = settings.profile_mode
+_cpu_active = False
+_memory_active = False
+_reports: list[str] = []
+_lock = threading.Lock()
+
+
+def arm_profiling(count: int, mode: ProfileMode = "cpu") -> ProfilingStatus:
+    """Profile the next count ingest/query requests (0 disarms).
+
+    Args:
+        count: Number of upcoming requests to profile
+        mode: "cpu" (cProfile) or "memory" (tracemalloc peak per stage)
+
+    Returns:
+        ProfilingStatus after arming
+    """
+    global _remaining, _mode
+
+    with _lock:
+        _remaining = max(0, count)
+        _mode = mode
+    logger.info("Profiling armed", extra={"requests": count, "mode": mode})
+    return get_profiling_status()
+
+
+def get_profiling_status() -> ProfilingStatus:
+    """Report the armed mode, remaining request count and recent reports."""
+    with _lock:
+        return ProfilingStatus(
+            mode=_mode,
+            remaining=_remaining,
+            output_dir=settings.profile_dir,
+            reports=list(_reports),
+        )
+
+
+def _claim() -> ProfileMode | None:
+    """Take one profiling slot, or None if disarmed (or a profile of the mode is running)."""
+    global _remaining, _cpu_active, _memory_active
+
+    with _lock:
+        if _remaining <= 0:
+            return None
+        if _mode == "cpu":
+            if _cpu_active:  # One cProfile per thread; the event loop runs on one thread
+                return None
+            _cpu_active = True
+        else:
+            if _memory_active:  # tracemalloc tracing and its peak are process-wide
+                return None
+            _memory_active = True
+        _remaining -= 1
+        return _mode
+
+
+def _report_path(tool: str, suffix: str) -> Path:
+    directory = Path(settings.profile_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    stamp = datetime.now(UTC).strftime("%Y%m%dT%H%M%S%fZ")
+    return directory / f"profile-{stamp}-{re.sub(r'[^A-Za-z0-9_-]', '_', tool)}{suffix}"
+
+
+def _remember(path: Path) -> None:
+    with _lock:
+        _reports.append(str(path))
+        del _reports[:-_RECENT_REPORTS]
+    logger.info("Profile written", extra={"path": str(path)})
+
+
+class _StageMemory:
+    """Span observer recording tracemalloc peak memory per stage.
+
+    Each open span keeps the highest peak seen since it started; the tracemalloc
+    peak is reset when a child starts and the child's peak is folded into its
+    parent when it ends, so nested stages report correct peaks.
+    """
+
+    def __init__(self) -> None:
+        self._stack: list[list[int]] = []  # [start_bytes, peak_bytes] per open span
+        self.stages: dict[str, dict[str, Any]] = {}
+
+    def on_span_start(self, span: Span) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        tracemalloc.reset_peak()
+        self._stack.append([current, current])
+
+    def on_span_end(self, span: Span) -> None:
+        if not self._stack:
+            return
+        start_bytes, peak_bytes = self._stack.pop()
+        peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak_bytes)
+        stage = self.stages.setdefault(
+            span.name, {"calls": 0, "peak_mb": 0.0, "peak_growth_mb": 0.0, "total_ms": 0.0}
+        )
+        stage["calls"] += 1
+        stage["peak_mb"] = max(stage["peak_mb"], round(peak_bytes / 2**20, 2))
+        stage["peak_growth_mb"] = max(
+            stage["peak_growth_mb"], round((peak_bytes - start_bytes) / 2**20, 2)
+        )
+        stage["total_ms"] = round(stage["total_ms"] + span.duration_ms, 2)
+
+
+class _ThreadProfiles:
+    """cProfile stats of the calls a CPU-profiled request ran on worker threads."""
+
+    def __init__(self) -> None:
+        self.stats: pstats.Stats | None = None
+        self.threads: Counter[str] = Counter()  # Thread name -> profiled calls
+        self._lock = threading.Lock()
+
+    def run(self, call: Callable[[], T]) -> T:
+        profiler = cProfile.Profile()
+        profiler.enable()  # cProfile covers the current thread only
+        try:
+            return call()
+        finally:
+            profiler.disable()
+            with self._lock:
+                if self.stats is None:
+                    self.stats = pstats.Stats(profiler)
+                else:
+                    self.stats.add(profiler)
+                self.threads[threading.current_thread().name] += 1
+
+
+# Worker-thread profile of the CPU-profiled request running in this context
+_thread_profiles: ContextVar[_ThreadProfiles | None] = ContextVar(
+    "raglite_thread_profiles", default=None
+)
+
+
+def profile_in_thread(call: Callable[[], T]) -> Callable[[], T]:
+    """Extend the caller's CPU profile to a call handed to another thread.
+
+    Used by the ingestion pool and the embedder thread (raglite.shared.scheduler).
+
+    Returns:
+        call itself unless the calling request is CPU-profiled
+    """
+    profiles = _thread_profiles.get()
+    if profiles is None:
+        return call
+    return functools.partial(profiles.run, call)
+
+
+@contextmanager
+def _cpu_profile(tool: str, params: dict[str, Any]) -> Iterator[None]:
+    global _cpu_active
+
+    profiler = cProfile.Profile()
+    profiles = _ThreadProfiles()
+    token = _thread_profiles.set(profiles)
+    start = time.perf_counter()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        _thread_profiles.reset(token)
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        with _lock:
+            _cpu_active = False
+        try:
+            path = _report_path(tool, ".prof")
+            summary = io.StringIO()
+            stats = pstats.Stats(profiler, stream=summary)
+            with profiles._lock:
+                if profiles.stats is not None:
+                    stats.add(profiles.stats)
+                threads = ", ".join(f"{name} ({n})" for name, n in sorted(profiles.threads.items()))
+            stats.dump_stats(path)
+            summary.write(f"tool: {tool}\nduration_ms: {duration_ms}\n")
+            summary.write(f"params: {json.dumps(params, default=str)}\n")
+            summary.write(f"worker threads (profiled calls): {threads or 'none'}\n\n")
+            stats.sort_stats("cumulative").print_stats(40)
+            path.with_suffix(".txt").write_text(summary.getvalue(), encoding="utf-8")
+            _remember(path)
+        except OSError as e:
+            logger.error("Failed to write CPU profile", extra={"error": str(e)})
+
+
+@contextmanager
+def _memory_profile(tool: str, params: dict[str, Any]) -> Iterator[None]:
+    global _memory_active
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    stages = _StageMemory()
+    start = time.perf_counter()
+    try:
+        with observe_spans(stages):
+            yield
+    finally:
+        duration_ms = round((time.perf_counter() - start) * 1000, 2)
+        top_live_allocations = []  # Still allocated when the request ends
+        try:
+            # Tracing may have been stopped elsewhere; a profiler failure never fails the request
+            if tracemalloc.is_tracing():
+                top_live_allocations = [
+                    {"site": str(stat.traceback), "size_mb": round(stat.size / 2**20, 3)}
+                    for stat in tracemalloc.take_snapshot().statistics("lineno")[:25]
+                ]
+        except RuntimeError as e:
+            logger.warning("Memory snapshot failed", extra={"error": str(e)})
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+            with _lock:
+                _memory_active = False
+        report = {
+            "tool": tool,
+            "params": params,
+            "duration_ms": duration_ms,
+            "stages": stages.stages,
+            "top_live_allocations": top_live_allocations,
+        }
+        try:
+            path = _report_path(tool, ".json")
+            path.write_text(json.dumps(report, indent=2, default=str), encoding="utf-8")
+            _remember(path)
+        except OSError as e:
+            logger.error("Failed to write memory profile", extra={"error": str(e)})
+
+
+@contextmanager
+def profile_request(tool: str, params: dict[str, Any]) -> Iterator[None]:
+    """Profile the enclosed request if the profiling switch is armed.
+
+    Args:
+        tool: Request kind, used in the report name ("ingest", "query")
+        params: Request parameters recorded in the report
+
+    Example:
+        >>> with profile_request("query", {"query": query, "top_k": 5}):
+        ...     results = await search_documents(query, 5)
+    """
+    if _remaining <= 0:  # Fast path: disarmed
+        yield
+        return
+
+    mode = _claim()
+    if mode is None:
+        yield
+    elif mode == "cpu":
+        with _cpu_profile(tool, params):
+            yield
+    else:
+        with _memory_profile(tool, params):
+            yield
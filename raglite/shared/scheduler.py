@@ -0,0 +1,256 @@
+"""Priority scheduling and admission control between queries and ingestion.
+
+Queries and ingestion share one embedding model and, before this module, one
+event loop: a large PDF ingest held the CPU (Docling convert, embedding
+batches) and query latency went from ~40 ms to seconds. Three mechanisms keep
+interactive queries fast while documents are ingested:
+
+- ``EmbeddingScheduler``: every ``model.encode`` call runs on one dedicated
+  embedder thread fed by a priority queue. Queries (``Priority.QUERY``) are
+  always taken before ingestion batches (``Priority.INGEST``), so a query
+  waits for at most the ingestion batch already running (32 chunks).
+- ``IngestionAdmission``: at most ``settings.ingest_max_concurrent``
+  ingestions run at once (tool calls and background jobs together). Up to
+  ``settings.ingest_max_waiting`` tool calls wait for a slot; further calls
+  are rejected with ``IngestionRejectedError`` (backpressure) instead of
+  piling up behind a saturated CPU.
+- ``run_ingest_task``: CPU-bound ingestion steps (Docling convert, Excel
+  parsing, chunking) run on a bounded ingestion thread pool instead of
+  blocking the event loop that serves queries.
+
+The embedder thread sizes torch's thread pools from the thread budget
+(raglite.shared.threads).
+
+Example:
+    >>> embeddings = await embed_with_priority(Priority.QUERY, model.encode, [query])
+"""
+
+import asyncio
+import contextvars
+import functools
+import itertools
+import queue
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from enum import IntEnum
+from typing import Any, TypeVar
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.metrics import EMBED_QUEUE_SECONDS
+from raglite.shared.profiling import profile_in_thread
+from raglite.shared.threads import get_thread_budget, set_torch_threads
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class Priority(IntEnum):
+    """Embedder priority (lower runs first)."""
+
+    QUERY = 0
+    INGEST = 1
+
+
+class IngestionRejectedError(Exception):
+    """Raised when ingestion capacity (running + waiting) is exhausted."""
+
+    pass
+
+
+class EmbeddingScheduler:
+    """Run embedding calls on one dedicated thread, highest priority first.
+
+    Args:
+        threads: torch intra-op threads for the embedder (None keeps torch's default)
+        interop_threads: torch inter-op threads (None keeps torch's default)
+    """
+
+    def __init__(self, threads: int | None = None, interop_threads: int | None = None) -> None:
+        self.threads = threads
+        self.interop_threads = interop_threads
+        self._queue: queue.PriorityQueue[tuple[int, int, float, Callable[[], Any], Future[Any]]]
+        self._queue = queue.PriorityQueue()
+        self._sequence = itertools.count()  # FIFO within a priority
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._worker, name="raglite-embedder", daemon=True
+                )
+                self._thread.start()
+
+    def _worker(self) -> None:
+        if self.threads:
+            set_torch_threads(self.threads, self.interop_threads)
+        while True:
+            priority, _, enqueued, call, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue  # Caller went away (e.g. query cancelled)
+            EMBED_QUEUE_SECONDS.labels(priority=Priority(priority).name.lower()).observe(
+                time.perf_counter() - enqueued
+            )
+            try:
+                future.set_result(call())
+            except BaseException as e:
+                future.set_exception(e)
+
+    def submit(
+        self, priority: Priority, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> "Future[T]":
+        """Queue fn(*args, **kwargs) for the embedder thread."""
+        if self._thread is None:
+            self._start()
+        future: Future[T] = Future()
+        call = profile_in_thread(functools.partial(fn, *args, **kwargs))
+        self._queue.put((priority, next(self._sequence), time.perf_counter(), call, future))
+        return future
+
+    async def run(self, priority: Priority, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Await fn(*args, **kwargs) on the embedder thread without blocking the loop."""
+        return await asyncio.wrap_future(self.submit(priority, fn, *args, **kwargs))
+
+
+class IngestionAdmission:
+    """Bound concurrent ingestions; reject callers beyond the waiting limit.
+
+    Args:
+        limit: Ingestions allowed to run at once
+        max_waiting: Rejecting callers allowed to wait for a slot
+    """
+
+    def __init__(self, limit: int, max_waiting: int) -> None:
+        self.limit = max(1, limit)
+        self.max_waiting = max(0, max_waiting)
+        self.running = 0
+        self.waiting = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, reject: bool = True) -> None:
+        """Block until a slot is free.
+
+        Args:
+            reject: Raise instead of waiting when max_waiting callers already wait
+                (background jobs pass False; they are queued persistently already)
+
+        Raises:
+            IngestionRejectedError: If reject is set and the waiting queue is full
+        """
+        with self._condition:
+            if self.running < self.limit:
+                self.running += 1
+                return
+            if reject and self.waiting >= self.max_waiting:
+                raise IngestionRejectedError(
+                    f"Ingestion capacity exhausted ({self.running} running, {self.waiting} "
+                    "waiting); retry later or queue it with submit_ingestion"
+                )
+            if reject:
+                self.waiting += 1
+            try:
+                self._condition.wait_for(lambda: self.running < self.limit)
+                self.running += 1
+            finally:
+                if reject:
+                    self.waiting -= 1
+
+    def release(self) -> None:
+        with self._condition:
+            self.running -= 1
+            self._condition.notify()
+
+
+# Module-level scheduler, admission gate and ingestion pool (created on first use)
+_embedding_scheduler: EmbeddingScheduler | None = None
+_ingestion_admission: IngestionAdmission | None = None
+_ingest_executor: ThreadPoolExecutor | None = None
+_singletons_lock = threading.Lock()
+
+
+def get_embedding_scheduler() -> EmbeddingScheduler:
+    """Return the process-wide embedding scheduler."""
+    global _embedding_scheduler
+
+    if _embedding_scheduler is None:
+        with _singletons_lock:
+            if _embedding_scheduler is None:
+                budget = get_thread_budget()
+                _embedding_scheduler = (
+                    EmbeddingScheduler(budget.torch_intra_op, budget.torch_inter_op)
+                    if budget is not None
+                    else EmbeddingScheduler(settings.embedding_threads)
+                )
+    return _embedding_scheduler
+
+
+def get_ingestion_admission() -> IngestionAdmission:
+    """Return the process-wide ingestion admission gate."""
+    global _ingestion_admission
+
+    if _ingestion_admission is None:
+        with _singletons_lock:
+            if _ingestion_admission is None:
+                _ingestion_admission = IngestionAdmission(
+                    settings.ingest_max_concurrent, settings.ingest_max_waiting
+                )
+    return _ingestion_admission
+
+
+async def embed_with_priority(
+    priority: Priority, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Run an embedding call (e.g. ``model.encode``) on the shared embedder thread."""
+    return await get_embedding_scheduler().run(priority, fn, *args, **kwargs)
+
+
+async def run_ingest_task(fn: Callable[..., T], *args: Any) -> T:
+    """Run a CPU-bound ingestion step on the bounded ingestion pool.
+
+    The caller's context (current tracing span) is carried into the pool thread,
+    and a CPU profile of the calling request covers the step.
+    """
+    global _ingest_executor
+
+    if _ingest_executor is None:
+        with _singletons_lock:
+            if _ingest_executor is None:
+                _ingest_executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.ingest_max_concurrent),
+                    thread_name_prefix="raglite-ingest",
+                )
+    context = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    call = profile_in_thread(functools.partial(fn, *args))
+    return await loop.run_in_executor(_ingest_executor, functools.partial(context.run, call))
+
+
+@asynccontextmanager
+async def admit_ingestion() -> AsyncIterator[None]:
+    """Hold an ingestion slot for the block, waiting or rejecting per IngestionAdmission.
+
+    Raises:
+        IngestionRejectedError: If capacity (running + waiting) is exhausted
+    """
+    admission = get_ingestion_admission()
+    acquire = asyncio.ensure_future(asyncio.to_thread(admission.acquire))
+    try:
+        await asyncio.shield(acquire)
+    except asyncio.CancelledError:
+        # The waiting thread may still get the slot: hand it back when it does
+        def _release_late(done: "asyncio.Future[None]") -> None:
+            if not done.cancelled() and done.exception() is None:
+                admission.release()
+
+        acquire.add_done_callback(_release_late)
+        raise
+    try:
+        yield
+    finally:
+        admission.release()
@@ -0,0 +1,95 @@
+"""Singleflight coalescing of identical in-flight requests.
+
+When many analysts send the same query within seconds, or automation
+re-submits a document whose ingestion is still running, every duplicate used
+to repeat the embedding (and, for ingestion, the conversion and upload).
+``SingleFlight.do`` runs the first caller's coroutine as a task and lets later
+callers with the same key await that task instead. The key is dropped once
+the task finishes, so results are never cached beyond the shared execution.
+
+The shared task is shielded: a caller that is cancelled (client disconnect)
+does not cancel it for the others. Exceptions reach every caller. Each caller
+gets its own deep copy of the result, since callers mutate what they get back
+(citations appended to chunk text, timings cleared).
+
+One ``SingleFlight`` coalesces calls across event loops and threads: the
+ingestion tool (server loop) and ingestion jobs (``asyncio.run`` in worker
+threads) share the same ingest flight. The shared task runs on the first
+caller's loop; callers on other loops await its result through a
+``concurrent.futures.Future``.
+
+Example:
+    >>> flight: SingleFlight[list[QueryResult]] = SingleFlight("query")
+    >>> results = await flight.do(("revenue", 5), lambda: search(query, 5))
+"""
+
+import asyncio
+import concurrent.futures
+import copy
+import threading
+import unicodedata
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from raglite.shared.metrics import COALESCED_REQUESTS
+
+T = TypeVar("T")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for coalescing keys (Unicode NFKC, collapsed whitespace).
+
+    Case is kept: the embedding model's tokenizer decides whether it matters.
+    """
+    return " ".join(unicodedata.normalize("NFKC", query).split())
+
+
+class SingleFlight(Generic[T]):
+    """Share one execution between concurrent calls with the same key.
+
+    Args:
+        kind: Label for the coalesced-requests metric (e.g. "query", "ingest")
+    """
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self._calls: dict[Hashable, concurrent.futures.Future[T]] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self) -> int:
+        """Number of keys currently executing."""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn(), or the identical call already in flight for key.
+
+        Returns:
+            A deep copy of the shared result (one per caller)
+        """
+        with self._lock:
+            shared = self._calls.get(key)
+            leader = shared is None
+            if shared is None:
+                shared = concurrent.futures.Future()
+                self._calls[key] = shared
+        if leader:
+            task = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda done: self._finish(key, shared, done))
+            result = await asyncio.shield(task)
+        else:
+            COALESCED_REQUESTS.labels(kind=self.kind).inc()
+            result = await asyncio.shield(asyncio.wrap_future(shared))
+        return copy.deepcopy(result)
+
+    def _finish(
+        self, key: Hashable, shared: concurrent.futures.Future[T], task: asyncio.Task[T]
+    ) -> None:
+        """Drop the key and hand the task's outcome to callers on any loop."""
+        with self._lock:
+            self._calls.pop(key, None)
+        if task.cancelled():
+            shared.cancel()
+        elif task.exception() is not None:
+            shared.set_exception(task.exception())  # type: ignore[arg-type]
+        else:
+            shared.set_result(task.result())
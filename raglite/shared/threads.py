@@ -0,0 +1,103 @@
+"""CPU thread budget shared by the embedder, Docling and numeric libraries.
+
+Docling's layout/TableFormer models, the sentence-transformers model, pandas
+and BLAS each size their thread pools to the whole machine by default, so
+parallel ingestion oversubscribes the CPU (several pools of N threads on N
+cores) and query latency suffers from context switching. ``get_thread_budget``
+divides ``settings.cpu_thread_budget`` (default: all CPUs) into one share for
+queries plus one per concurrent ingestion (``settings.ingest_max_concurrent``):
+
+- torch intra-op threads: one share (the torch pool is process-wide, so the
+  embedder and Docling's models use the same count); inter-op threads: 1
+- Docling accelerator threads per conversion: one share
+- OpenMP/MKL/OpenBLAS/numexpr/rayon threads: one share
+- ingestion pool workers: ``settings.ingest_max_concurrent``
+
+Over the HTTP transport each of ``settings.http_workers`` processes gets its own
+budget of ``cpu_thread_budget // http_workers`` threads.
+
+``settings.embedding_threads`` and ``settings.docling_threads`` override their
+shares. ``apply_thread_budget`` runs at server startup, before torch or numpy
+are imported (most libraries read their thread count once, at import);
+environment variables set explicitly are left as they are.
+
+Example:
+    >>> get_thread_budget()
+    ThreadBudget(total=8, torch_intra_op=4, torch_inter_op=1, docling=4, blas=4, ingest_workers=1)
+"""
+
+import os
+import sys
+
+from raglite.shared.config import settings
+from raglite.shared.logging import get_logger
+from raglite.shared.models import ThreadBudget
+
+logger = get_logger(__name__)
+
+# Thread-count environment variables read by BLAS, OpenMP, numexpr and tokenizers (rayon)
+_BLAS_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "NUMEXPR_MAX_THREADS",
+    "RAYON_NUM_THREADS",
+)
+
+
+def get_thread_budget() -> ThreadBudget | None:
+    """Compute the thread budget from settings (None when the budget is disabled)."""
+    if not settings.thread_budget_enabled:
+        return None
+    total = settings.cpu_thread_budget or os.cpu_count() or 1
+    if settings.mcp_transport == "http":
+        total = max(1, total // max(1, settings.http_workers))  # Budget is per worker process
+    ingestions = max(1, settings.ingest_max_concurrent)
+    share = max(1, total // (ingestions + 1))
+    return ThreadBudget(
+        total=total,
+        torch_intra_op=settings.embedding_threads or share,
+        torch_inter_op=1,
+        docling=settings.docling_threads or share,
+        blas=share,
+        ingest_workers=ingestions,
+    )
+
+
+def set_torch_threads(intra_op: int, inter_op: int | None = None) -> None:
+    """Limit torch thread pools if torch is loaded (never imports it).
+
+    The inter-op pool can only be sized before torch first uses it; later
+    attempts are ignored.
+    """
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    torch.set_num_threads(intra_op)
+    if inter_op is not None:
+        try:
+            torch.set_num_interop_threads(inter_op)
+        except RuntimeError:
+            pass  # Inter-op pool already started
+
+
+def apply_thread_budget(budget: ThreadBudget | None = None) -> ThreadBudget | None:
+    """Apply the thread budget to this process (call once at startup).
+
+    Args:
+        budget: Budget to apply (default: get_thread_budget())
+
+    Returns:
+        The applied budget, or None if the budget is disabled
+    """
+    budget = budget or get_thread_budget()
+    if budget is None:
+        return None
+    for name in _BLAS_ENV_VARS:
+        os.environ.setdefault(name, str(budget.blas))
+    os.environ.setdefault("DOCLING_NUM_THREADS", str(budget.docling))
+    set_torch_threads(budget.torch_intra_op, budget.torch_inter_op)
+    logger.info("Thread budget applied", extra=budget.model_dump())
+    return budget
@@ -0,0 +1,223 @@
+"""Request tracing: nested timed spans exported to a local JSONL file.
+
+Each ingestion or query gets a trace ID; stages inside it (Docling convert,
+chunking, embedding batches, upload batches, query embedding, vector search)
+are spans with their own span ID and a parent link, so one slow request can be
+broken down stage by stage. The current span is held in a ``ContextVar`` and
+follows the request across ``await`` points and ``asyncio.to_thread`` calls.
+
+Tracing is enabled by ``settings.trace_file`` (e.g. ``TRACE_FILE=workspace/
+traces/traces.jsonl``). When unset, ``span`` yields a shared non-recording span
+and nothing is allocated or written. Render a trace with
+``scripts/render-trace-timeline.py``.
+
+Example:
+    >>> with span("embed.batch", batch_index=3, batch_size=32) as s:
+    ...     embeddings = model.encode(texts)
+    ...     s.set_attribute("dimensions", embeddings.shape[1])
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Protocol, TextIO
+
+from raglite.shared.config import settings
+
+
+class Span:
+    """One timed operation within a trace."""
+
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "name",
+        "attributes",
+        "start_time",
+        "duration_ms",
+        "status",
+        "error",
+    )
+
+    def __init__(self, name: str, parent: "Span | None", attributes: dict[str, Any]) -> None:
+        self.trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.name = name
+        self.attributes = attributes
+        self.start_time = time.time()
+        self.duration_ms = 0.0
+        self.status = "ok"
+        self.error: str | None = None
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a value known only after the span started (e.g. result count)."""
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_time": round(self.start_time, 6),
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "thread": threading.current_thread().name,
+            "attributes": self.attributes,
+        }
+
+
+class _NonRecordingSpan(Span):
+    """Span yielded while tracing is disabled; attributes are discarded."""
+
+    def __init__(self) -> None:
+        self.trace_id = ""
+        self.span_id = ""
+        self.parent_id = None
+        self.name = ""
+        self.attributes = {}
+
+    @property
+    def recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NON_RECORDING_SPAN = _NonRecordingSpan()
+
+_current_span: ContextVar[Span | None] = ContextVar("raglite_current_span", default=None)
+
+
+class SpanObserver(Protocol):
+    """Receives span start/end events within a context (see observe_spans)."""
+
+    def on_span_start(self, span: Span) -> None: ...
+
+    def on_span_end(self, span: Span) -> None: ...
+
+
+_span_observers: ContextVar[tuple[SpanObserver, ...]] = ContextVar(
+    "raglite_span_observers", default=()
+)
+
+
+@contextmanager
+def observe_spans(observer: SpanObserver) -> Iterator[None]:
+    """Send start/end events of spans opened in this context to observer.
+
+    Spans are recorded while an observer is active even if trace_file is unset
+    (used by memory profiling to attribute peak usage to stages, and by
+    ingestion jobs to report stage progress). Observers nest.
+    """
+    token = _span_observers.set((*_span_observers.get(), observer))
+    try:
+        yield
+    finally:
+        _span_observers.reset(token)
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a JSONL file (one span per line).
+
+    Lines are buffered and flushed whenever a root span ends, so a request's
+    spans reach disk together.
+
+    Args:
+        path: Output file; parent directories are created
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file: TextIO | None = None
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self.path.open("a", encoding="utf-8")
+            self._file.write(line + "\n")
+            if span.parent_id is None:
+                self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+# Module-level exporter (created on first recorded span when settings.trace_file is set)
+_exporter: JsonlSpanExporter | None = None
+_exporter_lock = threading.Lock()
+
+
+def get_span_exporter() -> JsonlSpanExporter | None:
+    """Return the configured span exporter, or None if tracing is disabled."""
+    global _exporter
+
+    if settings.trace_file is None:
+        return None
+    if _exporter is None:
+        with _exporter_lock:
+            if _exporter is None:
+                _exporter = JsonlSpanExporter(settings.trace_file)
+                atexit.register(_exporter.close)
+    return _exporter
+
+
+def current_span() -> Span | None:
+    """Return the active span in this context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """Time a block as a span, child of the current span (or a new trace root).
+
+    Exceptions are recorded on the span (status "error") and re-raised.
+
+    Args:
+        name: Operation name (e.g. "convert", "embed.batch", "query_points")
+        attributes: Request parameters worth seeing on the timeline
+    """
+    exporter = get_span_exporter()
+    observers = _span_observers.get()
+    if exporter is None and not observers:
+        yield _NON_RECORDING_SPAN
+        return
+
+    current = Span(name, _current_span.get(), attributes)
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        for observer in observers:
+            observer.on_span_start(current)  # May raise (e.g. job cancelled)
+        yield current
+    except BaseException as e:
+        current.status = "error"
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        _current_span.reset(token)
+        for observer in observers:
+            observer.on_span_end(current)
+        if exporter is not None:
+            exporter.export(current)
@@ -0,0 +1,581 @@
+"""In-process NumPy vector store with exact search for single-node and offline use.
+
+Implements the subset of the QdrantClient API that RAGLite uses (see
+raglite.shared.clients.VectorStore) over a memory-mapped float32 matrix and a
+JSON Lines payload sidecar, one directory per collection:
+
+    <path>/<collection>/meta.json       vector size, distance, payload indexes
+    <path>/<collection>/vectors.f32     row-major float32 matrix (points x size)
+    <path>/<collection>/payloads.jsonl  append-only log of {"row", "id", "payload"}
+                                        and {"row", "id", "deleted"} tombstones
+
+Search is a single matrix-vector product over all rows (exact, no HNSW graph),
+which is fast for the tens of thousands of chunks a single node holds and has
+no server process or network round trip. Deleted points keep their matrix row
+(masked out of every count and search) until the collection is recreated.
+"""
+
+import json
+import os
+import shutil
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from qdrant_client.http.models import QueryResponse
+from qdrant_client.models import (
+    CollectionConfig,
+    CollectionInfo,
+    CollectionParams,
+    CollectionStatus,
+    CountResult,
+    Distance,
+    FieldCondition,
+    Filter,
+    FilterSelector,
+    HnswConfig,
+    MatchAny,
+    MatchValue,
+    PayloadIndexInfo,
+    PayloadSchemaType,
+    PointIdsList,
+    PointStruct,
+    Range,
+    Record,
+    ScoredPoint,
+    UpdateResult,
+    UpdateStatus,
+    VectorParams,
+)
+
+from raglite.shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+_META_FILE = "meta.json"
+_VECTORS_FILE = "vectors.f32"
+_PAYLOADS_FILE = "payloads.jsonl"
+
+
+class _Collection:
+    """On-disk state of one collection, loaded lazily and cached in memory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        meta = json.loads((directory / _META_FILE).read_text())
+        self.size: int = meta["size"]
+        self.distance = Distance(meta["distance"])
+        self.payload_schema: dict[str, str] = meta.get("payload_schema", {})
+
+        self.ids: list[str | int] = []
+        self.payloads: list[dict[str, Any]] = []
+        self.rows: dict[str, int] = {}  # str(point id) -> matrix row (live points only)
+        self.deleted: set[int] = set()  # Rows of deleted points
+        self._matrix: np.ndarray | None = None
+        self._value_index: dict[str, dict[Any, list[int]]] = {}
+
+        payloads_path = directory / _PAYLOADS_FILE
+        if payloads_path.exists():
+            with payloads_path.open(encoding="utf-8") as f:
+                for line in f:
+                    self._apply(json.loads(line))
+
+    def _apply(self, record: dict[str, Any]) -> None:
+        """Apply one payload log record (later records for a row win)."""
+        row = record["row"]
+        if record.get("deleted"):
+            self.rows.pop(str(record["id"]), None)
+            self.deleted.add(row)
+            return
+        if row == len(self.ids):
+            self.ids.append(record["id"])
+            self.payloads.append(record["payload"])
+        else:
+            self.ids[row] = record["id"]
+            self.payloads[row] = record["payload"]
+        self.rows[str(record["id"])] = row
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def live_mask(self) -> np.ndarray:
+        """Boolean mask of rows holding a live (not deleted) point."""
+        mask = np.ones(len(self), dtype=bool)
+        if self.deleted:
+            mask[list(self.deleted)] = False
+        return mask
+
+    def save_meta(self) -> None:
+        """Write meta.json atomically."""
+        meta = {
+            "size": self.size,
+            "distance": self.distance.value,
+            "payload_schema": self.payload_schema,
+        }
+        tmp_path = self.directory / f"{_META_FILE}.tmp"
+        tmp_path.write_text(json.dumps(meta))
+        os.replace(tmp_path, self.directory / _META_FILE)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """Memory-mapped (points x size) float32 matrix, reopened after writes."""
+        if self._matrix is None:
+            if len(self) == 0:
+                self._matrix = np.empty((0, self.size), dtype=np.float32)
+            else:
+                self._matrix = np.memmap(
+                    self.directory / _VECTORS_FILE,
+                    dtype=np.float32,
+                    mode="r",
+                    shape=(len(self), self.size),
+                )
+        return self._matrix
+
+    def _index(self, field: str) -> dict[Any, list[int]]:
+        """Payload value -> rows index of a field (built on demand)."""
+        index = self._value_index.get(field)
+        if index is None:
+            index = {}
+            for row, payload in enumerate(self.payloads):
+                value = payload.get(field)
+                if isinstance(value, list):
+                    for item in value:
+                        index.setdefault(item, []).append(row)
+                else:
+                    index.setdefault(value, []).append(row)
+            self._value_index[field] = index
+        return index
+
+    def rows_matching(self, field: str, values: Iterable[Any]) -> list[int]:
+        """Rows whose payload field equals any of values."""
+        index = self._index(field)
+        rows: list[int] = []
+        for value in values:
+            rows.extend(index.get(value, ()))
+        return rows
+
+    def rows_in_range(self, field: str, bounds: Range) -> list[int]:
+        """Rows whose numeric payload field lies within a Range."""
+        rows: list[int] = []
+        for value, value_rows in self._index(field).items():
+            if not isinstance(value, int | float) or isinstance(value, bool):
+                continue
+            if (
+                (bounds.gt is None or value > bounds.gt)
+                and (bounds.gte is None or value >= bounds.gte)
+                and (bounds.lt is None or value < bounds.lt)
+                and (bounds.lte is None or value <= bounds.lte)
+            ):
+                rows.extend(value_rows)
+        return rows
+
+    def upsert(self, points: list[PointStruct], durable: bool) -> None:
+        """Write points: new IDs are appended, existing IDs overwrite their row."""
+        points = list({str(point.id): point for point in points}.values())  # Last write wins
+        vectors = np.asarray([point.vector for point in points], dtype=np.float32)
+        if vectors.ndim != 2 or vectors.shape[1] != self.size:
+            raise ValueError(
+                f"Vector dimension mismatch: expected {self.size}, got shape {vectors.shape}"
+            )
+        if self.distance == Distance.COSINE:
+            # Qdrant normalizes cosine vectors on insert, so search is a dot product
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1.0, norms)
+
+        records = []
+        appended: list[int] = []
+        overwritten: list[tuple[int, int]] = []
+        next_row = len(self)
+        for i, point in enumerate(points):
+            row = self.rows.get(str(point.id))
+            if row is None:
+                row = next_row
+                next_row += 1
+                appended.append(i)
+            else:
+                overwritten.append((i, row))
+            records.append({"row": row, "id": point.id, "payload": point.payload or {}})
+
+        # Release the read-only map before touching the file
+        self._matrix = None
+        vectors_path = self.directory / _VECTORS_FILE
+        row_bytes = self.size * 4
+        with vectors_path.open("r+b" if vectors_path.exists() else "w+b") as f:
+            # Drop rows orphaned by an interrupted write (vectors without a payload record)
+            f.truncate(len(self) * row_bytes)
+            f.seek(len(self) * row_bytes)
+            f.write(vectors[appended].tobytes())
+            for i, row in overwritten:
+                f.seek(row * row_bytes)
+                f.write(vectors[i].tobytes())
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+        # Payload log is written after vectors: rows without a log record are ignored
+        with (self.directory / _PAYLOADS_FILE).open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+
+        for record in records:
+            self._apply(record)
+        self._value_index.clear()
+
+    def delete(self, rows: list[int], durable: bool) -> None:
+        """Tombstone rows in the payload log (their vectors stay in the matrix)."""
+        records = [{"row": row, "id": self.ids[row], "deleted": True} for row in rows]
+        with (self.directory / _PAYLOADS_FILE).open("a", encoding="utf-8") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        for record in records:
+            self._apply(record)
+
+
+class NumpyVectorStore:
+    """Exact-search vector store backed by NumPy memory maps (QdrantClient-compatible subset).
+
+    Writes are synchronous; ``wait=True`` additionally fsyncs the files. Supports
+    COSINE, DOT and EUCLID distances and filters made of ``must``/``must_not``
+    FieldConditions with MatchValue, MatchAny or a numeric Range, which covers
+    RAGLite's queries.
+
+    Args:
+        path: Root directory holding one subdirectory per collection
+
+    Example:
+        >>> store = NumpyVectorStore("data/vector_store")
+        >>> store.create_collection("docs", VectorParams(size=1024, distance=Distance.COSINE))
+        >>> store.upsert("docs", points=[PointStruct(id=1, vector=[...], payload={})])
+        >>> store.query_points("docs", query=[...], limit=5).points
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._collections: dict[str, _Collection] = {}
+        self._lock = threading.RLock()
+
+    def _collection(self, collection_name: str) -> _Collection:
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            directory = self.path / collection_name
+            if not (directory / _META_FILE).exists():
+                raise ValueError(f"Collection {collection_name} not found")
+            collection = _Collection(directory)
+            self._collections[collection_name] = collection
+        return collection
+
+    def collection_exists(self, collection_name: str, **kwargs: Any) -> bool:
+        """Return True if the collection exists on disk."""
+        return (self.path / collection_name / _META_FILE).exists()
+
+    def create_collection(
+        self, collection_name: str, vectors_config: VectorParams, **kwargs: Any
+    ) -> bool:
+        """Create an empty collection (HNSW and optimizer options are ignored)."""
+        with self._lock:
+            if self.collection_exists(collection_name):
+                raise ValueError(f"Collection {collection_name} already exists")
+            if vectors_config.distance not in (Distance.COSINE, Distance.DOT, Distance.EUCLID):
+                raise ValueError(f"Unsupported distance: {vectors_config.distance}")
+            directory = self.path / collection_name
+            directory.mkdir(parents=True, exist_ok=True)
+            (directory / _META_FILE).write_text(
+                json.dumps({"size": vectors_config.size, "distance": vectors_config.distance.value})
+            )
+            self._collections.pop(collection_name, None)
+            return True
+
+    def delete_collection(self, collection_name: str, **kwargs: Any) -> bool:
+        """Delete a collection and its files."""
+        with self._lock:
+            self._collections.pop(collection_name, None)
+            directory = self.path / collection_name
+            if not directory.exists():
+                return False
+            shutil.rmtree(directory)
+            return True
+
+    def get_collection(self, collection_name: str) -> CollectionInfo:
+        """Return collection info; always GREEN since there is no index to build."""
+        with self._lock:
+            collection = self._collection(collection_name)
+            points = len(collection.rows)
+            return CollectionInfo.model_construct(
+                status=CollectionStatus.GREEN,
+                optimizer_status="ok",
+                points_count=points,
+                indexed_vectors_count=points,
+                segments_count=1,
+                config=CollectionConfig.model_construct(
+                    params=CollectionParams.model_construct(
+                        vectors=VectorParams(size=collection.size, distance=collection.distance)
+                    ),
+                    hnsw_config=HnswConfig.model_construct(m=0),  # Exact search, no graph
+                ),
+                payload_schema={
+                    field: PayloadIndexInfo.model_construct(
+                        data_type=PayloadSchemaType(schema), points=points
+                    )
+                    for field, schema in collection.payload_schema.items()
+                },
+            )
+
+    def update_collection(self, collection_name: str, **kwargs: Any) -> bool:
+        """Accept HNSW/optimizer updates as no-ops (there is no index to tune)."""
+        self._collection(collection_name)
+        return True
+
+    def create_payload_index(
+        self,
+        collection_name: str,
+        field_name: str,
+        field_schema: PayloadSchemaType | None = None,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        """Record a payload index; value lookups are indexed in memory on first filter."""
+        with self._lock:
+            collection = self._collection(collection_name)
+            schema = field_schema or PayloadSchemaType.KEYWORD
+            collection.payload_schema[field_name] = PayloadSchemaType(schema).value
+            collection.save_meta()
+        return UpdateResult(operation_id=0, status=UpdateStatus.COMPLETED)
+
+    def upsert(
+        self, collection_name: str, points: list[PointStruct], wait: bool = True, **kwargs: Any
+    ) -> UpdateResult:
+        """Insert or overwrite points by ID."""
+        if points:
+            with self._lock:
+                self._collection(collection_name).upsert(points, durable=wait)
+        return UpdateResult(operation_id=0, status=UpdateStatus.COMPLETED)
+
+    def upload_points(
+        self,
+        collection_name: str,
+        points: Iterable[PointStruct],
+        batch_size: int = 64,
+        wait: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        """Upsert points in batches (parallel and retry options are ignored in-process)."""
+        batch: list[PointStruct] = []
+        for point in points:
+            batch.append(point)
+            if len(batch) >= batch_size:
+                self.upsert(collection_name, batch, wait=wait)
+                batch = []
+        if batch:
+            self.upsert(collection_name, batch, wait=wait)
+
+    def delete(
+        self,
+        collection_name: str,
+        points_selector: FilterSelector | PointIdsList | Filter | list[str | int],
+        wait: bool = True,
+        **kwargs: Any,
+    ) -> UpdateResult:
+        """Delete points selected by filter or by ID."""
+        with self._lock:
+            collection = self._collection(collection_name)
+            if isinstance(points_selector, FilterSelector):
+                points_selector = points_selector.filter
+            if isinstance(points_selector, Filter):
+                rows = np.flatnonzero(self._filter_rows(collection, points_selector)).tolist()
+            else:
+                if isinstance(points_selector, PointIdsList):
+                    points_selector = points_selector.points
+                rows = [
+                    collection.rows[str(point_id)]
+                    for point_id in points_selector
+                    if str(point_id) in collection.rows
+                ]
+            if rows:
+                collection.delete(rows, durable=wait)
+        return UpdateResult(operation_id=0, status=UpdateStatus.COMPLETED)
+
+    def _filter_rows(self, collection: _Collection, query_filter: Filter | None) -> np.ndarray:
+        """Boolean row mask of live points matching a Filter (all live points if None)."""
+        mask = collection.live_mask()
+        if query_filter is None:
+            return mask
+
+        def condition_mask(condition: Any) -> np.ndarray:
+            if not isinstance(condition, FieldCondition):
+                raise ValueError(f"Unsupported filter condition: {type(condition).__name__}")
+            selected = np.zeros(len(collection), dtype=bool)
+            if isinstance(condition.range, Range):
+                selected[collection.rows_in_range(condition.key, condition.range)] = True
+                return selected
+            if isinstance(condition.match, MatchValue):
+                values = [condition.match.value]
+            elif isinstance(condition.match, MatchAny):
+                values = list(condition.match.any)
+            else:
+                raise ValueError(f"Unsupported match for field {condition.key}")
+            selected[collection.rows_matching(condition.key, values)] = True
+            return selected
+
+        for condition in _as_list(query_filter.must):
+            mask &= condition_mask(condition)
+        for condition in _as_list(query_filter.must_not):
+            mask &= ~condition_mask(condition)
+        if query_filter.should:
+            any_mask = np.zeros(len(collection), dtype=bool)
+            for condition in _as_list(query_filter.should):
+                any_mask |= condition_mask(condition)
+            mask &= any_mask
+        return mask
+
+    def count(
+        self,
+        collection_name: str,
+        count_filter: Filter | None = None,
+        exact: bool = True,
+        **kwargs: Any,
+    ) -> CountResult:
+        """Count points matching a filter (always exact)."""
+        with self._lock:
+            collection = self._collection(collection_name)
+            return CountResult(count=int(self._filter_rows(collection, count_filter).sum()))
+
+    def query_points(
+        self,
+        collection_name: str,
+        query: list[float] | np.ndarray,
+        limit: int = 10,
+        query_filter: Filter | None = None,
+        with_payload: bool = True,
+        with_vectors: bool = False,
+        score_threshold: float | None = None,
+        **kwargs: Any,
+    ) -> QueryResponse:
+        """Exact nearest-neighbour search, best match first (like Qdrant's query_points)."""
+        with self._lock:
+            collection = self._collection(collection_name)
+            matrix = collection.matrix
+            mask = self._filter_rows(collection, query_filter)
+            ids = collection.ids
+            payloads = collection.payloads
+
+        candidates = np.flatnonzero(mask)
+        if candidates.size == 0 or limit <= 0:
+            return QueryResponse(points=[])
+
+        vector = np.asarray(query, dtype=np.float32)
+        subset = matrix if candidates.size == len(mask) else matrix[candidates]
+        if collection.distance == Distance.EUCLID:
+            scores = np.linalg.norm(subset - vector, axis=1)
+            order_scores = -scores  # Smaller distance is better
+        else:
+            if collection.distance == Distance.COSINE:
+                norm = np.linalg.norm(vector)
+                vector = vector / norm if norm else vector
+            scores = subset @ vector
+            order_scores = scores
+
+        k = min(limit, candidates.size)
+        top = np.argpartition(-order_scores, k - 1)[:k]
+        top = top[np.argsort(-order_scores[top])]
+
+        points = []
+        for i in top:
+            score = float(scores[i])
+            if score_threshold is not None and (
+                score > score_threshold
+                if collection.distance == Distance.EUCLID
+                else score < score_threshold
+            ):
+                continue
+            row = int(candidates[i])
+            points.append(
+                ScoredPoint(
+                    id=ids[row],
+                    version=0,
+                    score=score,
+                    payload=payloads[row] if with_payload else None,
+                    vector=matrix[row].tolist() if with_vectors else None,
+                )
+            )
+        return QueryResponse(points=points)
+
+    def retrieve(
+        self,
+        collection_name: str,
+        ids: Sequence[str | int],
+        with_payload: bool = True,
+        with_vectors: bool = False,
+        **kwargs: Any,
+    ) -> list[Record]:
+        """Fetch points by ID (unknown or deleted IDs are skipped)."""
+        with self._lock:
+            collection = self._collection(collection_name)
+            rows = [
+                collection.rows[str(point_id)]
+                for point_id in ids
+                if str(point_id) in collection.rows
+            ]
+            matrix = collection.matrix if with_vectors else None
+            return [
+                Record(
+                    id=collection.ids[row],
+                    payload=collection.payloads[row] if with_payload else None,
+                    vector=matrix[row].tolist() if matrix is not None else None,
+                )
+                for row in rows
+            ]
+
+    def scroll(
+        self,
+        collection_name: str,
+        scroll_filter: Filter | None = None,
+        limit: int = 10,
+        offset: str | int | None = None,
+        with_payload: bool = True,
+        with_vectors: bool = False,
+        **kwargs: Any,
+    ) -> tuple[list[Record], str | int | None]:
+        """Page through points matching a filter in ID order (like Qdrant's scroll).
+
+        Returns:
+            (points from offset on, at most limit; ID to pass as the next offset or None)
+        """
+        with self._lock:
+            collection = self._collection(collection_name)
+            rows = np.flatnonzero(self._filter_rows(collection, scroll_filter)).tolist()
+            ids = collection.ids
+            payloads = collection.payloads
+            matrix = collection.matrix if with_vectors else None
+
+        rows.sort(key=lambda row: str(ids[row]))
+        if offset is not None:
+            rows = [row for row in rows if str(ids[row]) >= str(offset)]
+        records = [
+            Record(
+                id=ids[row],
+                payload=payloads[row] if with_payload else None,
+                vector=matrix[row].tolist() if matrix is not None else None,
+            )
+            for row in rows[:limit]
+        ]
+        return records, ids[rows[limit]] if len(rows) > limit else None
+
+    def close(self, **kwargs: Any) -> None:
+        """Drop cached memory maps."""
+        with self._lock:
+            self._collections.clear()
+
+
+def _as_list(conditions: Any) -> list[Any]:
+    """Normalize a Filter clause (None, single condition or list) to a list."""
+    if conditions is None:
+        return []
+    if isinstance(conditions, list):
+        return conditions
+    return [conditions]
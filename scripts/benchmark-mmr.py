@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Benchmark MMR diversification latency (raglite.retrieval.mmr.mmr_select).
+
+Times mmr_select on synthetic candidates shaped like Fin-E5 search results:
+1024-dim embeddings that share a common direction (E5 cosine similarities
+cluster around 0.7-0.9) plus groups of near-duplicates (boilerplate pages).
+Two stages are timed per (candidates, top_k):
+
+- convert: query_points(with_vectors=True) returns vectors as lists of
+  floats; building the float32 matrix from them (paid once per query)
+- mmr: mmr_select on the matrix (the greedy selection itself)
+
+Reports p50/p95 milliseconds of both, and exits non-zero if any mmr p95
+exceeds --budget-ms. The selection at 100 candidates takes under a
+millisecond on a typical server core; the list conversion costs more.
+
+Usage:
+    uv run python scripts/benchmark-mmr.py
+
+    # Larger pools, stricter budget
+    uv run python scripts/benchmark-mmr.py --candidates 100 200 400 --budget-ms 2
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from raglite.retrieval.mmr import mmr_select  # noqa: E402
+from raglite.shared.config import settings  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark MMR diversification latency",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--candidates", type=int, nargs="+", default=[50, 100, 200], help="Candidate pool sizes"
+    )
+    parser.add_argument("--top-k", type=int, nargs="+", default=[5, 10, 20], help="Results picked")
+    parser.add_argument("--dimension", type=int, default=settings.embedding_dimension)
+    parser.add_argument("--lambda", dest="lambda_", type=float, default=settings.mmr_lambda)
+    parser.add_argument("--repeats", type=int, default=200, help="Timed runs per configuration")
+    parser.add_argument("--budget-ms", type=float, default=3.0, help="Maximum mmr p95")
+    return parser.parse_args()
+
+
+def make_candidates(n: int, dimension: int, seed: int) -> tuple[list[float], list[list[float]]]:
+    """Synthetic search candidates: relevance scores (best first) and vectors as lists."""
+    rng = np.random.default_rng(seed)
+    shared = rng.standard_normal(dimension)
+    vectors = 2.0 * shared + rng.standard_normal((n, dimension))
+    # Every fifth candidate is a near-copy of the previous one (repeated boilerplate)
+    for i in range(1, n, 5):
+        vectors[i] = vectors[i - 1] + 0.05 * rng.standard_normal(dimension)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+    relevance = np.sort(rng.uniform(0.75, 0.9, n))[::-1]
+    return relevance.tolist(), vectors.astype(np.float32).tolist()
+
+
+def percentile_95(samples: list[float]) -> float:
+    """95th percentile of timing samples."""
+    return statistics.quantiles(samples, n=20)[18]
+
+
+def main() -> None:
+    """Time every (candidates, top_k) configuration and print a table."""
+    args = parse_args()
+    print("=" * 64)
+    print(f"MMR LATENCY (dim {args.dimension}, lambda {args.lambda_}, {args.repeats} runs)")
+    print("=" * 64)
+    print(
+        f"{'Candidates':>10} {'top_k':>6} {'convert p50':>12} {'convert p95':>12} "
+        f"{'mmr p50':>8} {'mmr p95':>8}"
+    )
+
+    over_budget = []
+    for n in args.candidates:
+        relevance, vectors = make_candidates(n, args.dimension, seed=n)
+        for k in args.top_k:
+            mmr_select(relevance, vectors, k, args.lambda_)  # Warm-up
+            convert_ms, mmr_ms = [], []
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                matrix = np.asarray(vectors, dtype=np.float32)
+                converted = time.perf_counter()
+                mmr_select(relevance, matrix, k, args.lambda_)
+                convert_ms.append((converted - start) * 1000)
+                mmr_ms.append((time.perf_counter() - converted) * 1000)
+            mmr_p95 = percentile_95(mmr_ms)
+            print(
+                f"{n:>10} {k:>6} {statistics.median(convert_ms):>12.3f} "
+                f"{percentile_95(convert_ms):>12.3f} {statistics.median(mmr_ms):>8.3f} "
+                f"{mmr_p95:>8.3f}"
+            )
+            if mmr_p95 > args.budget_ms:
+                over_budget.append((n, k, mmr_p95))
+
+    if over_budget:
+        for n, k, p95 in over_budget:
+            print(
+                f"Over budget: {n} candidates, top_k {k}: mmr p95 {p95:.3f} ms "
+                f"> {args.budget_ms} ms"
+            )
+        sys.exit(1)
+    print(f"\nMMR p95 within the {args.budget_ms} ms budget for every configuration")
+
+
+if __name__ == "__main__":
+    main()
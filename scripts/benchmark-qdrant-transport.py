@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark Qdrant REST vs gRPC transport for RAGLite workloads.
+
+Runs the two hot Qdrant operations over both transports against the configured
+Qdrant server (settings.qdrant_host, REST port settings.qdrant_port, gRPC port
+settings.qdrant_grpc_port):
+  1. Upsert: 1024-dim vectors with chunk payloads, 100 points per request
+  2. query_points: top-5 vector search with payload, one query per request
+
+Reports points/s for upsert and p50/p95 latency plus QPS for queries, so the
+transport for production (QDRANT_PREFER_GRPC) can be chosen on measured numbers.
+
+Usage:
+    # Start Qdrant first: docker compose up -d qdrant
+    uv run python scripts/benchmark-qdrant-transport.py
+
+    # More points and queries
+    uv run python scripts/benchmark-qdrant-transport.py --points 20000 --queries 1000
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from qdrant_client import QdrantClient  # noqa: E402
+from qdrant_client.models import Distance, PointStruct, VectorParams  # noqa: E402
+
+from raglite.shared.clients import create_qdrant_client  # noqa: E402
+from raglite.shared.config import settings  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Qdrant REST vs gRPC transport",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--points", type=int, default=5000, help="Points to upsert")
+    parser.add_argument("--queries", type=int, default=500, help="query_points calls to time")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per query")
+    return parser.parse_args()
+
+
+def make_vectors(n: int, seed: int) -> np.ndarray:
+    """Generate normalized random float32 vectors."""
+    rng = np.random.default_rng(seed)
+    vectors = rng.standard_normal((n, settings.embedding_dimension), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def bench_upsert(client: QdrantClient, collection: str, vectors: np.ndarray) -> float:
+    """Upsert all vectors 100 per request; return points/s."""
+    rows = vectors.tolist()
+    points = [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=rows[i],
+            payload={
+                "text": "Revenue increased by 15% year over year " * 40,
+                "source_document": "benchmark.pdf",
+                "page_number": i // 2 + 1,
+                "chunk_index": i,
+            },
+        )
+        for i in range(len(rows))
+    ]
+    start = time.perf_counter()
+    for i in range(0, len(points), 100):
+        client.upsert(collection_name=collection, points=points[i : i + 100], wait=True)
+    return len(points) / (time.perf_counter() - start)
+
+
+def bench_query(
+    client: QdrantClient, collection: str, queries: np.ndarray, top_k: int
+) -> tuple[float, float, float]:
+    """Run query_points for each query vector; return (p50 ms, p95 ms, QPS)."""
+    latencies = []
+    start = time.perf_counter()
+    for query in queries.tolist():
+        t0 = time.perf_counter()
+        client.query_points(collection_name=collection, query=query, limit=top_k, with_payload=True)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    elapsed = time.perf_counter() - start
+    p95 = statistics.quantiles(latencies, n=20)[18]
+    return statistics.median(latencies), p95, len(latencies) / elapsed
+
+
+def main() -> None:
+    """Run the transport benchmark and print a comparison table."""
+    args = parse_args()
+    vectors = make_vectors(args.points, seed=1)
+    queries = make_vectors(args.queries, seed=2)
+
+    print("=" * 72)
+    print(
+        f"QDRANT TRANSPORT BENCHMARK ({settings.qdrant_host}, "
+        f"REST :{settings.qdrant_port}, gRPC :{settings.qdrant_grpc_port})"
+    )
+    print(f"Points: {args.points}, queries: {args.queries}, top_k: {args.top_k}")
+    print("=" * 72)
+
+    rows = []
+    for transport, prefer_grpc in [("REST", False), ("gRPC", True)]:
+        client = create_qdrant_client(prefer_grpc=prefer_grpc)
+        collection = f"benchmark_transport_{uuid.uuid4().hex[:8]}"
+        client.create_collection(
+            collection_name=collection,
+            vectors_config=VectorParams(
+                size=settings.embedding_dimension, distance=Distance.COSINE
+            ),
+        )
+        try:
+            upsert_pps = bench_upsert(client, collection, vectors)
+            p50, p95, qps = bench_query(client, collection, queries, args.top_k)
+        finally:
+            client.delete_collection(collection)
+            client.close()
+        rows.append((transport, upsert_pps, p50, p95, qps))
+
+    print(f"\n{'Transport':<10} {'Upsert pts/s':>13} {'Query p50 ms':>13} {'p95 ms':>8} {'QPS':>8}")
+    for transport, upsert_pps, p50, p95, qps in rows:
+        print(f"{transport:<10} {upsert_pps:>13.0f} {p50:>13.2f} {p95:>8.2f} {qps:>8.0f}")
+
+    rest, grpc_row = rows
+    print(
+        f"\ngRPC vs REST: upsert {grpc_row[1] / rest[1]:.2f}x, "
+        f"query p50 {rest[2] / grpc_row[2]:.2f}x faster"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""Benchmark Qdrant upload throughput (points/s) against a local Qdrant.
+
+Compares the legacy serial upload (``upsert`` of 100 points per request, waiting
+for each acknowledgement) with ``store_vectors_in_qdrant`` (parallel
+``upload_points`` with ``wait=False`` and a final barrier) at several
+parallelism levels. Uses synthetic 1024-dim vectors and ~500-word payloads in a
+throwaway collection that is deleted afterwards.
+
+Usage:
+    # Start Qdrant first: docker compose up -d qdrant
+    uv run python scripts/benchmark-qdrant-upload.py
+
+    # Larger upload, custom parallelism levels
+    uv run python scripts/benchmark-qdrant-upload.py --points 20000 --parallel 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from qdrant_client.models import Distance, PointStruct, VectorParams  # noqa: E402
+
+from raglite.ingestion.pipeline import (  # noqa: E402
+    reset_collection_registry,
+    store_vectors_in_qdrant,
+)
+from raglite.shared.clients import get_qdrant_client  # noqa: E402
+from raglite.shared.config import settings  # noqa: E402
+from raglite.shared.models import ChunkBatch, DocumentMetadata  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark Qdrant upload throughput",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--points", type=int, default=10000, help="Points to upload per run")
+    parser.add_argument(
+        "--parallel", type=int, nargs="+", default=[1, 2, 4], help="Parallelism levels to test"
+    )
+    parser.add_argument("--words", type=int, default=500, help="Words of payload text per point")
+    return parser.parse_args()
+
+
+def build_batch(n_points: int, words: int) -> ChunkBatch:
+    """Build a synthetic ChunkBatch with normalized random embeddings."""
+    metadata = DocumentMetadata(
+        filename="benchmark_upload.pdf",
+        doc_type="PDF",
+        ingestion_timestamp=datetime.now(UTC).isoformat(),
+        page_count=n_points // 2,
+    )
+    batch = ChunkBatch(metadata)
+    text = " ".join(["revenue"] * words)
+    for i in range(n_points):
+        batch.append(text, page_number=i // 2 + 1, chunk_index=i)
+
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((n_points, settings.embedding_dimension), dtype=np.float32)
+    batch.embeddings = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return batch
+
+
+def reset_collection(name: str) -> None:
+    """Recreate an empty benchmark collection."""
+    client = get_qdrant_client()
+    if client.collection_exists(name):
+        client.delete_collection(name)
+    client.create_collection(
+        collection_name=name,
+        vectors_config=VectorParams(size=settings.embedding_dimension, distance=Distance.COSINE),
+    )
+    reset_collection_registry(name)  # Re-check schema and payload indexes on next store
+
+
+def run_serial_baseline(batch: ChunkBatch, collection: str) -> float:
+    """Legacy behaviour: serial upsert of 100 points, waiting for each request."""
+    client = get_qdrant_client()
+    vectors = batch.embeddings.tolist() if batch.embeddings is not None else []
+    points = [
+        PointStruct(
+            id=str(uuid.uuid4()),
+            vector=vectors[i],
+            payload={"text": batch.content(i), "chunk_index": batch.chunk_indices[i]},
+        )
+        for i in range(len(batch))
+    ]
+    start = time.perf_counter()
+    for i in range(0, len(points), 100):
+        client.upsert(collection_name=collection, points=points[i : i + 100], wait=True)
+    return time.perf_counter() - start
+
+
+async def run_store(batch: ChunkBatch, collection: str, parallel: int) -> float:
+    """Current behaviour: parallel non-blocking upload with final barrier."""
+    start = time.perf_counter()
+    await store_vectors_in_qdrant(batch, collection_name=collection, parallel=parallel)
+    return time.perf_counter() - start
+
+
+async def main() -> None:
+    """Run the upload benchmark and print a throughput table."""
+    args = parse_args()
+    collection = f"benchmark_upload_{uuid.uuid4().hex[:8]}"
+    batch = build_batch(args.points, args.words)
+
+    # Force the parallel path for every run regardless of point count
+    settings.qdrant_upload_parallel_min_points = 0
+
+    print("=" * 60)
+    print(f"QDRANT UPLOAD BENCHMARK ({settings.qdrant_host}:{settings.qdrant_port})")
+    print(f"Points: {args.points}, payload words: {args.words}")
+    print("=" * 60)
+
+    results: list[tuple[str, float]] = []
+    try:
+        reset_collection(collection)
+        results.append(("serial upsert (100/req, wait)", run_serial_baseline(batch, collection)))
+
+        for parallel in args.parallel:
+            reset_collection(collection)
+            results.append(
+                (f"upload_points parallel={parallel}", await run_store(batch, collection, parallel))
+            )
+    finally:
+        client = get_qdrant_client()
+        if client.collection_exists(collection):
+            client.delete_collection(collection)
+
+    baseline = results[0][1]
+    print(f"\n{'Mode':<34} {'Seconds':>9} {'Points/s':>10} {'Speedup':>8}")
+    for mode, seconds in results:
+        print(
+            f"{mode:<34} {seconds:>9.2f} {args.points / seconds:>10.0f} {baseline / seconds:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""Benchmark the CPU thread budget under mixed ingestion + query load.
+
+Each configuration runs in a fresh worker process, because torch, Docling and
+BLAS size their thread pools when they are first imported. The worker:
+  1. Applies the thread budget and loads the embedding model and Docling converter
+  2. Ingests the PDF (--concurrent copies at once) into a temporary collection
+  3. Issues queries back to back (--query-interval apart) while ingestion runs
+
+and reports ingestion pages/s plus query p50/p95 latency during ingestion.
+
+Configurations: "off" (library default thread pools, THREAD_BUDGET_ENABLED=false)
+and one per CPU_THREAD_BUDGET value given with --budgets (default: all CPUs).
+
+Usage:
+    # Start Qdrant first: docker compose up -d qdrant
+    uv run python scripts/benchmark-thread-budget.py --pdf "docs/sample pdf/report.pdf"
+
+    # Two concurrent ingestions, budgets of 4 and 8 threads
+    uv run python scripts/benchmark-thread-budget.py --pdf report.pdf --concurrent 2 --budgets 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from raglite.shared.config import settings  # noqa: E402
+from raglite.shared.threads import apply_thread_budget  # noqa: E402
+
+QUERIES = [
+    "What was the total revenue?",
+    "How did operating margin change year over year?",
+    "What are the main cost drivers?",
+    "What is the EBITDA for the quarter?",
+    "How much cash was generated from operations?",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark the CPU thread budget under mixed load",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--pdf", type=Path, required=True, help="PDF to ingest")
+    parser.add_argument(
+        "--budgets",
+        type=int,
+        nargs="*",
+        default=[os.cpu_count() or 1],
+        help="CPU_THREAD_BUDGET values to compare against library defaults",
+    )
+    parser.add_argument("--concurrent", type=int, default=1, help="Concurrent ingestions")
+    parser.add_argument(
+        "--query-interval", type=float, default=0.05, help="Seconds between queries"
+    )
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+async def run_worker(args: argparse.Namespace) -> dict[str, object]:
+    """Measure one configuration in this process (configured through the environment)."""
+    budget = apply_thread_budget()
+
+    from raglite.ingestion.pipeline import (
+        create_collection,
+        get_document_converter,
+        ingest_document,
+    )
+    from raglite.retrieval.search import search_documents
+    from raglite.shared.clients import get_embedding_model, get_qdrant_client
+
+    settings.ingest_checkpoint_dir = None  # Concurrent copies would share one checkpoint
+    get_embedding_model()
+    get_document_converter()
+    create_collection(settings.qdrant_collection_name, settings.embedding_dimension)
+    await search_documents("warm-up query", top_k=5)
+
+    latencies: list[float] = []
+    ingesting = True
+
+    async def query_loop() -> None:
+        i = 0
+        while ingesting:
+            start = time.perf_counter()
+            await search_documents(QUERIES[i % len(QUERIES)], top_k=5)
+            latencies.append((time.perf_counter() - start) * 1000)
+            i += 1
+            await asyncio.sleep(args.query_interval)
+
+    queries = asyncio.create_task(query_loop())
+    start = time.perf_counter()
+    try:
+        results = await asyncio.gather(
+            *(ingest_document(str(args.pdf)) for _ in range(args.concurrent))
+        )
+    finally:
+        ingest_seconds = time.perf_counter() - start
+        ingesting = False
+        await queries
+        get_qdrant_client().delete_collection(settings.qdrant_collection_name)
+
+    pages = sum(metadata.page_count for metadata in results)
+    return {
+        "budget": budget.model_dump() if budget is not None else None,
+        "pages_per_second": pages / ingest_seconds,
+        "queries": len(latencies),
+        "query_p50_ms": statistics.median(latencies) if latencies else None,
+        "query_p95_ms": (
+            statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 2 else None
+        ),
+    }
+
+
+def run_config(args: argparse.Namespace, budget: int | None) -> dict[str, object]:
+    """Run one configuration in a fresh worker process."""
+    env = dict(os.environ)
+    for name in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        env.pop(name, None)  # Let the budget (or the library default) decide
+    env["QDRANT_COLLECTION_NAME"] = f"benchmark_threads_{uuid.uuid4().hex[:8]}"
+    env["INGEST_MAX_CONCURRENT"] = str(args.concurrent)
+    env["THREAD_BUDGET_ENABLED"] = "false" if budget is None else "true"
+    if budget is not None:
+        env["CPU_THREAD_BUDGET"] = str(budget)
+
+    command = [
+        sys.executable,
+        __file__,
+        "--worker",
+        "--pdf",
+        str(args.pdf),
+        "--concurrent",
+        str(args.concurrent),
+        "--query-interval",
+        str(args.query_interval),
+    ]
+    completed = subprocess.run(  # nosec B603
+        command, env=env, capture_output=True, text=True, check=False
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("RESULT "):
+            result: dict[str, object] = json.loads(line.removeprefix("RESULT "))
+            return result
+    raise RuntimeError(f"Worker failed (budget={budget}):\n{completed.stderr[-2000:]}")
+
+
+def _ms(value: object) -> str:
+    return f"{value:.1f}" if isinstance(value, float) else "-"
+
+
+def main() -> None:
+    """Run every configuration and print a comparison table."""
+    args = parse_args()
+    if args.worker:
+        print("RESULT " + json.dumps(asyncio.run(run_worker(args))), flush=True)
+        return
+
+    print("=" * 72)
+    print(f"THREAD BUDGET BENCHMARK ({os.cpu_count()} CPUs, {args.concurrent} concurrent ingest)")
+    print(f"PDF: {args.pdf}")
+    print("=" * 72)
+
+    configs: list[int | None] = [None, *args.budgets]
+    rows = []
+    for budget in configs:
+        label = "off" if budget is None else f"{budget} threads"
+        print(f"Running {label}...", flush=True)
+        rows.append((label, run_config(args, budget)))
+
+    print(
+        f"\n{'Budget':<12} {'torch/docling/blas':>19} {'Pages/s':>8} "
+        f"{'Query p50 ms':>13} {'p95 ms':>8} {'Queries':>8}"
+    )
+    for label, result in rows:
+        applied = result["budget"]
+        split = (
+            f"{applied['torch_intra_op']}/{applied['docling']}/{applied['blas']}"
+            if isinstance(applied, dict)
+            else "default"
+        )
+        print(
+            f"{label:<12} {split:>19} {result['pages_per_second']:>8.2f} "
+            f"{_ms(result['query_p50_ms']):>13} {_ms(result['query_p95_ms']):>8} "
+            f"{result['queries']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
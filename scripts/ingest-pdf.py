@@ -1,6 +1,16 @@
 #!/usr/bin/env python3
-"""Simple script to ingest the Performance Review PDF into Qdrant."""
+"""Ingest a directory of financial documents (PDF, Excel) into Qdrant.
 
+Defaults to the split Performance Review PDFs. Use --bulk-load for large
+backfills: HNSW indexing is deferred while points stream in and the index is
+rebuilt once at the end.
+
+Usage:
+    uv run python scripts/ingest-pdf.py
+    uv run python scripts/ingest-pdf.py "docs/sample pdf" --recursive --bulk-load
+"""
+
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -9,41 +19,59 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from raglite.ingestion.pipeline import ingest_document  # noqa: E402
+from raglite.ingestion.pipeline import ingest_directory  # noqa: E402
 
 
-async def main():
-    """Ingest the split PDF files."""
-    pdf_dir = project_root / "docs" / "sample pdf" / "split"
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Ingest a directory of documents into Qdrant",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "directory",
+        nargs="?",
+        default=str(project_root / "docs" / "sample pdf" / "split"),
+        help="Directory containing PDF/Excel documents (default: split Performance Review)",
+    )
+    parser.add_argument("--recursive", action="store_true", help="Include subdirectories")
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Defer HNSW indexing until all documents are stored (large backfills)",
+    )
+    return parser.parse_args()
 
-    pdf_files = [
-        pdf_dir / "2025-08 Performance Review CONSO_v2_part01_pages001-040.pdf",
-        pdf_dir / "2025-08 Performance Review CONSO_v2_part02_pages041-080.pdf",
-        pdf_dir / "2025-08 Performance Review CONSO_v2_part03_pages081-120.pdf",
-        pdf_dir / "2025-08 Performance Review CONSO_v2_part04_pages121-160.pdf",
-    ]
+
+async def main():
+    """Ingest all documents in the directory."""
+    args = parse_args()
 
     print("=" * 80)
-    print("PDF INGESTION - Story 1.14")
+    print("DIRECTORY INGESTION")
     print("=" * 80)
+    print(f"📁 Directory: {args.directory}")
+    print(f"⚙️  Bulk-load mode: {'ON' if args.bulk_load else 'OFF'}")
     print()
 
-    for pdf_file in pdf_files:
-        if not pdf_file.exists():
-            print(f"❌ File not found: {pdf_file}")
-            continue
+    try:
+        results = await ingest_directory(
+            args.directory, recursive=args.recursive, bulk_load=args.bulk_load
+        )
+    except FileNotFoundError as e:
+        print(f"❌ {e}")
+        return
 
-        print(f"📄 Ingesting: {pdf_file.name}")
-        try:
-            metadata = await ingest_document(str(pdf_file))
-            print(f"   ✓ Ingested {metadata.chunks_count} chunks from {metadata.pages} pages")
-        except Exception as e:
-            print(f"   ✗ Error: {e}")
-            continue
+    for metadata in results:
+        print(
+            f"   ✓ {metadata.filename}: {metadata.chunk_count} chunks from "
+            f"{metadata.page_count} pages"
+        )
 
     print()
     print("=" * 80)
-    print("INGESTION COMPLETE")
+    print(f"INGESTION COMPLETE ({len(results)} documents)")
     print("=" * 80)
 
 
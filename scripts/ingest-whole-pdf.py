@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
-"""Ingest the WHOLE Performance Review PDF (160 pages) into Qdrant."""
+"""Ingest the WHOLE Performance Review PDF (160 pages) into Qdrant.
 
+Usage:
+    uv run python scripts/ingest-whole-pdf.py [--bulk-load]
+"""
+
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -14,6 +19,14 @@ from raglite.ingestion.pipeline import ingest_document  # noqa: E402
 
 async def main():
     """Ingest the WHOLE PDF file."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--bulk-load",
+        action="store_true",
+        help="Defer HNSW indexing until all chunks are stored",
+    )
+    args = parser.parse_args()
+
     pdf_file = project_root / "docs" / "sample pdf" / "2025-08 Performance Review CONSO_v2.pdf"
 
     print("=" * 80)
@@ -30,7 +43,7 @@ async def main():
     print()
 
     try:
-        metadata = await ingest_document(str(pdf_file))
+        metadata = await ingest_document(str(pdf_file), bulk_load=args.bulk_load)
         print("   ✓ SUCCESS!")
         print(f"   ✓ Document ID: {metadata.document_id}")
         print(f"   ✓ Pages: {metadata.pages}")
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Load test the HTTP transport: query throughput as the worker count grows.
+
+For each worker count the script starts ``raglite-server`` with
+MCP_TRANSPORT=http and HTTP_WORKERS=N, waits until the server is ready, warms
+every worker up, then runs --clients concurrent MCP clients issuing
+query_financial_documents calls back to back for --duration seconds.
+
+Reports queries per second, p50/p95 latency and errors per worker count.
+Queries run against the configured collection, so ingest documents first.
+
+Usage:
+    # Start Qdrant first: docker compose up -d qdrant
+    uv run python scripts/load-test-http.py
+
+    # 1, 2, 4 and 8 workers, 32 concurrent clients, 60 s each
+    uv run python scripts/load-test-http.py --workers 1 2 4 8 --clients 32 --duration 60
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from fastmcp import Client
+
+project_root = Path(__file__).parent.parent
+
+QUERIES = [
+    "What was the total revenue?",
+    "How did operating margin change year over year?",
+    "What are the main cost drivers?",
+    "What is the EBITDA for the quarter?",
+    "How much cash was generated from operations?",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Load test the MCP HTTP transport",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Worker counts")
+    parser.add_argument("--clients", type=int, default=16, help="Concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per worker count")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Unmeasured seconds first")
+    parser.add_argument("--port", type=int, default=8765, help="Server port")
+    parser.add_argument("--top-k", type=int, default=5, help="top_k per query")
+    parser.add_argument(
+        "--startup-timeout", type=float, default=300.0, help="Seconds to wait for readiness"
+    )
+    return parser.parse_args()
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen[bytes]:
+    """Start raglite-server over HTTP with the given worker count."""
+    env = dict(os.environ)
+    env.update(
+        MCP_TRANSPORT="http",
+        HTTP_WORKERS=str(workers),
+        MCP_SERVER_HOST="127.0.0.1",
+        MCP_SERVER_PORT=str(port),
+        LOG_LEVEL="WARNING",
+    )
+    return subprocess.Popen(  # nosec B603
+        [sys.executable, "-m", "raglite.main"], cwd=project_root, env=env
+    )
+
+
+async def wait_until_ready(url: str, timeout: float) -> None:
+    """Poll the health tool until a worker reports ready."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            async with Client(url) as client:
+                health = await client.call_tool("health", {})
+                if health.structured_content and health.structured_content.get("ready"):
+                    return
+        except Exception:  # noqa: BLE001 - server still starting
+            pass
+        await asyncio.sleep(1.0)
+    raise TimeoutError(f"Server at {url} not ready after {timeout:.0f}s")
+
+
+async def run_load(
+    url: str, clients: int, seconds: float, top_k: int
+) -> tuple[list[float], int, float]:
+    """Run concurrent clients for a fixed time; return latencies (ms), errors and elapsed s."""
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.monotonic() + seconds
+
+    async def client_loop(index: int) -> None:
+        nonlocal errors
+        async with Client(url) as client:
+            i = index
+            while time.monotonic() < deadline:
+                request = {"query": QUERIES[i % len(QUERIES)], "top_k": top_k}
+                start = time.perf_counter()
+                try:
+                    await client.call_tool("query_financial_documents", {"request": request})
+                    latencies.append((time.perf_counter() - start) * 1000)
+                except Exception:  # noqa: BLE001 - counted, not fatal
+                    errors += 1
+                i += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client_loop(i) for i in range(clients)))
+    return latencies, errors, time.perf_counter() - start
+
+
+async def measure(args: argparse.Namespace, workers: int) -> dict[str, float]:
+    """Start a server with this many workers, load it and stop it (graceful drain)."""
+    url = f"http://127.0.0.1:{args.port}/mcp"
+    server = start_server(workers, args.port)
+    try:
+        await wait_until_ready(url, args.startup_timeout)
+        # Warm-up load reaches every worker (each loads its vector store connection)
+        await run_load(url, args.clients, args.warmup, args.top_k)
+        latencies, errors, elapsed = await run_load(url, args.clients, args.duration, args.top_k)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(timeout=120)
+
+    return {
+        "qps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) if latencies else float("nan"),
+        "p95_ms": (
+            statistics.quantiles(latencies, n=20)[18] if len(latencies) >= 2 else float("nan")
+        ),
+        "queries": len(latencies),
+        "errors": errors,
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    print("=" * 64)
+    print(f"HTTP LOAD TEST ({os.cpu_count()} CPUs, {args.clients} clients, {args.duration:.0f}s)")
+    print("=" * 64)
+
+    rows = []
+    for workers in args.workers:
+        print(f"Running {workers} worker(s)...", flush=True)
+        rows.append((workers, await measure(args, workers)))
+
+    baseline = rows[0][1]["qps"] or float("nan")
+    print(
+        f"\n{'Workers':>7} {'QPS':>8} {'Speedup':>8} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'Queries':>8} {'Errors':>7}"
+    )
+    for workers, result in rows:
+        print(
+            f"{workers:>7} {result['qps']:>8.1f} {result['qps'] / baseline:>7.2f}x "
+            f"{result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} "
+            f"{result['queries']:>8.0f} {result['errors']:>7.0f}"
+        )
+
+
+def main() -> None:
+    """Run the load test for every worker count and print a comparison table."""
+    asyncio.run(main_async(parse_args()))
+
+
+if __name__ == "__main__":
+    main()
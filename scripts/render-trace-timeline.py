@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Render request traces from a RAGLite span file as flame-style timelines.
+
+Reads the JSONL written when ``TRACE_FILE`` is set (see
+raglite.shared.tracing) and prints one timeline per trace: spans are nested
+under their parent and drawn as bars on a shared time axis, so the stage that
+dominates a slow ingestion or query stands out.
+
+Usage:
+    # Last 3 traces
+    uv run python scripts/render-trace-timeline.py workspace/traces/traces.jsonl --last 3
+
+    # One trace (ID prefix is enough), wider bars
+    uv run python scripts/render-trace-timeline.py traces.jsonl --trace 4bf92f35 --width 100
+
+Example output:
+    Trace 4bf92f3577b34da6 ingest_document  1184.2 ms  2025-10-12 09:30:01
+    ingest_document            [##################################]  1184.2 ms
+      convert                  [###############                   ]   512.7 ms
+      chunk_by_docling_items   [               #                  ]    31.4 ms
+      generate_embeddings      [                ##############    ]   470.9 ms
+        embed.batch            [                ###               ]    96.3 ms
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+Span = dict[str, Any]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Render RAGLite trace timelines",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("trace_file", type=Path, help="JSONL span file (settings.trace_file)")
+    parser.add_argument("--trace", help="Trace ID (or prefix) to render")
+    parser.add_argument("--last", type=int, default=1, help="Render the N most recent traces")
+    parser.add_argument("--width", type=int, default=60, help="Bar width in characters")
+    parser.add_argument(
+        "--min-ms", type=float, default=0.0, help="Hide spans shorter than this (ms)"
+    )
+    return parser.parse_args()
+
+
+def load_traces(path: Path) -> dict[str, list[Span]]:
+    """Group spans by trace ID, skipping malformed lines."""
+    traces: dict[str, list[Span]] = defaultdict(list)
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                span = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Partially written last line
+            traces[span["trace_id"]].append(span)
+    return traces
+
+
+def render_trace(spans: list[Span], width: int, min_ms: float) -> list[str]:
+    """Render one trace as indented rows with bars positioned on the trace's time axis."""
+    by_id = {span["span_id"]: span for span in spans}
+    children: dict[str | None, list[Span]] = defaultdict(list)
+    for span in spans:
+        parent = span["parent_id"] if span["parent_id"] in by_id else None
+        children[parent].append(span)
+
+    trace_start = min(span["start_time"] for span in spans)
+    trace_end = max(span["start_time"] + span["duration_ms"] / 1000 for span in spans)
+    total_seconds = max(trace_end - trace_start, 1e-9)
+    roots = sorted(children[None], key=lambda s: s["start_time"])
+
+    rows: list[tuple[str, Span]] = []
+
+    def walk(span: Span, depth: int) -> None:
+        if span["duration_ms"] >= min_ms or depth == 0:
+            rows.append(("  " * depth + span["name"], span))
+        for child in sorted(children[span["span_id"]], key=lambda s: s["start_time"]):
+            walk(child, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+
+    label_width = max(len(label) for label, _ in rows) + 2
+    started = datetime.fromtimestamp(trace_start).strftime("%Y-%m-%d %H:%M:%S")
+    lines = [
+        f"Trace {spans[0]['trace_id'][:16]} {roots[0]['name']}  "
+        f"{total_seconds * 1000:.1f} ms  {started}"
+    ]
+    for label, span in rows:
+        offset = int((span["start_time"] - trace_start) / total_seconds * width)
+        length = max(1, round(span["duration_ms"] / 1000 / total_seconds * width))
+        offset = min(offset, width - length)
+        bar = " " * offset + "#" * length + " " * (width - offset - length)
+        marker = "  ERROR " + span["error"] if span.get("status") == "error" else ""
+        lines.append(f"{label:<{label_width}}[{bar}] {span['duration_ms']:>9.1f} ms{marker}")
+    return lines
+
+
+def main() -> int:
+    """Render the selected traces."""
+    args = parse_args()
+    if not args.trace_file.exists():
+        print(f"Trace file not found: {args.trace_file}", file=sys.stderr)
+        return 1
+
+    traces = load_traces(args.trace_file)
+    if args.trace:
+        selected = [spans for trace_id, spans in traces.items() if trace_id.startswith(args.trace)]
+    else:
+        # Most recent by trace start time
+        ordered = sorted(traces.values(), key=lambda spans: min(s["start_time"] for s in spans))
+        selected = ordered[-args.last :]
+
+    if not selected:
+        print("No matching traces", file=sys.stderr)
+        return 1
+
+    for spans in selected:
+        print("\n".join(render_trace(spans, args.width, args.min_ms)))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -59,6 +59,17 @@ def test_settings(monkeypatch: MonkeyPatch) -> Settings:
     return Settings()
 
 
+@pytest.fixture(autouse=True)
+def isolated_collection_epochs(tmp_path_factory: pytest.TempPathFactory, monkeypatch: MonkeyPatch):
+    """Keep collection epoch files written by tests out of the working tree."""
+    from raglite.shared import epoch
+
+    monkeypatch.setattr(
+        epoch.settings, "collection_epoch_dir", str(tmp_path_factory.mktemp("epochs"))
+    )
+    monkeypatch.setattr(epoch, "_epochs", {})
+
+
 @pytest.fixture(scope="module")
 def mock_qdrant_client() -> MagicMock:
     """Provide a mock Qdrant client for unit tests (module-scoped).
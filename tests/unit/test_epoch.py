@@ -0,0 +1,48 @@
+"""Unit tests for collection epochs (raglite/shared/epoch.py)."""
+
+from pathlib import Path
+
+import pytest
+
+from raglite.shared import epoch
+from raglite.shared.epoch import CollectionEpoch, bump_collection_epoch, get_collection_epoch
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_epoch_increases_and_is_shared_through_the_file(tmp_path: Path) -> None:
+    """Test bumps only increase and another instance (process) sees them."""
+    path = tmp_path / "financial_docs.epoch"
+    writer, reader = CollectionEpoch(path), CollectionEpoch(path)
+    assert reader.current() == 0
+
+    first = writer.bump()
+    assert reader.current() == first
+
+    path.write_text(str(first + 10**12))  # Clock behind the stored epoch
+    reader.current()
+    second = writer.bump()
+    assert second == first + 10**12 + 1
+    assert reader.current() == second
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_collections_have_independent_epochs() -> None:
+    """Test bumping one collection leaves another's epoch unchanged."""
+    other = get_collection_epoch("other_docs")
+
+    assert bump_collection_epoch("financial_docs") > 0
+    assert get_collection_epoch("financial_docs") > 0
+    assert get_collection_epoch("other_docs") == other
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_bump_failure_is_logged_not_raised(tmp_path: Path) -> None:
+    """Test an unwritable epoch directory does not fail the write that triggered the bump."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    epoch._epochs["blocked"] = CollectionEpoch(blocker / "blocked.epoch")
+
+    assert bump_collection_epoch("blocked") == 0
@@ -0,0 +1,145 @@
+"""Unit tests for adjacent-chunk context expansion (raglite/retrieval/expansion.py)."""
+
+import uuid
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from raglite.ingestion import pipeline
+from raglite.retrieval.expansion import expand_adjacent_chunks, join_chunk_texts
+from raglite.retrieval.search import search_documents
+from raglite.shared.models import ChunkBatch, DocumentMetadata, QueryResult
+from raglite.shared.vector_store import NumpyVectorStore
+
+# Chunk i holds words w{4i}..w{4i+11}: 8 words overlap the next chunk
+TEXTS = [" ".join(f"w{j}" for j in range(4 * i, 4 * i + 12)) for i in range(8)]
+
+
+def _words(start: int, stop: int) -> str:
+    return " ".join(f"w{j}" for j in range(start, stop))
+
+
+def _hit(chunk_index: int, score: float, source_path: str | None = "report.pdf") -> QueryResult:
+    return QueryResult(
+        score=score,
+        text=TEXTS[chunk_index],
+        source_document="report.pdf",
+        page_number=chunk_index // 2 + 1,
+        chunk_index=chunk_index,
+        word_count=12,
+        source_path=source_path,
+    )
+
+
+@pytest.fixture
+async def store(tmp_path: Path) -> NumpyVectorStore:
+    """NumPy store holding an 8-chunk report.pdf in financial_docs."""
+    metadata = DocumentMetadata(
+        filename="report.pdf",
+        doc_type="PDF",
+        ingestion_timestamp=datetime.now().isoformat(),
+        page_count=4,
+    )
+    batch = ChunkBatch(metadata)
+    for i, text in enumerate(TEXTS):
+        batch.append(text, page_number=i // 2 + 1, chunk_index=i)
+    batch.embeddings = np.eye(len(TEXTS), 1024, dtype=np.float32)
+
+    store = NumpyVectorStore(tmp_path)
+    pipeline.reset_collection_registry()
+    with patch("raglite.ingestion.pipeline.get_vector_store", return_value=store):
+        await pipeline.store_vectors_in_qdrant(batch, collection_name="financial_docs")
+    pipeline.reset_collection_registry()
+    return store
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_join_chunk_texts_removes_overlap_once() -> None:
+    """Test consecutive chunks are joined without repeating their shared words."""
+    assert join_chunk_texts(TEXTS[:3]) == _words(0, 20)
+    assert join_chunk_texts(["a b", "c d"]) == "a b c d"
+    # A word repeated across pages is text, not chunk overlap
+    assert join_chunk_texts(["Total revenue", "revenue grew 12%"]) == (
+        "Total revenue revenue grew 12%"
+    )
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_overlapping_windows_merge_into_contiguous_passages(
+    store: NumpyVectorStore,
+) -> None:
+    """Test hits 2 and 3 share one passage, hit 7 stops at the end of the document."""
+    with patch.object(store, "retrieve", wraps=store.retrieve) as retrieve:
+        passages = expand_adjacent_chunks(
+            store, "financial_docs", [_hit(7, 0.8), _hit(2, 0.9), _hit(3, 0.7)], window=1
+        )
+
+    retrieve.assert_called_once()  # All neighbours in one request
+    assert [(p.chunk_index, p.chunk_count) for p in passages] == [(1, 4), (6, 2)]
+    assert passages[0].score == 0.9
+    assert passages[0].text == _words(4, 28)
+    assert passages[0].page_number == 1
+    assert passages[0].word_count == 24
+    assert passages[1].text == _words(24, 40)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_legacy_collection_neighbours_found_by_filter(tmp_path: Path) -> None:
+    """Test hits from points with random IDs and no source_path still expand."""
+    store = NumpyVectorStore(tmp_path)
+    store.create_collection("legacy_docs", VectorParams(size=4, distance=Distance.COSINE))
+    store.upsert(
+        "legacy_docs",
+        [
+            PointStruct(
+                id=str(uuid.uuid4()),
+                vector=[1.0, 0.0, 0.0, 0.0],
+                payload={
+                    "text": text,
+                    "source_document": filename,
+                    "page_number": i // 2 + 1,
+                    "chunk_index": i,
+                },
+            )
+            for filename in ("report.pdf", "other.pdf")
+            for i, text in enumerate(TEXTS)
+        ],
+    )
+
+    with patch.object(store, "scroll", wraps=store.scroll) as scroll:
+        passages = expand_adjacent_chunks(
+            store, "legacy_docs", [_hit(7, 0.8, None), _hit(2, 0.9, None)], window=1
+        )
+
+    scroll.assert_called_once()
+    assert [(p.chunk_index, p.chunk_count) for p in passages] == [(1, 3), (6, 2)]
+    assert passages[0].text == _words(4, 24)
+    assert passages[1].text == _words(24, 40)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_documents_context_window(store: NumpyVectorStore) -> None:
+    """Test search_documents(context_window=...) returns the passage around the best hit."""
+    with (
+        patch("raglite.retrieval.search.get_vector_store", return_value=store),
+        patch(
+            "raglite.retrieval.search.generate_query_embedding",
+            AsyncMock(return_value=np.eye(1, 1024, 4)[0].tolist()),
+        ),
+    ):
+        timings: dict[str, float] = {}
+        results = await search_documents("w12", top_k=1, timings=timings, context_window=2)
+
+    assert [(r.chunk_index, r.chunk_count) for r in results] == [(2, 5)]
+    assert results[0].text == _words(8, 36)
+    assert "expand_ms" in timings
@@ -0,0 +1,79 @@
+"""Import-time budget tests for fast MCP server startup.
+
+Runs ``python -X importtime`` in a fresh interpreter and fails if heavy
+dependencies are imported at startup or the server import exceeds its budget.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Loaded on first use only (ingestion, embedding, Claude and Qdrant clients)
+HEAVY_PACKAGES = {
+    "anthropic",
+    "docling",
+    "openpyxl",
+    "pandas",
+    "qdrant_client",
+    "sentence_transformers",
+    "torch",
+    "transformers",
+}
+
+# fastmcp dominates server startup (~1s); the eager ingestion stack was ~13s
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def _import_profile(statement: str) -> dict[str, int]:
+    """Run a statement under -X importtime; return cumulative microseconds per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=PROJECT_ROOT,
+    )
+    profile: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line.removeprefix("import time:").split("|")
+        if cumulative.strip().isdigit():  # Skip the header row
+            profile[module.strip()] = int(cumulative)
+    return profile
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_server_startup_skips_heavy_dependencies() -> None:
+    """Test importing raglite.main loads none of the heavy dependencies."""
+    profile = _import_profile("import raglite.main")
+
+    loaded = {module.split(".")[0] for module in profile}
+    assert "raglite" in loaded
+    assert loaded & HEAVY_PACKAGES == set()
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_server_import_within_budget() -> None:
+    """Test raglite.main imports within the startup budget."""
+    profile = _import_profile("import raglite.main")
+
+    assert profile["raglite.main"] / 1_000_000 < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_ingestion_package_import_is_lazy() -> None:
+    """Test the docling pipeline loads only when an ingestion function is accessed."""
+    assert "docling" not in {
+        module.split(".")[0] for module in _import_profile("import raglite.ingestion")
+    }
+    assert "raglite.ingestion.pipeline" in _import_profile(
+        "import raglite.ingestion; raglite.ingestion.ingest_pdf"
+    )
@@ -3,25 +3,44 @@
 Tests the ingest_pdf and extract_excel functions with mocked dependencies.
 """
 
+import asyncio
 from datetime import datetime
 from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
+from qdrant_client.models import Distance, PayloadSchemaType, VectorParams
 
+from raglite.ingestion import pipeline
 from raglite.ingestion.pipeline import (
     EmbeddingGenerationError,
     VectorStorageError,
+    bulk_load_mode,
     chunk_document,
     create_collection,
     extract_excel,
     generate_embeddings,
+    ingest_directory,
     ingest_document,
     ingest_pdf,
     store_vectors_in_qdrant,
 )
 from raglite.shared.clients import get_embedding_model, get_qdrant_client
-from raglite.shared.models import Chunk, DocumentMetadata
+from raglite.shared.models import Chunk, ChunkBatch, DocumentMetadata
+
+
+@pytest.fixture(autouse=True)
+def reset_pipeline_singletons(tmp_path):
+    """Clear the collection schema cache and shared Docling converter between tests.
+
+    Ingestion checkpoints go to a per-test directory so no test resumes another's.
+    """
+    pipeline.reset_collection_registry()
+    pipeline._document_converter = None
+    with patch.object(pipeline.settings, "ingest_checkpoint_dir", str(tmp_path / "checkpoints")):
+        yield
+    pipeline.reset_collection_registry()
+    pipeline._document_converter = None
 
 
 class TestIngestPDF:
@@ -73,6 +92,9 @@ class TestIngestPDF:
             assert result.page_count == 2  # Two unique pages
             assert result.source_path == str(pdf_file)
             assert result.ingestion_timestamp  # Should have timestamp
+            assert result.timings is not None
+            assert result.timings.convert_ms is not None
+            assert result.timings.total_ms >= result.timings.convert_ms
 
             # Verify ISO8601 timestamp format
             datetime.fromisoformat(result.ingestion_timestamp)
@@ -546,6 +568,42 @@ class TestIngestDocument:
         with pytest.raises(FileNotFoundError, match="Document file not found"):
             await ingest_document(nonexistent_path)
 
+    @pytest.mark.asyncio
+    async def test_ingest_directory_bulk_load(self, tmp_path):
+        """Test ingest_directory ingests supported files inside one bulk-load block.
+
+        Verifies unsupported files are ignored, failures are skipped, and HNSW
+        indexing is deferred once for the whole directory.
+        """
+        for name in ["b.pdf", "a.xlsx", "notes.txt", "c.pdf"]:
+            (tmp_path / name).write_bytes(b"content")
+
+        async def fake_ingest(path, bulk_load=False):
+            if path.endswith("c.pdf"):
+                raise RuntimeError("corrupt")
+            return DocumentMetadata(
+                filename=path.rsplit("/", 1)[-1],
+                doc_type="PDF",
+                ingestion_timestamp=datetime.now().isoformat(),
+            )
+
+        with (
+            patch("raglite.ingestion.pipeline.ingest_document", side_effect=fake_ingest) as mock,
+            patch("raglite.ingestion.pipeline.bulk_load_mode") as mock_bulk,
+        ):
+            results = await ingest_directory(str(tmp_path), bulk_load=True)
+
+        assert [m.filename for m in results] == ["a.xlsx", "b.pdf"]
+        assert mock.call_count == 3
+        mock_bulk.assert_called_once()
+        mock_bulk.return_value.__aenter__.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_ingest_directory_not_found(self):
+        """Test ingest_directory raises FileNotFoundError for missing directories."""
+        with pytest.raises(FileNotFoundError, match="Directory not found"):
+            await ingest_directory("/tmp/nonexistent_dir_12345")
+
 
 class TestChunkDocument:
     """Test suite for document chunking functionality."""
@@ -1100,6 +1158,41 @@ class TestGenerateEmbeddings:
             assert hasattr(start_log, "chunk_count")
             assert start_log.chunk_count == 5
 
+    @pytest.mark.asyncio
+    async def test_generate_embeddings_chunk_batch(self):
+        """Test embeddings are written into the ChunkBatch float32 matrix.
+
+        Verifies the columnar path encodes the shared text buffer in batches of 32
+        and fills one (n, 1024) matrix without per-chunk list conversion.
+        """
+        metadata = DocumentMetadata(
+            filename="batch.pdf",
+            doc_type="PDF",
+            ingestion_timestamp=datetime.now().isoformat(),
+            page_count=1,
+        )
+        batch = ChunkBatch(metadata)
+        for i in range(40):
+            batch.append(f"Chunk text {i}", page_number=1, chunk_index=i)
+
+        with patch("raglite.ingestion.pipeline.get_embedding_model") as mock_get_model:
+            mock_model = Mock()
+            mock_model.encode.side_effect = lambda texts, **kwargs: np.ones(
+                (len(texts), 1024), dtype=np.float32
+            )
+            mock_get_model.return_value = mock_model
+
+            result = await generate_embeddings(batch)
+
+        assert result is batch
+        assert batch.embeddings is not None
+        assert batch.embeddings.shape == (40, 1024)
+        assert batch.embeddings.dtype == np.float32
+        assert mock_model.encode.call_count == 2  # 32 + 8
+        assert mock_model.encode.call_args_list[1].args[0] == [
+            f"Chunk text {i}" for i in range(32, 40)
+        ]
+
 
 class TestQdrantStorage:
     """Test suite for Qdrant vector storage (Story 1.6)."""
@@ -1110,11 +1203,9 @@ class TestQdrantStorage:
 
         Verifies create_collection creates collection with correct parameters. AC2.
         """
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
-            mock_collections = Mock()
-            mock_collections.collections = []
-            mock_client.get_collections.return_value = mock_collections
+            mock_client.collection_exists.return_value = False
             mock_get_client.return_value = mock_client
 
             # Create collection
@@ -1126,6 +1217,15 @@ class TestQdrantStorage:
             assert call_args.kwargs["collection_name"] == "financial_docs"
             assert call_args.kwargs["vectors_config"].size == 1024
             assert call_args.kwargs["vectors_config"].distance.name == "COSINE"
+            indexed = {
+                c.kwargs["field_name"]: c.kwargs["field_schema"]
+                for c in mock_client.create_payload_index.call_args_list
+            }
+            assert indexed == {
+                "source_document": PayloadSchemaType.KEYWORD,
+                "source_path": PayloadSchemaType.KEYWORD,
+                "chunk_index": PayloadSchemaType.INTEGER,
+            }
 
     @pytest.mark.asyncio
     async def test_create_collection_idempotent(self):
@@ -1133,20 +1233,41 @@ class TestQdrantStorage:
 
         Verifies calling create_collection twice doesn't raise error. AC2.
         """
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
-            mock_collection = Mock()
-            mock_collection.name = "financial_docs"
-            mock_collections = Mock()
-            mock_collections.collections = [mock_collection]
-            mock_client.get_collections.return_value = mock_collections
+            mock_client.collection_exists.return_value = True
+            mock_client.get_collection.return_value.config.params.vectors = VectorParams(
+                size=1024, distance=Distance.COSINE
+            )
+            mock_client.get_collection.return_value.payload_schema = {
+                "source_document": Mock(),
+                "source_path": Mock(),
+                "chunk_index": Mock(),
+            }
             mock_get_client.return_value = mock_client
 
             # Create collection (should skip because it exists)
             create_collection("financial_docs", vector_size=1024)
+            create_collection("financial_docs", vector_size=1024)
 
             # Verify create_collection was NOT called (already exists)
             mock_client.create_collection.assert_not_called()
+            mock_client.create_payload_index.assert_not_called()
+            # Schema checked once, then served from the process registry
+            mock_client.collection_exists.assert_called_once()
+
+    def test_create_collection_vector_size_mismatch(self):
+        """Test an existing collection with a different vector size is rejected."""
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
+            mock_client = Mock()
+            mock_client.collection_exists.return_value = True
+            mock_client.get_collection.return_value.config.params.vectors = VectorParams(
+                size=768, distance=Distance.COSINE
+            )
+            mock_get_client.return_value = mock_client
+
+            with pytest.raises(VectorStorageError, match="vector size 768"):
+                create_collection("financial_docs", vector_size=1024)
 
     @pytest.mark.asyncio
     async def test_store_vectors_basic(self):
@@ -1173,16 +1294,12 @@ class TestQdrantStorage:
             for i in range(10)
         ]
 
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
-            mock_collections = Mock()
-            mock_collections.collections = []
-            mock_client.get_collections.return_value = mock_collections
+            mock_client.collection_exists.return_value = False
 
-            # Mock get_collection to return points_count
-            mock_collection_info = Mock()
-            mock_collection_info.points_count = 10
-            mock_client.get_collection.return_value = mock_collection_info
+            # Mock exact per-document count
+            mock_client.count.return_value.count = 10
 
             mock_get_client.return_value = mock_client
 
@@ -1193,6 +1310,13 @@ class TestQdrantStorage:
             assert points_stored == 10
             mock_client.upsert.assert_called_once()
 
+            # Verification counts only this document's points, exactly
+            count_kwargs = mock_client.count.call_args.kwargs
+            assert count_kwargs["exact"] is True
+            condition = count_kwargs["count_filter"].must[0]
+            assert condition.key == "source_path"
+            assert condition.match.any == ["/tmp/test_doc.pdf"]
+
             # Verify metadata is preserved in payload
             call_args = mock_client.upsert.call_args
             points = call_args.kwargs["points"]
@@ -1206,6 +1330,7 @@ class TestQdrantStorage:
                 first_point.payload["word_count"] == 7
             )  # "Test chunk content 0 with financial data"
             assert first_point.payload["source_document"] == "test_doc.pdf"
+            assert first_point.payload["source_path"] == "/tmp/test_doc.pdf"
             assert first_point.payload["page_number"] == 1
             assert first_point.payload["chunk_index"] == 0
 
@@ -1235,30 +1360,72 @@ class TestQdrantStorage:
             for i in range(250)
         ]
 
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
-            mock_collections = Mock()
-            mock_collections.collections = []
-            mock_client.get_collections.return_value = mock_collections
+            mock_client.collection_exists.return_value = False
 
-            mock_collection_info = Mock()
-            mock_collection_info.points_count = 250
-            mock_client.get_collection.return_value = mock_collection_info
+            mock_client.count.return_value.count = 250
 
             mock_get_client.return_value = mock_client
 
             # Store vectors with batch_size=100
             points_stored = await store_vectors_in_qdrant(chunks, batch_size=100)
 
-            # Verify 3 batches were uploaded (100, 100, 50)
-            assert mock_client.upsert.call_count == 3
+            # Verify 3 batches: 200 points streamed without waiting, final 50 as barrier
             assert points_stored == 250
+            mock_client.upload_points.assert_called_once()
+            upload_kwargs = mock_client.upload_points.call_args.kwargs
+            assert len(upload_kwargs["points"]) == 200
+            assert upload_kwargs["batch_size"] == 100
+            assert upload_kwargs["wait"] is False
+            assert upload_kwargs["parallel"] == 1  # Below parallel_min_points threshold
+
+            mock_client.upsert.assert_called_once()
+            barrier_kwargs = mock_client.upsert.call_args.kwargs
+            assert len(barrier_kwargs["points"]) == 50
+            assert barrier_kwargs["wait"] is True
+
+    @pytest.mark.asyncio
+    async def test_parallel_upload_adaptive_batch_size(self):
+        """Test large uploads use parallel workers and payload-adaptive batch size.
+
+        Verifies batch size shrinks as chunk text grows and parallelism is capped
+        by settings for uploads above the parallel threshold.
+        """
+        metadata = DocumentMetadata(
+            filename="big_doc.pdf",
+            doc_type="PDF",
+            ingestion_timestamp=datetime.now().isoformat(),
+            page_count=1,
+        )
+        batch = ChunkBatch(metadata)
+        for i in range(3000):
+            batch.append("word " * 500, page_number=1, chunk_index=i)
+        batch.embeddings = np.zeros((3000, 1024), dtype=np.float32)
+
+        with (
+            patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client,
+            patch("raglite.ingestion.pipeline.settings") as mock_settings,
+        ):
+            mock_settings.embedding_dimension = 1024
+            mock_settings.qdrant_upload_parallel = 4
+            mock_settings.qdrant_upload_parallel_min_points = 2000
+            mock_settings.qdrant_upload_target_batch_bytes = 4 * 1024 * 1024
+            mock_settings.qdrant_upload_max_batch_size = 512
+            mock_settings.qdrant_upload_max_retries = 3
+            mock_client = Mock()
+            mock_client.collection_exists.return_value = False
+            mock_client.count.return_value.count = 3000
+            mock_get_client.return_value = mock_client
+
+            await store_vectors_in_qdrant(batch)
 
-            # Verify batch sizes
-            calls = mock_client.upsert.call_args_list
-            assert len(calls[0].kwargs["points"]) == 100  # First batch
-            assert len(calls[1].kwargs["points"]) == 100  # Second batch
-            assert len(calls[2].kwargs["points"]) == 50  # Third batch
+        upload_kwargs = mock_client.upload_points.call_args.kwargs
+        # ~23 KB per point (1024 floats + 2.5 KB text) -> ~180 points per 4 MiB request
+        assert 150 <= upload_kwargs["batch_size"] <= 200
+        assert upload_kwargs["parallel"] == 4
+        streamed = len(upload_kwargs["points"])
+        assert streamed + len(mock_client.upsert.call_args.kwargs["points"]) == 3000
 
     @pytest.mark.asyncio
     async def test_metadata_preservation(self):
@@ -1286,15 +1453,11 @@ class TestQdrantStorage:
             for i in range(3)
         ]
 
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
-            mock_collections = Mock()
-            mock_collections.collections = []
-            mock_client.get_collections.return_value = mock_collections
+            mock_client.collection_exists.return_value = False
 
-            mock_collection_info = Mock()
-            mock_collection_info.points_count = 3
-            mock_client.get_collection.return_value = mock_collection_info
+            mock_client.count.return_value.count = 3
 
             mock_get_client.return_value = mock_client
 
@@ -1314,13 +1477,52 @@ class TestQdrantStorage:
                 assert payload["chunk_index"] == i
                 assert "word_count" in payload
 
+    @pytest.mark.asyncio
+    async def test_store_vectors_chunk_batch(self):
+        """Test storing a ChunkBatch produces the same payload as Chunk lists.
+
+        Verifies the columnar path reads text and vectors from shared buffers.
+        """
+        metadata = DocumentMetadata(
+            filename="batch_doc.pdf",
+            doc_type="PDF",
+            ingestion_timestamp=datetime.now().isoformat(),
+            page_count=2,
+        )
+        batch = ChunkBatch(metadata)
+        batch.append("First chunk text", page_number=1, chunk_index=0)
+        batch.append("Second chunk", page_number=2, chunk_index=1)
+        batch.embeddings = np.zeros((2, 1024), dtype=np.float32)
+
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
+            mock_client = Mock()
+            mock_client.collection_exists.return_value = False
+            mock_client.count.return_value.count = 2
+            mock_get_client.return_value = mock_client
+
+            points_stored = await store_vectors_in_qdrant(batch)
+
+        assert points_stored == 2
+        points = mock_client.upsert.call_args.kwargs["points"]
+        assert [p.payload["chunk_id"] for p in points] == ["batch_doc.pdf_0", "batch_doc.pdf_1"]
+        assert points[1].payload == {
+            "chunk_id": "batch_doc.pdf_1",
+            "text": "Second chunk",
+            "word_count": 2,
+            "source_document": "batch_doc.pdf",
+            "source_path": "batch_doc.pdf",  # No source path: the file name
+            "page_number": 2,
+            "chunk_index": 1,
+        }
+        assert len(points[0].vector) == 1024
+
     @pytest.mark.asyncio
     async def test_empty_chunks_handling(self):
         """Test graceful handling of empty chunk list.
 
         Verifies function returns 0 and doesn't call Qdrant for empty input. AC7.
         """
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
             mock_get_client.return_value = mock_client
 
@@ -1355,11 +1557,9 @@ class TestQdrantStorage:
             )
         ]
 
-        with patch("raglite.ingestion.pipeline.get_qdrant_client") as mock_get_client:
+        with patch("raglite.ingestion.pipeline.get_vector_store") as mock_get_client:
             mock_client = Mock()
-            mock_collections = Mock()
-            mock_collections.collections = []
-            mock_client.get_collections.return_value = mock_collections
+            mock_client.collection_exists.return_value = False
 
             # Mock upsert to raise exception
             mock_client.upsert.side_effect = Exception("Connection timeout")
@@ -1370,6 +1570,69 @@ class TestQdrantStorage:
             with pytest.raises(VectorStorageError, match="Failed to store vectors in Qdrant"):
                 await store_vectors_in_qdrant(chunks)
 
+    @pytest.mark.asyncio
+    async def test_bulk_load_mode_defers_and_restores_hnsw(self):
+        """Test bulk_load_mode sets HNSW m=0, restores it, and waits for GREEN.
+
+        Verifies indexing is deferred during the block, the original m is
+        restored afterwards, and optimization completion is awaited.
+        """
+        from qdrant_client.models import CollectionStatus
+
+        mock_client = Mock()
+        mock_client.collection_exists.return_value = False
+        info = Mock()
+        info.config.hnsw_config.m = 32
+        info.status = CollectionStatus.GREEN
+        mock_client.get_collection.return_value = info
+
+        with patch("raglite.ingestion.pipeline.get_vector_store", return_value=mock_client):
+            async with bulk_load_mode("financial_docs"):
+                # Nested blocks (e.g. ingest_document inside ingest_directory) are no-ops
+                async with bulk_load_mode("financial_docs"):
+                    pass
+                assert mock_client.update_collection.call_count == 1
+                assert mock_client.update_collection.call_args.kwargs["hnsw_config"].m == 0
+
+        # Created with indexing deferred, then restored to the original m
+        assert mock_client.create_collection.call_args.kwargs["hnsw_config"].m == 0
+        assert mock_client.update_collection.call_count == 2
+        assert mock_client.update_collection.call_args.kwargs["hnsw_config"].m == 32
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_mode_overlapping_loads_restore_once(self):
+        """Test overlapping bulk loads keep indexing off until the last one exits."""
+        from qdrant_client.models import CollectionStatus
+
+        mock_client = Mock()
+        mock_client.collection_exists.return_value = False
+        info = Mock()
+        info.config.hnsw_config.m = 16
+        info.status = CollectionStatus.GREEN
+        mock_client.get_collection.return_value = info
+        first_loaded = asyncio.Event()
+        second_loaded = asyncio.Event()
+        first_exited = asyncio.Event()
+
+        async def first() -> None:
+            async with bulk_load_mode("financial_docs"):
+                first_loaded.set()
+                await second_loaded.wait()
+            first_exited.set()
+
+        async def second() -> None:
+            await first_loaded.wait()
+            async with bulk_load_mode("financial_docs"):
+                second_loaded.set()
+                await first_exited.wait()  # Still streaming after the first load finished
+                assert mock_client.update_collection.call_args.kwargs["hnsw_config"].m == 0
+
+        with patch("raglite.ingestion.pipeline.get_vector_store", return_value=mock_client):
+            await asyncio.wait_for(asyncio.gather(first(), second()), timeout=10)
+
+        restores = [c.kwargs["hnsw_config"].m for c in mock_client.update_collection.call_args_list]
+        assert restores == [0, 16]
+
     def test_get_qdrant_client_singleton(self):
         """Test Qdrant client singleton pattern (client reuse).
 
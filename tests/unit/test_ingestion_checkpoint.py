@@ -0,0 +1,226 @@
+"""Unit tests for resumable ingestion checkpoints (raglite/ingestion/checkpoint.py)."""
+
+import os
+import time
+from collections.abc import Generator
+from pathlib import Path
+from typing import BinaryIO
+from unittest.mock import AsyncMock, Mock, patch
+
+import numpy as np
+import pytest
+from docling_core.types.doc import (
+    BoundingBox,
+    DocItemLabel,
+    DoclingDocument,
+    ProvenanceItem,
+    Size,
+)
+
+from raglite.ingestion import checkpoint as checkpoint_module
+from raglite.ingestion import pipeline
+from raglite.ingestion.checkpoint import IngestionCheckpoint, prune_checkpoints
+from raglite.ingestion.pipeline import (
+    VectorStorageError,
+    _build_points,
+    generate_embeddings,
+    ingest_pdf,
+)
+from raglite.shared.models import ChunkBatch, DocumentMetadata
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    directory = tmp_path / "checkpoints"
+    with patch.object(checkpoint_module.settings, "ingest_checkpoint_dir", str(directory)):
+        pipeline._document_converter = None
+        yield directory
+        pipeline._document_converter = None
+
+
+def _metadata() -> DocumentMetadata:
+    return DocumentMetadata(
+        filename="annual_2024.pdf",
+        doc_type="PDF",
+        ingestion_timestamp="2026-10-18T10:00:00Z",
+        page_count=2,
+        source_path="/data/annual_2024.pdf",
+    )
+
+
+def _batch(count: int) -> ChunkBatch:
+    batch = ChunkBatch(_metadata())
+    for i in range(count):
+        batch.append(f"Revenue for segment {i} grew {i}%.", page_number=i // 4 + 1, chunk_index=i)
+    return batch
+
+
+def _docling_document() -> DoclingDocument:
+    document = DoclingDocument(name="annual_2024")
+    for page_no in (1, 2):
+        document.add_page(page_no=page_no, size=Size(width=612, height=792))
+        text = f"Page {page_no} operating income increased on higher volumes. " * 8
+        document.add_text(
+            label=DocItemLabel.TEXT,
+            text=text,
+            prov=ProvenanceItem(
+                page_no=page_no,
+                bbox=BoundingBox(l=0, t=0, r=1, b=1),
+                charspan=(0, len(text)),
+            ),
+        )
+    return document
+
+
+class _CountingModel:
+    def __init__(self) -> None:
+        self.encoded = 0
+
+    def encode(self, texts: list[str], **kwargs: object) -> np.ndarray:
+        self.encoded += len(texts)
+        return np.full((len(texts), 8), 0.5, dtype=np.float32)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_chunks_and_embeddings_round_trip(tmp_path: Path) -> None:
+    """Test chunk batches and per-batch embeddings are restored exactly."""
+    checkpoint = IngestionCheckpoint(tmp_path / "doc")
+    batch = _batch(10)
+    checkpoint.save_chunks(batch)
+    checkpoint.save_embeddings(0, np.ones((4, 8)))
+
+    restored = checkpoint.load_chunks(_metadata())
+    assert restored is not None
+    assert restored.contents() == batch.contents()
+    assert list(restored.page_numbers) == list(batch.page_numbers)
+    assert restored.chunk_id(9) == batch.chunk_id(9)
+    assert checkpoint.load_embeddings(0, 4).dtype == np.float32
+    assert checkpoint.load_embeddings(0, 5) is None  # Batch size changed: recompute
+    assert checkpoint.load_embeddings(4, 4) is None
+    assert not list(checkpoint.directory.glob(".*.tmp"))
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_failed_checkpoint_write_is_not_fatal(tmp_path: Path) -> None:
+    """Test a write error leaves no checkpoint file and does not raise."""
+    checkpoint = IngestionCheckpoint(tmp_path / "doc")
+    broken = Mock()
+    broken.model_dump_json.side_effect = ValueError("not serializable")
+
+    checkpoint.save_conversion(broken)
+
+    assert checkpoint.load_conversion() is None
+    assert list(checkpoint.directory.iterdir()) == []
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_generate_embeddings_resumes_from_watermark(tmp_path: Path) -> None:
+    """Test batches embedded by an earlier attempt are not re-encoded."""
+    checkpoint = IngestionCheckpoint(tmp_path / "doc")
+    checkpoint.save_embeddings(0, np.zeros((32, 8)))
+    model = _CountingModel()
+
+    with patch("raglite.ingestion.pipeline.get_embedding_model", return_value=model):
+        batch = await generate_embeddings(_batch(40), checkpoint=checkpoint)
+
+    assert model.encoded == 8
+    assert batch.embeddings[:32].sum() == 0
+    assert checkpoint.load_embeddings(32, 8) is not None
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_ingest_pdf_resumes_after_failed_upload(tmp_path: Path, checkpoint_dir: Path) -> None:
+    """Test a retry skips conversion and embedding, and replays the upload."""
+    pdf_file = tmp_path / "annual_2024.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4 annual report")
+    model = _CountingModel()
+    store = AsyncMock(side_effect=[VectorStorageError("Qdrant unavailable"), 2])
+
+    with (
+        patch("raglite.ingestion.pipeline.DocumentConverter") as MockConverter,
+        patch("raglite.ingestion.pipeline.get_embedding_model", return_value=model),
+        patch("raglite.ingestion.pipeline.store_vectors_in_qdrant", store),
+    ):
+        MockConverter.return_value.convert.return_value = Mock(document=_docling_document())
+
+        with pytest.raises(VectorStorageError):
+            await ingest_pdf(str(pdf_file))
+        encoded_first_attempt = model.encoded
+        metadata = await ingest_pdf(str(pdf_file))
+
+    assert MockConverter.return_value.convert.call_count == 1
+    assert model.encoded == encoded_first_attempt  # Embeddings came from the checkpoint
+    assert metadata.page_count == 2
+    assert metadata.chunk_count == len(store.call_args_list[1].args[0])
+    assert metadata.timings is not None and metadata.timings.convert_ms is None
+    assert list(checkpoint_dir.iterdir()) == []  # Cleared once stored
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_concurrent_ingestions_share_a_checkpoint(tmp_path: Path, checkpoint_dir: Path) -> None:
+    """Test overlapping writes stay intact and the last ingestion to finish clears."""
+    pdf_file = tmp_path / "annual_2024.pdf"
+    pdf_file.write_bytes(b"%PDF-1.4 annual report")
+    first = IngestionCheckpoint.for_document(pdf_file)
+    second = IngestionCheckpoint.for_document(pdf_file)
+    assert first is not None and second is not None
+
+    def write_while_other_writes(f: BinaryIO) -> None:
+        second.save_embeddings(0, np.zeros((4, 8)))
+        np.save(f, np.ones((4, 8), dtype=np.float32))
+
+    first._write("embeddings-00000000.npy", write_while_other_writes)
+    assert first.load_embeddings(0, 4) is not None
+
+    first.clear()
+    assert second.load_embeddings(0, 4) is not None  # Still in use by the second ingestion
+    second.clear()
+    assert list(checkpoint_dir.iterdir()) == []
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_stale_checkpoints_are_pruned(tmp_path: Path, checkpoint_dir: Path) -> None:
+    """Test checkpoints untouched for the maximum age are removed unless in use."""
+    stale, in_use, fresh = (tmp_path / f"{name}.pdf" for name in ("stale", "in_use", "fresh"))
+    for pdf_file in (stale, in_use, fresh):
+        pdf_file.write_bytes(f"%PDF-1.4 {pdf_file.stem}".encode())
+    checkpoints = [IngestionCheckpoint.for_document(p) for p in (stale, in_use, fresh)]
+    for checkpoint in checkpoints:
+        assert checkpoint is not None
+        checkpoint.save_embeddings(0, np.zeros((4, 8)))
+    checkpoints[0].close()  # Failed ingestion: the checkpoint stays for a retry
+    checkpoints[2].close()
+    week_ago = time.time() - 8 * 24 * 3600
+    for checkpoint in checkpoints[:2]:
+        for path in (checkpoint.directory, checkpoint.directory.with_suffix(".lock")):
+            os.utime(path, (week_ago, week_ago))
+
+    assert prune_checkpoints(checkpoint_dir, max_age_seconds=7 * 24 * 3600) == 1
+
+    assert not checkpoints[0].directory.exists()
+    assert not checkpoints[0].directory.with_suffix(".lock").exists()
+    assert checkpoints[1].directory.exists()
+    assert checkpoints[2].directory.exists()
+    checkpoints[1].close()
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_point_ids_are_deterministic() -> None:
+    """Test re-building points for the same chunks yields the same IDs (replay-safe)."""
+    batch = _batch(3)
+    batch.embeddings = np.ones((3, 8), dtype=np.float32)
+
+    first = [p.id for p in _build_points(batch, "financial_docs")]
+    second = [p.id for p in _build_points(batch.to_chunks(), "financial_docs")]
+
+    assert first == second
+    assert len(set(first)) == 3
@@ -0,0 +1,294 @@
+"""Unit tests for background ingestion jobs (raglite/ingestion/jobs.py)."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from raglite.ingestion import jobs
+from raglite.ingestion.jobs import JobManager, JobNotFoundError, JobsUnavailableError
+from raglite.shared.models import DocumentMetadata, IngestionJobStatus
+from raglite.shared.tracing import span
+
+
+@pytest.fixture
+def document(tmp_path: Path) -> Path:
+    path = tmp_path / "Q3_Report.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    return path
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> Generator[JobManager, None, None]:
+    """JobManager on a temporary database (workers not started)."""
+    job_manager = JobManager(tmp_path / "jobs.sqlite3", workers=1, max_attempts=2)
+    yield job_manager
+    job_manager.shutdown(timeout=5)
+
+
+def _metadata(doc_path: str) -> DocumentMetadata:
+    return DocumentMetadata(
+        filename=Path(doc_path).name,
+        doc_type="PDF",
+        ingestion_timestamp="2026-10-18T10:00:00Z",
+        page_count=3,
+        source_path=doc_path,
+        chunk_count=4,
+    )
+
+
+async def _fake_ingest(doc_path: str, content_digest: str | None = None) -> DocumentMetadata:
+    """Open the pipeline's stage spans like ingest_pdf does."""
+    with span("ingest_document"):
+        with span("convert"):
+            pass
+        with span("chunk_by_docling_items"):
+            pass
+        with span("generate_embeddings", chunks=4):
+            for i in range(2):
+                with span("embed.batch", batch_index=i + 1, batch_size=2):
+                    pass
+        with span("store_vectors", chunks=4):
+            pass
+    return _metadata(doc_path)
+
+
+def _wait_for(
+    manager: JobManager, job_id: str, done: Callable[[IngestionJobStatus], bool]
+) -> IngestionJobStatus:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        status = manager.get(job_id)
+        if done(status):
+            return status
+        time.sleep(0.02)
+    raise AssertionError(f"Job {job_id} did not reach the expected state: {status}")
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_submitted_job_runs_to_completion(manager: JobManager, document: Path) -> None:
+    """Test submit returns a queued JobID and a worker records progress and the result."""
+    with patch("raglite.ingestion.pipeline.ingest_document", side_effect=_fake_ingest):
+        job = manager.submit(str(document))
+        assert job.status == "queued"
+        manager.start()
+        status = _wait_for(manager, job.job_id, lambda s: s.status == "succeeded")
+
+    assert status.chunks_embedded == 4
+    assert status.chunks_total == 4
+    assert status.attempts == 1
+    assert status.finished_at is not None
+    assert status.result is not None and status.result.chunk_count == 4
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_unknown_job_and_missing_document_raise(manager: JobManager, tmp_path: Path) -> None:
+    """Test unknown JobIDs and missing documents are rejected."""
+    with pytest.raises(JobNotFoundError):
+        manager.get("does-not-exist")
+    with pytest.raises(FileNotFoundError):
+        manager.submit(str(tmp_path / "missing.pdf"))
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_resubmitting_a_queued_document_returns_the_queued_job(
+    manager: JobManager, document: Path
+) -> None:
+    """Test a document already waiting in the queue is not queued twice."""
+    first = manager.submit(str(document))
+    again = manager.submit(str(document.parent / ".." / document.parent.name / document.name))
+
+    assert again.job_id == first.job_id
+    manager.cancel(first.job_id)
+    assert manager.submit(str(document)).job_id != first.job_id
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_cancel_queued_job_never_runs(manager: JobManager, document: Path) -> None:
+    """Test a queued job is cancelled immediately and is not claimed."""
+    job = manager.submit(str(document))
+
+    status = manager.cancel(job.job_id)
+
+    assert status.status == "cancelled"
+    assert status.cancel_requested is True
+    assert manager._claim() is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_cancel_running_job_stops_at_next_batch(manager: JobManager, document: Path) -> None:
+    """Test a running job stops cooperatively at the next span after cancel."""
+    started = threading.Event()
+
+    async def slow_ingest(doc_path: str, content_digest: str | None = None) -> DocumentMetadata:
+        with span("generate_embeddings", chunks=1000):
+            for i in range(1000):
+                with span("embed.batch", batch_index=i + 1, batch_size=1):
+                    started.set()
+                    time.sleep(0.01)
+        return _metadata(doc_path)
+
+    with patch("raglite.ingestion.pipeline.ingest_document", side_effect=slow_ingest):
+        job = manager.submit(str(document))
+        manager.start()
+        assert started.wait(5)
+        running = _wait_for(manager, job.job_id, lambda s: s.stage == "embed")
+        assert running.status == "running"
+        assert running.chunks_total == 1000
+
+        manager.cancel(job.job_id)
+        status = _wait_for(manager, job.job_id, lambda s: s.status != "running")
+
+    assert status.status == "cancelled"
+    assert status.chunks_embedded < 1000
+    assert status.result is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_interrupted_jobs_resume_after_restart(tmp_path: Path, document: Path) -> None:
+    """Test running jobs of a dead process are re-queued, then failed past max attempts."""
+    db_path = tmp_path / "jobs.sqlite3"
+    crashed = JobManager(db_path, max_attempts=2)
+    crashed.owner = f"{jobs.socket.gethostname()}:999999"
+    other = tmp_path / "Q4_Report.pdf"
+    other.write_bytes(b"%PDF-1.4")
+    first = crashed.submit(str(document))
+    second = crashed.submit(str(other))
+    crashed._claim()
+    crashed._claim()
+    crashed._update(second.job_id, attempts=2)
+
+    restarted = JobManager(db_path, max_attempts=2)
+    with (
+        patch.object(jobs, "_pid_alive", return_value=False),
+        patch("raglite.ingestion.pipeline.ingest_document", side_effect=_fake_ingest),
+    ):
+        restarted.start()
+        status = _wait_for(restarted, first.job_id, lambda s: s.status == "succeeded")
+    restarted.shutdown(timeout=5)
+
+    assert status.attempts == 2
+    exhausted = restarted.get(second.job_id)
+    assert exhausted.status == "failed"
+    assert "Interrupted" in (exhausted.error or "")
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_job_cancelled_while_its_process_is_down_stays_cancelled(
+    tmp_path: Path, document: Path
+) -> None:
+    """Test a running job cancelled after its process died is not re-run on restart."""
+    db_path = tmp_path / "jobs.sqlite3"
+    crashed = JobManager(db_path)
+    crashed.owner = f"{jobs.socket.gethostname()}:999999"
+    job = crashed.submit(str(document))
+    crashed._claim()
+    crashed.cancel(job.job_id)  # Flag only: the owning process is gone
+
+    restarted = JobManager(db_path)
+    with patch.object(jobs, "_pid_alive", return_value=False):
+        assert restarted.recover_orphaned_jobs() == 0
+    assert restarted.get(job.job_id).status == "cancelled"
+    assert restarted._claim() is None
+
+    # A job flagged just as it was claimed stops before its first stage
+    queued = restarted.submit(str(document))
+    claimed = restarted._claim()
+    assert claimed is not None
+    restarted._update(queued.job_id, cancel_requested=1)
+    with patch("raglite.ingestion.pipeline.ingest_document", side_effect=_fake_ingest) as ingest:
+        restarted._run(*claimed)
+    ingest.assert_not_called()
+    assert restarted.get(queued.job_id).status == "cancelled"
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_concurrent_claims_take_each_job_once(tmp_path: Path) -> None:
+    """Test claims from several managers on one database never share a job."""
+    db_path = tmp_path / "jobs.sqlite3"
+    managers = [JobManager(db_path) for _ in range(4)]
+    documents = [tmp_path / f"report_{i}.pdf" for i in range(20)]
+    for path in documents:
+        path.write_bytes(b"%PDF-1.4")
+    submitted = {managers[0].submit(str(path)).job_id for path in documents}
+    claimed: list[str] = []
+    claimed_lock = threading.Lock()
+
+    def claim_all(manager: JobManager) -> None:
+        while (job := manager._claim()) is not None:
+            with claimed_lock:
+                claimed.append(job[0])
+
+    threads = [threading.Thread(target=claim_all, args=(m,)) for m in managers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(submitted)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_job_joins_tool_ingestion_of_the_same_document(
+    manager: JobManager, document: Path
+) -> None:
+    """Test a job started while the ingest tool runs the same file shares that ingestion."""
+    release = threading.Event()
+    digests: list[str | None] = []
+
+    async def slow_ingest(doc_path: str, content_digest: str | None = None) -> DocumentMetadata:
+        digests.append(content_digest)
+        await asyncio.to_thread(release.wait, 5)
+        return _metadata(doc_path)
+
+    with patch("raglite.ingestion.pipeline.ingest_document", side_effect=slow_ingest):
+        key = jobs.document_key(str(document))
+        assert key is not None
+        tool_call = asyncio.create_task(
+            jobs.ingest_flight.do(key, lambda: slow_ingest(str(document), key[1]))
+        )
+        await asyncio.sleep(0.01)
+        job = manager.submit(str(document))
+        claimed = manager._claim()
+        assert claimed is not None
+        job_run = asyncio.create_task(asyncio.to_thread(manager._run, *claimed))
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(tool_call, job_run)
+
+    status = manager.get(job.job_id)
+    assert digests == [key[1]]
+    assert status.status == "succeeded"
+    assert status.result is not None and status.result.chunk_count == 4
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_unwritable_job_table_does_not_block_startup(tmp_path: Path) -> None:
+    """Test startup skips a missing job table and job tools report an unusable one."""
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    with (
+        patch.object(jobs.settings, "ingest_jobs_db_path", str(blocker / "jobs.sqlite3")),
+        patch.object(jobs, "_job_manager", None),
+    ):
+        jobs.resume_ingestion_jobs()
+        jobs.shutdown_job_manager(timeout=1)
+        assert jobs._job_manager is None
+
+        with pytest.raises(JobsUnavailableError, match="cannot open job table"):
+            jobs.get_job_manager()
@@ -0,0 +1,89 @@
+"""Unit tests for structured, asynchronous logging (raglite/shared/logging.py)."""
+
+import json
+import logging
+import queue
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from raglite.shared.logging import (
+    DebugSamplingFilter,
+    JsonFormatter,
+    _NonBlockingQueueHandler,
+)
+from raglite.shared.metrics import LOG_RECORDS_DROPPED
+
+
+def _record(
+    name: str = "raglite.test", level: int = logging.INFO, **extra: object
+) -> logging.LogRecord:
+    record = logging.LogRecord(name, level, __file__, 1, "Query %s", ("complete",), None)
+    record.__dict__.update(extra)
+    return record
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_json_formatter_includes_extra_fields() -> None:
+    """Test JSON output carries the message, level and every extra={...} field."""
+    entry = json.loads(JsonFormatter().format(_record(results=5, latency_ms=12.5)))
+
+    assert entry["message"] == "Query complete"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "raglite.test"
+    assert entry["results"] == 5
+    assert entry["latency_ms"] == 12.5
+    assert "args" not in entry and "pathname" not in entry
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_debug_sampling_uses_longest_logger_prefix() -> None:
+    """Test DEBUG records are sampled per logger and other levels always pass."""
+    sampler = DebugSamplingFilter({"raglite": 1.0, "raglite.retrieval": 0.0})
+
+    assert sampler.filter(_record("raglite.retrieval.search", logging.DEBUG)) is False
+    assert sampler.filter(_record("raglite.retrieval.search", logging.INFO)) is True
+    assert sampler.filter(_record("raglite.ingestion", logging.DEBUG)) is True
+    with patch("raglite.shared.logging.random.random", return_value=0.05):
+        assert DebugSamplingFilter({"raglite": 0.1}).filter(_record(level=logging.DEBUG))
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_queue_handler_preserves_extras_for_listener() -> None:
+    """Test queued records keep extras and a pre-rendered message and traceback."""
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+    handler = _NonBlockingQueueHandler(log_queue)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = _record(doc_id="abc")
+        record.exc_info = sys.exc_info()
+    handler.emit(record)
+
+    queued = log_queue.get_nowait()
+    entry = json.loads(JsonFormatter().format(queued))
+    assert entry["message"] == "Query complete"
+    assert entry["doc_id"] == "abc"
+    assert "ValueError: boom" in entry["exception"]
+    assert queued.exc_info is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_full_queue_drops_instead_of_blocking() -> None:
+    """Test a stalled sink (full queue) never blocks the logging thread."""
+    handler = _NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    dropped_before = LOG_RECORDS_DROPPED.value
+
+    start = time.perf_counter()
+    for _ in range(100):
+        handler.emit(_record())
+    elapsed = time.perf_counter() - start
+
+    assert LOG_RECORDS_DROPPED.value - dropped_before == 99
+    assert elapsed < 1.0
@@ -4,23 +4,33 @@ Tests MCP server initialization, tool definitions, error handling,
 and logging without requiring actual MCP client connection.
 """
 
-from unittest.mock import AsyncMock, patch
+import asyncio
+import hashlib
+from unittest.mock import ANY, AsyncMock, patch
 
 import pytest
 
 from raglite.main import (
     DocumentProcessingError,
+    get_metrics,
+    health,
     ingest_financial_document,
     mcp,
+    profile_requests,
     query_financial_documents,
 )
 from raglite.retrieval.search import QueryError
+from raglite.shared import scheduler
 from raglite.shared.models import (
     DocumentMetadata,
+    HealthStatus,
+    IngestionTimings,
+    QueryCacheStats,
     QueryRequest,
     QueryResponse,
     QueryResult,
 )
+from raglite.shared.scheduler import IngestionAdmission, IngestionRejectedError
 
 
 class TestMCPServerInitialization:
@@ -39,6 +49,46 @@ class TestMCPServerInitialization:
         assert callable(ingest_financial_document.fn)
         assert callable(query_financial_documents.fn)
 
+    @pytest.mark.asyncio
+    async def test_health_tool_reports_status(self):
+        """Test health tool returns a HealthStatus readiness report."""
+        assert hasattr(health, "fn")
+
+        status = await health.fn()
+
+        assert isinstance(status, HealthStatus)
+        assert status.uptime_seconds >= 0
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_tool_returns_snapshot(self):
+        """Test get_metrics tool returns latency histograms and counters."""
+        assert hasattr(get_metrics, "fn")
+
+        snapshot = await get_metrics.fn()
+
+        assert "raglite_query_seconds" in snapshot.histograms
+        assert "raglite_ingest_chunks_total" in snapshot.counters
+        assert snapshot.query_cache is None  # Disabled by default
+
+    @pytest.mark.asyncio
+    async def test_get_metrics_tool_reports_query_cache_stats(self):
+        """Test get_metrics includes the semantic query cache statistics when enabled."""
+        with patch("raglite.main.settings.query_cache_enabled", True):
+            snapshot = await get_metrics.fn()
+
+        assert isinstance(snapshot.query_cache, QueryCacheStats)
+        assert 0.0 <= snapshot.query_cache.hit_rate <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_profile_requests_tool_arms_and_disarms(self):
+        """Test profile_requests arms the profiler and reports its state."""
+        armed = await profile_requests.fn(count=2, mode="memory")
+        assert (armed.remaining, armed.mode) == (2, "memory")
+
+        disarmed = await profile_requests.fn(count=0)
+        assert disarmed.remaining == 0
+        assert (await profile_requests.fn()).remaining == 0
+
 
 class TestIngestFinancialDocumentTool:
     """Test ingest_financial_document MCP tool."""
@@ -65,7 +115,79 @@ class TestIngestFinancialDocumentTool:
             assert result.filename == "Q3_2023_Report.pdf"
             assert result.chunk_count == 42
             assert result.page_count == 10
-            mock_ingest.assert_called_once_with("/data/Q3_2023_Report.pdf")
+            mock_ingest.assert_called_once_with("/data/Q3_2023_Report.pdf", content_digest=None)
+
+    @pytest.mark.asyncio
+    async def test_ingest_tool_rejected_when_capacity_exhausted(self):
+        """Test ingest calls beyond running + waiting capacity fail fast with backpressure."""
+        saturated = IngestionAdmission(limit=1, max_waiting=0)
+        saturated.acquire()  # Another ingestion holds the only slot
+
+        with (
+            patch.object(scheduler, "_ingestion_admission", saturated),
+            patch("raglite.main.ingest_document", new_callable=AsyncMock) as mock_ingest,
+        ):
+            with pytest.raises(IngestionRejectedError, match="capacity exhausted"):
+                await ingest_financial_document.fn("/data/Q3_2023_Report.pdf")
+
+        mock_ingest.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ingest_tool_coalesces_resubmitted_document(self, tmp_path):
+        """Test a re-submission during an ingestion shares it instead of re-ingesting."""
+        pdf = tmp_path / "Q3_2023_Report.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        digests = []
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_ingest(doc_path, content_digest=None):
+            digests.append(content_digest)
+            started.set()
+            await release.wait()
+            return DocumentMetadata(
+                filename="Q3_2023_Report.pdf",
+                doc_type="PDF",
+                ingestion_timestamp="2023-10-13T10:00:00Z",
+                chunk_count=42,
+            )
+
+        with patch("raglite.main.ingest_document", side_effect=slow_ingest) as mock_ingest:
+            first = asyncio.create_task(ingest_financial_document.fn(str(pdf)))
+            await started.wait()
+            second = asyncio.create_task(
+                ingest_financial_document.fn(str(tmp_path / "." / pdf.name))
+            )
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        assert mock_ingest.call_count == 1
+        assert digests == [hashlib.sha256(b"%PDF-1.4").hexdigest()]  # Hashed once, passed on
+        assert [r.chunk_count for r in results] == [42, 42]
+        assert results[0] is not results[1]
+
+    @pytest.mark.asyncio
+    async def test_ingest_tool_stage_timings_opt_in(self):
+        """Test per-stage ingestion timings are returned only when requested."""
+
+        def metadata_with_timings(*args, **kwargs):
+            return DocumentMetadata(
+                filename="Q3_2023_Report.pdf",
+                doc_type="PDF",
+                ingestion_timestamp="2023-10-13T10:00:00Z",
+                timings=IngestionTimings(convert_ms=900.0, total_ms=1200.0, pages_per_second=8.3),
+            )
+
+        with patch("raglite.main.ingest_document", side_effect=metadata_with_timings):
+            default = await ingest_financial_document.fn("/data/Q3_2023_Report.pdf")
+            opted_in = await ingest_financial_document.fn(
+                "/data/Q3_2023_Report.pdf", include_timings=True
+            )
+
+        assert default.timings is None
+        assert opted_in.timings is not None
+        assert opted_in.timings.convert_ms == 900.0
 
     @pytest.mark.asyncio
     async def test_ingest_tool_file_not_found(self):
@@ -174,8 +296,33 @@ class TestQueryFinancialDocumentsTool:
             assert response.results[0].score == 0.95
             assert response.retrieval_time_ms >= 0
 
-            mock_search.assert_called_once_with("What was Q3 revenue?", 5)
-            mock_citations.assert_called_once_with(mock_search_results)
+            mock_search.assert_called_once_with(
+                "What was Q3 revenue?", 5, timings=ANY, context_window=0, diversify=False
+            )
+            mock_citations.assert_called_once_with(mock_search_results, append_to_text=True)
+            assert response.timings is None  # Opt-in only
+
+    @pytest.mark.asyncio
+    async def test_query_tool_stage_timings_opt_in(self):
+        """Test include_timings returns the per-stage latency breakdown."""
+
+        async def fake_search(query, top_k, timings, context_window, diversify):
+            timings.update(embed_ms=12.5, vector_search_ms=30.25)
+            return []
+
+        with (
+            patch("raglite.main.search_documents", side_effect=fake_search),
+            patch("raglite.main.generate_citations", new_callable=AsyncMock, return_value=[]),
+        ):
+            request = QueryRequest(query="What was Q3 revenue?", include_timings=True)
+            response = await query_financial_documents.fn(request)
+
+        assert response.timings is not None
+        assert response.timings.embed_ms == 12.5
+        assert response.timings.vector_search_ms == 30.25
+        assert response.timings.citation_ms is not None
+        assert response.timings.rerank_ms is None
+        assert response.timings.total_ms >= 0
 
     @pytest.mark.asyncio
     async def test_query_tool_empty_query(self):
@@ -0,0 +1,151 @@
+"""Unit tests for the in-process metrics registry (raglite/shared/metrics.py)."""
+
+import json
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from raglite.shared.metrics import (
+    CACHE_REQUESTS_METRIC,
+    MetricsRegistry,
+    MultiprocessMetrics,
+    start_metrics_server,
+)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_counter_sums_across_threads() -> None:
+    """Test per-thread counter slots add up to the total increments."""
+    counter = MetricsRegistry().counter("test_total", "Test counter")
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.value == 8000
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_histogram_buckets_and_percentiles() -> None:
+    """Test histogram cumulative buckets and interpolated percentiles."""
+    histogram = MetricsRegistry().histogram("test_seconds", "Test", buckets=(0.1, 0.2, 0.5))
+    for value in [0.05] * 50 + [0.15] * 45 + [0.4] * 4 + [5.0]:
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+
+    assert snapshot.count == 100
+    assert snapshot.sum == pytest.approx(50 * 0.05 + 45 * 0.15 + 4 * 0.4 + 5.0)
+    assert snapshot.buckets == {"0.1": 50, "0.2": 95, "0.5": 99, "+Inf": 100}
+    assert snapshot.p50 == pytest.approx(0.1)
+    assert snapshot.p95 == pytest.approx(0.2)
+    assert 0.2 < snapshot.p99 <= 0.5  # type: ignore[operator]
+    assert MetricsRegistry().histogram("empty", "Empty").snapshot().p50 is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_snapshot_labels_and_cache_hit_rates() -> None:
+    """Test snapshot keys include labels and cache hit rates are computed per cache."""
+    registry = MetricsRegistry()
+    queries = registry.counter("raglite_queries_total", "Queries", ("status",))
+    cache = registry.counter(CACHE_REQUESTS_METRIC, "Cache lookups", ("cache", "result"))
+    inflight = registry.gauge("raglite_inflight_requests", "In flight", ("tool",))
+
+    queries.labels(status="ok").inc(3)
+    cache.labels(cache="query", result="hit").inc(3)
+    cache.labels(cache="query", result="miss").inc()
+    cache.labels(cache="schema", result="miss").inc()
+    inflight.labels(tool="query").inc()
+
+    snapshot = registry.snapshot()
+
+    assert snapshot.counters['raglite_queries_total{status="ok"}'] == 3
+    assert snapshot.gauges['raglite_inflight_requests{tool="query"}'] == 1
+    assert snapshot.cache_hit_rates == {"query": 0.75, "schema": 0.0}
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_registry_rejects_kind_mismatch() -> None:
+    """Test re-registering a name returns the same family, or fails for another kind."""
+    registry = MetricsRegistry()
+    counter = registry.counter("test_total", "Test")
+
+    assert registry.counter("test_total", "Test") is counter
+    with pytest.raises(ValueError, match="already registered"):
+        registry.gauge("test_total", "Test")
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_metrics_http_endpoint_serves_prometheus_text() -> None:
+    """Test the standalone /metrics endpoint returns the Prometheus exposition."""
+    server = start_metrics_server(port=0)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics", timeout=5) as response:
+            body = response.read().decode()
+            content_type = response.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert content_type.startswith("text/plain")
+    assert "# TYPE raglite_query_seconds histogram" in body
+    assert 'raglite_query_seconds_bucket{le="+Inf"}' in body
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_multiprocess_metrics_merge_all_workers(tmp_path: Path) -> None:
+    """Test /metrics in a worker sums every worker's file, dropping exited workers' gauges."""
+
+    def worker_registry(queries: int, inflight: int, latency: float) -> MetricsRegistry:
+        registry = MetricsRegistry()
+        registry.counter("raglite_queries_total", "Queries", ("status",)).labels(status="ok").inc(
+            queries
+        )
+        registry.gauge("raglite_inflight_requests", "In flight").inc(inflight)
+        registry.histogram("raglite_query_seconds", "Latency", buckets=(0.1, 1.0)).observe(latency)
+        return registry
+
+    this_worker = worker_registry(queries=2, inflight=1, latency=0.05)
+    exited_worker = worker_registry(queries=3, inflight=5, latency=0.5)
+    (tmp_path / "999999999.json").write_text(json.dumps(exited_worker.state()))
+
+    body = MultiprocessMetrics(this_worker, tmp_path).render()
+
+    assert 'raglite_queries_total{status="ok"} 5.0' in body
+    assert "raglite_inflight_requests 1.0" in body
+    assert 'raglite_query_seconds_bucket{le="0.1"} 1' in body
+    assert 'raglite_query_seconds_bucket{le="1.0"} 2' in body
+    assert "raglite_query_seconds_count 2" in body
+    assert body.count("# TYPE raglite_queries_total counter") == 1
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+@pytest.mark.p2
+@pytest.mark.unit
+def test_observe_overhead_is_negligible() -> None:
+    """Test a histogram observation costs microseconds (generous CI bound)."""
+    histogram = MetricsRegistry().histogram("test_seconds", "Test")
+    iterations = 100_000
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        histogram.observe(0.042)
+    per_call = (time.perf_counter() - start) / iterations
+
+    assert per_call < 20e-6
@@ -0,0 +1,73 @@
+"""Unit tests for MMR diversification (raglite/retrieval/mmr.py)."""
+
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from qdrant_client.models import Distance, PointStruct, VectorParams
+
+from raglite.retrieval import search
+from raglite.retrieval.mmr import mmr_select
+from raglite.retrieval.search import search_documents
+from raglite.shared.vector_store import NumpyVectorStore
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_mmr_skips_near_duplicates() -> None:
+    """Test a near-copy of the best candidate loses to a less relevant distinct one."""
+    vectors = np.array([[1.0, 0.0, 0.0], [0.99, 0.01, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+    relevance = [0.9, 0.89, 0.7, 0.5]
+
+    assert mmr_select(relevance, vectors, k=3, lambda_=0.7) == [0, 2, 3]
+    assert mmr_select(relevance, vectors, k=3, lambda_=1.0) == [0, 1, 2]  # Relevance only
+    assert mmr_select(relevance, vectors, k=10) == [0, 2, 3, 1]  # k capped at candidates
+    assert mmr_select([], np.empty((0, 3)), k=5) == []
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_documents_diversify(tmp_path) -> None:
+    """Test diversify over-fetches with vectors and returns distinct chunks."""
+    store = NumpyVectorStore(tmp_path)
+    store.create_collection(
+        "financial_docs", vectors_config=VectorParams(size=4, distance=Distance.COSINE)
+    )
+    # Three copies of a boilerplate chunk, then two distinct chunks
+    vectors = [[1, 0.4, 0, 0], [1, 0.41, 0, 0], [1, 0.42, 0, 0], [1, -0.5, 0, 0], [1, 0, -0.6, 0]]
+    store.upsert(
+        "financial_docs",
+        points=[
+            PointStruct(
+                id=i,
+                vector=vector,
+                payload={
+                    "text": f"chunk {i}",
+                    "source_document": "report.pdf",
+                    "page_number": i + 1,
+                    "chunk_index": i,
+                    "word_count": 2,
+                },
+            )
+            for i, vector in enumerate(vectors)
+        ],
+    )
+
+    timings: dict[str, float] = {}
+    with (
+        patch.object(search.settings, "mmr_candidates", 5),
+        patch("raglite.retrieval.search.get_vector_store", return_value=store),
+        patch(
+            "raglite.retrieval.search.generate_query_embedding",
+            AsyncMock(return_value=[1.0, 0.0, 0.0, 0.0]),
+        ),
+    ):
+        plain = await search_documents("What was revenue?", top_k=3)
+        diverse = await search_documents(
+            "What was revenue?", top_k=3, timings=timings, diversify=True
+        )
+
+    assert [r.chunk_index for r in plain] == [0, 1, 2]
+    assert [r.chunk_index for r in diverse] == [0, 3, 4]
+    assert "rerank_ms" in timings
@@ -0,0 +1,96 @@
+"""Unit tests for token-budgeted context packing (raglite/retrieval/packing.py)."""
+
+import pytest
+
+from raglite.retrieval.attribution import generate_citations
+from raglite.retrieval.packing import estimate_tokens, pack_results
+from raglite.shared.models import QueryResult
+
+
+def _result(
+    chunk_index: int,
+    score: float,
+    text: str,
+    source: str = "Q3_Report.pdf",
+    source_path: str | None = None,
+) -> QueryResult:
+    return QueryResult(
+        score=score,
+        text=text,
+        source_document=source,
+        page_number=chunk_index + 1,
+        chunk_index=chunk_index,
+        word_count=len(text.split()),
+        source_path=source_path,
+    )
+
+
+def _words(start: int, stop: int, prefix: str = "w") -> str:
+    return " ".join(f"{prefix}{i}" for i in range(start, stop))
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_overlap_between_adjacent_chunks_is_sent_once() -> None:
+    """Test a neighbour's overlapping words are trimmed and an enclosed chunk is dropped."""
+    passage = _result(1, 0.7, _words(10, 40)).model_copy(update={"chunk_count": 2})
+    results = [
+        _result(0, 0.9, _words(0, 20)),  # Overlaps the passage by w10..w19
+        passage,
+        _result(2, 0.6, _words(25, 40)),  # Inside the passage (chunks 1-2)
+    ]
+
+    packed, tokens = pack_results(results, token_budget=10_000)
+
+    assert [r.chunk_index for r in packed] == [0, 1]
+    assert packed[1].text == _words(20, 40)
+    assert packed[1].word_count == 20
+    assert results[1].text == _words(10, 40)  # Inputs are not modified
+    assert tokens < sum(estimate_tokens(r.text) for r in results)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_words_repeated_across_pages_and_same_named_files_are_kept() -> None:
+    """Test only chunker overlap is trimmed, and only between chunks of one file."""
+    results = [
+        _result(0, 0.9, "Revenue grew to $4.2M in Q3 2024", source_path="/a/Q3_Report.pdf"),
+        _result(1, 0.8, "Q3 2024 operating costs fell 5%", source_path="/a/Q3_Report.pdf"),
+        _result(2, 0.7, _words(20, 40), source_path="/a/Q3_Report.pdf"),
+        _result(1, 0.6, _words(0, 30), source_path="/b/Q3_Report.pdf"),
+    ]
+
+    packed, _ = pack_results(results, token_budget=10_000)
+
+    assert [r.text for r in packed] == [r.text for r in results]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_near_duplicates_dropped_and_budget_filled_in_score_order() -> None:
+    """Test boilerplate repeated across documents is sent once and the budget is respected."""
+    boilerplate = _words(0, 100, "b")
+    results = [
+        _result(3, 0.95, boilerplate, "Q3_Report.pdf"),
+        _result(7, 0.9, boilerplate + " Q4", "Q4_Report.pdf"),
+        _result(5, 0.8, _words(0, 300, "x")),
+        _result(9, 0.7, _words(0, 20, "y")),
+    ]
+
+    packed, tokens = pack_results(results, token_budget=300)
+
+    assert tokens <= 300
+    assert [r.chunk_index for r in packed] == [3, 5]  # Q4 duplicate dropped, y over budget
+    assert packed[0].text == boilerplate
+    assert packed[1].chunk_index == 5 and packed[1].word_count < 300  # Truncated to fit
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_packed_citations_stay_structured() -> None:
+    """Test generate_citations(append_to_text=False) only fills the citation field."""
+    cited = await generate_citations([_result(4, 0.9, "Revenue was $4.2M")], append_to_text=False)
+
+    assert cited[0].text == "Revenue was $4.2M"
+    assert cited[0].citation == "(Source: Q3_Report.pdf, page 5, chunk 4)"
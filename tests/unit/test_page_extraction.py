@@ -347,3 +347,43 @@ class TestChunkByDoclingItems:
 
         # Verify export_to_markdown was called
         mock_table_item.export_to_markdown.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_chunk_by_docling_items_columnar_matches_list(self):
+        """Test columnar=True returns a ChunkBatch equivalent to the Chunk list.
+
+        Verifies the compact representation carries the same content, page numbers
+        and chunk IDs as the default list output, with one shared metadata record.
+        """
+        from raglite.shared.models import ChunkBatch
+
+        items = []
+        for page_no, word_count in [(1, 20), (2, 700), (3, 5)]:
+            item = Mock()
+            item.text = " ".join(f"p{page_no}w{i}" for i in range(word_count))
+            prov = Mock()
+            prov.page_no = page_no
+            item.prov = [prov]
+            items.append((item, 1))
+
+        mock_result = Mock()
+        mock_result.document.iterate_items.return_value = items
+
+        metadata = DocumentMetadata(
+            filename="columnar.pdf",
+            doc_type="PDF",
+            ingestion_timestamp="2025-10-16T00:00:00Z",
+            page_count=3,
+        )
+
+        chunks = await chunk_by_docling_items(mock_result, metadata)
+        batch = await chunk_by_docling_items(mock_result, metadata, columnar=True)
+
+        assert isinstance(batch, ChunkBatch)
+        assert len(batch) == len(chunks) == 4
+        assert list(batch.page_numbers) == [1, 2, 2, 3]
+        assert list(batch.chunk_indices) == [0, 1, 2, 3]
+        for i, chunk in enumerate(chunks):
+            assert batch.content(i) == chunk.content
+            assert batch.chunk_id(i) == chunk.chunk_id
+        assert batch.metadata is metadata
@@ -0,0 +1,79 @@
+"""Unit tests for pre-fork HTTP serving (raglite/shared/prefork.py)."""
+
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Master process serving a tiny ASGI app from 2 workers (/pid and a 1 s /slow request)
+_SERVER = """
+import asyncio, os, sys
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from raglite.shared.prefork import bind_socket, serve_prefork
+
+async def pid(request):
+    return JSONResponse({"pid": os.getpid()})
+
+async def slow(request):
+    await asyncio.sleep(1.0)
+    return JSONResponse({"pid": os.getpid(), "done": True})
+
+app = Starlette(routes=[Route("/pid", pid), Route("/slow", slow)])
+sock = bind_socket("127.0.0.1", 0)
+print(sock.getsockname()[1], flush=True)
+serve_prefork(app, sock, workers=2, graceful_timeout=5.0)
+"""
+
+
+def _get(port: int, path: str) -> dict[str, object]:
+    with urllib.request.urlopen(f"http://127.0.0.1:{port}{path}", timeout=10) as response:  # nosec
+        result: dict[str, object] = json.loads(response.read())
+        return result
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.timeout(60)
+def test_workers_serve_shared_socket_and_drain_on_sigterm() -> None:
+    """Test forked workers answer on the master's socket and finish in-flight requests."""
+    master = subprocess.Popen(  # nosec B603
+        [sys.executable, "-c", _SERVER],
+        cwd=Path(__file__).parents[2],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    try:
+        assert master.stdout is not None
+        port = int(master.stdout.readline())
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                worker_pid = _get(port, "/pid")["pid"]
+                break
+            except OSError:
+                assert time.monotonic() < deadline, "workers did not start"
+                time.sleep(0.1)
+        assert worker_pid != master.pid
+
+        slow: dict[str, object] = {}
+        request = threading.Thread(target=lambda: slow.update(_get(port, "/slow")))
+        request.start()
+        time.sleep(0.3)  # Request is in flight
+        os.kill(master.pid, signal.SIGTERM)
+
+        request.join(10)
+        assert slow.get("done") is True
+        assert master.wait(15) == 0
+    finally:
+        if master.poll() is None:
+            master.kill()
+            master.wait()
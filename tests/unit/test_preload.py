@@ -0,0 +1,133 @@
+"""Unit tests for background model preloading and the readiness report."""
+
+import asyncio
+import threading
+from collections.abc import Generator
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from raglite.shared import preload
+from raglite.shared.preload import (
+    EMBEDDING_MODEL,
+    QUERY_COMPONENTS,
+    VECTOR_STORE,
+    get_health_status,
+    start_preload,
+    wait_until_ready,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_preload_state() -> Generator[None, None, None]:
+    """Reset the module-level preload state between tests."""
+    preload._preload = None
+    yield
+    preload._preload = None
+
+
+@pytest.fixture
+def mock_clients() -> Generator[tuple[Mock, Mock], None, None]:
+    """Patch the embedding model and vector store used by the preload thread."""
+    model = Mock()
+    model.encode.return_value = np.zeros((1, 1024), dtype=np.float32)
+    store = Mock()
+    store.collection_exists.return_value = True
+    with (
+        patch("raglite.shared.preload.get_embedding_model", return_value=model),
+        patch("raglite.shared.preload.get_vector_store", return_value=store),
+    ):
+        yield model, store
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_preload_reports_ready_with_timings(mock_clients: tuple[Mock, Mock]) -> None:
+    """Test preload loads query components, runs a warm-up query and reports ready."""
+    _, store = mock_clients
+
+    assert start_preload(include_document_converter=False) is True
+    assert start_preload(include_document_converter=False) is False  # Idempotent
+    await wait_until_ready(*QUERY_COMPONENTS)
+
+    # Warm-up runs right after the vector store future resolves
+    for _ in range(100):
+        if get_health_status().warmup_query_ms is not None:
+            break
+        await asyncio.sleep(0.01)
+
+    status = get_health_status()
+    assert status.ready is True
+    assert status.components == {EMBEDDING_MODEL: "ready", VECTOR_STORE: "ready"}
+    assert set(status.load_times_ms) == {EMBEDDING_MODEL, VECTOR_STORE}
+    assert status.warmup_query_ms is not None
+    store.query_points.assert_called_once()
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_early_request_waits_on_shared_future() -> None:
+    """Test requests arriving mid-load wait for the in-flight load and see 'loading'."""
+    release = threading.Event()
+    loads = []
+
+    def slow_load() -> Mock:
+        loads.append(1)
+        release.wait(timeout=5)
+        return Mock()
+
+    with (
+        patch("raglite.shared.preload.get_embedding_model", side_effect=slow_load),
+        patch("raglite.shared.preload.get_vector_store", return_value=Mock()),
+        patch("raglite.shared.preload._warmup_query"),
+    ):
+        start_preload(include_document_converter=False)
+        for _ in range(100):
+            if loads:
+                break
+            await asyncio.sleep(0.01)
+
+        status = get_health_status()
+        assert status.ready is False
+        assert status.components[EMBEDDING_MODEL] == "loading"
+
+        release.set()
+        await wait_until_ready(EMBEDDING_MODEL)
+
+    assert get_health_status().components[EMBEDDING_MODEL] == "ready"
+    assert len(loads) == 1
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_preload_failure_reported_not_raised() -> None:
+    """Test a failed load is reported in health and does not raise in waiters."""
+    with (
+        patch(
+            "raglite.shared.preload.get_embedding_model",
+            side_effect=RuntimeError("model download failed"),
+        ),
+        patch("raglite.shared.preload.get_vector_store", return_value=Mock()),
+    ):
+        start_preload(include_document_converter=False)
+        await wait_until_ready(*QUERY_COMPONENTS)
+
+    status = get_health_status()
+    assert status.ready is False
+    assert status.components[EMBEDDING_MODEL] == "failed"
+    assert "model download failed" in status.errors[EMBEDDING_MODEL]
+    assert status.warmup_query_ms is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_health_without_preload_is_lazy() -> None:
+    """Test servers started without preloading report ready with lazy components."""
+    status = get_health_status()
+
+    assert status.ready is True
+    assert status.components == dict.fromkeys(QUERY_COMPONENTS, "lazy")
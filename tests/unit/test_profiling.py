@@ -0,0 +1,130 @@
+"""Unit tests for on-demand request profiling (raglite/shared/profiling.py)."""
+
+import asyncio
+import json
+import tracemalloc
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from raglite.shared import profiling
+from raglite.shared.profiling import arm_profiling, get_profiling_status, profile_request
+from raglite.shared.scheduler import Priority, embed_with_priority, run_ingest_task
+from raglite.shared.tracing import span
+
+
+@pytest.fixture(autouse=True)
+def profile_dir(tmp_path: Path) -> Generator[Path, None, None]:
+    """Disarm the profiler and write reports to a temporary directory."""
+    profiling._remaining = 0
+    profiling._cpu_active = False
+    profiling._memory_active = False
+    profiling._reports.clear()
+    with patch.object(profiling.settings, "profile_dir", str(tmp_path)):
+        yield tmp_path
+    profiling._remaining = 0
+    profiling._reports.clear()
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_disarmed_profiler_writes_nothing(profile_dir: Path) -> None:
+    """Test requests run unprofiled while the switch is off."""
+    with profile_request("query", {"query": "revenue"}):
+        sum(range(1000))
+
+    assert list(profile_dir.iterdir()) == []
+    assert get_profiling_status().remaining == 0
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_cpu_profile_covers_next_n_requests(profile_dir: Path) -> None:
+    """Test only the next N requests are profiled, with parameters in the summary."""
+    arm_profiling(1, "cpu")
+
+    with profile_request("query", {"query": "Q3 revenue", "top_k": 5}):
+        sorted(range(10_000), reverse=True)
+    with profile_request("query", {"query": "second"}):
+        pass
+
+    status = get_profiling_status()
+    assert status.remaining == 0
+    assert len(status.reports) == 1
+    report = Path(status.reports[0])
+    assert report.suffix == ".prof" and report.exists()
+    summary = report.with_suffix(".txt").read_text()
+    assert '"query": "Q3 revenue"' in summary
+    assert "function calls" in summary
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_memory_profile_reports_peak_per_stage(profile_dir: Path) -> None:
+    """Test memory mode attributes peak allocations to the stage spans that made them."""
+    arm_profiling(1, "memory")
+
+    with profile_request("ingest", {"doc_path": "report.pdf"}):
+        with span("ingest_document"):
+            with span("convert"):
+                buffer = bytearray(8 * 2**20)
+                del buffer
+            with span("chunk_by_docling_items"):
+                pass
+
+    report = json.loads(Path(get_profiling_status().reports[0]).read_text())
+    stages = report["stages"]
+    assert report["params"] == {"doc_path": "report.pdf"}
+    assert stages["convert"]["peak_growth_mb"] >= 7.5
+    assert stages["chunk_by_docling_items"]["peak_growth_mb"] < 1
+    assert stages["ingest_document"]["peak_growth_mb"] >= stages["convert"]["peak_growth_mb"]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cpu_profile_covers_ingest_pool_and_embedder_threads(profile_dir: Path) -> None:
+    """Test work handed to worker threads appears in the request's CPU profile."""
+
+    def convert_document() -> int:
+        return sum(range(10_000))
+
+    def encode_chunks() -> list[int]:
+        return sorted(range(10_000), reverse=True)
+
+    await run_ingest_task(convert_document)  # Unprofiled: not part of a request
+    arm_profiling(1, "cpu")
+    with profile_request("ingest", {"doc_path": "report.pdf"}):
+        await run_ingest_task(convert_document)
+        await embed_with_priority(Priority.INGEST, encode_chunks)
+
+    summary = Path(get_profiling_status().reports[0]).with_suffix(".txt").read_text()
+    assert "convert_document" in summary
+    assert "encode_chunks" in summary
+    assert "raglite-embedder (1)" in summary
+    assert "raglite-ingest_" in summary
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_overlapping_memory_profiles_run_one_at_a_time(profile_dir: Path) -> None:
+    """Test a second memory request overlapping the first runs unprofiled and both succeed."""
+    arm_profiling(2, "memory")
+
+    async def request(name: str) -> str:
+        with profile_request("query", {"query": name}):
+            with span("query_points"):
+                await asyncio.sleep(0.02)
+        return name
+
+    assert await asyncio.gather(request("a"), request("b")) == ["a", "b"]
+    assert len(get_profiling_status().reports) == 1
+    assert get_profiling_status().remaining == 1
+
+    # Tracing stopped by someone else mid-request: the report is written, the request succeeds
+    with profile_request("query", {"query": "c"}):
+        tracemalloc.stop()
+    assert len(get_profiling_status().reports) == 2
@@ -0,0 +1,128 @@
+"""Unit tests for the semantic query cache (raglite/retrieval/query_cache.py)."""
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from raglite.retrieval import query_cache, search
+from raglite.retrieval.query_cache import SemanticQueryCache
+from raglite.retrieval.search import search_documents
+from raglite.shared.epoch import bump_collection_epoch
+from raglite.shared.models import QueryResult
+
+
+def _result(chunk_index: int, score: float = 0.9) -> QueryResult:
+    return QueryResult(
+        score=score,
+        text=f"Revenue chunk {chunk_index}",
+        source_document="Q3_Report.pdf",
+        page_number=4,
+        chunk_index=chunk_index,
+        word_count=3,
+    )
+
+
+def _vector(*components: float) -> np.ndarray:
+    vector = np.zeros(4, dtype=np.float32)
+    vector[: len(components)] = components
+    return vector
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_similar_query_reuses_results() -> None:
+    """Test a paraphrase above the threshold hits; dissimilar or differently filtered misses."""
+    cache = SemanticQueryCache(dimension=4, size=8, threshold=0.95)
+    cache.store(_vector(1.0, 0.1), 10, (), [_result(i) for i in range(10)], search_ms=40.0)
+
+    paraphrase = cache.lookup(_vector(1.0, 0.15), top_k=5)  # cosine ~0.999
+    assert paraphrase is not None
+    assert [r.chunk_index for r in paraphrase] == [0, 1, 2, 3, 4]
+    paraphrase[0].text += " (Source: Q3_Report.pdf)"  # Callers may mutate results
+
+    again = cache.lookup(_vector(1.0, 0.1), top_k=5)
+    assert again is not None and again[0].text == "Revenue chunk 0"
+    assert cache.lookup(_vector(0.7, 0.7), top_k=5) is None  # cosine ~0.77
+    assert cache.lookup(_vector(1.0, 0.1), top_k=20) is None  # Needs more results
+    assert cache.lookup(_vector(1.0, 0.1), top_k=5, filters=(("doc", "Q4"),)) is None
+
+    stats = cache.stats()
+    assert (stats.lookups, stats.hits, stats.entries) == (5, 2, 1)
+    assert stats.hit_rate == pytest.approx(0.4)
+    assert stats.latency_saved_ms == 80.0
+    assert stats.min_hit_similarity is not None and stats.min_hit_similarity > 0.99
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_full_cache_evicts_least_recently_used() -> None:
+    """Test the least recently used entry is replaced when the cache is full."""
+    cache = SemanticQueryCache(dimension=4, size=2, threshold=0.99)
+    cache.store(_vector(1.0), 5, (), [_result(0)], search_ms=10.0)
+    cache.store(_vector(0.0, 1.0), 5, (), [_result(1)], search_ms=10.0)
+    assert cache.lookup(_vector(1.0), top_k=5) is not None  # First entry now most recent
+
+    cache.store(_vector(0.0, 0.0, 1.0), 5, (), [_result(2)], search_ms=10.0)
+
+    assert cache.lookup(_vector(1.0), top_k=5) is not None
+    assert cache.lookup(_vector(0.0, 1.0), top_k=5) is None
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_epoch_change_and_ttl_drop_entries() -> None:
+    """Test entries from an older epoch never match, and an optional TTL expires entries."""
+    cache = SemanticQueryCache(dimension=4, size=4, threshold=0.95)
+    cache.store(_vector(1.0), 5, (), [_result(0)], search_ms=10.0, epoch=1)
+    assert cache.lookup(_vector(1.0), top_k=5, epoch=1) is not None
+
+    assert cache.lookup(_vector(1.0), top_k=5, epoch=2) is None
+    # A search that started before the change stores under its old epoch: never served
+    cache.store(_vector(0.0, 1.0), 5, (), [_result(1)], search_ms=10.0, epoch=1)
+    assert cache.lookup(_vector(0.0, 1.0), top_k=5, epoch=2) is None
+    assert cache.stats().invalidations == 1
+    assert cache.stats().entries == 0
+
+    expiring = SemanticQueryCache(dimension=4, size=4, threshold=0.95, ttl_seconds=60.0)
+    expiring.store(_vector(1.0), 5, (), [_result(0)], search_ms=10.0)
+    with patch.object(
+        query_cache.time, "monotonic", return_value=query_cache.time.monotonic() + 61
+    ):
+        assert expiring.lookup(_vector(1.0), top_k=5) is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_documents_skips_vector_search_on_cache_hit() -> None:
+    """Test a repeated query with the cache enabled is answered without query_points."""
+    model = Mock()
+    model.encode.return_value = np.ones((1, 1024), dtype=np.float32)
+    point = Mock(
+        score=0.91,
+        payload={
+            "text": "Revenue was $4.2M",
+            "source_document": "Q3_Report.pdf",
+            "page_number": 4,
+            "chunk_index": 0,
+            "word_count": 4,
+        },
+    )
+    store = Mock()
+    store.query_points.return_value = Mock(points=[point])
+
+    with (
+        patch.object(search.settings, "query_cache_enabled", True),
+        patch.object(query_cache, "_query_cache", SemanticQueryCache(1024, size=16)),
+        patch("raglite.retrieval.search.get_embedding_model", return_value=model),
+        patch("raglite.retrieval.search.get_vector_store", return_value=store),
+    ):
+        first = await search_documents("What was Q3 revenue?", top_k=5)
+        second = await search_documents("Q3 revenue?", top_k=3)
+        bump_collection_epoch()  # Documents stored or deleted
+        await search_documents("Q3 revenue?", top_k=3)
+
+    assert first == second
+    assert store.query_points.call_count == 2
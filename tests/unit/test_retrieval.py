@@ -114,7 +114,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             results = await search_documents(query, top_k=5)
 
@@ -159,7 +159,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             # Test top_k=10
             results = await search_documents(query, top_k=10)
@@ -202,7 +202,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             results = await search_documents(query, top_k=5, filters=filters)
 
@@ -262,7 +262,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             results = await search_documents(query, top_k=5)
 
@@ -289,7 +289,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             with pytest.raises(QueryError, match="Vector search failed"):
                 await search_documents(query, top_k=5)
@@ -326,7 +326,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             results = await search_documents(query, top_k=5)
 
@@ -373,7 +373,7 @@ class TestSearchDocuments:
 
         with (
             patch("raglite.retrieval.search.generate_query_embedding", return_value=mock_embedding),
-            patch("raglite.retrieval.search.get_qdrant_client", return_value=mock_qdrant),
+            patch("raglite.retrieval.search.get_vector_store", return_value=mock_qdrant),
         ):
             # Should not raise error, but logs warning
             results = await search_documents(query, top_k=5)
@@ -0,0 +1,134 @@
+"""Unit tests for embedder scheduling and ingestion admission (raglite/shared/scheduler.py)."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from raglite.shared import scheduler
+from raglite.shared.scheduler import (
+    EmbeddingScheduler,
+    IngestionAdmission,
+    IngestionRejectedError,
+    Priority,
+    admit_ingestion,
+    run_ingest_task,
+)
+from raglite.shared.tracing import current_span, observe_spans, span
+
+
+@pytest.fixture(autouse=True)
+def reset_admission() -> Generator[None, None, None]:
+    """Use a fresh admission gate (1 running, 1 waiting) per test."""
+    with patch.object(scheduler, "_ingestion_admission", IngestionAdmission(1, 1)):
+        yield
+
+
+class _NullObserver:
+    def on_span_start(self, span: object) -> None:
+        pass
+
+    def on_span_end(self, span: object) -> None:
+        pass
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_queries_run_before_queued_ingest_batches() -> None:
+    """Test a query submitted behind ingestion batches runs right after the current one."""
+    embedder = EmbeddingScheduler()
+    running = threading.Event()
+    release = threading.Event()
+    order: list[str] = []
+
+    def blocking_batch() -> None:
+        running.set()
+        release.wait(5)
+        order.append("ingest-0")
+
+    first = embedder.submit(Priority.INGEST, blocking_batch)
+    assert running.wait(5)
+    batches = [embedder.submit(Priority.INGEST, order.append, f"ingest-{i}") for i in (1, 2, 3)]
+    query = embedder.submit(Priority.QUERY, order.append, "query")
+    release.set()
+
+    for future in (first, *batches, query):
+        future.result(timeout=5)
+    assert order == ["ingest-0", "query", "ingest-1", "ingest-2", "ingest-3"]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_scheduler_propagates_errors_to_caller() -> None:
+    """Test an exception raised by the embedding call reaches the awaiting coroutine."""
+    embedder = EmbeddingScheduler()
+
+    def failing_encode(texts: list[str]) -> None:
+        raise RuntimeError("CUDA out of memory")
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        await embedder.run(Priority.QUERY, failing_encode, ["revenue"])
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+def test_admission_waits_then_rejects_beyond_waiting_limit() -> None:
+    """Test callers beyond the running limit wait, and beyond the waiting limit are rejected."""
+    admission = IngestionAdmission(limit=1, max_waiting=1)
+    admission.acquire()
+    waiter = threading.Thread(target=admission.acquire)
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while admission.waiting == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    with pytest.raises(IngestionRejectedError, match="1 running, 1 waiting"):
+        admission.acquire()
+
+    admission.release()
+    waiter.join(5)
+    assert not waiter.is_alive()
+    assert (admission.running, admission.waiting) == (1, 0)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_admit_ingestion_rejects_when_saturated() -> None:
+    """Test concurrent tool ingestions beyond running + waiting capacity are rejected."""
+    release = asyncio.Event()
+
+    async def ingest() -> str:
+        async with admit_ingestion():
+            await release.wait()
+            return "ok"
+
+    running = asyncio.create_task(ingest())
+    await asyncio.sleep(0.05)
+    waiting = asyncio.create_task(ingest())
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(IngestionRejectedError):
+        await ingest()
+
+    release.set()
+    assert await asyncio.gather(running, waiting) == ["ok", "ok"]
+    assert scheduler.get_ingestion_admission().running == 0
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_run_ingest_task_keeps_trace_context() -> None:
+    """Test pool tasks run off the event loop thread inside the caller's span."""
+    with observe_spans(_NullObserver()), span("convert") as convert_span:
+        thread_name, task_span = await run_ingest_task(
+            lambda: (threading.current_thread().name, current_span())
+        )
+
+    assert thread_name.startswith("raglite-ingest")
+    assert task_span is convert_span
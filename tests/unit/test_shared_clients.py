@@ -1,22 +1,30 @@
 """Unit tests for raglite.shared.clients module."""
 
 from collections.abc import Generator
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 from pytest import MonkeyPatch
 
 import raglite.shared.clients
-from raglite.shared.clients import get_claude_client, get_qdrant_client
+from raglite.shared.clients import (
+    create_qdrant_client,
+    get_claude_client,
+    get_qdrant_client,
+    get_vector_store,
+)
 from raglite.shared.config import Settings
 
 
 @pytest.fixture(autouse=True)
 def reset_qdrant_client_singleton() -> Generator[None, None, None]:
-    """Reset the Qdrant client singleton between tests."""
+    """Reset the Qdrant client and vector store singletons between tests."""
     raglite.shared.clients._qdrant_client = None
+    raglite.shared.clients._vector_store = None
     yield
     raglite.shared.clients._qdrant_client = None
+    raglite.shared.clients._vector_store = None
 
 
 @pytest.mark.p0
@@ -31,10 +39,48 @@ def test_get_qdrant_client_success(mock_qdrant_class: MagicMock, test_settings:
 
     assert client == mock_client
     mock_qdrant_class.assert_called_once_with(
-        host=test_settings.qdrant_host, port=test_settings.qdrant_port, timeout=30
+        host=test_settings.qdrant_host,
+        port=test_settings.qdrant_port,
+        grpc_port=6334,
+        prefer_grpc=False,
+        timeout=30,
     )
 
 
+@pytest.mark.p1
+@pytest.mark.unit
+@patch("raglite.shared.clients.QdrantClient")
+@patch("raglite.shared.clients.settings")
+def test_create_qdrant_client_grpc_tuning(
+    mock_settings: MagicMock, mock_qdrant_class: MagicMock
+) -> None:
+    """Test gRPC transport, pool size and compression settings reach QdrantClient."""
+    import grpc
+    import httpx
+
+    mock_settings.qdrant_host = "qdrant.internal"
+    mock_settings.qdrant_port = 6333
+    mock_settings.qdrant_grpc_port = 7334
+    mock_settings.qdrant_prefer_grpc = True
+    mock_settings.qdrant_timeout = 10
+    mock_settings.qdrant_pool_size = 16
+    mock_settings.qdrant_grpc_compression = "gzip"
+
+    create_qdrant_client()
+
+    kwargs = mock_qdrant_class.call_args.kwargs
+    assert kwargs["prefer_grpc"] is True
+    assert kwargs["grpc_port"] == 7334
+    assert kwargs["timeout"] == 10
+    assert kwargs["grpc_compression"] == grpc.Compression.Gzip
+    assert isinstance(kwargs["limits"], httpx.Limits)
+    assert kwargs["limits"].max_connections == 16
+
+    # Explicit override (used by the transport benchmark) wins over settings
+    create_qdrant_client(prefer_grpc=False)
+    assert mock_qdrant_class.call_args.kwargs["prefer_grpc"] is False
+
+
 @pytest.mark.p1
 @pytest.mark.unit
 @patch("raglite.shared.clients.QdrantClient")
@@ -49,6 +95,32 @@ def test_get_qdrant_client_connection_error(
         get_qdrant_client()
 
 
+@pytest.mark.p1
+@pytest.mark.unit
+@patch("raglite.shared.clients.QdrantClient")
+@patch("raglite.shared.clients.settings")
+def test_get_vector_store_backends(
+    mock_settings: MagicMock, mock_qdrant_class: MagicMock, tmp_path: Path
+) -> None:
+    """Test get_vector_store selects remote, embedded Qdrant, or NumPy backend."""
+    from raglite.shared.vector_store import NumpyVectorStore
+
+    mock_settings.vector_store_path = str(tmp_path)
+
+    mock_settings.vector_backend = "qdrant"
+    assert get_vector_store() is get_qdrant_client()
+    assert "host" in mock_qdrant_class.call_args.kwargs
+
+    mock_settings.vector_backend = "qdrant_local"
+    store = get_vector_store()
+    mock_qdrant_class.assert_called_with(path=str(tmp_path))
+    assert get_vector_store() is store  # Cached singleton
+
+    raglite.shared.clients._vector_store = None
+    mock_settings.vector_backend = "numpy"
+    assert isinstance(get_vector_store(), NumpyVectorStore)
+
+
 @pytest.mark.p0
 @pytest.mark.unit
 @patch("raglite.shared.clients.Anthropic")
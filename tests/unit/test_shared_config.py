@@ -32,6 +32,8 @@ def test_settings_default_values(monkeypatch: MonkeyPatch) -> None:
     assert settings.qdrant_port == 6333
     assert settings.embedding_model == "intfloat/e5-large-v2"
     assert settings.embedding_dimension == 1024
+    assert settings.qdrant_prefer_grpc is False
+    assert settings.qdrant_grpc_port == 6334
 
 
 @pytest.mark.p0
@@ -3,7 +3,7 @@
 import pytest
 from pydantic import ValidationError
 
-from raglite.shared.models import Chunk, DocumentMetadata, SearchResult
+from raglite.shared.models import Chunk, ChunkBatch, DocumentMetadata, SearchResult
 
 
 @pytest.mark.p0
@@ -75,3 +75,48 @@ def test_search_result_score_validation(sample_chunk: Chunk) -> None:
     # Invalid score < 0
     with pytest.raises(ValidationError):
         SearchResult(score=-0.1, chunk=sample_chunk)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_chunk_batch_columnar_storage(sample_document_metadata: DocumentMetadata) -> None:
+    """Test ChunkBatch stores chunks in shared buffers and exposes Chunk views."""
+    batch = ChunkBatch(sample_document_metadata)
+    batch.append("Revenue grew 15%", page_number=3, chunk_index=0)
+    batch.append("EBITDA margin 22%", page_number=4, chunk_index=1)
+
+    assert len(batch) == 2
+    assert batch.text == "Revenue grew 15%EBITDA margin 22%"
+    assert batch._parts == []  # Parts are dropped once joined into the buffer
+    assert list(batch.page_numbers) == [3, 4]
+    assert batch.contents() == ["Revenue grew 15%", "EBITDA margin 22%"]
+
+    chunk = batch[1]
+    assert isinstance(chunk, Chunk)
+    assert chunk.chunk_id == "test_financial_report.pdf_1"
+    assert chunk.content == "EBITDA margin 22%"
+    assert chunk.page_number == 4
+    assert chunk.metadata is sample_document_metadata  # One shared metadata record
+    assert chunk.embedding == []
+
+    batch.append("Net income $3M", page_number=5, chunk_index=2)
+    assert batch.contents(1) == ["EBITDA margin 22%", "Net income $3M"]
+
+    with pytest.raises(IndexError):
+        batch[3]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_chunk_batch_embedding_view(sample_document_metadata: DocumentMetadata) -> None:
+    """Test ChunkBatch views read embeddings from the shared float32 matrix."""
+    import numpy as np
+
+    batch = ChunkBatch(sample_document_metadata)
+    batch.append("a", page_number=1, chunk_index=0)
+    batch.embeddings = np.full((1, 4), 0.5, dtype=np.float32)
+
+    assert batch[0].embedding == [0.5, 0.5, 0.5, 0.5]
+    chunks = batch.to_chunks()
+    assert [c.chunk_index for c in chunks] == [0]
+    assert chunks[0].metadata is sample_document_metadata  # Validation keeps the shared record
@@ -0,0 +1,104 @@
+"""Unit tests for request coalescing (raglite/shared/singleflight.py)."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from raglite.retrieval import search
+from raglite.retrieval.search import search_documents
+from raglite.shared.metrics import COALESCED_REQUESTS
+from raglite.shared.models import QueryResult
+from raglite.shared.singleflight import SingleFlight, normalize_query
+
+
+def _result(text: str) -> QueryResult:
+    return QueryResult(
+        score=0.9,
+        text=text,
+        source_document="Q3_Report.pdf",
+        page_number=4,
+        chunk_index=0,
+        word_count=len(text.split()),
+    )
+
+
+@pytest.mark.p0
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_identical_calls_share_one_execution() -> None:
+    """Test concurrent calls with one key run once and each get their own copy."""
+    flight: SingleFlight[list[QueryResult]] = SingleFlight("test")
+    calls = 0
+    release = asyncio.Event()
+
+    async def search_once() -> list[QueryResult]:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return [_result("Revenue was $4.2M")]
+
+    coalesced_before = COALESCED_REQUESTS.labels(kind="test").value
+    callers = [asyncio.create_task(flight.do(("revenue", 5), search_once)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    assert flight.in_flight() == 1
+    release.set()
+    first, second, third = await asyncio.gather(*callers)
+
+    assert calls == 1
+    assert COALESCED_REQUESTS.labels(kind="test").value - coalesced_before == 2
+    first[0].text += " (Source: Q3_Report.pdf, page 4)"  # Citations mutate results
+    assert second[0].text == third[0].text == "Revenue was $4.2M"
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_execution() -> None:
+    """Test a disconnecting caller leaves the execution running; errors reach everyone."""
+    flight: SingleFlight[str] = SingleFlight("test")
+    release = asyncio.Event()
+
+    async def failing() -> str:
+        await release.wait()
+        raise RuntimeError("Qdrant unavailable")
+
+    leader = asyncio.create_task(flight.do("key", failing))
+    follower = asyncio.create_task(flight.do("key", failing))
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+
+    with pytest.raises(RuntimeError, match="Qdrant unavailable"):
+        await follower
+    assert leader.cancelled()
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_documents_coalesces_normalized_queries() -> None:
+    """Test queries differing only in whitespace share one search and its stage timings."""
+    calls: list[str] = []
+
+    async def fake_search(query, top_k, filters, timings, epoch, diversify):
+        calls.append(query)
+        await asyncio.sleep(0.05)
+        timings["embed_ms"] = 12.0
+        return [_result("Revenue was $4.2M")]
+
+    timings_a: dict[str, float] = {}
+    timings_b: dict[str, float] = {}
+    with patch.object(search, "_search_documents", side_effect=fake_search):
+        results = await asyncio.gather(
+            search_documents("What was  revenue?", 5, timings=timings_a),
+            search_documents(" What was revenue? ", 5, timings=timings_b),
+            search_documents("What was revenue?", 10),
+        )
+
+    assert len(calls) == 2  # top_k=10 is a different search
+    assert [len(r) for r in results] == [1, 1, 1]
+    assert timings_a == timings_b == {"embed_ms": 12.0}
+    assert normalize_query("ＡＢＣ  revenue\n") == "ABC revenue"
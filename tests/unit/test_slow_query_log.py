@@ -0,0 +1,100 @@
+"""Unit tests for the slow-query log (raglite/retrieval/slow_query_log.py)."""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from raglite.retrieval import slow_query_log
+from raglite.retrieval.search import search_documents
+from raglite.retrieval.slow_query_log import log_if_slow
+from raglite.shared.models import QueryResult
+
+TIMINGS = {"embed_ms": 40.0, "vector_search_ms": 2300.0, "citation_ms": 0.5}
+
+
+@pytest.fixture
+def slow_log(tmp_path: Path) -> Generator[Path, None, None]:
+    """Write the slow log to a temporary file with a 1000 ms threshold."""
+    path = tmp_path / "reports" / "slow-queries.jsonl"
+    with (
+        patch.object(slow_query_log.settings, "slow_query_log_file", str(path)),
+        patch.object(slow_query_log.settings, "slow_query_threshold_ms", 1000.0),
+    ):
+        yield path
+
+
+def _result(score: float) -> QueryResult:
+    return QueryResult(
+        score=score,
+        text="Q3 EBITDA margin was 21%.",
+        source_document="Q3_Report.pdf",
+        page_number=4,
+        chunk_index=0,
+        word_count=5,
+    )
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_slow_query_logged_with_stage_breakdown(slow_log: Path) -> None:
+    """Test a query over the threshold is appended with stage timings and top score."""
+    results = [_result(0.82134), _result(0.7)]
+
+    assert log_if_slow("Q3 EBITDA margin?", 5, 2412.73, TIMINGS, results) is True
+    assert log_if_slow("second slow query", 5, 1500.0, TIMINGS, []) is True
+
+    entries = [json.loads(line) for line in slow_log.read_text().splitlines()]
+    assert len(entries) == 2
+    assert entries[0]["query"] == "Q3 EBITDA margin?"
+    assert entries[0]["total_ms"] == 2412.73
+    assert entries[0]["vector_search_ms"] == 2300.0
+    assert entries[0]["citation_ms"] == 0.5
+    assert entries[0]["results"] == 2
+    assert entries[0]["top_score"] == 0.8213
+    assert entries[1]["top_score"] is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_fast_or_disabled_queries_not_logged(slow_log: Path) -> None:
+    """Test queries under the threshold, or with the log disabled, are not written."""
+    assert log_if_slow("fast query", 5, 120.0, TIMINGS, []) is False
+    with patch.object(slow_query_log.settings, "slow_query_threshold_ms", None):
+        assert log_if_slow("slow query", 5, 9000.0, TIMINGS, []) is False
+
+    assert not slow_log.exists()
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_slow_log_write_failure_does_not_raise(tmp_path: Path) -> None:
+    """Test an unwritable log path is reported in logs, not raised to the caller."""
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    with (
+        patch.object(slow_query_log.settings, "slow_query_log_file", str(blocker / "slow.jsonl")),
+        patch.object(slow_query_log.settings, "slow_query_threshold_ms", 0.0),
+    ):
+        assert log_if_slow("query", 5, 10.0, TIMINGS, []) is True
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_search_documents_reports_stage_timings() -> None:
+    """Test search_documents fills embed and vector search latencies when asked."""
+    store = Mock()
+    store.query_points.return_value = Mock(points=[])
+    timings: dict[str, float] = {}
+
+    with (
+        patch("raglite.retrieval.search.generate_query_embedding", return_value=[0.1] * 1024),
+        patch("raglite.retrieval.search.get_vector_store", return_value=store),
+    ):
+        await search_documents("What was Q3 revenue?", top_k=5, timings=timings)
+
+    assert set(timings) == {"embed_ms", "vector_search_ms"}
+    assert all(value >= 0 for value in timings.values())
@@ -0,0 +1,92 @@
+"""Unit tests for the CPU thread budget (raglite/shared/threads.py)."""
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from raglite.shared import threads
+from raglite.shared.models import ThreadBudget
+from raglite.shared.threads import apply_thread_budget, get_thread_budget
+
+
+@pytest.fixture
+def budget_settings() -> Generator[None, None, None]:
+    """8 CPUs, one concurrent ingestion, no explicit overrides."""
+    with (
+        patch.object(threads.settings, "thread_budget_enabled", True),
+        patch.object(threads.settings, "cpu_thread_budget", 8),
+        patch.object(threads.settings, "ingest_max_concurrent", 1),
+        patch.object(threads.settings, "embedding_threads", None),
+        patch.object(threads.settings, "docling_threads", None),
+    ):
+        yield
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_budget_splits_cpus_between_queries_and_ingestions(budget_settings: None) -> None:
+    """Test each pool gets one share of total // (concurrent ingestions + 1)."""
+    assert get_thread_budget() == ThreadBudget(
+        total=8, torch_intra_op=4, torch_inter_op=1, docling=4, blas=4, ingest_workers=1
+    )
+
+    with (
+        patch.object(threads.settings, "ingest_max_concurrent", 3),
+        patch.object(threads.settings, "docling_threads", 1),
+    ):
+        budget = get_thread_budget()
+    assert budget is not None
+    assert (budget.torch_intra_op, budget.docling, budget.blas) == (2, 1, 2)
+    assert budget.ingest_workers == 3
+
+    with patch.object(threads.settings, "thread_budget_enabled", False):
+        assert get_thread_budget() is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_http_workers_each_get_a_share_of_the_budget(budget_settings: None) -> None:
+    """Test the HTTP transport divides the CPUs between its worker processes."""
+    with (
+        patch.object(threads.settings, "mcp_transport", "http"),
+        patch.object(threads.settings, "http_workers", 2),
+    ):
+        budget = get_thread_budget()
+    assert budget is not None
+    assert (budget.total, budget.torch_intra_op, budget.docling) == (4, 2, 2)
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_apply_keeps_explicit_environment(
+    budget_settings: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test unset thread variables get the budget while explicit ones are kept."""
+    for name in (*threads._BLAS_ENV_VARS, "DOCLING_NUM_THREADS"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("MKL_NUM_THREADS", "1")
+
+    budget = apply_thread_budget()
+
+    assert budget is not None
+    assert threads.os.environ["OMP_NUM_THREADS"] == "4"
+    assert threads.os.environ["DOCLING_NUM_THREADS"] == "4"
+    assert threads.os.environ["MKL_NUM_THREADS"] == "1"
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_docling_converter_uses_budgeted_threads(budget_settings: None) -> None:
+    """Test the shared Docling converter is configured with the Docling share."""
+    from raglite.ingestion import pipeline
+
+    pipeline._document_converter = None
+    try:
+        with patch("raglite.ingestion.pipeline.DocumentConverter") as MockConverter:
+            pipeline.get_document_converter()
+        format_options = MockConverter.call_args.kwargs["format_options"]
+        options = next(iter(format_options.values())).pipeline_options
+        assert options.accelerator_options.num_threads == 4
+    finally:
+        pipeline._document_converter = None
@@ -0,0 +1,107 @@
+"""Unit tests for request tracing spans (raglite/shared/tracing.py)."""
+
+import asyncio
+import json
+from collections.abc import Generator
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from raglite.retrieval.search import search_documents
+from raglite.shared import tracing
+from raglite.shared.tracing import current_span, span
+
+
+@pytest.fixture
+def trace_file(tmp_path: Path) -> Generator[Path, None, None]:
+    """Enable tracing to a temporary JSONL file."""
+    path = tmp_path / "traces.jsonl"
+    tracing._exporter = None
+    with patch.object(tracing.settings, "trace_file", str(path)):
+        yield path
+        if tracing._exporter is not None:
+            tracing._exporter.close()
+    tracing._exporter = None
+
+
+def _read_spans(path: Path) -> dict[str, dict]:
+    if tracing._exporter is not None:
+        tracing._exporter.close()
+    return {s["name"]: s for s in map(json.loads, path.read_text().splitlines())}
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_nested_spans_share_trace_and_link_parents(trace_file: Path) -> None:
+    """Test child spans inherit the trace ID and point at their parent."""
+    with span("ingest_document", doc_filename="report.pdf") as root:
+        with span("convert") as convert:
+            convert.set_attribute("pages", 12)
+        assert current_span() is root
+    assert current_span() is None
+
+    spans = _read_spans(trace_file)
+    assert spans["convert"]["trace_id"] == spans["ingest_document"]["trace_id"]
+    assert spans["convert"]["parent_id"] == spans["ingest_document"]["span_id"]
+    assert spans["ingest_document"]["parent_id"] is None
+    assert spans["convert"]["attributes"] == {"pages": 12}
+    assert spans["ingest_document"]["duration_ms"] >= spans["convert"]["duration_ms"]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_span_records_error_and_reraises(trace_file: Path) -> None:
+    """Test a failing block marks its span as an error without swallowing it."""
+    with pytest.raises(RuntimeError, match="Docling parsing failed"):
+        with span("convert"):
+            raise RuntimeError("Docling parsing failed")
+
+    spans = _read_spans(trace_file)
+    assert spans["convert"]["status"] == "error"
+    assert "Docling parsing failed" in spans["convert"]["error"]
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+def test_disabled_tracing_records_nothing(tmp_path: Path) -> None:
+    """Test spans are non-recording and no file is written when trace_file is unset."""
+    tracing._exporter = None
+    with patch.object(tracing.settings, "trace_file", None):
+        with span("query") as query_span:
+            query_span.set_attribute("results", 5)
+            assert query_span.recording is False
+            assert current_span() is None
+
+
+@pytest.mark.p1
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_concurrent_queries_get_separate_traces(trace_file: Path) -> None:
+    """Test each concurrent request gets its own trace with query stage spans."""
+    model = Mock()
+    model.encode.return_value = np.zeros((1, 1024), dtype=np.float32)
+    store = Mock()
+    store.query_points.return_value = Mock(points=[])
+
+    async def traced_query(name: str) -> None:
+        with span(name):
+            # Distinct queries: identical in-flight queries share one search
+            await search_documents(f"What was Q3 revenue? ({name})", top_k=5)
+
+    with (
+        patch("raglite.retrieval.search.get_embedding_model", return_value=model),
+        patch("raglite.retrieval.search.get_vector_store", return_value=store),
+    ):
+        await asyncio.gather(traced_query("query_a"), traced_query("query_b"))
+
+    if tracing._exporter is not None:
+        tracing._exporter.close()
+    spans = [json.loads(line) for line in trace_file.read_text().splitlines()]
+    traces: dict[str, set[str]] = {}
+    for s in spans:
+        traces.setdefault(s["trace_id"], set()).add(s["name"])
+    assert len(traces) == 2
+    for names in traces.values():
+        assert {"generate_query_embedding", "query_points"} <= names
@@ -0,0 +1,186 @@
+"""Unit tests for the in-process NumPy vector store backend."""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+from qdrant_client.models import (
+    Distance,
+    FieldCondition,
+    Filter,
+    MatchAny,
+    MatchValue,
+    PointStruct,
+    VectorParams,
+)
+
+from raglite.ingestion import pipeline
+from raglite.retrieval.search import search_documents
+from raglite.shared.epoch import get_collection_epoch
+from raglite.shared.models import ChunkBatch, DocumentMetadata
+from raglite.shared.vector_store import NumpyVectorStore
+
+
+def _points(start: int, n: int, source: str, dim: int = 8) -> list[PointStruct]:
+    rng = np.random.default_rng(start)
+    return [
+        PointStruct(
+            id=start + i,
+            vector=rng.standard_normal(dim).tolist(),
+            payload={"source_document": source, "chunk_index": i},
+        )
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path) -> NumpyVectorStore:
+    """NumPy store with an 8-dim cosine collection."""
+    store = NumpyVectorStore(tmp_path)
+    store.create_collection("docs", vectors_config=VectorParams(size=8, distance=Distance.COSINE))
+    return store
+
+
+@pytest.mark.unit
+def test_exact_search_matches_brute_force(store: NumpyVectorStore) -> None:
+    """Test query_points returns the true cosine top-k in descending score order."""
+    points = _points(0, 50, "a.pdf")
+    store.upload_points("docs", points, batch_size=16)
+
+    query = np.random.default_rng(99).standard_normal(8)
+    matrix = np.array([p.vector for p in points])
+    expected = np.argsort(-(matrix @ query / np.linalg.norm(matrix, axis=1)))[:5]
+
+    result = store.query_points("docs", query=query.tolist(), limit=5).points
+
+    assert [p.id for p in result] == expected.tolist()
+    assert result[0].score >= result[-1].score
+    assert result[0].payload == {"source_document": "a.pdf", "chunk_index": int(expected[0])}
+
+
+@pytest.mark.unit
+def test_filters_count_and_persistence(store: NumpyVectorStore, tmp_path) -> None:
+    """Test source_document filters, exact count, upsert-by-ID and reload from disk."""
+    store.upsert("docs", points=_points(0, 10, "a.pdf"))
+    store.upsert("docs", points=_points(100, 5, "b.pdf"))
+    # Re-upserting existing IDs overwrites in place instead of adding rows
+    store.upsert("docs", points=_points(100, 5, "b.pdf"))
+
+    only_b = Filter(must=[FieldCondition(key="source_document", match=MatchValue(value="b.pdf"))])
+    assert store.count("docs", count_filter=only_b).count == 5
+    any_ab = Filter(
+        must=[FieldCondition(key="source_document", match=MatchAny(any=["a.pdf", "b.pdf"]))]
+    )
+    assert store.count("docs", count_filter=any_ab).count == 15
+
+    results = store.query_points("docs", query=[1.0] * 8, limit=20, query_filter=only_b).points
+    assert {p.id for p in results} == set(range(100, 105))
+
+    reopened = NumpyVectorStore(tmp_path)
+    assert reopened.get_collection("docs").points_count == 15
+    assert reopened.count("docs", count_filter=only_b).count == 5
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_store_and_search_through_numpy_backend(tmp_path) -> None:
+    """Test store_vectors_in_qdrant and search_documents work against the NumPy backend."""
+    metadata = DocumentMetadata(
+        filename="report.pdf",
+        doc_type="PDF",
+        ingestion_timestamp=datetime.now().isoformat(),
+        page_count=2,
+    )
+    batch = ChunkBatch(metadata)
+    batch.append("Revenue grew 15%", page_number=1, chunk_index=0)
+    batch.append("Operating costs fell", page_number=2, chunk_index=1)
+    batch.embeddings = np.eye(2, 1024, dtype=np.float32)
+
+    store = NumpyVectorStore(tmp_path)
+    pipeline.reset_collection_registry()
+    with (
+        patch("raglite.ingestion.pipeline.get_vector_store", return_value=store),
+        patch("raglite.retrieval.search.get_vector_store", return_value=store),
+        patch(
+            "raglite.retrieval.search.generate_query_embedding",
+            AsyncMock(return_value=np.eye(1, 1024, 1)[0].tolist()),
+        ),
+    ):
+        stored = await pipeline.store_vectors_in_qdrant(batch, collection_name="financial_docs")
+        results = await search_documents("What happened to costs?", top_k=1)
+    pipeline.reset_collection_registry()
+
+    assert stored == 2
+    assert results[0].text == "Operating costs fell"
+    assert results[0].page_number == 2
+    assert results[0].score == pytest.approx(1.0)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_delete_document_tombstones_points_and_bumps_epoch(tmp_path) -> None:
+    """Test delete_document removes a document's points (persisted) and bumps the epoch."""
+    store = NumpyVectorStore(tmp_path)
+    store.create_collection(
+        "financial_docs", vectors_config=VectorParams(size=8, distance=Distance.COSINE)
+    )
+    store.upsert("financial_docs", points=_points(0, 10, "a.pdf"))
+    store.upsert("financial_docs", points=_points(100, 5, "b.pdf"))
+    epoch = get_collection_epoch("financial_docs")
+
+    with patch("raglite.ingestion.pipeline.get_vector_store", return_value=store):
+        assert await pipeline.delete_document("a.pdf", "financial_docs") == 10
+        assert await pipeline.delete_document("a.pdf", "financial_docs") == 0
+
+    assert get_collection_epoch("financial_docs") > epoch
+    results = store.query_points("financial_docs", query=[1.0] * 8, limit=20).points
+    assert {p.id for p in results} == set(range(100, 105))
+
+    # Tombstones survive a reload; a deleted ID can be stored again
+    reopened = NumpyVectorStore(tmp_path)
+    assert reopened.get_collection("financial_docs").points_count == 5
+    reopened.upsert("financial_docs", points=_points(0, 1, "a.pdf"))
+    assert reopened.count("financial_docs").count == 6
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_same_file_name_in_two_directories_and_shorter_reingest(tmp_path) -> None:
+    """Test same-named documents keep separate points and a shorter re-ingest drops its tail."""
+
+    def annual_report(year: int, chunks: int) -> ChunkBatch:
+        metadata = DocumentMetadata(
+            filename="annual_report.pdf",
+            doc_type="PDF",
+            ingestion_timestamp=datetime.now().isoformat(),
+            source_path=f"/reports/{year}/annual_report.pdf",
+        )
+        batch = ChunkBatch(metadata)
+        for i in range(chunks):
+            batch.append(f"{year} chunk {i}", page_number=1, chunk_index=i)
+        batch.embeddings = np.ones((chunks, 1024), dtype=np.float32)
+        return batch
+
+    store = NumpyVectorStore(tmp_path)
+    pipeline.reset_collection_registry()
+    with patch("raglite.ingestion.pipeline.get_vector_store", return_value=store):
+        assert await pipeline.store_vectors_in_qdrant(annual_report(2023, 5), "docs") == 5
+        assert await pipeline.store_vectors_in_qdrant(annual_report(2024, 4), "docs") == 4
+        # 2023 report edited: now 3 chunks, chunks 3 and 4 are stale
+        assert await pipeline.store_vectors_in_qdrant(annual_report(2023, 3), "docs") == 3
+    pipeline.reset_collection_registry()
+
+    def indices(year: int) -> list[int]:
+        path_filter = Filter(
+            must=[
+                FieldCondition(
+                    key="source_path", match=MatchValue(value=f"/reports/{year}/annual_report.pdf")
+                )
+            ]
+        )
+        points = store.query_points("docs", query=[1.0] * 1024, limit=20, query_filter=path_filter)
+        return sorted(p.payload["chunk_index"] for p in points.points)
+
+    assert indices(2023) == [0, 1, 2]
+    assert indices(2024) == [0, 1, 2, 3]